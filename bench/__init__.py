@@ -0,0 +1,5 @@
+"""
+性能基准脚本。每个模块可单独运行，例如：
+
+    python -m pvzemu2.bench.clone
+"""
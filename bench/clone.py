@@ -0,0 +1,57 @@
+"""
+World.clone() 基准：克隆耗时随场上对象数量的变化，并与 copy.deepcopy 对比。
+
+    python -m pvzemu2.bench.clone [--repeat N]
+"""
+import argparse
+import copy
+import timeit
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.world import World
+
+# 每行种植的列数，对应不同的场上规模
+BOARD_SIZES = (0, 2, 4, 6, 9)
+ZOMBIES_PER_ROW = (0, 2, 4, 8, 12)
+
+
+def make_world(cols: int, zombies_per_row: int) -> World:
+    world = World(SceneType.DAY)
+    world.seed(0)
+    world.scene.stop_spawn = True
+    for row in range(world.scene.rows):
+        for col in range(cols):
+            world.plant(PlantType.WALLNUT if col % 2 else PlantType.PEA_SHOOTER, row, col)
+        for i in range(zombies_per_row):
+            world.spawn(ZombieType.CONE_HEAD, row, x=720.0 + 5 * i)
+    # 跑几帧让子弹等对象出现
+    world.step(60)
+    return world
+
+
+def _per_call_us(stmt: object, repeat: int) -> float:
+    return min(timeit.repeat(stmt, number=repeat, repeat=3)) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'plants':>6} {'zombies':>7} {'objects':>7} {'clone':>10} {'restore':>10} "
+          f"{'deepcopy':>10} {'speedup':>8}")
+    for cols, zpr in zip(BOARD_SIZES, ZOMBIES_PER_ROW):
+        world = make_world(cols, zpr)
+        snap = world.snapshot()
+        scene = world.scene
+        n_objects = len(scene.plants) + len(scene.zombies) + len(scene.projectiles) + len(scene.grid_items)
+
+        clone_us = _per_call_us(world.clone, args.repeat)
+        restore_us = _per_call_us(lambda: world.restore(snap), args.repeat)
+        deepcopy_us = _per_call_us(lambda: copy.deepcopy(world), max(1, args.repeat // 10))
+        print(f"{len(scene.plants):>6} {len(scene.zombies):>7} {n_objects:>7} {clone_us:>8.1f}us "
+              f"{restore_us:>8.1f}us {deepcopy_us:>8.1f}us {deepcopy_us / clone_us:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
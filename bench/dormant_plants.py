@@ -0,0 +1,54 @@
+"""
+休眠植物基准：地刺与已出土的土豆雷面对空行，比较空场、触发区间唤醒 (默认) 与逐帧 find_target
+(以 mock 关闭休眠模拟改动前的行为) 三种情况下每帧的耗时。
+
+    python -m pvzemu2.bench.dormant_plants [--frames N] [--repeat N] [--plants N]
+"""
+import argparse
+import time
+from contextlib import nullcontext
+from unittest import mock
+
+from pvzemu2.enums import SceneType, PlantType, PlantStatus
+from pvzemu2.world import World
+from pvzemu2.zombie_index import ZombieRow
+
+
+def _build(n_plants: int) -> World:
+    world = World(SceneType.DAY)
+    world.seed(0)
+    world.scene.stop_spawn = True
+    for i in range(n_plants):
+        row, col = i % 5, i // 5 % 9
+        plant_type = PlantType.SPIKEWEED if i % 2 == 0 else PlantType.POTATO_MINE
+        plant = world.plant(plant_type, row, col)
+        if plant is not None and plant_type == PlantType.POTATO_MINE:
+            plant.status = PlantStatus.POTATO_ARMED
+    return world
+
+
+def _run(n_plants: int, frames: int, polling: bool) -> float:
+    world = _build(n_plants)
+    ctx = mock.patch.object(ZombieRow, 'is_dormant', lambda row, plant: False) if polling else nullcontext()
+    with ctx:
+        start = time.perf_counter()
+        for _ in range(frames):
+            world.update()
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--plants', type=int, default=20)
+    args = parser.parse_args()
+
+    cases = (('empty', 0, False), ('dormant', args.plants, False), ('polling', args.plants, True))
+    for label, n_plants, polling in cases:
+        best = min(_run(n_plants, args.frames, polling) for _ in range(args.repeat))
+        print(f"{label:>8}: {best * 1e6 / args.frames:.1f}us/frame ({n_plants} plants)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+几何内核基准：单次重叠 / 圆相交判定，以及一个区间对 N 个矩形的批量判定。
+对比先构造 Rect 再调用方法 (rect)、直接传整数 (ints) 与 RectArray (batch)。
+
+    python -m pvzemu2.bench.geometry [--rounds N]
+"""
+import argparse
+import random
+import time
+
+from pvzemu2.geometry import Rect, RectArray, overlap_len, circle_overlaps
+
+BATCH_SIZES = (10, 100, 1000)
+
+
+def _per_call(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    fn(rounds)
+    return (time.perf_counter() - start) / rounds * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=200000)
+    args = parser.parse_args()
+
+    a = (100, 50, 40, 80)
+    b = (120, 60, 30, 70)
+
+    def rect_overlap(n: int) -> None:
+        for _ in range(n):
+            Rect(*a).get_overlap_len(Rect(*b))
+
+    def int_overlap(n: int) -> None:
+        ax, _, aw, _ = a
+        bx, _, bw, _ = b
+        for _ in range(n):
+            overlap_len(ax, aw, bx, bw)
+
+    def rect_circle(n: int) -> None:
+        for _ in range(n):
+            Rect(*a).is_overlap_with_circle(200, 100, 115)
+
+    def int_circle(n: int) -> None:
+        ax, ay, aw, ah = a
+        for _ in range(n):
+            circle_overlaps(ax, ay, aw, ah, 200, 100, 115)
+
+    print(f"{'overlap rect':>16} {_per_call(rect_overlap, args.rounds):>8.1f}ns")
+    print(f"{'overlap ints':>16} {_per_call(int_overlap, args.rounds):>8.1f}ns")
+    print(f"{'circle rect':>16} {_per_call(rect_circle, args.rounds):>8.1f}ns")
+    print(f"{'circle ints':>16} {_per_call(int_circle, args.rounds):>8.1f}ns")
+
+    rng = random.Random(0)
+    for size in BATCH_SIZES:
+        rects = [Rect(rng.randint(0, 800), 0, rng.randint(20, 100), 100) for _ in range(size)]
+        batch = RectArray(rects)
+        rounds = max(1, args.rounds // size)
+
+        def loop(n: int) -> None:
+            for _ in range(n):
+                q = Rect(300, 0, 40, 100)
+                [i for i, r in enumerate(rects) if q.get_overlap_len(r) >= 0]
+
+        def batched(n: int) -> None:
+            for _ in range(n):
+                batch.overlapping(300, 40)
+
+        per_rect_loop = _per_call(loop, rounds) / size
+        per_rect_batch = _per_call(batched, rounds) / size
+        print(f"{'batch n=' + str(size):>16} {per_rect_loop:>8.1f}ns/rect (loop) {per_rect_batch:>8.1f}ns/rect (batch)")
+
+
+if __name__ == '__main__':
+    main()
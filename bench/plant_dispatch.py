@@ -0,0 +1,97 @@
+"""
+植物分派基准：按类型查找每帧 update 处理函数的单株开销，
+对比原先的 if/elif 链 (chain) 与 PlantSystem.records 下标查表 (table)，
+并给出全部植物类型混合时 PlantSystem.update 的单帧耗时。
+
+    python -m pvzemu2.bench.plant_dispatch [--rounds N]
+"""
+import argparse
+import time
+
+from pvzemu2.enums import SceneType, PlantType
+from pvzemu2.objects.plant import Plant
+from pvzemu2.systems.plant_system import PlantSystem
+from pvzemu2.world import World
+
+
+def chain_lookup(ps: PlantSystem, p: Plant):
+    """重构前 PlantSystem.update 中的 if/elif 链"""
+    if p.type == PlantType.COB_CANNON:
+        return ps.cob_cannon_subsystem.update
+    elif p.type == PlantType.BLOVER:
+        return ps.blover_subsystem.update
+    elif p.type == PlantType.GRAVE_BUSTER:
+        return ps.grave_buster_subsystem.update
+    elif p.type in (PlantType.SPIKEWEED, PlantType.SPIKEROCK):
+        return ps.spike_family_subsystem.update
+    elif p.type == PlantType.SQUASH:
+        return ps.squash_subsystem.update
+    elif p.type == PlantType.CHOMPER:
+        return ps.chomper_subsystem.update
+    elif p.type == PlantType.POTATO_MINE:
+        return ps.potato_mine_subsystem.update
+    elif p.type == PlantType.TANGLE_KELP:
+        return ps.tangle_kelp_subsystem.update
+    elif p.type in (PlantType.DOOMSHROOM, PlantType.SUNSHROOM, PlantType.ICESHROOM, PlantType.MAGNETSHROOM,
+                    PlantType.SCAREDYSHROOM):
+        return ps.mushroom_family_subsystem.update
+    elif p.type in (PlantType.WALLNUT, PlantType.TALLNUT, PlantType.PUMPKIN, PlantType.GARLIC):
+        return ps.shield_plants_subsystem.update
+    elif p.type == PlantType.STARFRUIT:
+        return ps.starfruit_subsystem.update
+    elif p.type == PlantType.TORCHWOOD:
+        return ps.torchwood_subsystem.update
+    elif p.type == PlantType.UMBRELLA_LEAF:
+        return ps.umbrella_leaf_subsystem.update
+    elif p.type == PlantType.CACTUS:
+        return ps.cactus_subsystem.update
+    elif p.type == PlantType.IMITATER:
+        return ps.imitater_subsystem.update
+    elif p.type == PlantType.FUMESHROOM:
+        return ps.fume_shroom_subsystem.update
+    return None
+
+
+def table_lookup(ps: PlantSystem, p: Plant):
+    return ps.records[p.type].update
+
+
+def make_world() -> World:
+    world = World(SceneType.POOL)
+    world.seed(0)
+    world.scene.stop_spawn = True
+    for t in PlantType:
+        if PlantType.PEA_SHOOTER <= t <= PlantType.IMITATER:
+            world.plant_factory.create(t, t % 6, t % 9)
+    return world
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rounds', type=int, default=20000)
+    args = parser.parse_args()
+
+    world = make_world()
+    ps = world.plant_system
+    plants = list(world.scene.plants)
+    for p in plants:
+        assert chain_lookup(ps, p) == table_lookup(ps, p)
+
+    for name, lookup in (('chain', chain_lookup), ('table', table_lookup)):
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for p in plants:
+                lookup(ps, p)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>6} {elapsed / (args.rounds * len(plants)) * 1e9:>8.1f}ns/plant")
+
+    frames = 300
+    start = time.perf_counter()
+    for _ in range(frames):
+        ps.update()
+    elapsed = time.perf_counter() - start
+    print(f"{'update':>6} {elapsed / frames * 1e6:>8.1f}us/frame ({len(world.scene.plants)} plants)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+子弹对象池基准：满场机枪射手对持续出怪，分别在默认模式与 pooled_projectiles 模式下运行，
+比较新建的 Projectile 数、各代 GC 次数与耗时。
+
+    python -m pvzemu2.bench.projectile_pool [--frames N] [--repeat N]
+"""
+import argparse
+import gc
+import time
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.objects import projectile as projectile_module
+from pvzemu2.world import World
+
+
+def _build(pooled: bool) -> World:
+    world = World(SceneType.DAY, pooled_projectiles=pooled)
+    world.seed(0)
+    world.scene.stop_spawn = True
+    for row in range(5):
+        for col in range(6):
+            world.plant(PlantType.REPEATER, row, col)
+            world.plant(PlantType.GATLING_PEA, row, col)
+        world.plant(PlantType.TALLNUT, row, 8)
+    return world
+
+
+def _run(pooled: bool, frames: int) -> tuple[float, int, list[int]]:
+    """返回 (耗时, 构造的 Projectile 数, 各代 GC 次数)"""
+    world = _build(pooled)
+    constructed = 0
+    init = projectile_module.Projectile.__init__
+
+    def counting_init(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        nonlocal constructed
+        constructed += 1
+        init(self, *args, **kwargs)
+
+    gc.collect()
+    before = [s['collections'] for s in gc.get_stats()]
+    projectile_module.Projectile.__init__ = counting_init  # type: ignore[method-assign]
+    try:
+        start = time.perf_counter()
+        for frame in range(frames):
+            if frame % 25 == 0:
+                world.spawn(ZombieType.BUCKET_HEAD, frame // 25 % 5, x=700.0)
+            world.update()
+        elapsed = time.perf_counter() - start
+    finally:
+        projectile_module.Projectile.__init__ = init  # type: ignore[method-assign]
+    after = [s['collections'] for s in gc.get_stats()]
+    return elapsed, constructed, [b - a for a, b in zip(before, after)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=3000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for pooled in (False, True):
+        runs = [_run(pooled, args.frames) for _ in range(args.repeat)]
+        elapsed, constructed, collections = min(runs, key=lambda r: r[0])
+        label = 'pooled' if pooled else 'default'
+        print(f"{label:>8}: {elapsed * 1e3 / args.frames:.3f}ms/frame, "
+              f"{constructed} Projectile constructed, gc collections (gen0/1/2) {collections}")
+
+
+if __name__ == '__main__':
+    main()
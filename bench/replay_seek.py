@@ -0,0 +1,66 @@
+"""
+回放跳转基准：录制一局 (定期种植与出怪)，之后随机跳转到若干帧，
+对比 Replay.seek 与从第 0 帧重新模拟到目标帧的耗时。
+
+    python -m pvzemu2.bench.replay_seek [--frames N] [--interval K] [--seeks N]
+"""
+import argparse
+import dataclasses
+import random
+import time
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.replay import Recorder, Replay
+from pvzemu2.world import World
+
+
+def _record(frames: int, interval: int) -> Recorder:
+    rec = Recorder(World(SceneType.DAY), checkpoint_interval=interval, seed=0)
+    rec.world.scene.stop_spawn = True
+    for row in range(5):
+        rec.plant(PlantType.SUNFLOWER, row, 0)
+        rec.plant(PlantType.REPEATER, row, 1)
+        rec.plant(PlantType.WALLNUT, row, 6)
+    while rec.frame < frames:
+        if rec.frame % 300 == 0:
+            rec.spawn(ZombieType.CONE_HEAD, rec.frame // 300 % 5)
+        rec.step(100)
+    return rec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=48000)
+    parser.add_argument('--interval', type=int, default=100)
+    parser.add_argument('--seeks', type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rec = _record(args.frames, args.interval)
+    elapsed = time.perf_counter() - start
+    size = sum(len(data) for _, data in rec.log.checkpoints)
+    print(f"record {rec.frame} frames: {elapsed:.2f}s, "
+          f"{len(rec.log.checkpoints)} checkpoints ({size / 1024:.0f} KiB)")
+
+    rng = random.Random(0)
+    targets = [rng.randrange(rec.frame + 1) for _ in range(args.seeks)]
+    replay = Replay(rec.log)
+    start = time.perf_counter()
+    for f in targets:
+        replay.seek(f)
+    per_seek = (time.perf_counter() - start) / len(targets)
+    print(f"seek: {per_seek * 1e3:.1f}ms per seek")
+
+    # 只保留第 0 帧检查点，即从头重新模拟；代价高，只取前两个目标
+    log = dataclasses.replace(rec.log, checkpoint_frames=rec.log.checkpoint_frames[:1],
+                              checkpoints=rec.log.checkpoints[:1])
+    rerun = targets[:2]
+    start = time.perf_counter()
+    for f in rerun:
+        Replay(log).seek(f)
+    per_rerun = (time.perf_counter() - start) / len(rerun)
+    print(f"rerun from frame 0: {per_rerun * 1e3:.1f}ms per seek")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+高频增删基准：ObjList 与 SlotMap 在大量对象反复创建、销毁、按 id 查找与遍历下的耗时。
+
+每轮移除 churn 个随机对象、加入同样多的新对象，按 id 查找 lookups 次 (模拟 master_id / target 等交叉引用)，
+再完整遍历一次 (模拟每帧的系统更新)；SlotMap 另测带代数校验的句柄解析。
+
+    python -m pvzemu2.bench.slot_map [--live N] [--churn N] [--lookups N] [--rounds N]
+"""
+import argparse
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from pvzemu2.obj_list import ObjList
+from pvzemu2.slot_map import SlotMap
+
+
+@dataclass(slots=True, eq=False)
+class _Entity:
+    hp: int = 270
+    id: int = -1
+
+
+def _run(make: Callable[[], Any], live: int, churn: int, lookups: int, rounds: int, seed: int = 0) -> float:
+    rng = random.Random(seed)
+    objs = make()
+    ids = [objs.add(_Entity()) for _ in range(live)]
+    plan = [([rng.randrange(live) for _ in range(churn)], [rng.randrange(live) for _ in range(lookups)])
+            for _ in range(rounds)]
+
+    start = time.perf_counter()
+    for victims, probes in plan:
+        for k in victims:
+            objs.remove(ids[k])
+            ids[k] = objs.add(_Entity())
+        get = objs.get
+        for k in probes:
+            get(ids[k])
+        with objs.scan() as it:
+            for e in it:
+                e.hp -= 1
+    return time.perf_counter() - start
+
+
+def _run_handles(live: int, lookups: int, rounds: int) -> float:
+    objs: SlotMap[_Entity] = SlotMap()
+    handles = [objs.handle(objs.add(_Entity())) for _ in range(live)]
+    probes = [handles[i % live] for i in range(lookups)]
+    resolve = objs.resolve
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for h in probes:
+            resolve(h)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--live', type=int, default=2000)
+    parser.add_argument('--churn', type=int, default=200)
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=300)
+    args = parser.parse_args()
+
+    for name, make in (('ObjList', lambda: ObjList(use_recycle=True)), ('SlotMap', SlotMap)):
+        best = min(_run(make, args.live, args.churn, args.lookups, args.rounds) for _ in range(3))
+        print(f"{name:>8}: {best * 1e6 / args.rounds:.1f}us per round "
+              f"({args.churn} remove+add, {args.lookups} get, 1 scan over {args.live})")
+
+    best = min(_run_handles(args.live, args.lookups, args.rounds) for _ in range(3))
+    print(f"SlotMap.resolve: {best * 1e9 / (args.rounds * args.lookups):.0f}ns per handle")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+状态判定微基准：对一批随机状态的僵尸调用 is_not_movable / can_be_freezed / has_death_status，
+对比逐项比较的写法 (chain) 与 status_flags 位掩码表 (table)。
+
+    python -m pvzemu2.bench.status_predicates [--zombies N] [--rounds N]
+"""
+import argparse
+import functools
+import random
+import time
+
+from pvzemu2.enums import SceneType, ZombieType, ZombieStatus as S, ZombieAction as A
+from pvzemu2.objects.zombie import Zombie
+from pvzemu2.systems.util import is_not_movable
+from pvzemu2.world import World
+
+
+def _chain_is_not_movable(z) -> bool:
+    # 改写前 util.is_not_movable 的第一段
+    return (z.is_eating or z.countdown.freeze > 0 or z.countdown.butter > 0 or
+            z.status == S.JACKBOX_POP or z.status == S.NEWSPAPER_DESTROYED or
+            z.status == S.GARGANTUAR_THROW or z.status == S.GARGANTUAR_SMASH or
+            z.status == S.CATAPULT_SHOOT or z.status == S.CATAPULT_IDLE or
+            z.status == S.DIGGER_DRILL or z.status == S.DIGGER_LOST_DIG or
+            z.status == S.DIGGER_LANDING or z.status == S.DIGGER_DIZZY or
+            z.status == S.DANCING_POINT or z.status == S.DANCING_WAIT_SUMMONING or
+            z.status == S.DANCING_SUMMONING or z.status == S.DANCING_DANCER_SPAWNING or
+            z.status == S.IMP_FLYING or z.status == S.IMP_LANDING or
+            z.status == S.LADDER_PLACING or z.action == A.FALL_FROM_SKY or
+            z.status == S.DANCING_ARMRISE1 or z.status == S.DANCING_ARMRISE2 or
+            z.status == S.DANCING_ARMRISE3 or z.status == S.DANCING_ARMRISE4 or
+            z.status == S.DANCING_ARMRISE5 or z.type == ZombieType.BUNGEE)
+
+
+def _chain_can_be_freezed(z) -> bool:
+    if z.type == ZombieType.ZOMBONI or z.is_dead:
+        return False
+    if z.status in (S.DYING, S.DYING_FROM_INSTANT_KILL, S.DYING_FROM_LAWNMOWER) or \
+            z.status in (S.DIGGER_DIG, S.DIGGER_DRILL, S.DIGGER_LOST_DIG, S.DIGGER_LANDING,
+                         S.RISING_FROM_GROUND, S.DANCING_DANCER_SPAWNING) or z.is_hypno:
+        return False
+    return (z.status not in (S.POLE_VALUTING_JUMPING, S.DOLPHIN_JUMP_IN_POOL, S.DOLPHIN_IN_JUMP,
+                             S.SNORKEL_JUMP_IN_THE_POOL, S.IMP_FLYING, S.IMP_LANDING) and
+            z.status not in (S.BALLOON_FLYING, S.BALLOON_FALLING) and
+            int(z.status) != 19 and
+            not (S.POGO_WITH_STICK <= z.status <= S.POGO_JUMP_ACROSS) and
+            (z.type != ZombieType.BUNGEE or z.status == S.BUNGEE_IDLE_AFTER_DROP))
+
+
+def _chain_has_death_status(z) -> bool:
+    return z.status in (S.DYING, S.DYING_FROM_INSTANT_KILL, S.DYING_FROM_LAWNMOWER)
+
+
+def _per_call(fn, zombies: list, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for z in zombies:
+            fn(z)
+    return (time.perf_counter() - start) / (rounds * len(zombies)) * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--zombies', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=500)
+    args = parser.parse_args()
+
+    world = World(SceneType.DAY)
+    world.scene.stop_spawn = True
+    rng = random.Random(0)
+    statuses = list(S)
+    types = [t for t in ZombieType if t not in (ZombieType.NONE, ZombieType.DANCING, ZombieType.BACKUP_DANCER)]
+    zombies = []
+    for i in range(args.zombies):
+        z = world.spawn(ZombieType.ZOMBIE, i % 5, x=700.0)
+        z.status = rng.choice(statuses)
+        z.type = rng.choice(types)
+        zombies.append(z)
+
+    cases = (
+        ('is_not_movable', _chain_is_not_movable, functools.partial(is_not_movable, world.scene)),
+        ('can_be_freezed', _chain_can_be_freezed, Zombie.can_be_freezed),
+        ('has_death_status', _chain_has_death_status, Zombie.has_death_status),
+    )
+    for name, chain, table in cases:
+        t_chain = _per_call(chain, zombies, args.rounds)
+        t_table = _per_call(table, zombies, args.rounds)
+        print(f"{name:>18} chain {t_chain:>7.1f}ns  table {t_table:>7.1f}ns  x{t_chain / t_table:.2f}")
+
+
+if __name__ == '__main__':
+    main()
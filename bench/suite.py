@@ -0,0 +1,346 @@
+"""
+场景基准套件：在一组固定场景上测量 World.update 的吞吐，输出 JSON 并与基线比较。
+
+每个场景报告
+- fps: 每秒模拟帧数 (取 --repeat 次中最快的一次)
+- us_per_entity_update: 每次实体更新的平均耗时，实体更新数为每帧开始时植物、僵尸、子弹、场地物品数之和
+- peak_kib: tracemalloc 记录的峰值内存 (单独一轮，不计入计时)
+
+与基线 (默认为本目录下的 baseline.json) 比较时，fps 低于基线 (1 - tolerance) 倍、
+或峰值内存高于基线 (1 + mem_tolerance) 倍的场景视为退化，进程以状态码 1 退出。
+
+fps 与机器速度有关：每次运行先测量一段固定的纯 Python 标定负载 (calibration，每秒轮数)，
+比较前把基线 fps 按两次标定值之比换算到本机，基线因而可以在不同机器之间沿用。
+Python 实现、主次版本或机器架构与基线不同时不比较 fps，帧数与基线不同的场景整体跳过，均只给出提示。
+
+    python -m pvzemu2.bench.suite [--only NAME ...] [--frames N] [--repeat N] [--json PATH]
+                                  [--baseline PATH] [--update-baseline] [--no-compare] [--profile]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType, GridItemType, PlantStatus
+from pvzemu2.world import World
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+Script = Callable[[World, int], None]
+
+
+@dataclass(slots=True)
+class Scenario:
+    name: str
+    description: str
+    frames: int
+    build: Callable[[], World]
+    # 每帧开始前调用 script(world, frame)，用于按时出怪、发射玉米加农炮等
+    script: Optional[Script] = None
+
+
+def _world(scene_type: SceneType, stop_spawn: bool = True) -> World:
+    world = World(scene_type)
+    world.seed(0)
+    world.scene.stop_spawn = stop_spawn
+    return world
+
+
+def _plant(world: World, plant_type: PlantType, row: int, col: int, base: Optional[PlantType] = None) -> None:
+    """种植 plant_type；base 为其前置植物 (升级植物、睡莲)"""
+    if base is not None:
+        world.plant(base, row, col)
+    world.plant(plant_type, row, col)
+
+
+def _spawner(every: int, kinds: tuple[ZombieType, ...], rows: tuple[int, ...], x: float = 800.0) -> Script:
+    def script(world: World, frame: int) -> None:
+        if frame % every == 0:
+            wave = frame // every
+            for i, row in enumerate(rows):
+                world.spawn(kinds[(wave + i) % len(kinds)], row, x)
+    return script
+
+
+# ---- 场景 ----
+
+def _build_empty() -> World:
+    return _world(SceneType.DAY)
+
+
+def _build_day_lane() -> World:
+    world = _world(SceneType.DAY)
+    world.plant(PlantType.PEA_SHOOTER, 2, 0)
+    return world
+
+
+def _build_pool_heavy() -> World:
+    world = _world(SceneType.POOL)
+    for row in range(6):
+        water = row in (2, 3)
+        lily = PlantType.LILY_PAD if water else None
+        _plant(world, PlantType.SEASHROOM if water else PlantType.SUNFLOWER, row, 0)
+        _plant(world, PlantType.SNOW_PEA, row, 1, lily)
+        if water:
+            world.plant(PlantType.LILY_PAD, row, 2)
+        _plant(world, PlantType.GATLING_PEA, row, 2, PlantType.REPEATER)
+        _plant(world, PlantType.SPLIT_PEA, row, 3, lily)
+        _plant(world, PlantType.THREEPEATER, row, 4, lily)
+        _plant(world, PlantType.TALLNUT, row, 6, lily)
+    return world
+
+
+_POOL_KINDS = (ZombieType.ZOMBIE, ZombieType.CONE_HEAD, ZombieType.BUCKET_HEAD, ZombieType.FOOTBALL,
+               ZombieType.NEWSPAPER, ZombieType.POLE_VAULTING)
+
+_MIXED_KINDS = (ZombieType.ZOMBIE, ZombieType.CONE_HEAD, ZombieType.BUCKET_HEAD, ZombieType.FOOTBALL,
+                ZombieType.NEWSPAPER, ZombieType.SCREEN_DOOR, ZombieType.POLE_VAULTING, ZombieType.DANCING)
+
+
+def _build_mixed_500() -> World:
+    world = _world(SceneType.DAY)
+    for row in range(5):
+        for col in range(4):
+            _plant(world, PlantType.GATLING_PEA, row, col, PlantType.REPEATER)
+        for col in (4, 5):
+            _plant(world, PlantType.WINTER_MELON, row, col, PlantType.MELONPULT)
+    for i in range(500):
+        world.spawn(_MIXED_KINDS[i % len(_MIXED_KINDS)], i % 5, x=700.0 + (i // 5) % 20 * 5)
+    return world
+
+
+def _build_starfruit_cob() -> World:
+    world = _world(SceneType.DAY)
+    for row in range(5):
+        world.plant(PlantType.KERNELPULT, row, 0)
+        world.plant(PlantType.KERNELPULT, row, 1)
+        world.plant(PlantType.COB_CANNON, row, 0)
+        for col in range(2, 7):
+            world.plant(PlantType.STARFRUIT, row, col)
+    return world
+
+
+def _cob_script(world: World, frame: int) -> None:
+    _spawner(60, _POOL_KINDS, (0, 1, 2, 3, 4))(world, frame)
+    if frame % 50 == 0:
+        cob = world.plant_system.cob_cannon_subsystem
+        for p in world.scene.plants:
+            if p.type == PlantType.COB_CANNON and p.status == PlantStatus.COB_CANNON_ARMED_IDLE:
+                cob.launch(p, 700, 80 + 100 * p.row)
+
+
+def _build_night_graves() -> World:
+    world = _world(SceneType.NIGHT, stop_spawn=False)
+    for row in range(5):
+        world.plant(PlantType.SUNSHROOM, row, 0)
+        world.plant(PlantType.FUMESHROOM, row, 1)
+        world.plant(PlantType.PUFFSHROOM, row, 2)
+        world.griditem_factory.create(GridItemType.GRAVE, row, 5 + row % 3)
+    world.plant(PlantType.GRAVE_BUSTER, 0, 5)
+    return world
+
+
+SCENARIOS = (
+    Scenario('empty', "空白白天场景", 20000, _build_empty),
+    Scenario('day_lane', "白天单行：豌豆射手对普通僵尸", 6000, _build_day_lane,
+             _spawner(300, (ZombieType.ZOMBIE,), (2,))),
+    Scenario('pool_heavy', "泳池满场，每 80 帧一批 6 只僵尸", 3000, _build_pool_heavy,
+             _spawner(80, _POOL_KINDS, (0, 1, 2, 3, 4, 5))),
+    Scenario('mixed_500', "500 只混合僵尸对机枪射手与冰西瓜", 300, _build_mixed_500),
+    Scenario('starfruit_cob', "杨桃与玉米加农炮满场", 3000, _build_starfruit_cob, _cob_script),
+    Scenario('night_graves', "黑夜蘑菇阵与墓碑，自然出怪", 4000, _build_night_graves),
+)
+
+
+# ---- 运行 ----
+
+def _run_once(scenario: Scenario, frames: int, profile: bool) -> tuple[float, int, Optional[dict[str, Any]]]:
+    world = scenario.build()
+    prof = world.enable_profiling() if profile else None
+    scene = world.scene
+    script = scenario.script
+    entity_updates = 0
+    start = time.perf_counter()
+    for frame in range(frames):
+        if script is not None:
+            script(world, frame)
+        entity_updates += len(scene.plants) + len(scene.zombies) + len(scene.projectiles) + len(scene.grid_items)
+        world.update()
+    return time.perf_counter() - start, entity_updates, prof.to_dict() if prof is not None else None
+
+
+def _peak_memory(scenario: Scenario, frames: int) -> int:
+    tracemalloc.start()
+    try:
+        world = scenario.build()
+        script = scenario.script
+        for frame in range(frames):
+            if script is not None:
+                script(world, frame)
+            world.update()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(scenario: Scenario, frames: Optional[int] = None, repeat: int = 3,
+                 memory: bool = True, profile: bool = False) -> dict[str, Any]:
+    frames = frames or scenario.frames
+    best, entity_updates, prof = min((_run_once(scenario, frames, profile) for _ in range(max(1, repeat))),
+                                     key=lambda run: run[0])
+    result: dict[str, Any] = {
+        'frames': frames,
+        'seconds': best,
+        'fps': frames / best,
+        'entity_updates': entity_updates,
+        'us_per_entity_update': best / entity_updates * 1e6 if entity_updates else None,
+    }
+    if memory:
+        result['peak_kib'] = _peak_memory(scenario, frames) / 1024
+    if prof is not None:
+        result['profile'] = prof
+    return result
+
+
+class _CalibrationObject:
+    __slots__ = ('x', 'dx')
+
+    def __init__(self, x: float, dx: float) -> None:
+        self.x = x
+        self.dx = dx
+
+
+def _calibration_load(rounds: int) -> int:
+    # 与模拟器热路径相近的操作：slots 属性读写、浮点运算、dict 查找
+    objs = [_CalibrationObject(float(i * 12), 0.25 + i % 4 * 0.1) for i in range(64)]
+    table = {i: i * 3 for i in range(64)}
+    total = 0
+    for r in range(rounds):
+        o = objs[r & 63]
+        o.x -= o.dx
+        if o.x < 0.0:
+            o.x += 800.0
+        total += table[r & 63] + int(o.x)
+    return total
+
+
+def calibrate(rounds: int = 200000, repeat: int = 5) -> float:
+    """标定负载每秒执行的轮数 (取最快的一次)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_load(rounds)
+        best = min(best, time.perf_counter() - start)
+    return rounds / best
+
+
+def _fps_skip_reason(results: dict[str, Any], baseline: dict[str, Any]) -> Optional[str]:
+    """不能比较 fps 的原因，可以比较时为 None"""
+    for key in ('implementation', 'machine'):
+        if results.get(key) != baseline.get(key):
+            return f"{key} {results.get(key)} != baseline {baseline.get(key)}"
+    py, base_py = (str(d.get('python', '')).split('.')[:2] for d in (results, baseline))
+    if py != base_py:
+        return f"python {results.get('python')} != baseline {baseline.get('python')}"
+    if not results.get('calibration') or not baseline.get('calibration'):
+        return "no calibration in results or baseline"
+    return None
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float,
+            mem_tolerance: float) -> tuple[list[str], list[str]]:
+    """
+    返回 (退化描述列表, 跳过说明列表)。基线中没有的场景不比较；
+    fps 按标定值之比换算后比较，见模块说明。
+    """
+    regressions: list[str] = []
+    skipped: list[str] = []
+    fps_skip = _fps_skip_reason(results, baseline)
+    if fps_skip is not None:
+        skipped.append(f"fps not compared: {fps_skip}")
+        scale = 0.0
+    else:
+        scale = results['calibration'] / baseline['calibration']
+
+    for name, r in results['scenarios'].items():
+        b = baseline.get('scenarios', {}).get(name)
+        if b is None:
+            continue
+        if r['frames'] != b['frames']:
+            skipped.append(f"{name}: {r['frames']} frames != baseline {b['frames']}")
+            continue
+        expected = b['fps'] * scale
+        if fps_skip is None and r['fps'] < expected * (1 - tolerance):
+            regressions.append(f"{name}: fps {r['fps']:.0f} < baseline {expected:.0f} on this machine "
+                               f"(-{1 - r['fps'] / expected:.0%})")
+        if r.get('peak_kib') is not None and b.get('peak_kib') is not None and \
+                r['peak_kib'] > b['peak_kib'] * (1 + mem_tolerance):
+            regressions.append(f"{name}: peak {r['peak_kib']:.0f}KiB > baseline {b['peak_kib']:.0f}KiB")
+    return regressions, skipped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--only', nargs='+', choices=[s.name for s in SCENARIOS], help="只运行指定场景")
+    parser.add_argument('--frames', type=int, help="覆盖各场景的默认帧数")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help="把结果写入该文件 ('-' 为标准输出)")
+    parser.add_argument('--baseline', default=BASELINE_PATH)
+    parser.add_argument('--update-baseline', action='store_true', help="用本次结果覆盖基线")
+    parser.add_argument('--no-compare', action='store_true')
+    parser.add_argument('--no-memory', action='store_true', help="跳过峰值内存测量")
+    parser.add_argument('--profile', action='store_true', help="附带各阶段计时 (会略微降低 fps)")
+    parser.add_argument('--tolerance', type=float, default=0.15)
+    parser.add_argument('--mem-tolerance', type=float, default=0.25)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'calibration': calibrate(),
+        'scenarios': {},
+    }
+    for scenario in SCENARIOS:
+        if args.only and scenario.name not in args.only:
+            continue
+        r = run_scenario(scenario, args.frames, args.repeat, not args.no_memory, args.profile)
+        results['scenarios'][scenario.name] = r
+        us = r['us_per_entity_update']
+        peak = f"{r['peak_kib']:>9.0f}KiB" if 'peak_kib' in r else ''
+        print(f"{scenario.name:>14} {r['fps']:>9.0f} fps {(us or 0.0):>7.2f}us/entity {peak}", file=sys.stderr)
+
+    if args.json:
+        text = json.dumps(results, indent=2)
+        if args.json == '-':
+            print(text)
+        else:
+            with open(args.json, 'w') as f:
+                f.write(text + '\n')
+
+    if args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            f.write(json.dumps(results, indent=2) + '\n')
+        print(f"baseline written to {args.baseline}", file=sys.stderr)
+        return
+
+    if args.no_compare or not os.path.exists(args.baseline):
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions, skipped = compare(results, baseline, args.tolerance, args.mem_tolerance)
+    for line in skipped:
+        print(f"SKIP {line}", file=sys.stderr)
+    for line in regressions:
+        print(f"REGRESSION {line}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
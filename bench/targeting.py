@@ -0,0 +1,47 @@
+"""
+索敌基准：整行射手 + 每行大量僵尸 (后期波次) 时 World.update 的单帧耗时。
+植物与子弹的索敌都是 zombies_by_row 上的区间查询 (见 zombie_index.py)。
+
+    python -m pvzemu2.bench.targeting [--frames N]
+"""
+import argparse
+import time
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.world import World
+
+ZOMBIES_PER_ROW = (1, 5, 10, 20, 30, 40)
+
+
+def make_world(zombies_per_row: int) -> World:
+    world = World(SceneType.DAY)
+    world.seed(0)
+    world.scene.stop_spawn = True
+    for row in range(world.scene.rows):
+        for col in range(6):
+            world.plant(PlantType.REPEATER if col % 2 else PlantType.SNOW_PEA, row, col)
+        world.plant(PlantType.TALLNUT, row, 7)
+        for i in range(zombies_per_row):
+            # 不会被打死的铁桶僵尸挤在墙前，保持每行的僵尸数量
+            z = world.spawn(ZombieType.BUCKET_HEAD, row, x=640.0 + 4 * i)
+            z.accessory_1_hp = z.hp = 10 ** 9
+    world.step(30)
+    return world
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--frames', type=int, default=300)
+    args = parser.parse_args()
+
+    print(f"{'zombies/row':>11} {'zombies':>7} {'frame':>10}")
+    for zpr in ZOMBIES_PER_ROW:
+        world = make_world(zpr)
+        start = time.perf_counter()
+        world.step(args.frames)
+        elapsed = time.perf_counter() - start
+        print(f"{zpr:>11} {len(world.scene.zombies):>7} {elapsed / args.frames * 1e6:>8.1f}us")
+
+
+if __name__ == '__main__':
+    main()
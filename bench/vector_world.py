@@ -0,0 +1,73 @@
+"""
+VectorWorld 基准：N 个白天场景 (每个场景一行豌豆射手对普通僵尸，其余行只有向日葵)，
+比较逐个调用 World.step (并编码观测，同 SubprocWorldPool 的 worker) 与 VectorWorld.step 的总帧率。
+
+    python -m pvzemu2.bench.vector_world [--envs N] [--steps N] [--frames-per-step N] [--repeat N]
+"""
+import argparse
+import time
+from array import array
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.parallel import SUMMARY_SIZE, encode_summary, _make_world
+from pvzemu2.vector_world import VectorWorld
+from pvzemu2.world import World
+
+
+def _setup(world: World, i: int) -> None:
+    world.scene.stop_spawn = True
+    for row in range(5):
+        world.plant(PlantType.SUNFLOWER, row, 0)
+    world.plant(PlantType.PEA_SHOOTER, i % 5, 1)
+
+
+def _spawn(world: World, step: int, i: int) -> None:
+    if step % 40 == 0:
+        world.spawn(ZombieType.ZOMBIE, i % 5, x=700.0)
+
+
+def _run_loop(n: int, steps: int, frames_per_step: int) -> float:
+    worlds = [_make_world(SceneType.DAY, 0, i, 0, n, False) for i in range(n)]
+    for i, w in enumerate(worlds):
+        _setup(w, i)
+    obs = memoryview(array('d', bytes(8 * n * SUMMARY_SIZE)))
+    rows = [obs[i * SUMMARY_SIZE:(i + 1) * SUMMARY_SIZE] for i in range(n)]
+    start = time.perf_counter()
+    for step in range(steps):
+        for i, w in enumerate(worlds):
+            _spawn(w, step, i)
+            w.step(frames_per_step)
+            encode_summary(w, rows[i])
+    return time.perf_counter() - start
+
+
+def _run_vector(n: int, steps: int, frames_per_step: int) -> float:
+    vw = VectorWorld(n, SceneType.DAY, seed=0, frames_per_step=frames_per_step)
+    for i, w in enumerate(vw):
+        _setup(w, i)
+    start = time.perf_counter()
+    for step in range(steps):
+        for i, w in enumerate(vw):
+            _spawn(w, step, i)
+        vw.step()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--envs', type=int, default=32)
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--frames-per-step', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for fps_step in args.frames_per_step:
+        frames = args.envs * args.steps * fps_step
+        loop = min(_run_loop(args.envs, args.steps, fps_step) for _ in range(args.repeat))
+        vector = min(_run_vector(args.envs, args.steps, fps_step) for _ in range(args.repeat))
+        print(f"frames/step={fps_step:>3}: World.step loop {frames / loop:>8.0f} fps, "
+              f"VectorWorld {frames / vector:>8.0f} fps ({loop / vector:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
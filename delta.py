@@ -0,0 +1,123 @@
+"""
+增量观测：World.get_delta(since_token) 只返回自某次调用以来发生变化的实体与字段。
+
+- 不在每帧记录变更，而是在调用 get_delta 时把各实体的定长记录值 (见 scene_codec) 与
+  基线逐一比较，因此从不调用 get_delta 的 World 没有任何额外开销。
+- 每次调用都会以当前状态生成新的基线并返回其 token，最多保留 max_baselines 个基线；
+  since_token 为 None、未知或已被淘汰时返回全量 (full=True)。
+- 实体以对象身份区分：id 被 ObjList 回收复用时，旧实体出现在 removed 中，新实体出现在 created 中。
+
+增量格式：
+    {
+        'token': int, 'since': int | None, 'full': bool,
+        'scene': {字段: 值, ...},                     # 变化的场景标量 (阳光、波数等)
+        'plants': {
+            'created': {id: {字段: 值, ...}},
+            'removed': [id, ...],
+            'modified': {id: {字段: 值, ...}},        # 只包含变化的字段
+        },
+        'zombies': ..., 'projectiles': ..., 'grid_items': ...,
+    }
+字段名与值即 scene_codec 中定长记录的 names / values，枚举为整数。
+"""
+from typing import Any, Optional
+
+from pvzemu2.scene import Scene
+from pvzemu2.scene_codec import PLANT_RECORD, ZOMBIE_RECORD, PROJECTILE_RECORD, GRID_ITEM_RECORD, SCENE_RECORD
+
+ENTITY_KINDS = ('plants', 'zombies', 'projectiles', 'grid_items')
+
+_KIND_RECORDS = (
+    ('plants', PLANT_RECORD),
+    ('zombies', ZOMBIE_RECORD),
+    ('projectiles', PROJECTILE_RECORD),
+    ('grid_items', GRID_ITEM_RECORD),
+)
+
+# 基线：每类实体 id -> (对象, 记录值)，以及场景标量的记录值
+_Baseline = tuple[dict[str, dict[int, tuple[Any, tuple[Any, ...]]]], tuple[Any, ...]]
+
+
+def _changed_fields(names: tuple[str, ...], old: tuple[Any, ...], new: tuple[Any, ...]) -> dict[str, Any]:
+    return {name: b for name, a, b in zip(names, old, new) if a != b}
+
+
+class DeltaTracker:
+    """保存 get_delta 基线并计算增量，由 World 在首次调用 get_delta 时创建。"""
+    __slots__ = ('max_baselines', '_baselines', '_next_token')
+
+    def __init__(self, max_baselines: int = 8) -> None:
+        self.max_baselines = max_baselines
+        self._baselines: dict[int, _Baseline] = {}
+        self._next_token = 0
+
+    def get_delta(self, scene: Scene, since_token: Optional[int] = None) -> dict[str, Any]:
+        base = self._baselines.get(since_token) if since_token is not None else None
+        full = base is None
+
+        entities: dict[str, dict[int, tuple[Any, tuple[Any, ...]]]] = {}
+        delta: dict[str, Any] = {'token': self._next_token, 'since': None if full else since_token, 'full': full}
+
+        scene_values = SCENE_RECORD.values(scene)
+        if full:
+            delta['scene'] = dict(zip(SCENE_RECORD.names, scene_values))
+        else:
+            delta['scene'] = _changed_fields(SCENE_RECORD.names, base[1], scene_values)
+
+        for kind, record in _KIND_RECORDS:
+            names = record.names
+            values = record.values
+            current = entities[kind] = {obj.id: (obj, values(obj)) for obj in getattr(scene, kind)}
+            created: dict[int, dict[str, Any]] = {}
+            removed: list[int] = []
+            modified: dict[int, dict[str, Any]] = {}
+
+            if full:
+                for obj_id, (_, vals) in current.items():
+                    created[obj_id] = dict(zip(names, vals))
+            else:
+                previous = base[0][kind]
+                for obj_id, (obj, vals) in current.items():
+                    prev = previous.get(obj_id)
+                    if prev is None or prev[0] is not obj:
+                        created[obj_id] = dict(zip(names, vals))
+                    elif prev[1] != vals:
+                        modified[obj_id] = _changed_fields(names, prev[1], vals)
+                for obj_id, (obj, _) in previous.items():
+                    cur = current.get(obj_id)
+                    if cur is None or cur[0] is not obj:
+                        removed.append(obj_id)
+
+            delta[kind] = {'created': created, 'removed': removed, 'modified': modified}
+
+        self._baselines[self._next_token] = (entities, scene_values)
+        self._next_token += 1
+        while len(self._baselines) > self.max_baselines:
+            del self._baselines[next(iter(self._baselines))]
+        return delta
+
+
+def apply_delta(state: Optional[dict[str, Any]], delta: dict[str, Any]) -> dict[str, Any]:
+    """
+    消费端：把增量合并进 state 并返回。state 为 None 或 delta 为全量时重新开始。
+    state 形如 {'token': int, 'scene': {字段: 值}, 'plants': {id: {字段: 值}}, ...}。
+    """
+    if state is None or delta['full']:
+        state = {'token': None, 'scene': {}}
+        for kind in ENTITY_KINDS:
+            state[kind] = {}
+    elif delta['since'] != state['token']:
+        raise ValueError(f"delta since token {delta['since']} does not follow state token {state['token']}")
+
+    state['token'] = delta['token']
+    state['scene'].update(delta['scene'])
+    for kind in ENTITY_KINDS:
+        entities = state[kind]
+        d = delta[kind]
+        for obj_id in d['removed']:
+            entities.pop(obj_id, None)
+        for obj_id, fields in d['created'].items():
+            entities[obj_id] = dict(fields)
+        for obj_id, fields in d['modified'].items():
+            entities[obj_id].update(fields)
+    return state
@@ -0,0 +1,166 @@
+"""
+碰撞检测用的几何内核，对应 C++ rect。
+
+- Rect: 矩形 (slots dataclass)，get_overlap_len / is_overlap_with_circle 为原版判定
+- FrozenRect: 不可修改的 Rect，用于会被缓存、共享的矩形 (如僵尸的判定框)
+- overlap_len / circle_overlaps: 同样的判定，直接接受整数参数，热路径上的调用方不必构造 Rect
+- RectArray: 以并行 array('q') 存放的一组矩形，一次判定一个区间 (或圆) 与其中的全部矩形
+"""
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+
+def overlap_len(x0: int, w0: int, x1: int, w1: int) -> int:
+    """
+    横向区间 [x0, x0 + w0) 与 [x1, x1 + w1) 的重叠长度，不相交时为负的间距。
+    即 Rect(x0, _, w0, _).get_overlap_len(Rect(x1, _, w1, _))。
+    """
+    if x0 < x1:
+        xmax = x0 + w0
+        rmin = x1
+        rmax = x1 + w1
+    else:
+        xmax = x1 + w1
+        rmin = x0
+        rmax = x0 + w0
+    if xmax <= rmin:
+        return xmax - rmin
+    if rmax <= xmax:
+        return rmax - rmin
+    return xmax - rmin
+
+
+def circle_overlaps(x: int, y: int, width: int, height: int, cx: int, cy: int, r: int) -> bool:
+    """矩形 (x, y, width, height) 是否与圆心 (cx, cy)、半径 r 的圆相交 (含相切)。"""
+    if cx < x:
+        dx = x - cx
+    elif cx >= x + width:
+        dx = cx - x - width
+    else:
+        # 圆心横坐标落在矩形内
+        if cy < y:
+            return y - cy <= r
+        if cy >= y + height:
+            return cy - y - height <= r
+        return True
+
+    if cy < y:
+        dy = y - cy
+    elif cy >= y + height:
+        dy = cy - y - height
+    else:
+        return dx <= r
+    return dx * dx + dy * dy <= r * r
+
+
+@dataclass(slots=True)
+class Rect:
+    x: int = 0
+    y: int = 0
+    width: int = 0
+    height: int = 0
+
+    def get_overlap_len(self, r: 'Rect') -> int:
+        return overlap_len(self.x, self.width, r.x, r.width)
+
+    def is_overlap_with_circle(self, x: int, y: int, r: int) -> bool:
+        return circle_overlaps(self.x, self.y, self.width, self.height, x, y, r)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"x": self.x, "y": self.y, "width": self.width, "height": self.height}
+
+
+class FrozenRect(Rect):
+    """不可修改的 Rect：给字段赋值时抛出 AttributeError，需要修改时先用 Rect(...) 复制。"""
+    __slots__ = ()
+
+    def __init__(self, x: int = 0, y: int = 0, width: int = 0, height: int = 0) -> None:
+        set_field = object.__setattr__
+        set_field(self, 'x', x)
+        set_field(self, 'y', y)
+        set_field(self, 'width', width)
+        set_field(self, 'height', height)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"FrozenRect is read-only (field {name!r})")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"FrozenRect is read-only (field {name!r})")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rect):
+            return NotImplemented
+        return (self.x, self.y, self.width, self.height) == (other.x, other.y, other.width, other.height)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return FrozenRect, (self.x, self.y, self.width, self.height)
+
+
+class RectArray:
+    """一组矩形，x / y / width / height 为平行的 array('q')，下标即矩形编号。"""
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, rects: Iterable[Rect] = ()) -> None:
+        self.x = array('q')
+        self.y = array('q')
+        self.width = array('q')
+        self.height = array('q')
+        for r in rects:
+            self.append(r.x, r.y, r.width, r.height)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, i: int) -> Rect:
+        return Rect(self.x[i], self.y[i], self.width[i], self.height[i])
+
+    def append(self, x: int, y: int, width: int, height: int) -> None:
+        self.x.append(x)
+        self.y.append(y)
+        self.width.append(width)
+        self.height.append(height)
+
+    def clear(self) -> None:
+        del self.x[:], self.y[:], self.width[:], self.height[:]
+
+    def overlap_lens(self, x: int, width: int) -> list[int]:
+        """区间 [x, x + width) 与每个矩形的 overlap_len。"""
+        out = []
+        for rx, rw in zip(self.x, self.width):
+            if x < rx:
+                xmax = x + width
+                rmin = rx
+                rmax = rx + rw
+            else:
+                xmax = rx + rw
+                rmin = x
+                rmax = x + width
+            if xmax <= rmin or rmax > xmax:
+                out.append(xmax - rmin)
+            else:
+                out.append(rmax - rmin)
+        return out
+
+    def overlapping(self, x: int, width: int, min_len: int = 0) -> list[int]:
+        """overlap_len >= min_len 的矩形下标 (升序)。"""
+        out = []
+        x_end = x + width
+        for i, (rx, rw) in enumerate(zip(self.x, self.width)):
+            if x < rx:
+                xmax = x_end
+                rmin = rx
+                rmax = rx + rw
+            else:
+                xmax = rx + rw
+                rmin = x
+                rmax = x_end
+            d = xmax - rmin if xmax <= rmin or rmax > xmax else rmax - rmin
+            if d >= min_len:
+                out.append(i)
+        return out
+
+    def circle_hits(self, cx: int, cy: int, r: int) -> list[int]:
+        """与圆相交的矩形下标 (升序)。"""
+        return [i for i, (x, y, w, h) in enumerate(zip(self.x, self.y, self.width, self.height))
+                if circle_overlaps(x, y, w, h, cx, cy, r)]
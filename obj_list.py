@@ -1,11 +1,35 @@
 from collections import deque
-from typing import TypeVar, Generic, Iterator, Optional, Any
+from typing import TypeVar, Generic, Iterator, Optional, Any, Callable
 
 T = TypeVar('T')
 
+# 墓碑占比超过一半 (且不少于该数量) 时压缩 _slots
+_COMPACT_MIN_HOLES = 32
+
+# 句柄 = (generation << _GEN_SHIFT) | id，SlotMap 使用相同的布局
+_GEN_SHIFT = 32
+_ID_MASK = (1 << _GEN_SHIFT) - 1
+
+
+def handle_id(handle: int) -> int:
+    """句柄中的对象 id"""
+    return handle & _ID_MASK
+
 
 class ObjList(Generic[T]):
-    __slots__ = ('_objects', '_free_ids', '_next_id', '_use_recycle')
+    """
+    Id-addressed object pool.
+
+    Besides the id -> object dict, objects are kept in a dense slot array in insertion order
+    (the same order as iteration), which backs scan(): a copy-free iteration that tolerates
+    additions and removals made by the loop body.
+
+    Ids are recycled, so an id kept across frames may later name a different object.
+    handle(id) packs (generation, id) into one int; resolve(handle) returns None once that object
+    was removed, even if the id already belongs to a new one.
+    """
+    __slots__ = ('_objects', '_free_ids', '_next_id', '_use_recycle',
+                 '_slots', '_slot_of', '_holes', '_pending', '_scanning', '_generations')
 
     def __init__(self, use_recycle: bool = False):
         self._objects: dict[int, T] = {}
@@ -15,6 +39,17 @@ class ObjList(Generic[T]):
         self._free_ids: deque[int] = deque()
         self._next_id = 0
 
+        # 插入顺序的对象数组，被移除的位置置 None (墓碑)
+        self._slots: list[Optional[T]] = []
+        # id -> 在 _slots 中的下标；扫描期间加入的对象为 ~(在 _pending 中的下标)
+        self._slot_of: dict[int, int] = {}
+        self._holes = 0
+        # 扫描期间加入的 (id, 对象)，扫描结束后追加到 _slots
+        self._pending: list[Optional[tuple[int, T]]] = []
+        self._scanning = 0
+        # id -> 被移除的次数 (句柄的代数)，从未移除过的 id 不在其中
+        self._generations: dict[int, int] = {}
+
     def add(self, obj: T) -> int:
         """
         Add an object and return its assigned ID.
@@ -26,13 +61,22 @@ class ObjList(Generic[T]):
             obj_id = self._next_id
             self._next_id += 1
 
-        self._objects[obj_id] = obj
+        self._put(obj_id, obj)
 
         if hasattr(obj, 'id'):
             object.__setattr__(obj, 'id', obj_id)
 
         return obj_id
 
+    def _put(self, obj_id: int, obj: T) -> None:
+        self._objects[obj_id] = obj
+        if self._scanning:
+            self._slot_of[obj_id] = ~len(self._pending)
+            self._pending.append((obj_id, obj))
+        else:
+            self._slot_of[obj_id] = len(self._slots)
+            self._slots.append(obj)
+
     def get(self, obj_id: int) -> Optional[T]:
         """O(1) retrieval"""
         return self._objects.get(obj_id)
@@ -41,18 +85,119 @@ class ObjList(Generic[T]):
         """O(1) removal"""
         if obj_id in self._objects:
             del self._objects[obj_id]
+            i = self._slot_of.pop(obj_id)
+            if i >= 0:
+                self._slots[i] = None
+                self._holes += 1
+            else:
+                self._pending[~i] = None
             if self._use_recycle:
+                # 不回收的 id 不会再被占用，无需推进代数
+                gens = self._generations
+                gens[obj_id] = gens.get(obj_id, 0) + 1
                 self._free_ids.append(obj_id)
+            if not self._scanning and self._holes >= _COMPACT_MIN_HOLES and self._holes * 2 > len(self._slots):
+                self._rebuild_slots()
+
+    def in_iteration_order(self, objs: list[T]) -> list[T]:
+        """把 objs (均在本列表中) 按迭代顺序排列：按 _slots 下标排序，扫描期间加入的排在最后，不遍历整个列表"""
+        slot_of = self._slot_of
+        n_slots = len(self._slots)
+
+        def position(obj: Any) -> int:
+            i = slot_of[obj.id]
+            return i if i >= 0 else n_slots + ~i
+        return sorted(objs, key=position)
 
     def remove_obj(self, obj: T) -> None:
         """Remove by object instance (requires object to have .id)"""
         if hasattr(obj, 'id'):
             self.remove(obj.id)
 
+    # --- 句柄 ---
+
+    def handle(self, obj_id: int) -> int:
+        """当前占用 obj_id 的对象的句柄；对象不存在时抛出 KeyError"""
+        if obj_id not in self._objects:
+            raise KeyError(obj_id)
+        return (self._generations.get(obj_id, 0) << _GEN_SHIFT) | obj_id
+
+    def resolve(self, handle: int) -> Optional[T]:
+        """句柄指向的对象；对象已被移除 (id 可能已被复用) 时返回 None"""
+        obj_id = handle & _ID_MASK
+        obj = self._objects.get(obj_id)
+        if obj is not None and self._generations.get(obj_id, 0) == handle >> _GEN_SHIFT:
+            return obj
+        return None
+
+    def scan(self) -> 'ObjList[T]':
+        """
+        Copy-free iteration that is safe against mutation by the loop body:
+
+            with objs.scan() as it:
+                for obj in it: ...
+
+        Rules (deterministic, matching a C++ array scan over fixed slots):
+        - objects are visited in insertion order, the same order as plain iteration;
+        - an object removed before the scan reaches it is skipped (its slot is a tombstone);
+        - objects added during the scan go to a pending segment and are not visited by it;
+          they are appended after the scan ends (nested scans share one epoch).
+        get() / len() / plain iteration see additions and removals immediately.
+        """
+        # 每帧每个系统各开一次扫描：由 ObjList 自身充当上下文管理器，不创建生成器或额外对象
+        return self
+
+    def __enter__(self) -> Iterator[T]:
+        self._scanning += 1
+        # 对象实例均为真值，filter(None, ...) 在 C 层跳过墓碑
+        return filter(None, self._slots)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._scanning -= 1
+        if not self._scanning and (self._pending or self._holes):
+            self._end_scan()
+
+    def _end_scan(self) -> None:
+        pending = self._pending
+        if pending:
+            slot_of = self._slot_of
+            slots = self._slots
+            for entry in pending:
+                if entry is not None:
+                    slot_of[entry[0]] = len(slots)
+                    slots.append(entry[1])
+            pending.clear()
+        if self._holes >= _COMPACT_MIN_HOLES and self._holes * 2 > len(self._slots):
+            self._rebuild_slots()
+
+    def _rebuild_slots(self) -> None:
+        """按 _objects (插入顺序) 重建无墓碑的 _slots，不可在扫描期间调用"""
+        self._slots = list(self._objects.values())
+        self._slot_of = {obj_id: i for i, obj_id in enumerate(self._objects)}
+        self._holes = 0
+
+    def clone(self, copy_obj: Callable[[T], T]) -> 'ObjList[T]':
+        """Copy the list, the ID allocator state and every object (via copy_obj)."""
+        new: ObjList[T] = ObjList(use_recycle=self._use_recycle)
+        new._objects = {obj_id: copy_obj(obj) for obj_id, obj in self._objects.items()}
+        new._free_ids = deque(self._free_ids)
+        new._next_id = self._next_id
+        new._generations = dict(self._generations)
+        new._rebuild_slots()
+        return new
+
     def clear(self) -> None:
+        # 保留并推进代数，旧句柄不会解析到清空后加入的对象
+        gens = self._generations
+        for obj_id in self._objects:
+            gens[obj_id] = gens.get(obj_id, 0) + 1
         self._objects.clear()
         self._free_ids.clear()
         self._next_id = 0
+        self._slots = []
+        self._slot_of = {}
+        self._holes = 0
+        self._pending = []
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over active objects directly."""
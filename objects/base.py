@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Any
+from typing import Any, TypeVar
+
+T = TypeVar('T')
 
 
 class ReanimateType(IntEnum):
@@ -63,6 +65,31 @@ class Reanimate:
         return rfs
 
 
+_SLOT_COPIERS: dict[type, Any] = {}
+
+
+def _make_slot_copier(cls: type) -> Any:
+    # 与 dataclasses 的做法相同，生成逐字段赋值的函数，避免逐槽的反射调用
+    names = [name for klass in cls.__mro__ for name in klass.__dict__.get('__slots__', ())]
+    body = ''.join(f'    dst.{name} = src.{name}\n' for name in names)
+    src = f'def _copy(src):\n    dst = _new(_cls)\n{body}    return dst\n'
+    namespace: dict[str, Any] = {'_new': object.__new__, '_cls': cls}
+    exec(src, namespace)
+    return namespace['_copy']
+
+
+def copy_slots(obj: T) -> T:
+    """
+    按 __slots__ 逐槽浅拷贝对象 (不调用 __init__ / __post_init__)，所有 slot 必须已赋值。
+    用于克隆场景时复制 slots dataclass，比 copy.copy 快得多；嵌套的可变字段需由调用方另行复制。
+    """
+    cls = obj.__class__
+    copier = _SLOT_COPIERS.get(cls)
+    if copier is None:
+        copier = _SLOT_COPIERS[cls] = _make_slot_copier(cls)
+    return copier(obj)
+
+
 _uuid_counter = 0
 
 
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 from pvzemu2.enums import GridItemType
-from pvzemu2.objects.base import get_uuid
+from pvzemu2.objects.base import get_uuid, copy_slots
 
 
 @dataclass(slots=True)
@@ -19,6 +19,10 @@ class GridItem:
     def __post_init__(self) -> None:
         self.id = get_uuid()
 
+    def clone(self) -> 'GridItem':
+        """复制场地物品，保留 id。"""
+        return copy_slots(self)
+
     @property
     def is_freeable(self) -> bool:
         return self.is_disappeared
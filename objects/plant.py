@@ -3,8 +3,10 @@ from typing import Any
 
 from pvzemu2.enums import PlantType, PlantStatus, PlantEdibleStatus, PlantDirection, AttackFlags, PlantReanimName
 from pvzemu2.geometry import Rect
-from pvzemu2.objects.base import Reanimate, ReanimateType, get_uuid
+from pvzemu2.obj_list import handle_id
+from pvzemu2.objects.base import Reanimate, ReanimateType, get_uuid, copy_slots
 from pvzemu2.objects.plant_reanim_data import get_plant_reanim_data, get_reanim_frame_data, has_reanim
+from pvzemu2.status_flags import PLANT_STATUS_FLAGS, PS_SQUASH_ATTACKING
 
 BOARD_WIDTH = 800  # PC: 800 - Console : 1280
 BOARD_HEIGHT = 600  # PC : 600 - Console : 720
@@ -93,6 +95,7 @@ class Plant:
     # Default size based on C++ plant_base.cpp (80x80)
     attack_box: Rect = field(default_factory=lambda: Rect(0, 0, 80, 80))
 
+    # 缠绕水草抓取目标的句柄 (ObjList.handle)，-1 表示无
     target_id: int = -1
     imitater_target: PlantType = PlantType.NONE
     split_pea_attack_flags: dict[str, bool] = field(default_factory=lambda: {'front': False, 'back': False})
@@ -150,6 +153,15 @@ class Plant:
         self.id = get_uuid()
         self.init_reanim()
 
+    def clone(self) -> 'Plant':
+        """复制植物 (含嵌套的动画、倒计时等可变字段)，保留 id。"""
+        p = copy_slots(self)
+        p.reanimate = copy_slots(self.reanimate)
+        p.countdown = copy_slots(self.countdown)
+        p.attack_box = copy_slots(self.attack_box)
+        p.split_pea_attack_flags = self.split_pea_attack_flags.copy()
+        return p
+
     def init_reanim(self) -> None:
         self.reanimate.prev_progress = -1
         n_frames, fps = get_plant_reanim_data(self.type)
@@ -173,11 +185,7 @@ class Plant:
         return has_reanim(self.type, name)
 
     def is_squash_attacking(self) -> bool:
-        return self.type == PlantType.SQUASH and self.status in (
-            PlantStatus.SQUASH_STOP_IN_THE_AIR,
-            PlantStatus.SQUASH_JUMP_DOWN,
-            PlantStatus.SQUASH_CRUSHED
-        )
+        return self.type == PlantType.SQUASH and PLANT_STATUS_FLAGS[self.status] & PS_SQUASH_ATTACKING != 0
 
     def is_sun_plant(self) -> bool:
         return self.type in (PlantType.SUNFLOWER, PlantType.TWIN_SUNFLOWER, PlantType.SUNSHROOM)
@@ -378,7 +386,7 @@ class Plant:
             "can_attack": self.can_attack,
             "max_boot_delay": self.max_boot_delay,
             "direction": "left" if self.direction == PlantDirection.LEFT else "right",
-            "target": self.target_id if self.target_id != -1 else None,
+            "target": handle_id(self.target_id) if self.target_id != -1 else None,
             "imitater_target": self.imitater_target.name.lower(),
             "edible": self.edible.name.lower(),
             "threepeater_time_since_first_shot": self.threepeater_time_since_first_shot,
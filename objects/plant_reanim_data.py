@@ -124,7 +124,7 @@ PEA_OFFSETS_SPLIT_PEA = [
 ]
 
 
-def get_plant_reanim_data(plant_type):
+def _reanim_data_source(plant_type):
     n_frames = 0
     fps = 12.0
 
@@ -233,7 +233,7 @@ def get_plant_reanim_data(plant_type):
     return n_frames, fps
 
 
-def get_reanim_frame_data(plant_type, name):
+def _frame_data_source(plant_type, name):
     begin_frame = 0
     n_frames = 0
 
@@ -671,7 +671,7 @@ def get_reanim_frame_data(plant_type, name):
     return begin_frame, n_frames
 
 
-def has_reanim(plant_type, name):
+def _has_reanim_source(plant_type, name):
     if plant_type == PlantType.BLOVER:
         return name == PlantReanimName.anim_loop or \
             name == PlantReanimName.anim_idle
@@ -882,3 +882,31 @@ def has_reanim(plant_type, name):
             name == PlantReanimName.anim_shooting
 
     return False
+
+
+# --- 导入时编译的查找表 ---
+# 上面的 if 链是原始数据，导入时对每个 (植物类型, 动画名) 求值一次，编译为按下标访问的平坦表：
+# 下标为 (plant_type + 1) * _N_NAMES + name (PlantType.NONE = -1)，has_reanim 为每个类型一个位集。
+
+_N_TYPES = max(PlantType) + 2
+_N_NAMES = max(PlantReanimName) + 1
+
+_REANIM_DATA: list[tuple[int, float]] = [_reanim_data_source(t - 1) for t in range(_N_TYPES)]
+_FRAME_DATA: list[tuple[int, int]] = [_frame_data_source(t - 1, name)
+                                      for t in range(_N_TYPES) for name in range(_N_NAMES)]
+_HAS_REANIM: list[int] = [sum(1 << name for name in range(_N_NAMES) if _has_reanim_source(t - 1, name))
+                          for t in range(_N_TYPES)]
+
+
+def get_plant_reanim_data(plant_type: PlantType) -> tuple[int, float]:
+    """(动画总帧数, fps)"""
+    return _REANIM_DATA[plant_type + 1]
+
+
+def get_reanim_frame_data(plant_type: PlantType, name: PlantReanimName) -> tuple[int, int]:
+    """(起始帧, 帧数)，没有该动画时为 (0, 0)"""
+    return _FRAME_DATA[(plant_type + 1) * _N_NAMES + name]
+
+
+def has_reanim(plant_type: PlantType, name: PlantReanimName) -> bool:
+    return (_HAS_REANIM[plant_type + 1] >> name) & 1 == 1
@@ -9,7 +9,7 @@ from pvzemu2.enums import (
     ZombieAccessoriesType2
 )
 from pvzemu2.geometry import Rect
-from pvzemu2.objects.base import get_uuid
+from pvzemu2.objects.base import get_uuid, copy_slots
 from pvzemu2.objects.zombie import Zombie
 
 
@@ -49,6 +49,9 @@ class Projectile:
     is_disappeared: bool = False
     is_visible: bool = True
 
+    # 每次归还对象池时加一，见 objects/projectile_pool.py
+    generation: int = 0
+
     # DAMAGE array matching C++ (14 elements)
     DAMAGE = [20, 20, 40, 80, 20, 80, 40, 20, 20, 75, 20, 300, 40, 0]
 
@@ -61,6 +64,10 @@ class Projectile:
         self.int_x = int(self.x)
         self.int_y = int(self.y)
 
+    def clone(self) -> 'Projectile':
+        """复制子弹，保留 id。"""
+        return copy_slots(self)
+
     def get_attack_box(self) -> Rect:
         """获取攻击判定框，匹配 C++ 实现"""
         r = Rect(0, 0, 0, 0)
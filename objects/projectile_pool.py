@@ -0,0 +1,126 @@
+"""
+子弹对象池 (free list)。
+
+默认情况下每颗子弹都由 ProjectileFactory.create 新建、消失后交给 GC。启用对象池后，
+帧末清理掉的子弹进入按场景的空闲链表，下次 create 时原地重置全部字段后复用，
+满场机枪射手时可省去绝大部分 Projectile 的分配与回收。
+
+复用意味着旧引用可能指向一颗新子弹。每次归还时 Projectile.generation 加一，
+需要跨帧持有子弹的代码应使用 ProjectileRef，它会在子弹被归还后拒绝解引用。
+"""
+from dataclasses import MISSING, fields
+from typing import Any, Optional
+
+from pvzemu2.enums import ProjectileType
+from pvzemu2.objects.base import get_uuid
+from pvzemu2.objects.projectile import Projectile
+
+
+class StaleProjectileError(LookupError):
+    """解引用一颗已被归还对象池的子弹"""
+
+
+def _make_reinit() -> Any:
+    # 与 copy_slots 相同，生成逐字段赋值的函数；generation 跨复用保留
+    lines = []
+    namespace: dict[str, Any] = {'_get_uuid': get_uuid}
+    for i, f in enumerate(fields(Projectile)):
+        if f.name in ('type', 'row', 'x', 'y', 'generation'):
+            continue
+        if f.name == 'id':
+            lines.append('    proj.id = _get_uuid()\n')
+        elif f.default is not MISSING:
+            namespace[f'_d{i}'] = f.default
+            lines.append(f'    proj.{f.name} = _d{i}\n')
+        else:
+            raise TypeError(f"Projectile.{f.name} has no default and cannot be reinitialized")
+    src = ('def _reinit(proj, type, row, x, y):\n'
+           '    proj.type = type\n    proj.row = row\n    proj.x = x\n    proj.y = y\n'
+           f'{"".join(lines)}'
+           '    proj.int_x = int(x)\n    proj.int_y = int(y)\n')
+    exec(src, namespace)
+    return namespace['_reinit']
+
+
+# 与 Projectile(type, row, x, y) 构造出的对象逐字段相同 (generation 除外)
+_reinit = _make_reinit()
+
+
+class ProjectilePool:
+    """
+    按场景的子弹空闲链表。
+
+    - release 只把子弹挂到待回收列表，recycle (World 在帧末清理后调用) 才让它们可被复用，
+      因此同一帧内仍持有旧子弹的系统不会看到它被改写
+    - allocated / reused 统计新建与复用的次数
+    """
+    __slots__ = ('_free', '_retired', '_pooled', 'allocated', 'reused')
+
+    def __init__(self) -> None:
+        self._free: list[Projectile] = []
+        self._retired: list[Projectile] = []
+        # 池中对象的 id()，用于发现重复归还
+        self._pooled: set[int] = set()
+        self.allocated = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        """池中 (空闲与待回收) 的子弹数"""
+        return len(self._free) + len(self._retired)
+
+    def acquire(self, projectile_type: ProjectileType, row: int, x: float, y: float) -> Projectile:
+        """取出一颗子弹并重置为 Projectile(projectile_type, row, x, y) 的初始状态"""
+        if self._free:
+            proj = self._free.pop()
+            self._pooled.discard(id(proj))
+            _reinit(proj, projectile_type, row, x, y)
+            self.reused += 1
+            return proj
+        self.allocated += 1
+        return Projectile(type=projectile_type, row=row, x=x, y=y)
+
+    def release(self, proj: Projectile) -> None:
+        """归还已从场景移除的子弹，使其所有 ProjectileRef 失效"""
+        key = id(proj)
+        if key in self._pooled:
+            raise ValueError(f"projectile {proj.id} released twice")
+        self._pooled.add(key)
+        proj.is_disappeared = True
+        proj.generation += 1
+        self._retired.append(proj)
+
+    def recycle(self) -> None:
+        """把待回收的子弹移入空闲链表"""
+        if self._retired:
+            self._free.extend(self._retired)
+            self._retired.clear()
+
+    def clone(self) -> 'ProjectilePool':
+        """池中对象不属于场景状态，复制场景时得到一个空池"""
+        return ProjectilePool()
+
+    def clear(self) -> None:
+        self._free.clear()
+        self._retired.clear()
+        self._pooled.clear()
+
+
+class ProjectileRef:
+    """跨帧持有子弹的弱句柄：子弹被归还对象池后 get() 抛出 StaleProjectileError"""
+    __slots__ = ('_proj', '_generation')
+
+    def __init__(self, proj: Projectile) -> None:
+        self._proj = proj
+        self._generation = proj.generation
+
+    @property
+    def alive(self) -> bool:
+        return self._proj.generation == self._generation
+
+    def get(self) -> Projectile:
+        if self._proj.generation != self._generation:
+            raise StaleProjectileError(f"projectile was recycled (now id {self._proj.id})")
+        return self._proj
+
+    def get_or_none(self) -> Optional[Projectile]:
+        return self._proj if self._proj.generation == self._generation else None
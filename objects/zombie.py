@@ -3,10 +3,11 @@ from typing import Any
 
 from pvzemu2.enums import ZombieType, ZombieStatus, ZombieAction, ZombieAccessoriesType2, ZombieAccessoriesType1, \
     ZombieReanimName
-from pvzemu2.geometry import Rect
-from pvzemu2.objects.base import Reanimate, get_uuid
+from pvzemu2.geometry import Rect, FrozenRect
+from pvzemu2.objects.base import Reanimate, get_uuid, copy_slots
 from pvzemu2.objects.zombie_reanim_data import COMMON_ZOMBIE_GROUND
 from pvzemu2.objects.zombie_reanim_data import get_zombie_reanim_data, get_reanim_frame_data, has_reanim
+from pvzemu2.status_flags import ZOMBIE_STATUS_FLAGS, ZS_BALLOON_AIR, ZS_DYING, ZS_POGO, ZS_NO_SLOW, ZS_NO_FREEZE
 
 
 @dataclass(slots=True)
@@ -112,10 +113,23 @@ class Zombie:
     # Speed caching for slowdown effects
     _original_dx: float | None = None
 
+    # 绝对判定框 / 攻击框缓存: (_box_key() 快照, Rect)
+    _hit_box_cache: tuple[tuple, Rect] | None = field(default=None, repr=False, compare=False)
+    _attack_box_cache: tuple[tuple, Rect] | None = field(default=None, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         self.id = get_uuid()
         self.init_reanim()
 
+    def clone(self) -> 'Zombie':
+        """复制僵尸 (含嵌套的动画、倒计时等可变字段)，保留 id。"""
+        z = copy_slots(self)
+        z.reanimate = copy_slots(self.reanimate)
+        z.countdown = copy_slots(self.countdown)
+        z.garlic_tick = copy_slots(self.garlic_tick)
+        z.partners = self.partners[:]
+        return z
+
     def init_reanim(self) -> None:
         self.reanimate.prev_progress = -1
         n_frames, fps = get_zombie_reanim_data(self.type)
@@ -139,7 +153,7 @@ class Zombie:
         return has_reanim(self.type, name)
 
     def is_flying_or_falling(self) -> bool:
-        return self.status in (ZombieStatus.BALLOON_FLYING, ZombieStatus.BALLOON_FALLING)
+        return ZOMBIE_STATUS_FLAGS[self.status] & ZS_BALLOON_AIR != 0
 
     def is_walk_right(self) -> bool:
         if self.is_hypno:
@@ -155,44 +169,24 @@ class Zombie:
         return self.type == ZombieType.YETI and not self.has_item_or_walk_left
 
     def has_death_status(self) -> bool:
-        return self.status in (
-            ZombieStatus.DYING,
-            ZombieStatus.DYING_FROM_INSTANT_KILL,
-            ZombieStatus.DYING_FROM_LAWNMOWER
-        )
+        return ZOMBIE_STATUS_FLAGS[self.status] & ZS_DYING != 0
 
     def has_pogo_status(self) -> bool:
-        return ZombieStatus.POGO_WITH_STICK <= self.status <= 28
+        return ZOMBIE_STATUS_FLAGS[self.status] & ZS_POGO != 0
 
     def can_be_slowed(self) -> bool:
-        if self.type == ZombieType.ZOMBONI or self.is_dead:
+        if self.type == ZombieType.ZOMBONI or self.is_dead or self.is_hypno:
             return False
-
-        return (not self.has_death_status() and
-                self.status not in (
-                    ZombieStatus.DIGGER_DIG,
-                    ZombieStatus.DIGGER_DRILL,
-                    ZombieStatus.DIGGER_LOST_DIG,
-                    ZombieStatus.DIGGER_LANDING,
-                    ZombieStatus.RISING_FROM_GROUND,
-                    ZombieStatus.DANCING_DANCER_SPAWNING
-                ) and not self.is_hypno)
+        return ZOMBIE_STATUS_FLAGS[self.status] & (ZS_DYING | ZS_NO_SLOW) == 0
 
     def can_be_freezed(self) -> bool:
-        if not self.can_be_slowed():
+        if self.type == ZombieType.ZOMBONI or self.is_dead or self.is_hypno:
             return False
-
-        return (self.status not in (
-            ZombieStatus.POLE_VALUTING_JUMPING,
-            ZombieStatus.DOLPHIN_JUMP_IN_POOL,
-            ZombieStatus.DOLPHIN_IN_JUMP,
-            ZombieStatus.SNORKEL_JUMP_IN_THE_POOL,
-            ZombieStatus.IMP_FLYING,
-            ZombieStatus.IMP_LANDING
-        ) and not self.is_flying_or_falling() and
-                int(self.status) != 19 and
-                not (ZombieStatus.POGO_WITH_STICK <= self.status <= ZombieStatus.POGO_JUMP_ACROSS) and
-                (self.type != ZombieType.BUNGEE or self.status == ZombieStatus.BUNGEE_IDLE_AFTER_DROP))
+        status = self.status
+        if ZOMBIE_STATUS_FLAGS[status] & (ZS_DYING | ZS_NO_SLOW | ZS_NO_FREEZE):
+            return False
+        # 蹦极僵尸只有落地停留时可冻结
+        return self.type != ZombieType.BUNGEE or status == ZombieStatus.BUNGEE_IDLE_AFTER_DROP
 
     def get_height_bias(self) -> float:
         if self.status == ZombieStatus.RISING_FROM_GROUND:
@@ -259,7 +253,38 @@ class Zombie:
 
         return -200.0
 
+    def _box_key(self) -> tuple:
+        # 判定框与攻击框依赖的全部字段 (坐标、状态、动画进度、is_walk_right 与 get_height_bias 的输入、框参数)
+        return (self.int_x, self.int_y, self.dy, self.status, self.action, self.reanimate.progress,
+                self.countdown.action, self.is_hypno, self.has_item_or_walk_left, self.is_in_water, self.is_eating,
+                self.hit_box_x, self.hit_box_y, self.hit_box_width, self.hit_box_height, self.hit_box_offset_x,
+                self.attack_box_x, self.attack_box_y, self.attack_box_width, self.attack_box_height)
+
     def get_hit_box_rect(self) -> Rect:
+        """
+        绝对坐标的判定框。
+        依赖的字段未变化时返回缓存的同一个 FrozenRect (同一帧内的重复调用只需比较一次快照)，
+        返回值不可修改，需要调整时在局部变量上计算。
+        """
+        key = self._box_key()
+        cache = self._hit_box_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        rect = self._compute_hit_box_rect()
+        self._hit_box_cache = (key, rect)
+        return rect
+
+    def get_attack_box_rect(self) -> Rect:
+        """绝对坐标的攻击框，缓存规则同 get_hit_box_rect。"""
+        key = self._box_key()
+        cache = self._attack_box_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        rect = self._compute_attack_box_rect()
+        self._attack_box_cache = (key, rect)
+        return rect
+
+    def _compute_hit_box_rect(self) -> Rect:
         # Start with hit box values
         rect_x = self.hit_box_x
         rect_y = self.hit_box_y
@@ -279,9 +304,9 @@ class Zombie:
         if bias > -100:
             rect_height -= int(bias)
 
-        return Rect(rect_x, rect_y, rect_width, rect_height)
+        return FrozenRect(rect_x, rect_y, rect_width, rect_height)
 
-    def get_attack_box_rect(self) -> Rect:
+    def _compute_attack_box_rect(self) -> Rect:
         # Start with attack box values
         rect_x = self.attack_box_x
         rect_y = self.attack_box_y
@@ -308,7 +333,7 @@ class Zombie:
         if bias > -100:
             rect_height -= int(bias)
 
-        return Rect(rect_x, rect_y, rect_width, rect_height)
+        return FrozenRect(rect_x, rect_y, rect_width, rect_height)
 
     def get_dx_from_ground(self) -> float:
         """依据动画帧读取数组，计算精准的基础像素位移 dx"""
@@ -39,7 +39,7 @@ COMMON_ZOMBIE_GROUND: Final[List[float]] = [
 ]
 
 
-def get_zombie_reanim_data(zombie_type):
+def _reanim_data_source(zombie_type):
     n_frames = 0
     fps = 12.0
 
@@ -89,7 +89,7 @@ def get_zombie_reanim_data(zombie_type):
     return n_frames, fps
 
 
-def get_reanim_frame_data(zombie_type, name):
+def _frame_data_source(zombie_type, name):
     begin_frame = 0
     n_frames = 0
 
@@ -459,7 +459,7 @@ def get_reanim_frame_data(zombie_type, name):
     return begin_frame, n_frames
 
 
-def has_reanim(zombie_type, name):
+def _has_reanim_source(zombie_type, name):
     if name == ZombieReanimName._ground:
         return zombie_type != ZombieType.BUNGEE and \
             zombie_type != ZombieType.ZOMBONI and \
@@ -613,3 +613,31 @@ def has_reanim(zombie_type, name):
             name == ZombieReanimName.anim_wheelie2
 
     return False
+
+
+# --- 导入时编译的查找表 ---
+# 上面的 if 链是原始数据，导入时对每个 (僵尸类型, 动画名) 求值一次，编译为按下标访问的平坦表：
+# 下标为 (zombie_type + 1) * _N_NAMES + name (ZombieType.NONE = -1)，has_reanim 为每个类型一个位集。
+
+_N_TYPES = max(ZombieType) + 2
+_N_NAMES = max(ZombieReanimName) + 1
+
+_REANIM_DATA: list[tuple[int, float]] = [_reanim_data_source(t - 1) for t in range(_N_TYPES)]
+_FRAME_DATA: list[tuple[int, int]] = [_frame_data_source(t - 1, name)
+                                      for t in range(_N_TYPES) for name in range(_N_NAMES)]
+_HAS_REANIM: list[int] = [sum(1 << name for name in range(_N_NAMES) if _has_reanim_source(t - 1, name))
+                          for t in range(_N_TYPES)]
+
+
+def get_zombie_reanim_data(zombie_type: ZombieType) -> tuple[int, float]:
+    """(动画总帧数, fps)"""
+    return _REANIM_DATA[zombie_type + 1]
+
+
+def get_reanim_frame_data(zombie_type: ZombieType, name: ZombieReanimName) -> tuple[int, int]:
+    """(起始帧, 帧数)，没有该动画时为 (0, 0)"""
+    return _FRAME_DATA[(zombie_type + 1) * _N_NAMES + name]
+
+
+def has_reanim(zombie_type: ZombieType, name: ZombieReanimName) -> bool:
+    return (_HAS_REANIM[zombie_type + 1] >> name) & 1 == 1
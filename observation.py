@@ -0,0 +1,195 @@
+"""
+定长张量观测编码器：直接写入调用方预分配的 float64 缓冲区 (array('d')、NumPy 数组、memoryview 等)，
+不经过 Scene.to_dict()。
+
+观测由三段连续的 float64 组成 (偏移见 ObservationEncoder 的同名属性)：
+    scalars     SCALAR_FEATURES
+    planes      len(PLANE_NAMES) 个 6x9 网格平面，按 [plane][row][col] 排列
+    zombies     max_zombies x len(ZOMBIE_FEATURES) 的僵尸表 (不足部分补零)，
+                随后是 max_zombies 个有效位 (1 表示该行有效)
+
+编码器在 bind() 时预先切好全部视图，之后每次 encode() 只做下标写入与整段清零，
+不创建列表、字典等中间对象。
+"""
+from typing import Any
+
+from pvzemu2.enums import GridItemType
+from pvzemu2.scene import Scene
+
+ROWS = 6
+COLS = 9
+CELLS = ROWS * COLS
+N_CARDS = 10
+
+SCALAR_FEATURES = ('sun', 'wave', 'countdown_next_wave', 'n_zombies') + tuple(
+    f'card_{i}_cold_down' for i in range(N_CARDS))
+
+# plant_map 的每一层各占类型、HP 两个平面，类型平面存 PlantType + 1 (0 表示空)
+_PLANT_LAYERS = ('content', 'pumpkin', 'base', 'coffee_bean')
+
+PLANE_NAMES = tuple(f'{layer}_{kind}' for layer in _PLANT_LAYERS for kind in ('type', 'hp')) + (
+    'zombie_count',
+    'zombie_hp',
+    'projectile_count',
+    'ice_path',
+    'crater',
+    'grave',
+)
+
+ZOMBIE_FEATURES = (
+    'type', 'row', 'x', 'y', 'hp', 'accessory_1_hp', 'accessory_2_hp', 'status', 'dx',
+    'slow', 'freeze', 'butter', 'is_eating',
+)
+
+_ZOMBIE_COUNT_PLANE = PLANE_NAMES.index('zombie_count') * CELLS
+_ZOMBIE_HP_PLANE = PLANE_NAMES.index('zombie_hp') * CELLS
+_PROJECTILE_PLANE = PLANE_NAMES.index('projectile_count') * CELLS
+_ICE_PLANE = PLANE_NAMES.index('ice_path') * CELLS
+_CRATER_PLANE = PLANE_NAMES.index('crater') * CELLS
+_GRAVE_PLANE = PLANE_NAMES.index('grave') * CELLS
+
+
+def _col_of(x: int) -> int:
+    # 与 util.get_col_by_x 相同，但把场外坐标夹到 [0, 8]
+    if x < 120:
+        return 0
+    col = (x - 40) // 80
+    return col if col < 8 else 8
+
+
+class ObservationEncoder:
+    """
+    把场景编码进定长缓冲区。用法：
+        enc = ObservationEncoder(max_zombies=64)
+        buf = array('d', bytes(8 * enc.size))      # 或 np.zeros(enc.size)
+        enc.bind(buf)
+        enc.encode(world.scene)                     # 每步调用，结果写入 buf
+    """
+    __slots__ = ('max_zombies', 'size', 'scalar_offset', 'plane_offset', 'zombie_offset', 'mask_offset',
+                 '_out', '_scalars', '_planes', '_zombies', '_mask', '_zero_planes', '_zero_zombies',
+                 '_zero_mask')
+
+    def __init__(self, max_zombies: int = 64) -> None:
+        self.max_zombies = max_zombies
+        self.scalar_offset = 0
+        self.plane_offset = len(SCALAR_FEATURES)
+        self.zombie_offset = self.plane_offset + len(PLANE_NAMES) * CELLS
+        self.mask_offset = self.zombie_offset + max_zombies * len(ZOMBIE_FEATURES)
+        self.size = self.mask_offset + max_zombies
+
+        n_zeros = max(len(PLANE_NAMES) * CELLS, max_zombies * len(ZOMBIE_FEATURES))
+        zeros = memoryview(bytearray(8 * n_zeros)).cast('d')
+        self._zero_planes = zeros[:len(PLANE_NAMES) * CELLS]
+        self._zero_zombies = zeros[:max_zombies * len(ZOMBIE_FEATURES)]
+        self._zero_mask = zeros[:max_zombies]
+        self._out: Any = None
+
+    def bind(self, buffer: Any) -> None:
+        """
+        绑定输出缓冲区：任何 C 连续、元素为 float64 且长度为 size 的缓冲区对象。
+        编码结果原地写入，调用方持有的数组即是观测。
+        """
+        out = memoryview(buffer)
+        if out.format != 'd' or out.ndim != 1:
+            out = out.cast('B').cast('d')
+        if len(out) != self.size:
+            raise ValueError(f"observation buffer has {len(out)} float64 values, expected {self.size}")
+        self._out = out
+        self._scalars = out[self.scalar_offset:self.plane_offset]
+        self._planes = out[self.plane_offset:self.zombie_offset]
+        self._zombies = out[self.zombie_offset:self.mask_offset]
+        self._mask = out[self.mask_offset:self.size]
+
+    def encode(self, scene: Scene) -> None:
+        """把 scene 编码进已绑定的缓冲区。"""
+        if self._out is None:
+            raise RuntimeError("ObservationEncoder.encode() called before bind()")
+
+        scalars = self._scalars
+        scalars[0] = scene.sun.sun
+        scalars[1] = scene.spawn.wave
+        scalars[2] = scene.spawn.countdown_next_wave
+        scalars[3] = len(scene.zombies)
+        i = 4
+        for card in scene.cards:
+            if i >= 4 + N_CARDS:
+                break
+            scalars[i] = card.cold_down
+            i += 1
+
+        planes = self._planes
+        planes[:] = self._zero_planes
+        self._encode_plants(scene, planes)
+        self._encode_zombies(scene, planes)
+
+        for p in scene.projectiles:
+            if 0 <= p.row < ROWS:
+                planes[_PROJECTILE_PLANE + p.row * COLS + _col_of(p.int_x)] += 1
+
+        ice = scene.ice_path
+        for row in range(scene.rows):
+            if ice.countdown[row] > 0:
+                # 冰道从 x 向右延伸到场地右端
+                base = _ICE_PLANE + row * COLS
+                for col in range(_col_of(ice.x[row]), COLS):
+                    planes[base + col] = 1
+
+        for item in scene.grid_items:
+            if not (0 <= item.row < ROWS and 0 <= item.col < COLS):
+                continue
+            if item.type == GridItemType.CRATER:
+                planes[_CRATER_PLANE + item.row * COLS + item.col] = 1
+            elif item.type == GridItemType.GRAVE:
+                planes[_GRAVE_PLANE + item.row * COLS + item.col] = 1
+
+    # --- 内部辅助逻辑 ---
+
+    @staticmethod
+    def _encode_plants(scene: Scene, planes: memoryview) -> None:
+        for row in range(len(scene.plant_map)):
+            cells = scene.plant_map[row]
+            for col in range(COLS):
+                cell = cells[col]
+                idx = row * COLS + col
+                offset = 0
+                for layer in _PLANT_LAYERS:
+                    p = cell[layer]
+                    if p is not None:
+                        planes[offset + idx] = p.type + 1
+                        planes[offset + CELLS + idx] = p.hp
+                    offset += 2 * CELLS
+
+    def _encode_zombies(self, scene: Scene, planes: memoryview) -> None:
+        table = self._zombies
+        mask = self._mask
+        table[:] = self._zero_zombies
+        mask[:] = self._zero_mask
+
+        n_features = len(ZOMBIE_FEATURES)
+        capacity = self.max_zombies
+        k = 0
+        for z in scene.zombies:
+            row = z.row
+            if 0 <= row < ROWS:
+                idx = row * COLS + _col_of(z.int_x)
+                planes[_ZOMBIE_COUNT_PLANE + idx] += 1
+                planes[_ZOMBIE_HP_PLANE + idx] += z.hp + z.accessory_1_hp + z.accessory_2_hp
+
+            if k < capacity:
+                base = k * n_features
+                table[base] = z.type
+                table[base + 1] = row
+                table[base + 2] = z.x
+                table[base + 3] = z.y
+                table[base + 4] = z.hp
+                table[base + 5] = z.accessory_1_hp
+                table[base + 6] = z.accessory_2_hp
+                table[base + 7] = z.status
+                table[base + 8] = z.dx
+                countdown = z.countdown
+                table[base + 9] = countdown.slow
+                table[base + 10] = countdown.freeze
+                table[base + 11] = countdown.butter
+                table[base + 12] = z.is_eating
+                mask[k] = 1
+                k += 1
@@ -0,0 +1,338 @@
+"""
+多进程批量环境：SubprocWorldPool。
+
+每个 worker 进程持有若干 World，主进程通过 Pipe 下发动作，
+观测由 worker 直接写入 multiprocessing.shared_memory 中的共享缓冲区，管道上只传输 done 标志，
+避免了 Scene.to_dict() 的序列化开销。
+"""
+import multiprocessing as mp
+import traceback
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Sequence, Any
+
+from pvzemu2.enums import SceneType, PlantType
+from pvzemu2.systems.rng import CounterRNG
+from pvzemu2.world import World
+
+# 动作：None 表示不操作，(plant_type, row, col) 表示种植
+Action = Optional[tuple[PlantType, int, int]]
+# 观测编码函数：把 world 的状态写入长度为 obs_size 的 'd' memoryview
+Encoder = Callable[[World, memoryview], None]
+
+SUMMARY_SIZE = 3 + 6 + 54 + 54
+
+
+def encode_summary(world: World, out: memoryview) -> None:
+    """
+    默认的定长观测编码 (共 SUMMARY_SIZE 个 float)：
+    [阳光, 波数, 下一波倒计时, 每行僵尸数 x6, 每格植物类型+1 x54, 每格植物 HP x54]
+    """
+    scene = world.scene
+    out[0] = scene.sun.sun
+    out[1] = scene.spawn.wave
+    out[2] = scene.spawn.countdown_next_wave
+    for row in range(6):
+        out[3 + row] = len(scene.zombies_by_row[row])
+
+    i = 9
+    for row in range(6):
+        for cell in scene.plant_map[row]:
+            p = cell['content']
+            if p is None:
+                out[i] = 0
+                out[i + 54] = 0
+            else:
+                out[i] = int(p.type) + 1
+                out[i + 54] = p.hp
+            i += 1
+
+
+def _env_seed(seed: Optional[int], env_index: int, episode: int, n_envs: int) -> Optional[int]:
+    """第 env_index 个环境第 episode 局的种子，保证各环境、各局互不相同。"""
+    if seed is None:
+        return None
+    return seed + env_index + episode * n_envs
+
+
+def _make_world(scene_type: SceneType, seed: Optional[int], env_index: int, episode: int, n_envs: int,
+                rng_streams: bool) -> World:
+    """第 env_index 个环境第 episode 局的 World。rng_streams 时使用 CounterRNG(seed) 的子流 [env_index][episode]。"""
+    if seed is None:
+        return World(scene_type)
+    if rng_streams:
+        return World(scene_type, rng=CounterRNG(seed).spawn(env_index).spawn(episode))
+    world = World(scene_type)
+    world.seed(_env_seed(seed, env_index, episode, n_envs))
+    return world
+
+
+def _worker(conn: Any, shm_name: str, first_env: int, n_worlds: int, n_envs: int,
+            scene_type: SceneType, seed: Optional[int], rng_streams: bool, episodes: list[int],
+            obs_size: int, frames_per_step: int, auto_reset: bool, encode: Encoder) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    obs = shm.buf.cast('d')
+    rows = [obs[(first_env + j) * obs_size:(first_env + j + 1) * obs_size] for j in range(n_worlds)]
+    try:
+        worlds = [_make_world(scene_type, seed, first_env + j, episodes[j], n_envs, rng_streams)
+                  for j in range(n_worlds)]
+        for j in range(n_worlds):
+            encode(worlds[j], rows[j])
+        conn.send(('ok', None))
+
+        while True:
+            cmd, data = conn.recv()
+            if cmd == 'step':
+                dones = []
+                for j, action in enumerate(data):
+                    world = worlds[j]
+                    if action is not None:
+                        world.plant(*action)
+                    done = world.step(frames_per_step)
+                    if done and auto_reset:
+                        episodes[j] += 1
+                        world = worlds[j] = _make_world(
+                            scene_type, seed, first_env + j, episodes[j], n_envs, rng_streams)
+                    encode(world, rows[j])
+                    dones.append(done)
+                conn.send(('ok', dones))
+            elif cmd == 'reset':
+                seed, episodes = data
+                for j in range(n_worlds):
+                    worlds[j] = _make_world(scene_type, seed, first_env + j, episodes[j], n_envs, rng_streams)
+                    encode(worlds[j], rows[j])
+                conn.send(('ok', None))
+            elif cmd == 'close':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    except Exception:
+        try:
+            conn.send(('error', traceback.format_exc()))
+        except (BrokenPipeError, OSError):
+            pass
+    finally:
+        # 共享内存上的视图必须先释放，否则 shm.close() 会抛出 BufferError
+        for row in rows:
+            row.release()
+        obs.release()
+        shm.close()
+        conn.close()
+
+
+class WorkerCrashedError(RuntimeError):
+    """worker 进程异常退出且重启失败。"""
+
+
+class SubprocWorldPool:
+    """
+    多进程 World 池。环境按 worker 连续编号：worker w 持有
+    [w * worlds_per_worker, (w + 1) * worlds_per_worker) 号环境。
+
+    - step(actions) / reset() 返回的观测是共享内存上的 memoryview 行视图，在下一次 step/reset 前有效
+    - 给定 seed 时，第 i 号环境第 e 局使用种子 seed + i + e * n_envs；
+      rng_streams=True 时改用 CounterRNG(seed).spawn(i).spawn(e)，各局的随机数流互不重叠
+    - worker 崩溃或超过 timeout 秒未应答时自动重启，其环境以新一局重新开始并在本次 step 中报告 done=True
+    """
+
+    def __init__(self, n_workers: int, worlds_per_worker: int = 1, scene_type: SceneType = SceneType.DAY,
+                 seed: Optional[int] = None, frames_per_step: int = 1, auto_reset: bool = True,
+                 encode: Encoder = encode_summary, obs_size: int = SUMMARY_SIZE,
+                 start_method: Optional[str] = None, rng_streams: bool = False,
+                 timeout: Optional[float] = 60.0) -> None:
+        """:param timeout: 等待单个 worker 应答的秒数，None 表示一直等待。"""
+        self.n_workers = n_workers
+        self.worlds_per_worker = worlds_per_worker
+        self.n_envs = n_workers * worlds_per_worker
+        self.scene_type = scene_type
+        self.seed = seed
+        self.rng_streams = rng_streams
+        self.timeout = timeout
+        self.frames_per_step = frames_per_step
+        self.auto_reset = auto_reset
+        self.encode = encode
+        self.obs_size = obs_size
+        self.restarts = [0] * n_workers
+        self.worker_errors: list[Optional[str]] = [None] * n_workers
+
+        self._ctx = mp.get_context(start_method)
+        self._episodes = [0] * self.n_envs
+        self._shm = shared_memory.SharedMemory(create=True, size=max(8, 8 * self.n_envs * obs_size))
+        self._obs = self._shm.buf.cast('d')
+        self._rows = [self._obs[i * obs_size:(i + 1) * obs_size] for i in range(self.n_envs)]
+        self._procs: list[Any] = [None] * n_workers
+        self._conns: list[Any] = [None] * n_workers
+        self._closed = False
+        self._unlinked = False
+
+        for w in range(n_workers):
+            self._start_worker(w)
+        for w in range(n_workers):
+            self._recv(w)
+
+    # --- 公共接口 ---
+
+    @property
+    def observations(self) -> list[memoryview]:
+        """每个环境的观测行视图 (长度 obs_size)。"""
+        return self._rows
+
+    @property
+    def shared_buffer(self) -> memoryview:
+        """全部观测的扁平视图，形状为 n_envs * obs_size，可直接交给 NumPy (np.frombuffer)。"""
+        return self._obs
+
+    def step(self, actions: Optional[Sequence[Action]] = None) -> tuple[list[memoryview], list[bool]]:
+        """
+        每个环境执行一个动作并推进 frames_per_step 帧。
+        :param actions: 长度为 n_envs 的动作序列，None 表示全部不操作。
+        :return: (观测行视图, done 标志)
+        """
+        if actions is None:
+            actions = [None] * self.n_envs
+        if len(actions) != self.n_envs:
+            raise ValueError(f"expected {self.n_envs} actions, got {len(actions)}")
+
+        k = self.worlds_per_worker
+        sent = []
+        for w in range(self.n_workers):
+            sent.append(self._send(w, ('step', list(actions[w * k:(w + 1) * k]))))
+
+        dones: list[bool] = []
+        for w in range(self.n_workers):
+            result = self._recv(w) if sent[w] else None
+            if result is None:
+                # worker 已崩溃并被重启，其环境视为结束
+                dones.extend([True] * k)
+                continue
+            if self.auto_reset:
+                for j, done in enumerate(result):
+                    if done:
+                        self._episodes[w * k + j] += 1
+            dones.extend(result)
+        return self._rows, dones
+
+    def reset(self, seed: Optional[int] = None) -> list[memoryview]:
+        """重置全部环境。给定 seed 时替换池的基准种子并重新计数局数。"""
+        if seed is not None:
+            self.seed = seed
+            self._episodes = [0] * self.n_envs
+        else:
+            self._episodes = [e + 1 for e in self._episodes]
+
+        k = self.worlds_per_worker
+        sent = [self._send(w, ('reset', (self.seed, self._episodes[w * k:(w + 1) * k])))
+                for w in range(self.n_workers)]
+        for w in range(self.n_workers):
+            if sent[w]:
+                self._recv(w)
+        return self._rows
+
+    def close(self) -> None:
+        """关闭全部 worker 并释放共享内存。"""
+        if self._closed:
+            return
+        for w in range(self.n_workers):
+            if self._conns[w] is not None:
+                self._send(w, ('close', None))
+        for w in range(self.n_workers):
+            self._stop_worker(w)
+        try:
+            # 调用方可能仍持有行视图，逐个释放后才能关闭共享内存；
+            # 仍有由观测派生的视图时这里抛出 BufferError，释放这些视图后可再次调用 close()
+            for row in self._rows:
+                row.release()
+            self._obs.release()
+            self._shm.close()
+        finally:
+            # 共享内存段无论如何都要删除，否则会遗留在 /dev/shm 中
+            if not self._unlinked:
+                self._unlinked = True
+                self._shm.unlink()
+        self._rows = []
+        self._closed = True
+
+    def __enter__(self) -> 'SubprocWorldPool':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    # --- 内部辅助逻辑 ---
+
+    def _start_worker(self, w: int) -> None:
+        k = self.worlds_per_worker
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker,
+            args=(child_conn, self._shm.name, w * k, k, self.n_envs, self.scene_type, self.seed, self.rng_streams,
+                  self._episodes[w * k:(w + 1) * k], self.obs_size, self.frames_per_step,
+                  self.auto_reset, self.encode),
+            daemon=True,
+        )
+        proc.start()
+        # 关闭父进程中的子端，子进程退出时父端才能收到 EOF
+        child_conn.close()
+        self._procs[w] = proc
+        self._conns[w] = parent_conn
+
+    def _stop_worker(self, w: int) -> None:
+        proc, conn = self._procs[w], self._conns[w]
+        if conn is not None:
+            conn.close()
+        if proc is not None:
+            proc.join(timeout=1.0)
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+        self._procs[w] = None
+        self._conns[w] = None
+
+    def _restart_worker(self, w: int, error: Optional[str]) -> None:
+        self.restarts[w] += 1
+        self.worker_errors[w] = error
+        self._stop_worker(w)
+
+        k = self.worlds_per_worker
+        for i in range(w * k, (w + 1) * k):
+            self._episodes[i] += 1
+
+        self._start_worker(w)
+        if self._recv(w, restart=False) is False:
+            raise WorkerCrashedError(f"worker {w} failed to restart:\n{self.worker_errors[w]}")
+
+    def _send(self, w: int, msg: tuple[str, Any]) -> bool:
+        try:
+            self._conns[w].send(msg)
+            return True
+        except (BrokenPipeError, OSError):
+            if msg[0] != 'close':
+                self._restart_worker(w, None)
+            return False
+
+    def _recv(self, w: int, restart: bool = True) -> Any:
+        """
+        接收 worker 的应答。worker 已崩溃或超过 timeout 秒未应答时重启它并返回 None
+        (restart=False 时返回 False)。
+        """
+        conn = self._conns[w]
+        try:
+            if self.timeout is not None and not conn.poll(self.timeout):
+                status, data = 'error', f"worker {w} did not respond within {self.timeout}s"
+            else:
+                status, data = conn.recv()
+        except (EOFError, ConnectionResetError, OSError):
+            status, data = 'error', f"worker {w} exited with code {self._procs[w].exitcode}"
+
+        if status == 'ok':
+            return data
+        if not restart:
+            self.worker_errors[w] = data
+            return False
+        self._restart_worker(w, data)
+        return None
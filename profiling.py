@@ -0,0 +1,119 @@
+"""
+帧流水线的计时统计，由 World.enable_profiling() 启用。
+
+启用时 World 阶段表中的绑定方法换成计时包装、PlantSystem 的单株更新同样换成计时包装；
+关闭后恢复原方法，未启用的 World 没有任何额外开销。
+"""
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from pvzemu2.enums import PlantType
+
+if TYPE_CHECKING:
+    from pvzemu2.objects.plant import Plant
+    from pvzemu2.systems.plant_system import PlantSystem
+
+# World.update 中各阶段的名称，按执行顺序 (与 World._stages 一一对应)
+STAGES = (
+    'griditem_system',
+    'plant_system',
+    'zombie_system',
+    'projectile_system',
+    '_update_cards',
+    'sun_system',
+    'spawn_system',
+    'ice_path_system',
+    '_clean_dead_objects',
+)
+(GRIDITEM, PLANT, ZOMBIE, PROJECTILE, CARDS, SUN, SPAWN, ICE_PATH, CLEAN) = range(len(STAGES))
+
+_N_PLANT_TYPES = max(PlantType) + 1
+
+
+class FrameProfiler:
+    """各阶段与各植物类型的累计耗时 (秒) 与调用次数"""
+    __slots__ = ('frames', 'stage_time', 'stage_calls', 'plant_time', 'plant_calls')
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.frames = 0
+        self.stage_time = [0.0] * len(STAGES)
+        self.stage_calls = [0] * len(STAGES)
+        self.plant_time = [0.0] * _N_PLANT_TYPES
+        self.plant_calls = [0] * _N_PLANT_TYPES
+
+    def instrument_stages(self, stages: tuple[Callable[[], Optional[bool]], ...]
+                          ) -> tuple[Callable[[], Optional[bool]], ...]:
+        """返回 stages 的计时包装 (顺序与 STAGES 一致)，第一个阶段同时计帧数"""
+        stage_time = self.stage_time
+        stage_calls = self.stage_calls
+
+        def timed(i: int, stage: Callable[[], Optional[bool]]) -> Callable[[], Optional[bool]]:
+            def run() -> Optional[bool]:
+                if i == 0:
+                    self.frames += 1
+                start = perf_counter()
+                result = stage()
+                stage_time[i] += perf_counter() - start
+                stage_calls[i] += 1
+                return result
+            return run
+
+        return tuple(timed(i, stage) for i, stage in enumerate(stages))
+
+    def instrument_plant_system(self, plant_system: 'PlantSystem') -> None:
+        """以计时包装替换 plant_system 的单株更新 (实例属性，遮蔽类方法)"""
+        inner = type(plant_system)._update_plant
+        plant_time = self.plant_time
+        plant_calls = self.plant_calls
+
+        def update_plant(p: 'Plant') -> None:
+            # 按更新前的类型计入 (模仿者会在更新中变身)
+            t = p.type
+            start = perf_counter()
+            inner(plant_system, p)
+            plant_time[t] += perf_counter() - start
+            plant_calls[t] += 1
+
+        plant_system._update_plant = update_plant  # type: ignore[method-assign]
+
+    @staticmethod
+    def uninstrument_plant_system(plant_system: 'PlantSystem') -> None:
+        plant_system.__dict__.pop('_update_plant', None)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        {'frames': 帧数,
+         'stages': {阶段名: {'time': 秒, 'calls': 次数}},
+         'plants': {植物类型名: {'time': 秒, 'calls': 次数}}}  (只含被调用过的类型)
+        """
+        return {
+            'frames': self.frames,
+            'stages': {name: {'time': self.stage_time[i], 'calls': self.stage_calls[i]}
+                       for i, name in enumerate(STAGES)},
+            'plants': {PlantType(t).name: {'time': self.plant_time[t], 'calls': self.plant_calls[t]}
+                       for t in range(_N_PLANT_TYPES) if self.plant_calls[t]},
+        }
+
+    def report(self) -> str:
+        """可打印的表格，阶段按执行顺序，植物按耗时降序"""
+        total = sum(self.stage_time) or 1.0
+        lines = [f"{self.frames} frames, {sum(self.stage_time) * 1e3:.1f}ms",
+                 f"{'stage':<22}{'total ms':>10}{'calls':>10}{'us/call':>10}{'share':>8}"]
+        for i, name in enumerate(STAGES):
+            t, n = self.stage_time[i], self.stage_calls[i]
+            lines.append(f"{name:<22}{t * 1e3:>10.2f}{n:>10}{(t / n * 1e6 if n else 0.0):>10.2f}{t / total:>8.1%}")
+
+        plants = sorted((t for t in range(_N_PLANT_TYPES) if self.plant_calls[t]),
+                        key=lambda t: self.plant_time[t], reverse=True)
+        if plants:
+            lines.append(f"{'plant type':<22}{'total ms':>10}{'calls':>10}{'us/call':>10}")
+            for t in plants:
+                s, n = self.plant_time[t], self.plant_calls[t]
+                lines.append(f"{PlantType(t).name:<22}{s * 1e3:>10.2f}{n:>10}{s / n * 1e6:>10.2f}")
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        return self.report()
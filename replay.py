@@ -0,0 +1,227 @@
+"""
+录像与回放：Recorder 记录一局中的全部外部操作与周期性检查点，Replay 可跳转到任意帧。
+
+- Recorder 包装一个 World，plant / remove_plant / spawn / seed / set_field 会被写入操作日志，
+  step / step_until 推进时每 checkpoint_interval 帧保存一个检查点 (Scene.to_bytes 的紧凑快照)。
+  直接对 recorder.world 做的修改不会被记录。
+- 操作日志项为 (帧号, 操作名, 参数)，帧号是操作发生前已模拟的帧数；
+  检查点在第 k * checkpoint_interval 帧模拟完毕时保存，为 (帧号, 已包含的操作数, 快照)。
+- Replay.seek(frame) 二分找到不晚于 frame 的最近检查点，恢复后重放其余操作与帧，
+  因此跳转的代价与 checkpoint_interval 成正比，与总帧数无关。
+  seek(frame) 得到的是第 frame 帧刚模拟完毕的状态，帧号为 frame 的操作尚未执行。
+
+ReplayLog 只包含基本类型、枚举与 bytes，可直接 pickle 保存。
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import Any, Callable, Iterable, Optional, Union
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.objects.griditem import GridItem
+from pvzemu2.objects.plant import Plant
+from pvzemu2.objects.projectile import Projectile
+from pvzemu2.objects.zombie import Zombie
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+# 死亡 / 消失标志：写入 True 时经 Scene.kill 排入清理队列，直接改写标志不会使对象被移除
+_KILL_FLAGS = frozenset(('is_dead', 'is_disappeared'))
+
+# set_field 可修改的对象种类，实体按 id 查找
+_KINDS: tuple[tuple[type, str], ...] = (
+    (Plant, 'plants'),
+    (Zombie, 'zombies'),
+    (Projectile, 'projectiles'),
+    (GridItem, 'grid_items'),
+    (Scene, 'scene'),
+)
+
+Action = tuple[int, str, tuple[Any, ...]]
+
+
+@dataclass(slots=True)
+class ReplayLog:
+    scene_type: SceneType
+    checkpoint_interval: int
+    seed: Optional[int] = None
+    frames: int = 0
+    actions: list[Action] = field(default_factory=list)
+    checkpoint_frames: list[int] = field(default_factory=list)
+    # 与 checkpoint_frames 一一对应：(已包含的操作数, 快照)
+    checkpoints: list[tuple[int, bytes]] = field(default_factory=list)
+
+
+def _resolve(scene: Scene, kind: str, obj_id: int, path: str) -> tuple[Any, str]:
+    """按 (种类, id, 属性路径) 找到被修改的对象与最后一级属性名"""
+    obj: Any = scene if kind == 'scene' else getattr(scene, kind).get(obj_id)
+    if obj is None:
+        raise LookupError(f"{kind} {obj_id} does not exist")
+    *parents, name = path.split('.')
+    return reduce(getattr, parents, obj), name
+
+
+def apply_action(world: World, op: str, args: tuple[Any, ...]) -> Any:
+    """执行一条日志中的操作"""
+    if op == 'plant':
+        return world.plant(*args)
+    if op == 'remove_plant':
+        return world.remove_plant(*args)
+    if op == 'spawn':
+        return world.spawn(*args)
+    if op == 'seed':
+        return world.seed(*args)
+    if op == 'set':
+        kind, obj_id, path, value = args
+        obj, name = _resolve(world.scene, kind, obj_id, path)
+        if path in _KILL_FLAGS and value and kind != 'scene':
+            world.scene.kill(obj)
+        else:
+            setattr(obj, name, value)
+        return None
+    raise ValueError(f"unknown action {op!r}")
+
+
+class Recorder:
+    """
+    记录 world 上的外部操作。构造时保存第 0 帧检查点，之后应只通过本对象推进与修改 world。
+    """
+    __slots__ = ('world', 'log')
+
+    def __init__(self, world: World, checkpoint_interval: int = 500, seed: Optional[int] = None) -> None:
+        """
+        :param checkpoint_interval: 检查点间隔帧数，越小跳转越快、占用内存越多。
+        :param seed: 若给定，先以该种子调用 world.seed 再保存第 0 帧检查点。
+        """
+        if checkpoint_interval <= 0:
+            raise ValueError("checkpoint_interval must be positive")
+        if seed is not None:
+            world.seed(seed)
+        self.world = world
+        self.log = ReplayLog(world.scene.type, checkpoint_interval, seed)
+        self._checkpoint()
+
+    @property
+    def frame(self) -> int:
+        return self.log.frames
+
+    # --- 操作 ---
+
+    def plant(self, plant_type: PlantType, row: int, col: int) -> Optional[Plant]:
+        return self._record('plant', (plant_type, row, col))
+
+    def remove_plant(self, row: int, col: int) -> bool:
+        return self._record('remove_plant', (row, col))
+
+    def spawn(self, zombie_type: ZombieType, row: int, x: float = 800.0) -> Zombie:
+        return self._record('spawn', (zombie_type, row, x))
+
+    def seed(self, seed: int) -> None:
+        self._record('seed', (seed,))
+
+    def set_field(self, target: Union[Scene, Plant, Zombie, Projectile, GridItem], path: str, value: Any) -> None:
+        """
+        直接修改字段并记录，例如 set_field(zombie, 'hp', 50)、set_field(scene, 'sun.sun', 9990)。
+        path 为点分隔的属性路径；修改 row 等索引相关字段时不会更新场景索引。
+        把 is_dead / is_disappeared 设为 True 等同于 Scene.kill(target)，对象在本帧末被移除。
+        """
+        for cls, kind in _KINDS:
+            if isinstance(target, cls):
+                break
+        else:
+            raise TypeError(f"cannot record edits on {type(target).__name__}")
+        obj_id = -1 if kind == 'scene' else target.id
+        self._record('set', (kind, obj_id, path, value))
+
+    def _record(self, op: str, args: tuple[Any, ...]) -> Any:
+        result = apply_action(self.world, op, args)
+        self.log.actions.append((self.log.frames, op, args))
+        return result
+
+    # --- 推进 ---
+
+    def update(self) -> bool:
+        """推进一帧，对应 World.update"""
+        done = self.world.update()
+        self.log.frames += 1
+        self._maybe_checkpoint()
+        return done
+
+    def step(self, frames: int = 1) -> bool:
+        """对应 World.step"""
+        for _ in range(frames):
+            if self.update():
+                return True
+        return False
+
+    def step_until(self, until: Union[Callable[[World], bool], Iterable[str], None] = None,
+                   max_frames: int = 100000) -> int:
+        """
+        对应 World.step_until。在检查点边界处分段调用，保证每个检查点都落在间隔的整数倍上。
+        """
+        interval = self.log.checkpoint_interval
+        frames = 0
+        while frames < max_frames and not self.world.scene.is_game_over:
+            chunk = min(max_frames - frames, interval - self.log.frames % interval)
+            done = self.world.step_until(until, chunk)
+            self.log.frames += done
+            frames += done
+            self._maybe_checkpoint()
+            if done < chunk:
+                break
+        return frames
+
+    def _maybe_checkpoint(self) -> None:
+        log = self.log
+        if log.frames % log.checkpoint_interval == 0 and log.frames > log.checkpoint_frames[-1]:
+            self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        log = self.log
+        log.checkpoint_frames.append(log.frames)
+        log.checkpoints.append((len(log.actions), self.world.scene.to_bytes()))
+
+
+class Replay:
+    """
+    按 ReplayLog 重建任意帧。seek 之后的 world 属于 Replay，继续 seek 时可能被替换或继续推进。
+    """
+    __slots__ = ('log', 'world', 'frame', '_next_action')
+
+    def __init__(self, log: ReplayLog) -> None:
+        self.log = log
+        self.world: Optional[World] = None
+        self.frame = -1
+        self._next_action = 0
+
+    def seek(self, frame: int) -> World:
+        """跳转到第 frame 帧 (0 <= frame <= log.frames)"""
+        log = self.log
+        if not 0 <= frame <= log.frames:
+            raise ValueError(f"frame {frame} out of range [0, {log.frames}]")
+
+        i = bisect_right(log.checkpoint_frames, frame) - 1
+        start = log.checkpoint_frames[i]
+        # 当前位置在最近检查点与目标之间时直接向前推进，顺序拖动进度条无需反复恢复
+        if self.world is None or not start <= self.frame <= frame:
+            action_index, data = log.checkpoints[i]
+            self.world = World.from_scene(Scene.from_bytes(data))
+            self.frame = start
+            self._next_action = action_index
+
+        world = self.world
+        actions = log.actions
+        n_actions = len(actions)
+        k = self._next_action
+        while self.frame < frame:
+            while k < n_actions and actions[k][0] == self.frame:
+                _, op, args = actions[k]
+                apply_action(world, op, args)
+                k += 1
+            # 两次操作之间用 step_until 推进 (空闲帧被解析地跳过，结果与逐帧 update 相同)；
+            # 游戏结束后 update 不再改变状态，提前返回也只需对齐帧号
+            stop = min(frame, actions[k][0]) if k < n_actions else frame
+            world.step_until(None, stop - self.frame)
+            self.frame = stop
+        self._next_action = k
+        return world
@@ -1,14 +1,17 @@
 import json
 from dataclasses import dataclass, field
 from random import Random
-from typing import Any, List
+from typing import Any, List, Optional
 
 from pvzemu2.enums import SceneType, PlantType
 from pvzemu2.obj_list import ObjList
+from pvzemu2.objects.base import copy_slots
 from pvzemu2.objects.griditem import GridItem
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.projectile import Projectile
+from pvzemu2.objects.projectile_pool import ProjectilePool
 from pvzemu2.objects.zombie import Zombie
+from pvzemu2.zombie_index import ZombieRow
 
 
 @dataclass(slots=True)
@@ -99,6 +102,13 @@ class SpawnData:
     # spawn_list 简化处理
     spawn_list: list[list[Any]] = field(default_factory=lambda: [[0] * 50 for _ in range(20)])
 
+    def clone(self) -> 'SpawnData':
+        s = copy_slots(self)
+        s.row_random = [copy_slots(r) for r in self.row_random]
+        s.spawn_flags = self.spawn_flags[:]
+        s.spawn_list = [r[:] for r in self.spawn_list]
+        return s
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "wave": self.wave,
@@ -135,13 +145,26 @@ class Scene:
     grid_items: ObjList[GridItem] = field(default_factory=lambda: ObjList(use_recycle=True))
     ice_path: IcePathData = field(default_factory=IcePathData)
 
-    # 空间索引优化：按行存储僵尸 ID
-    zombies_by_row: list[set[int]] = field(init=False)
+    # 帧末待清理队列：只被标记死亡/消失、尚未经 factory.destroy 移除的对象 (见 kill)
+    dead_zombies: list[Zombie] = field(default_factory=list)
+    dead_plants: list[Plant] = field(default_factory=list)
+    dead_projectiles: list[Projectile] = field(default_factory=list)
+    dead_grid_items: list[GridItem] = field(default_factory=list)
+
+    # 空间索引优化：按行存储僵尸，行内按 x 升序 (见 zombie_index.py)
+    zombies_by_row: list[ZombieRow] = field(init=False)
 
     # Plant Map Grid (6 rows, 9 cols)
     # 简单模拟 C++ grid_plant_status, 这里存 Plant 的引用或 None
     plant_map: list[list[dict[str, Plant | None]]] = field(init=False)
 
+    # 按格子索引 grid_items (墓碑、弹坑、梯子)，每格按加入 grid_items 的先后排列
+    grid_item_map: list[list[list[GridItem]]] = field(init=False)
+
+    # 植物二级索引：按行、按 (行, 类型)，均按加入 plants 的先后排列，由 PlantFactory 维护
+    plants_by_row: list[list[Plant]] = field(init=False)
+    plants_by_row_type: dict[tuple[int, PlantType], list[Plant]] = field(init=False)
+
     sun: SunData = field(default_factory=SunData)
     spawn: SpawnData = field(default_factory=SpawnData)
 
@@ -158,11 +181,14 @@ class Scene:
     is_game_over: bool = False
     rng: Random = field(default_factory=Random)
 
+    # 可选的子弹对象池，None 表示每颗子弹都新建
+    projectile_pool: Optional[ProjectilePool] = None
+
     def __post_init__(self) -> None:
         self.rows = 6 if self.type in (SceneType.POOL, SceneType.FOG) else 5
 
         # 初始化僵尸行索引
-        self.zombies_by_row = [set() for _ in range(6)]
+        self.zombies_by_row = [ZombieRow() for _ in range(6)]
 
         # 初始化 Grid，包含 coffee_bean 字段
         self.plant_map = [
@@ -172,6 +198,9 @@ class Scene:
             ]
             for _ in range(6)
         ]
+        self.grid_item_map = [[[] for _ in range(9)] for _ in range(6)]
+        self.plants_by_row = [[] for _ in range(6)]
+        self.plants_by_row_type = {}
 
         # 初始化 zombie_dancing_clock
         self.zombie_dancing_clock = self.rng.randint(0, 9999)
@@ -181,8 +210,16 @@ class Scene:
         self.plants.clear()
         self.projectiles.clear()
         self.grid_items.clear()
-        for s in self.zombies_by_row:
-            s.clear()
+        self.dead_zombies.clear()
+        self.dead_plants.clear()
+        self.dead_projectiles.clear()
+        self.dead_grid_items.clear()
+        if self.projectile_pool is not None:
+            self.projectile_pool.clear()
+        for zombie_row in self.zombies_by_row:
+            zombie_row.clear()
+        self.rebuild_grid_item_map()
+        self.rebuild_plant_index()
 
         self.sun.sun = 9990
         self.zombie_dancing_clock = 0  # 重置为0，而不是随机值
@@ -197,6 +234,149 @@ class Scene:
                 self.plant_map[row][col] = {'content': None, 'pumpkin': None, 'base': None, 'coffee_bean': None}
         # ... 其他重置逻辑
 
+    def kill(self, obj: Zombie | Plant | Projectile | GridItem) -> None:
+        """
+        标记对象死亡 (is_dead) 或消失 (is_disappeared)，并排入帧末清理队列。
+        不经 factory.destroy 的死亡路径 (咖啡豆、被篮球砸死的植物、随植物消失的梯子) 使用；
+        World 只清理队列中的对象，直接改写标志不会使对象被移除。
+        """
+        if isinstance(obj, Zombie):
+            obj.is_dead = True
+            self.dead_zombies.append(obj)
+        elif isinstance(obj, Plant):
+            obj.is_dead = True
+            self.dead_plants.append(obj)
+        elif isinstance(obj, Projectile):
+            obj.is_disappeared = True
+            self.dead_projectiles.append(obj)
+        else:
+            obj.is_disappeared = True
+            self.dead_grid_items.append(obj)
+
+    def requeue_dead(self) -> None:
+        """按标志重建待清理队列，用于复制或解码出的场景"""
+        self.dead_zombies = [z for z in self.zombies if z.is_dead]
+        self.dead_plants = [p for p in self.plants if p.is_dead]
+        self.dead_projectiles = [p for p in self.projectiles if p.is_disappeared]
+        self.dead_grid_items = [i for i in self.grid_items if i.is_disappeared]
+
+    def sync_zombie_index(self) -> None:
+        """僵尸移动后重新排序 zombies_by_row，区间查询前调用。"""
+        for zombie_row in self.zombies_by_row:
+            zombie_row.sync()
+
+    def grid_items_at(self, row: int, col: int) -> list[GridItem]:
+        """格子 (row, col) 上的场地物品，越界时返回空列表。"""
+        if 0 <= row < 6 and 0 <= col < 9:
+            return self.grid_item_map[row][col]
+        return []
+
+    def index_grid_item(self, item: GridItem) -> None:
+        self.grid_items_at(item.row, item.col).append(item)
+
+    def unindex_grid_item(self, item: GridItem) -> None:
+        cell = self.grid_items_at(item.row, item.col)
+        for i, other in enumerate(cell):
+            if other is item:
+                del cell[i]
+                return
+
+    def rebuild_grid_item_map(self) -> None:
+        """按 grid_items 的当前内容重建 grid_item_map。"""
+        self.grid_item_map = [[[] for _ in range(9)] for _ in range(6)]
+        for item in self.grid_items:
+            self.index_grid_item(item)
+
+    def plants_in_row(self, row: int) -> list[Plant]:
+        """第 row 行的植物，越界时返回空列表。"""
+        if 0 <= row < 6:
+            return self.plants_by_row[row]
+        return []
+
+    def plants_of_type(self, row: int, type: PlantType) -> list[Plant]:
+        """第 row 行中类型为 type 的植物 (如每行的火炬树桩)。"""
+        return self.plants_by_row_type.get((row, type), [])
+
+    def index_plant(self, p: Plant) -> None:
+        if 0 <= p.row < 6:
+            self.plants_by_row[p.row].append(p)
+            self.plants_by_row_type.setdefault((p.row, p.type), []).append(p)
+
+    def unindex_plant(self, p: Plant) -> None:
+        for plants in (self.plants_in_row(p.row), self.plants_of_type(p.row, p.type)):
+            for i, other in enumerate(plants):
+                if other is p:
+                    del plants[i]
+                    break
+
+    def rebuild_plant_index(self) -> None:
+        """按 plants 的当前内容重建 plants_by_row / plants_by_row_type。"""
+        self.plants_by_row = [[] for _ in range(6)]
+        self.plants_by_row_type = {}
+        for p in self.plants:
+            self.index_plant(p)
+
+    def clone(self) -> 'Scene':
+        """
+        深拷贝场景，用于 World.clone() / snapshot()。
+        逐类型复制 slots 对象而不走 copy.deepcopy，plant_map 中的引用重新指向复制后的植物，
+        对象 id 与 ObjList 的 id 分配状态保持不变。
+        """
+        new = copy_slots(self)
+
+        zombie_memo: dict[int, Zombie] = {}
+
+        def clone_zombie(z: Zombie) -> Zombie:
+            q = zombie_memo[id(z)] = z.clone()
+            return q
+
+        new.zombies = self.zombies.clone(clone_zombie)
+
+        memo: dict[int, Plant] = {}
+
+        def clone_plant(p: Plant) -> Plant:
+            q = memo[id(p)] = p.clone()
+            return q
+
+        new.plants = self.plants.clone(clone_plant)
+        new.rebuild_plant_index()
+        new.plant_map = [
+            [
+                {k: (None if p is None else memo.get(id(p)) or p.clone()) for k, p in cell.items()}
+                for cell in row
+            ]
+            for row in self.plant_map
+        ]
+        new.projectiles = self.projectiles.clone(Projectile.clone)
+        if self.projectile_pool is not None:
+            new.projectile_pool = self.projectile_pool.clone()
+        new.grid_items = self.grid_items.clone(GridItem.clone)
+        new.rebuild_grid_item_map()
+        new.ice_path = IcePathData(self.ice_path.countdown[:], self.ice_path.x[:])
+        new.zombies_by_row = [zombie_row.clone(zombie_memo) for zombie_row in self.zombies_by_row]
+
+        new.sun = copy_slots(self.sun)
+        new.spawn = self.spawn.clone()
+        new.cards = [copy_slots(c) for c in self.cards]
+        new.requeue_dead()
+
+        rng_type = type(self.rng)
+        rng = rng_type.__new__(rng_type)
+        rng.setstate(self.rng.getstate())
+        new.rng = rng
+        return new
+
+    def to_bytes(self) -> bytes:
+        """紧凑的二进制快照 (格式见 scene_codec.py)，包含随机数状态，可由 from_bytes 完整恢复。"""
+        from pvzemu2.scene_codec import encode_scene
+        return encode_scene(self)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> 'Scene':
+        """从 to_bytes() 的结果重建场景。格式版本不符或数据损坏时抛出 ValueError。"""
+        from pvzemu2.scene_codec import decode_scene
+        return decode_scene(data)
+
     def is_water_grid(self, row: int, col: int) -> bool:
         """检查是否为水池格子"""
         if self.type not in (SceneType.POOL, SceneType.FOG):
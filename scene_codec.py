@@ -0,0 +1,388 @@
+"""
+Scene 的紧凑二进制编码 (Scene.to_bytes / Scene.from_bytes)。
+
+布局 (小端)：
+    头部    magic 'PVZS' | 格式版本 u16 | 记录布局校验 u32 | 标志 u8 (bit0: CounterRNG, bit1: 子弹对象池)
+    场景    Scene 标量字段与 SunData
+    出怪    SpawnData 标量、row_random、spawn_flags、spawn_list
+    卡片    数量 + 定长记录
+    冰道    countdown x6, x x6
+    随机数  Random.getstate() 的 625 个 u32 与 gauss_next；CounterRNG 则为 key u64、counter u64 与 gauss_next
+    对象池  植物、僵尸、子弹、场地物品各一段：ObjList 分配状态 (含句柄代数) + 按迭代顺序排列的定长记录
+    索引    plant_map (每格 4 个植物 id，-1 表示空) 与 zombies_by_row
+
+对象 id、spawn_list 等整数数组使用 i32，实体记录中的整数字段使用 i64。
+
+实体记录的字段由 dataclass 定义自动展开 (int/float/bool/枚举及嵌套的 slots dataclass)，
+其余字段 (列表、Optional 等) 由各类型的附加字段单独编码。
+float 字段中实际保存的 int 值 (如子弹的 y、动画的 fps) 在记录末尾的位掩码中标记，解码后还原为 int。
+记录布局校验是全部记录格式串的 CRC32，实体字段变化后旧快照会被拒绝而不是被错误解析。
+"""
+import dataclasses
+import struct
+import zlib
+from enum import IntEnum
+from operator import attrgetter
+from random import Random
+from typing import Any, Callable, Optional
+
+from pvzemu2.obj_list import ObjList
+from pvzemu2.objects.griditem import GridItem
+from pvzemu2.objects.plant import Plant
+from pvzemu2.objects.projectile import Projectile
+from pvzemu2.objects.projectile_pool import ProjectilePool
+from pvzemu2.objects.zombie import Zombie
+from pvzemu2.objects.zombie_reanim_data import COMMON_ZOMBIE_GROUND
+from pvzemu2.scene import Scene, SpawnData, RowRandomData, CardData, IcePathData
+from pvzemu2.systems.rng import CounterRNG
+from pvzemu2.zombie_index import ZombieRow
+
+MAGIC = b'PVZS'
+FORMAT_VERSION = 1
+
+_PLANT_SLOTS = ('content', 'pumpkin', 'base', 'coffee_bean')
+
+_HEADER = struct.Struct('<4sHIB')
+_COUNT = struct.Struct('<q')
+_OBJ_LIST = struct.Struct('<?qqqq')
+_ICE_PATH = struct.Struct('<6q6q')
+_RNG = struct.Struct('<q625I?d')
+_COUNTER_RNG = struct.Struct('<QQ?d')
+
+_FLAG_COUNTER_RNG = 1
+_FLAG_PROJECTILE_POOL = 2
+_KNOWN_FLAGS = _FLAG_COUNTER_RNG | _FLAG_PROJECTILE_POOL
+
+
+def _flatten(cls: type, skip: frozenset[str] = frozenset(), prefix: str = '') -> list[tuple[str, str, Any]]:
+    """把 dataclass 展开为 (属性路径, struct 格式符, 枚举类型或 None) 列表。"""
+    out: list[tuple[str, str, Any]] = []
+    for f in dataclasses.fields(cls):
+        if f.name in skip:
+            continue
+        path = prefix + f.name
+        t = f.type
+        if t is bool:
+            out.append((path, '?', None))
+        elif t is int:
+            out.append((path, 'q', None))
+        elif t is float:
+            out.append((path, 'd', None))
+        elif isinstance(t, type) and issubclass(t, IntEnum):
+            out.append((path, 'q', t))
+        elif isinstance(t, type) and dataclasses.is_dataclass(t):
+            out.extend(_flatten(t, prefix=path + '.'))
+        else:
+            raise TypeError(f"{cls.__name__}.{f.name}: unsupported field type {t!r}")
+    return out
+
+
+def _nested_types(cls: type, skip: frozenset[str]) -> list[tuple[str, type]]:
+    """一层嵌套的 dataclass 字段 (如 reanimate、countdown)，解码时需先创建。"""
+    return [(f.name, f.type) for f in dataclasses.fields(cls)
+            if f.name not in skip and isinstance(f.type, type) and dataclasses.is_dataclass(f.type)]
+
+
+class _RecordCodec:
+    """
+    一种实体的定长记录。
+    skip 中的字段不自动展开，由 extra_fields ((名称, 格式符), ...) 与 extra_get / extra_set 编码。
+    names 为记录中每个值的名称，嵌套字段形如 'reanimate.progress'。
+    记录末尾是 'd' 值的 int 位掩码 (每 64 个一个 u64)，不计入 names。
+    """
+    __slots__ = ('cls', 'struct', 'layout', 'names', '_get', '_set', '_extra_get', '_extra_set', '_nested',
+                 '_n_fields', '_float_index', '_n_values')
+
+    def __init__(self, cls: type, skip: tuple[str, ...] = (), extra_fields: tuple[tuple[str, str], ...] = (),
+                 extra_get: Optional[Callable[[Any], tuple[Any, ...]]] = None,
+                 extra_set: Optional[Callable[[Any, tuple[Any, ...]], None]] = None) -> None:
+        fields = _flatten(cls, frozenset(skip))
+        self.cls = cls
+        codes = [code for _, code, _ in fields] + [code for _, code in extra_fields]
+        self._float_index = tuple(i for i, code in enumerate(codes) if code == 'd')
+        self._n_values = len(codes)
+        self.layout = ''.join(codes) + 'Q' * ((len(self._float_index) + 63) // 64)
+        self.names = tuple(path for path, _, _ in fields) + tuple(name for name, _ in extra_fields)
+        self.struct = struct.Struct('<' + self.layout)
+        self._get = attrgetter(*[path for path, _, _ in fields])
+        self._extra_get = extra_get
+        self._extra_set = extra_set
+        self._nested = _nested_types(cls, frozenset(skip))
+
+        # 与 copy_slots 相同，生成逐字段赋值的函数
+        namespace: dict[str, Any] = {}
+        lines = []
+        for i, (path, _, enum_type) in enumerate(fields):
+            value = f'v[{i}]'
+            if enum_type is not None:
+                namespace[f'_e{i}'] = enum_type
+                value = f'_e{i}({value})'
+            lines.append(f'    obj.{path} = {value}\n')
+        exec(f'def _set(obj, v):\n{"".join(lines)}', namespace)
+        self._set = namespace['_set']
+        self._n_fields = len(fields)
+
+    def values(self, obj: Any) -> tuple[Any, ...]:
+        """记录中的全部值，与 names 一一对应。"""
+        if self._extra_get is None:
+            return self._get(obj)
+        return self._get(obj) + self._extra_get(obj)
+
+    def pack(self, obj: Any) -> bytes:
+        v = self.values(obj)
+        mask = 0
+        for bit, i in enumerate(self._float_index):
+            if type(v[i]) is int:
+                mask |= 1 << bit
+        words = [(mask >> shift) & 0xFFFFFFFFFFFFFFFF for shift in range(0, len(self._float_index), 64)]
+        return self.struct.pack(*v, *words)
+
+    def blank(self) -> Any:
+        """不调用 __init__ / __post_init__ 创建对象，仅创建嵌套的 dataclass 字段。"""
+        obj = object.__new__(self.cls)
+        for name, t in self._nested:
+            setattr(obj, name, t())
+        return obj
+
+    def unpack_into(self, obj: Any, data: Any, offset: int) -> int:
+        v = self.struct.unpack_from(data, offset)
+        mask = 0
+        for shift, word in enumerate(v[self._n_values:]):
+            mask |= word << (64 * shift)
+        if mask:
+            v = list(v)
+            for bit, i in enumerate(self._float_index):
+                if mask >> bit & 1:
+                    v[i] = int(v[i])
+        self._set(obj, v)
+        if self._extra_set is not None:
+            self._extra_set(obj, v[self._n_fields:])
+        return offset + self.struct.size
+
+
+def _zombie_extra_get(z: Zombie) -> tuple[Any, ...]:
+    master_id = -1 if z.master_id is None else z.master_id
+    original_dx = z._original_dx
+    return (*z.partners, master_id, z._ground is not None,
+            original_dx is not None, 0.0 if original_dx is None else original_dx)
+
+
+def _zombie_extra_set(z: Zombie, v: tuple[Any, ...]) -> None:
+    z.partners = list(v[0:4])
+    z.master_id = None if v[4] == -1 else v[4]
+    # _ground 总是指向共享的地面位移表，只记录是否被禁用
+    z._ground = COMMON_ZOMBIE_GROUND if v[5] else None
+    z._original_dx = v[7] if v[6] else None
+    z._hit_box_cache = z._attack_box_cache = None
+
+
+def _plant_extra_get(p: Plant) -> tuple[Any, ...]:
+    flags = p.split_pea_attack_flags
+    return flags['front'], flags['back']
+
+
+def _plant_extra_set(p: Plant, v: tuple[Any, ...]) -> None:
+    p.split_pea_attack_flags = {'front': v[0], 'back': v[1]}
+
+
+PLANT_RECORD = _RecordCodec(
+    Plant, ('split_pea_attack_flags',),
+    (('split_pea_attack_flags.front', '?'), ('split_pea_attack_flags.back', '?')),
+    _plant_extra_get, _plant_extra_set)
+ZOMBIE_RECORD = _RecordCodec(
+    Zombie, ('partners', 'master_id', '_ground', '_original_dx', '_hit_box_cache', '_attack_box_cache'),
+    (('partners.0', 'q'), ('partners.1', 'q'), ('partners.2', 'q'), ('partners.3', 'q'), ('master_id', 'q'),
+     ('has_ground', '?'), ('has_original_dx', '?'), ('_original_dx', 'd')),
+    _zombie_extra_get, _zombie_extra_set)
+PROJECTILE_RECORD = _RecordCodec(Projectile)
+GRID_ITEM_RECORD = _RecordCodec(GridItem)
+CARD_RECORD = _RecordCodec(CardData)
+SPAWN_RECORD = _RecordCodec(SpawnData, ('row_random', 'spawn_flags', 'spawn_list'))
+ROW_RANDOM_RECORD = _RecordCodec(RowRandomData)
+SCENE_RECORD = _RecordCodec(Scene, ('zombies', 'plants', 'projectiles', 'grid_items', 'ice_path',
+                                    'dead_zombies', 'dead_plants', 'dead_projectiles', 'dead_grid_items', 'zombies_by_row',
+                                    'grid_item_map', 'plants_by_row', 'plants_by_row_type', 'plant_map', 'spawn',
+                                    'cards', 'rng', 'projectile_pool'))
+
+_RECORDS = (PLANT_RECORD, ZOMBIE_RECORD, PROJECTILE_RECORD, GRID_ITEM_RECORD, CARD_RECORD,
+            SPAWN_RECORD, ROW_RANDOM_RECORD, SCENE_RECORD)
+LAYOUT_CHECKSUM = zlib.crc32('|'.join(r.layout for r in _RECORDS).encode())
+
+
+# --- 编码 ---
+
+def _pack_obj_list(out: list[bytes], objs: ObjList[Any], record: _RecordCodec) -> None:
+    if not isinstance(objs, ObjList):
+        raise TypeError(f"scene snapshots only support ObjList pools, not {type(objs).__name__}")
+    free_ids = objs._free_ids
+    gens = objs._generations
+    out.append(_OBJ_LIST.pack(objs._use_recycle, objs._next_id, len(free_ids), len(gens), len(objs)))
+    out.append(struct.pack(f'<{len(free_ids)}i', *free_ids))
+    out.append(struct.pack(f'<{len(gens)}i', *gens))
+    out.append(struct.pack(f'<{len(gens)}q', *gens.values()))
+    pack = record.pack
+    out.extend([pack(obj) for obj in objs])
+
+
+def encode_scene(scene: Scene) -> bytes:
+    """把场景编码为 bytes，见模块文档中的布局说明。"""
+    flags = 0
+    if isinstance(scene.rng, CounterRNG):
+        flags |= _FLAG_COUNTER_RNG
+    if scene.projectile_pool is not None:
+        flags |= _FLAG_PROJECTILE_POOL
+    out = [_HEADER.pack(MAGIC, FORMAT_VERSION, LAYOUT_CHECKSUM, flags), SCENE_RECORD.pack(scene)]
+
+    spawn = scene.spawn
+    out.append(SPAWN_RECORD.pack(spawn))
+    out.extend([ROW_RANDOM_RECORD.pack(r) for r in spawn.row_random])
+    out.append(_COUNT.pack(len(spawn.spawn_flags)))
+    out.append(struct.pack(f'<{len(spawn.spawn_flags)}?', *spawn.spawn_flags))
+    n_cols = len(spawn.spawn_list[0]) if spawn.spawn_list else 0
+    out.append(struct.pack('<qq', len(spawn.spawn_list), n_cols))
+    for row in spawn.spawn_list:
+        out.append(struct.pack(f'<{n_cols}i', *row))
+
+    out.append(_COUNT.pack(len(scene.cards)))
+    out.extend([CARD_RECORD.pack(c) for c in scene.cards])
+    out.append(_ICE_PATH.pack(*scene.ice_path.countdown, *scene.ice_path.x))
+
+    if flags & _FLAG_COUNTER_RNG:
+        _, key, counter, gauss_next = scene.rng.getstate()
+        out.append(_COUNTER_RNG.pack(key, counter, gauss_next is not None, gauss_next or 0.0))
+    else:
+        version, internal, gauss_next = scene.rng.getstate()
+        out.append(_RNG.pack(version, *internal, gauss_next is not None, gauss_next or 0.0))
+
+    _pack_obj_list(out, scene.plants, PLANT_RECORD)
+    _pack_obj_list(out, scene.zombies, ZOMBIE_RECORD)
+    _pack_obj_list(out, scene.projectiles, PROJECTILE_RECORD)
+    _pack_obj_list(out, scene.grid_items, GRID_ITEM_RECORD)
+
+    plant_ids = []
+    for row in scene.plant_map:
+        for cell in row:
+            for key in _PLANT_SLOTS:
+                p = cell[key]
+                plant_ids.append(-1 if p is None else p.id)
+    out.append(_COUNT.pack(len(scene.plant_map)))
+    out.append(struct.pack(f'<{len(plant_ids)}i', *plant_ids))
+
+    out.append(_COUNT.pack(len(scene.zombies_by_row)))
+    get_zombie = scene.zombies.get
+    for zombie_row in scene.zombies_by_row:
+        # 行内顺序即按 x 排序后的顺序；已从 zombies 移除的僵尸不写入
+        ids = [z.id for z in zombie_row if get_zombie(z.id) is z]
+        out.append(_COUNT.pack(len(ids)))
+        out.append(struct.pack(f'<{len(ids)}i', *ids))
+    return b''.join(out)
+
+
+# --- 解码 ---
+
+class _Reader:
+    __slots__ = ('data', 'offset')
+
+    def __init__(self, data: Any) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read(self, s: struct.Struct) -> tuple[Any, ...]:
+        v = s.unpack_from(self.data, self.offset)
+        self.offset += s.size
+        return v
+
+    def read_array(self, code: str, n: int) -> tuple[Any, ...]:
+        return self.read(struct.Struct(f'<{n}{code}'))
+
+    def read_count(self) -> int:
+        return self.read(_COUNT)[0]
+
+    def read_into(self, record: _RecordCodec, obj: Any) -> Any:
+        self.offset = record.unpack_into(obj, self.data, self.offset)
+        return obj
+
+
+def _read_obj_list(reader: _Reader, record: _RecordCodec, new_obj: Callable[[], Any]) -> ObjList[Any]:
+    use_recycle, next_id, n_free, n_generations, n_objects = reader.read(_OBJ_LIST)
+    objs: ObjList[Any] = ObjList(use_recycle=use_recycle)
+    objs._next_id = next_id
+    objs._free_ids.extend(reader.read_array('i', n_free))
+    gen_ids = reader.read_array('i', n_generations)
+    objs._generations = dict(zip(gen_ids, reader.read_array('q', n_generations)))
+    for _ in range(n_objects):
+        obj = reader.read_into(record, new_obj())
+        objs._put(obj.id, obj)
+    return objs
+
+
+def decode_scene(data: Any) -> Scene:
+    """从 encode_scene 的结果重建场景 (含随机数状态)。"""
+    reader = _Reader(data)
+    if len(reader.data) < _HEADER.size:
+        raise ValueError("truncated scene snapshot")
+    magic, version, checksum, flags = reader.read(_HEADER)
+    if magic != MAGIC:
+        raise ValueError("not a scene snapshot")
+    if version != FORMAT_VERSION or checksum != LAYOUT_CHECKSUM:
+        raise ValueError(f"unsupported scene snapshot format (version {version}, layout {checksum:#010x})")
+    if flags & ~_KNOWN_FLAGS:
+        raise ValueError(f"unsupported scene snapshot flags {flags:#04x}")
+
+    try:
+        return _decode_body(reader, flags)
+    except struct.error as e:
+        raise ValueError(f"corrupted scene snapshot: {e}") from None
+
+
+def _decode_body(reader: _Reader, flags: int) -> Scene:
+    scene = reader.read_into(SCENE_RECORD, SCENE_RECORD.blank())
+    # 池中的空闲对象不属于场景状态，只记录是否启用
+    scene.projectile_pool = ProjectilePool() if flags & _FLAG_PROJECTILE_POOL else None
+
+    spawn = scene.spawn = reader.read_into(SPAWN_RECORD, SPAWN_RECORD.blank())
+    spawn.row_random = [reader.read_into(ROW_RANDOM_RECORD, RowRandomData()) for _ in range(6)]
+    spawn.spawn_flags = list(reader.read_array('?', reader.read_count()))
+    n_rows, n_cols = reader.read_array('q', 2)
+    spawn.spawn_list = [list(reader.read_array('i', n_cols)) for _ in range(n_rows)]
+
+    scene.cards = [reader.read_into(CARD_RECORD, CardData()) for _ in range(reader.read_count())]
+    ice = reader.read(_ICE_PATH)
+    scene.ice_path = IcePathData(list(ice[:6]), list(ice[6:]))
+
+    if flags & _FLAG_COUNTER_RNG:
+        key, counter, has_gauss, gauss_next = reader.read(_COUNTER_RNG)
+        scene.rng = CounterRNG.__new__(CounterRNG)
+        scene.rng.setstate((CounterRNG.STATE_TAG, key, counter, gauss_next if has_gauss else None))
+    else:
+        rng_state = reader.read(_RNG)
+        scene.rng = Random.__new__(Random)
+        scene.rng.setstate((rng_state[0], rng_state[1:626], rng_state[627] if rng_state[626] else None))
+
+    scene.plants = _read_obj_list(reader, PLANT_RECORD, PLANT_RECORD.blank)
+    scene.rebuild_plant_index()
+    scene.zombies = _read_obj_list(reader, ZOMBIE_RECORD, ZOMBIE_RECORD.blank)
+    scene.projectiles = _read_obj_list(reader, PROJECTILE_RECORD, PROJECTILE_RECORD.blank)
+    scene.grid_items = _read_obj_list(reader, GRID_ITEM_RECORD, GRID_ITEM_RECORD.blank)
+    scene.rebuild_grid_item_map()
+
+    n_map_rows = reader.read_count()
+    plant_ids = reader.read_array('i', n_map_rows * 9 * len(_PLANT_SLOTS))
+    get_plant = scene.plants.get
+    it = iter(plant_ids)
+    scene.plant_map = [
+        [{key: (None if (pid := next(it)) == -1 else get_plant(pid)) for key in _PLANT_SLOTS} for _ in range(9)]
+        for _ in range(n_map_rows)
+    ]
+
+    get_zombie = scene.zombies.get
+    scene.zombies_by_row = []
+    for _ in range(reader.read_count()):
+        zombie_row = ZombieRow()
+        zombies = [get_zombie(zid) for zid in reader.read_array('i', reader.read_count())]
+        if None in zombies:
+            raise ValueError("zombies_by_row references an unknown zombie id")
+        zombie_row.rebuild(zombies)
+        scene.zombies_by_row.append(zombie_row)
+    scene.requeue_dead()
+    return scene
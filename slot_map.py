@@ -0,0 +1,129 @@
+from collections import deque
+from contextlib import contextmanager
+from typing import TypeVar, Generic, Iterator, Optional, Any, Callable
+
+from pvzemu2.obj_list import _GEN_SHIFT, _ID_MASK as _SLOT_MASK
+
+T = TypeVar('T')
+
+
+class SlotMap(Generic[T]):
+    """
+    Dense generational slot map, an alternative to ObjList with the same method names (add / get /
+    remove / remove_obj / handle / resolve / scan / clone / clear / iteration / len / to_json_list)
+    but not a drop-in replacement:
+
+    - scan() follows the C++ array walk and also visits objects added during the scan into slots
+      ahead of the cursor; ObjList.scan() never visits objects added during the scan. The two give
+      different frame results when a system spawns objects while it iterates.
+    - Scene snapshots (scene_codec) only encode ObjList pools; a scene holding SlotMaps raises
+      TypeError in to_bytes().
+
+    - The object id is its slot index, like an index into the C++ object array. Freed slots are
+      reused in FIFO order, the same id recycling rule as ObjList(use_recycle=True).
+    - Every slot has a generation counter that is bumped on removal. handle(id) packs
+      (generation, slot) into one int, and resolve(handle) returns None once the object was removed,
+      even if the slot already holds a new object.
+    - Iteration and scan() walk the slots in index order, mirroring the C++ array layout.
+    - add / get / remove index plain lists, no hashing.
+    """
+    __slots__ = ('_slots', '_generations', '_free_ids', '_count')
+
+    def __init__(self, use_recycle: bool = True):
+        if not use_recycle:
+            raise ValueError("SlotMap always recycles slots")
+        self._slots: list[Optional[T]] = []
+        self._generations: list[int] = []
+        self._free_ids: deque[int] = deque()
+        self._count = 0
+
+    def add(self, obj: T) -> int:
+        """Add an object and return its slot id; sets obj.id if the attribute exists."""
+        if self._free_ids:
+            obj_id = self._free_ids.popleft()
+            self._slots[obj_id] = obj
+        else:
+            obj_id = len(self._slots)
+            self._slots.append(obj)
+            self._generations.append(0)
+        self._count += 1
+
+        if hasattr(obj, 'id'):
+            object.__setattr__(obj, 'id', obj_id)
+
+        return obj_id
+
+    def get(self, obj_id: int) -> Optional[T]:
+        """O(1) retrieval by slot, without a generation check (same contract as ObjList.get)."""
+        if 0 <= obj_id < len(self._slots):
+            return self._slots[obj_id]
+        return None
+
+    def remove(self, obj_id: int) -> None:
+        """O(1) removal; invalidates every handle to the slot."""
+        if 0 <= obj_id < len(self._slots) and self._slots[obj_id] is not None:
+            self._slots[obj_id] = None
+            self._generations[obj_id] += 1
+            self._free_ids.append(obj_id)
+            self._count -= 1
+
+    def remove_obj(self, obj: T) -> None:
+        """Remove by object instance (requires object to have .id)"""
+        if hasattr(obj, 'id') and self.get(obj.id) is obj:
+            self.remove(obj.id)
+
+    # --- 句柄 ---
+
+    def handle(self, obj_id: int) -> int:
+        """当前占用 obj_id 的对象的句柄；slot 为空时抛出 KeyError"""
+        if self.get(obj_id) is None:
+            raise KeyError(obj_id)
+        return (self._generations[obj_id] << _GEN_SHIFT) | obj_id
+
+    def resolve(self, handle: int) -> Optional[T]:
+        """句柄指向的对象；对象已被移除 (slot 为空或已被复用) 时返回 None"""
+        slot = handle & _SLOT_MASK
+        if slot < len(self._slots) and self._generations[slot] == handle >> _GEN_SHIFT:
+            return self._slots[slot]
+        return None
+
+    def generation(self, obj_id: int) -> int:
+        return self._generations[obj_id]
+
+    # --- 遍历 ---
+
+    @contextmanager
+    def scan(self) -> Iterator[Iterator[T]]:
+        """
+        与 ObjList.scan 接口相同，规则为 C++ 数组扫描：按 slot 下标顺序访问，
+        游标到达前被移除的对象跳过，放入游标之后 slot (复用或新追加) 的对象本轮也会被访问。
+        """
+        # 对象实例均为真值，filter(None, ...) 在 C 层跳过空 slot；列表只会被原地写入或追加
+        yield filter(None, self._slots)
+
+    def clone(self, copy_obj: Callable[[T], T]) -> 'SlotMap[T]':
+        """Copy the slots, generations, free list and every object (via copy_obj)."""
+        new: SlotMap[T] = SlotMap()
+        new._slots = [None if obj is None else copy_obj(obj) for obj in self._slots]
+        new._generations = self._generations[:]
+        new._free_ids = deque(self._free_ids)
+        new._count = self._count
+        return new
+
+    def clear(self) -> None:
+        """清空全部 slot；id 重新从 0 分配，但保留并推进 generation，旧句柄不会解析到新对象"""
+        n = len(self._slots)
+        self._slots = [None] * n
+        self._generations = [g + 1 for g in self._generations]
+        self._free_ids = deque(range(n))
+        self._count = 0
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over live objects in slot order."""
+        return filter(None, self._slots)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def to_json_list(self) -> list[dict[str, Any]]:
+        return [obj.to_dict() for obj in filter(None, self._slots)]  # type: ignore[attr-defined]
@@ -0,0 +1,107 @@
+"""
+僵尸 / 植物状态属性的位掩码表。
+
+热路径上的判定原本是一串 `status in (...)` / `status == A or status == B ...`，
+这里在导入时把每个 ZombieStatus / ZombieAction / ZombieType / PlantStatus 映射为一个属性位掩码，
+判定变为一次列表下标加一次按位与：
+
+    ZOMBIE_STATUS_FLAGS[z.status] & ZS_DYING
+
+表以枚举值为下标。ZombieType.NONE 为 -1，ZOMBIE_TYPE_FLAGS 末尾多留一个恒为 0 的槽位，
+负下标正好落在这个槽位上。
+"""
+from typing import Iterable
+
+from pvzemu2.enums import ZombieStatus, ZombieAction, ZombieType, PlantStatus
+
+# ---- ZombieStatus ----
+ZS_DYING = 1 << 0  # 死亡中 (has_death_status)
+ZS_IMMOBILE = 1 << 1  # 原地动作，不能移动 (is_not_movable)
+ZS_ANIMATING = 1 << 2  # 特殊动画中，只有 ANIMATING_ZOMBIES 能命中 (can_be_attacked)
+ZS_BALLOON_AIR = 1 << 3  # 气球飞行或坠落
+ZS_NO_SLOW = 1 << 4  # 不能被减速 (Zombie.can_be_slowed)
+ZS_NO_FREEZE = 1 << 5  # 不能被冻结 (Zombie.can_be_freezed，不含 ZS_NO_SLOW 与 ZS_DYING)
+ZS_NO_ICE = 1 << 6  # 不受寒冰菇冻结 (DamageSystem._can_be_freezed)
+ZS_NO_EAT = 1 << 7  # 不会啃食 (ZombieSystem._update_eating)
+ZS_POGO = 1 << 8  # 跳跳状态 (has_pogo_status)
+
+# ---- ZombieAction ----
+ZA_IMMOBILE = 1 << 0
+ZA_NO_EAT = 1 << 1
+ZA_POOL_TRANSITION = 1 << 2  # 正在入水或出水
+
+# ---- ZombieType ----
+ZT_IMMOBILE = 1 << 0
+ZT_NO_EAT = 1 << 1
+ZT_NO_SLOW = 1 << 2
+ZT_NO_ICE = 1 << 3
+ZT_WADES = 1 << 4  # 进入泳池后会切换到水中状态 (ZombieSystem._update_water_status)
+
+# ---- PlantStatus ----
+PS_SQUASH_ATTACKING = 1 << 0  # 倭瓜下落攻击中 (Plant.is_squash_attacking)
+PS_NOT_EDIBLE = 1 << 1  # 不能被啃食
+
+
+def _build(size: int, groups: Iterable[tuple[int, Iterable[int]]]) -> list[int]:
+    table = [0] * size
+    for bit, members in groups:
+        for m in members:
+            table[m] |= bit
+    return table
+
+
+_S = ZombieStatus
+
+ZOMBIE_STATUS_FLAGS: list[int] = _build(max(ZombieStatus) + 1, (
+    (ZS_DYING, (_S.DYING, _S.DYING_FROM_INSTANT_KILL, _S.DYING_FROM_LAWNMOWER)),
+    (ZS_IMMOBILE, (_S.JACKBOX_POP, _S.NEWSPAPER_DESTROYED, _S.GARGANTUAR_THROW, _S.GARGANTUAR_SMASH,
+                   _S.CATAPULT_SHOOT, _S.CATAPULT_IDLE, _S.DIGGER_DRILL, _S.DIGGER_LOST_DIG,
+                   _S.DIGGER_LANDING, _S.DIGGER_DIZZY, _S.DANCING_POINT, _S.DANCING_WAIT_SUMMONING,
+                   _S.DANCING_SUMMONING, _S.DANCING_DANCER_SPAWNING, _S.IMP_FLYING, _S.IMP_LANDING,
+                   _S.LADDER_PLACING, _S.DANCING_ARMRISE1, _S.DANCING_ARMRISE2, _S.DANCING_ARMRISE3,
+                   _S.DANCING_ARMRISE4, _S.DANCING_ARMRISE5)),
+    (ZS_ANIMATING, (_S.POLE_VALUTING_JUMPING, _S.IMP_FLYING, _S.DIGGER_DRILL, _S.DIGGER_LOST_DIG,
+                    _S.DIGGER_LANDING, _S.DOLPHIN_JUMP_IN_POOL, _S.DOLPHIN_IN_JUMP,
+                    _S.SNORKEL_JUMP_IN_THE_POOL, _S.BALLOON_FALLING, _S.RISING_FROM_GROUND,
+                    _S.DANCING_DANCER_SPAWNING)),
+    (ZS_BALLOON_AIR, (_S.BALLOON_FLYING, _S.BALLOON_FALLING)),
+    (ZS_NO_SLOW, (_S.DIGGER_DIG, _S.DIGGER_DRILL, _S.DIGGER_LOST_DIG, _S.DIGGER_LANDING,
+                  _S.RISING_FROM_GROUND, _S.DANCING_DANCER_SPAWNING)),
+    # 雪橇撞毁 (0x13) 与 POGO_WITH_STICK..POGO_JUMP_ACROSS 也不能冻结
+    (ZS_NO_FREEZE, (_S.POLE_VALUTING_JUMPING, _S.DOLPHIN_JUMP_IN_POOL, _S.DOLPHIN_IN_JUMP,
+                    _S.SNORKEL_JUMP_IN_THE_POOL, _S.IMP_FLYING, _S.IMP_LANDING,
+                    _S.BALLOON_FLYING, _S.BALLOON_FALLING, _S.BOBSLED_CRASHING,
+                    *range(_S.POGO_WITH_STICK, _S.POGO_JUMP_ACROSS + 1))),
+    (ZS_NO_ICE, (_S.POLE_VALUTING_JUMPING, _S.DOLPHIN_JUMP_IN_POOL, _S.DOLPHIN_IN_JUMP, _S.DOLPHIN_RIDE,
+                 _S.SNORKEL_JUMP_IN_THE_POOL)),
+    (ZS_NO_EAT, (_S.POLE_VALUTING_JUMPING, _S.BALLOON_FLYING)),
+    (ZS_POGO, range(_S.POGO_WITH_STICK, 28 + 1)),
+))
+
+_A = ZombieAction
+
+ZOMBIE_ACTION_FLAGS: list[int] = _build(max(ZombieAction) + 1, (
+    (ZA_IMMOBILE, (_A.FALL_FROM_SKY,)),
+    (ZA_NO_EAT, (_A.FALL_FROM_SKY, _A.CLIMBING_LADDER, _A.ENTERING_POOL, _A.LEAVING_POOL, _A.FALLING)),
+    (ZA_POOL_TRANSITION, (_A.ENTERING_POOL, _A.LEAVING_POOL)),
+))
+
+_T = ZombieType
+
+ZOMBIE_TYPE_FLAGS: list[int] = _build(max(ZombieType) + 2, (
+    (ZT_IMMOBILE, (_T.BUNGEE,)),
+    (ZT_NO_EAT, (_T.BUNGEE, _T.GARGANTUAR, _T.GIGA_GARGANTUAR, _T.ZOMBONI, _T.CATAPULT)),
+    (ZT_NO_SLOW, (_T.ZOMBONI,)),
+    (ZT_NO_ICE, (_T.ZOMBONI, _T.CATAPULT, _T.BUNGEE)),
+    (ZT_WADES, (_T.ZOMBIE, _T.CONE_HEAD, _T.BUCKET_HEAD, _T.FLAG, _T.BALLOON)),
+))
+
+_P = PlantStatus
+
+PLANT_STATUS_FLAGS: list[int] = _build(max(PlantStatus) + 1, (
+    (PS_SQUASH_ATTACKING, (_P.SQUASH_STOP_IN_THE_AIR, _P.SQUASH_JUMP_DOWN, _P.SQUASH_CRUSHED)),
+    (PS_NOT_EDIBLE, (_P.SQUASH_JUMP_UP, _P.SQUASH_STOP_IN_THE_AIR, _P.SQUASH_JUMP_DOWN, _P.SQUASH_CRUSHED,
+                     _P.FLOWER_POT_PLACED, _P.LILY_PAD_PLACED)),
+))
+
+del _S, _A, _T, _P
@@ -4,16 +4,22 @@ from pvzemu2.enums import (
     GridItemType, PlantType, PlantStatus, ZombieAccessoriesType1,
     ZombieReanimName, PlantReanimName
 )
+from pvzemu2.geometry import circle_overlaps, overlap_len
 from pvzemu2.objects.base import ReanimateType
+from pvzemu2.objects.griditem import GridItem
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.scene import Scene
+from pvzemu2.status_flags import (
+    ZOMBIE_STATUS_FLAGS, ZOMBIE_TYPE_FLAGS, ZS_DYING, ZS_ANIMATING, ZS_BALLOON_AIR, ZS_NO_ICE, ZT_NO_ICE
+)
 from pvzemu2.systems import reanim
 from pvzemu2.systems.griditem_factory import GridItemFactory
 from pvzemu2.systems.plant_factory import PlantFactory
 from pvzemu2.systems.rng import RNG
 from pvzemu2.systems.util import get_col_by_x, get_row_by_x_and_y
 from pvzemu2.systems.zombie_factory import ZombieFactory
+from pvzemu2.zombie_index import by_id
 
 
 class DebuffSystem:
@@ -78,21 +84,7 @@ class DamageSystem:
         if z.action == ZombieAction.FALL_FROM_SKY:
             return False
 
-        is_animating = (
-                z.status == ZombieStatus.POLE_VALUTING_JUMPING or
-                z.status == ZombieStatus.IMP_FLYING or
-                z.status == ZombieStatus.DIGGER_DRILL or
-                z.status == ZombieStatus.DIGGER_LOST_DIG or
-                z.status == ZombieStatus.DIGGER_LANDING or
-                z.status == ZombieStatus.DOLPHIN_JUMP_IN_POOL or
-                z.status == ZombieStatus.DOLPHIN_IN_JUMP or
-                z.status == ZombieStatus.SNORKEL_JUMP_IN_THE_POOL or
-                z.status == ZombieStatus.BALLOON_FALLING or
-                z.status == ZombieStatus.RISING_FROM_GROUND or
-                z.status == ZombieStatus.DANCING_DANCER_SPAWNING
-        )
-
-        if is_animating:
+        if ZOMBIE_STATUS_FLAGS[z.status] & ZS_ANIMATING:
             return bool(flags & AttackFlags.ANIMATING_ZOMBIES)
 
         rect = z.get_hit_box_rect()
@@ -363,18 +355,11 @@ class DamageSystem:
         # print(f"[Debug] Explosion at Row:{row}, X:{x}, Y:{y}, Radius:{radius}")
         candidates = []
         for r in range(start_row, end_row):
-            candidates.extend(self.scene.zombies_by_row[r])
+            candidates.extend(by_id(self.scene.zombies_by_row[r]))
 
-        # Collect zombies to process first to avoid modification during iteration issues if we were iterating scene.zombies directly,
-        # but here we iterate over a list of IDs, so it's safeish, but looking up object and destroying might affect zombies_by_row if we are not careful?
-        # Actually, self.scene.zombies.get(id) is safe. Destroying removes from zombies_by_row.
-        # Since we collected IDs into 'candidates' list (copy), iterating candidates is safe.
-
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None:
-                continue
+        # candidates 是行索引的副本，处理过程中销毁僵尸 (从 zombies_by_row 移除) 不影响遍历
 
+        for z in candidates:
             if not self.can_be_attacked(z, flags):
                 # print(f"  [Zombie {z.id}] Skipped: cannot be attacked (Status:{z.status.name})")
                 continue
@@ -386,7 +371,8 @@ class DamageSystem:
             # print(f"  [Zombie {z.id}] RowCheck:{row_check}, DistCheck:{dist_check}, Rect:{rect}")
 
             # Double check row diff in case grid_radius logic needs it (it's already handled by loop range, but keeping check is fine or remove it)
-            if abs(z.row - row) <= grid_radius and rect.is_overlap_with_circle(x, y, radius):
+            if (abs(z.row - row) <= grid_radius and
+                    circle_overlaps(rect.x, rect.y, rect.width, rect.height, x, y, radius)):
                 if is_ash_attack:
                     self.take_ash_attack(z)
                 else:
@@ -395,10 +381,19 @@ class DamageSystem:
         col = max(0, get_col_by_x(x))
         source_row = max(0, get_row_by_x_and_y(self.scene.type, max(40, x), y))
 
-        for item in self.scene.grid_items:
-            if item.type == GridItemType.LADDER:
-                if abs(item.col - col) <= grid_radius and abs(item.row - source_row) <= grid_radius:
-                    self.grid_item_factory.destroy(item)
+        ladders = []
+        for r in range(max(0, source_row - grid_radius), min(6, source_row + grid_radius + 1)):
+            for c in range(max(0, col - grid_radius), min(9, col + grid_radius + 1)):
+                ladders.extend(item for item in self.scene.grid_items_at(r, c) if item.type == GridItemType.LADDER)
+        self._destroy_ladders(ladders)
+
+    def _destroy_ladders(self, ladders: list[GridItem]) -> None:
+        # 按 grid_items 中的先后销毁，保持 id 回收顺序不变
+        if len(ladders) > 1:
+            order = {id(item): i for i, item in enumerate(self.scene.grid_items)}
+            ladders.sort(key=lambda item: order[id(item)])
+        for item in ladders:
+            self.grid_item_factory.destroy(item)
 
     def take_ash_attack(self, z: Zombie) -> None:
         if z.status == ZombieStatus.DYING_FROM_INSTANT_KILL:
@@ -480,8 +475,8 @@ class DamageSystem:
             self.take_instant_kill(p.row, x, y, 250, 3, True, flags)
 
             to_destroy = []
-            for other in self.scene.plants:
-                if other.row == p.row and other.col == p.col:
+            for other in self.scene.plants_in_row(p.row):
+                if other.col == p.col:
                     to_destroy.append(other)
             for other in to_destroy:
                 self.plant_factory.destroy(other)
@@ -492,12 +487,9 @@ class DamageSystem:
             # Spatial optimization: only current row
             candidates = []
             if 0 <= p.row < len(self.scene.zombies_by_row):
-                candidates = list(self.scene.zombies_by_row[p.row])
-
-            for z_id in candidates:
-                z = self.scene.zombies.get(z_id)
-                if z is None: continue
+                candidates = by_id(self.scene.zombies_by_row[p.row])
 
+            for z in candidates:
                 if not self.can_be_attacked(z, flags):
                     continue
 
@@ -508,9 +500,10 @@ class DamageSystem:
 
                 self.take_ash_attack(z)
 
-            for item in self.scene.grid_items:
-                if item.row == p.row and item.type == GridItemType.LADDER:
-                    self.grid_item_factory.destroy(item)
+            ladders = []
+            for c in range(9):
+                ladders.extend(item for item in self.scene.grid_items_at(p.row, c) if item.type == GridItemType.LADDER)
+            self._destroy_ladders(ladders)
 
             self.plant_factory.destroy(p)
 
@@ -525,22 +518,23 @@ class DamageSystem:
                 p.reanimate.n_repeated = 0
 
         elif p.type == PlantType.ICESHROOM:
-            # Global effect, iterate all zombies (safe copy)
-            for z in list(self.scene.zombies):
-                has_freezed_or_slowed = z.countdown.slow > 0 or z.countdown.freeze > 0
+            # Global effect, iterate all zombies (take 可能移除僵尸，用 scan() 遍历)
+            with self.scene.zombies.scan() as zombies:
+                for z in zombies:
+                    has_freezed_or_slowed = z.countdown.slow > 0 or z.countdown.freeze > 0
 
-                self.debuff.set_slowed(z, 2000)
+                    self.debuff.set_slowed(z, 2000)
 
-                if self._can_be_freezed(z):
-                    if z.is_in_water:
-                        z.countdown.freeze = 300
-                    elif has_freezed_or_slowed:
-                        z.countdown.freeze = self.rng.randint(101) + 300
-                    else:
-                        z.countdown.freeze = self.rng.randint(201) + 400
+                    if self._can_be_freezed(z):
+                        if z.is_in_water:
+                            z.countdown.freeze = 300
+                        elif has_freezed_or_slowed:
+                            z.countdown.freeze = self.rng.randint(101) + 300
+                        else:
+                            z.countdown.freeze = self.rng.randint(201) + 400
 
-                    self.take(z, 20, DamageFlags.BYPASSES_SHIELD)
-                    self.debuff.update_fps(z)
+                        self.take(z, 20, DamageFlags.BYPASSES_SHIELD)
+                        self.debuff.update_fps(z)
 
             self.scene.spawn.countdown_pool = 300
             self.plant_factory.destroy(p)
@@ -551,8 +545,8 @@ class DamageSystem:
 
         elif p.type == PlantType.COFFEE_BEAN:
             target = None
-            for other in self.scene.plants:
-                if other.row == p.row and other.col == p.col and other != p:
+            for other in self.scene.plants_in_row(p.row):
+                if other.col == p.col and other != p:
                     if other.is_sleeping:
                         target = other
                         break
@@ -587,8 +581,8 @@ class DamageSystem:
                 p.is_smashed = True
                 p.countdown.dead = 500
 
-                for item in self.scene.grid_items:
-                    if item.col == p.col and item.row == p.row and item.type == GridItemType.LADDER:
+                for item in self.scene.grid_items_at(p.row, p.col):
+                    if item.type == GridItemType.LADDER:
                         self.grid_item_factory.destroy(item)
                         break
         else:
@@ -601,14 +595,12 @@ class DamageSystem:
         start_row = max(0, p.row - 1)
         end_row = min(len(self.scene.zombies_by_row), p.row + 2)
 
+        # 只取判定框可能与攻击框相交的僵尸
         candidates = []
         for r in range(start_row, end_row):
-            candidates.extend(self.scene.zombies_by_row[r])
-
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
+            candidates.extend(by_id(self.scene.zombies_by_row[r].overlapping(pr_abs.x, pr_abs.x + pr_abs.width)))
 
+        for z in candidates:
             diff = abs(z.row - p.row)
             if (p.type != PlantType.GLOOMSHROOM and diff != 0):
                 continue
@@ -618,7 +610,7 @@ class DamageSystem:
 
             zr = z.get_hit_box_rect()
 
-            if pr_abs.get_overlap_len(zr) >= 0:
+            if overlap_len(pr_abs.x, pr_abs.width, zr.x, zr.width) >= 0:
                 d = 20
                 if (z.type in (ZombieType.ZOMBONI, ZombieType.CATAPULT)) and (flags & DamageFlags.SPIKE):
                     d = 1800
@@ -637,21 +629,15 @@ class DamageSystem:
                 self.take(z, d, flags)
 
     def _has_death_status(self, z: Zombie) -> bool:
-        return z.status in (ZombieStatus.DYING,
-                            ZombieStatus.DYING_FROM_INSTANT_KILL,
-                            ZombieStatus.DYING_FROM_LAWNMOWER)
+        return ZOMBIE_STATUS_FLAGS[z.status] & ZS_DYING != 0
 
     def _is_flying_or_falling(self, z: Zombie) -> bool:
-        return z.type == ZombieType.BALLOON and z.status in (ZombieStatus.BALLOON_FLYING, ZombieStatus.BALLOON_FALLING)
+        return z.type == ZombieType.BALLOON and ZOMBIE_STATUS_FLAGS[z.status] & ZS_BALLOON_AIR != 0
 
     def _can_be_freezed(self, z: Zombie) -> bool:
-        if z.type in (ZombieType.ZOMBONI, ZombieType.CATAPULT, ZombieType.BUNGEE) or \
-                self._is_flying_or_falling(z) or \
-                z.status in (ZombieStatus.POLE_VALUTING_JUMPING, ZombieStatus.DOLPHIN_JUMP_IN_POOL,
-                             ZombieStatus.DOLPHIN_IN_JUMP, ZombieStatus.DOLPHIN_RIDE,
-                             ZombieStatus.SNORKEL_JUMP_IN_THE_POOL):
+        if ZOMBIE_TYPE_FLAGS[z.type] & ZT_NO_ICE or ZOMBIE_STATUS_FLAGS[z.status] & ZS_NO_ICE:
             return False
-        return True
+        return not self._is_flying_or_falling(z)
 
     def _get_plant_attack_flags(self, p: Plant, is_range_attack: bool = True) -> int:
         flags = 0
@@ -0,0 +1,162 @@
+from pvzemu2.enums import PlantType, PlantStatus, PlantEdibleStatus, SceneType, GridItemType
+from pvzemu2.objects.plant import Plant
+from pvzemu2.scene import Scene
+from pvzemu2.systems import reanim
+
+# 逐帧更新中 (无僵尸、无子弹时) 除倒计时递减与动画推进外没有任何行为的植物：
+# 不进入 PlantSystem 的子系统分支，或对应子系统的 update 为空
+_IDLE_PLANT_TYPES = frozenset({
+    PlantType.PEA_SHOOTER, PlantType.SUNFLOWER, PlantType.CHERRY_BOMB, PlantType.WALLNUT,
+    PlantType.SNOW_PEA, PlantType.REPEATER, PlantType.PUFFSHROOM, PlantType.FUMESHROOM,
+    PlantType.HYPNOSHROOM, PlantType.LILY_PAD, PlantType.THREEPEATER, PlantType.JALAPENO,
+    PlantType.SEASHROOM, PlantType.PLANTERN, PlantType.TORCHWOOD, PlantType.TALLNUT,
+    PlantType.PUMPKIN, PlantType.CABBAGEPULT, PlantType.FLOWER_POT, PlantType.KERNELPULT,
+    PlantType.COFFEE_BEAN, PlantType.GARLIC, PlantType.MELONPULT, PlantType.GATLING_PEA,
+    PlantType.TWIN_SUNFLOWER, PlantType.GLOOMSHROOM, PlantType.CATTAIL, PlantType.WINTER_MELON,
+    PlantType.GOLD_MAGNET, PlantType.SPLIT_PEA, PlantType.POTATO_MINE,
+})
+
+_SUN_PLANT_TYPES = frozenset({PlantType.SUNFLOWER, PlantType.TWIN_SUNFLOWER, PlantType.SUNSHROOM})
+
+# 土豆雷在这些状态下于 countdown.status 归零时切换状态
+_POTATO_TIMED_STATUS = frozenset({PlantStatus.IDLE, PlantStatus.POTATO_SPROUT_OUT})
+
+_NATURAL_SUN_SCENES = frozenset({SceneType.POOL, SceneType.DAY, SceneType.ROOF})
+
+# 没有任何事件时的上限
+NO_EVENT = 1 << 62
+
+
+class FastForwardSystem:
+    """
+    空闲帧快进。
+
+    idle_frames() 计算从当前状态起可以跳过多少帧：这些帧内所有系统只做倒计时递减
+    (阳光、出怪、卡片、植物 countdown、弹坑、冰道等) 和动画推进，不会有任何倒计时越过阈值、
+    不消耗随机数、不创建或销毁对象。advance(n) 直接把这些帧的效果一次性施加到场景上，
+    结果与逐帧调用 World.update 逐位相同。
+
+    场上存在僵尸、子弹，或存在行为未被建模的植物时不快进。
+    """
+
+    def __init__(self, scene: Scene) -> None:
+        self.scene = scene
+
+    def idle_frames(self, limit: int) -> int:
+        """下一个事件帧之前可以安全跳过的帧数，不超过 limit。"""
+        scene = self.scene
+        if scene.is_game_over or len(scene.zombies) or len(scene.projectiles) or limit <= 0:
+            return 0
+
+        # horizon 为下一个事件发生在第几帧 (从 1 开始)，可以跳过 horizon - 1 帧
+        horizon = limit + 1
+
+        if scene.type in _NATURAL_SUN_SCENES:
+            horizon = min(horizon, max(scene.sun.natural_sun_countdown, 1))
+
+        spawn = scene.spawn
+        if not scene.stop_spawn and spawn.countdown_endgame <= 0 and spawn.countdown_next_wave >= 0:
+            horizon = min(horizon, max(spawn.countdown_next_wave, 1))
+
+        ice = scene.ice_path
+        for row in range(scene.rows):
+            if ice.countdown[row] > 0:
+                horizon = min(horizon, ice.countdown[row])
+
+        for item in scene.grid_items:
+            if item.type == GridItemType.CRATER and item.countdown > 0:
+                horizon = min(horizon, item.countdown)
+
+        for p in scene.plants:
+            if horizon <= 1:
+                return 0
+            horizon = min(horizon, self._plant_horizon(p))
+
+        return max(horizon - 1, 0)
+
+    def advance(self, frames: int) -> None:
+        """施加 frames 个空闲帧的效果。调用方需保证 frames <= idle_frames()。"""
+        if frames <= 0:
+            return
+        scene = self.scene
+        scene.zombie_dancing_clock += frames
+
+        for item in scene.grid_items:
+            if item.type == GridItemType.GRAVE:
+                item.countdown = max(item.countdown, min(100, item.countdown + frames))
+            elif item.type == GridItemType.CRATER and item.countdown > 0:
+                item.countdown -= frames
+
+        for p in scene.plants:
+            self._advance_plant(p, frames)
+
+        for card in scene.cards:
+            if card.cold_down > 0:
+                card.cold_down = max(card.cold_down - frames, 0)
+
+        if scene.type in _NATURAL_SUN_SCENES:
+            scene.sun.natural_sun_countdown -= frames
+
+        spawn = scene.spawn
+        if not scene.stop_spawn and spawn.countdown_endgame <= 0 and spawn.countdown_next_wave > 0:
+            spawn.countdown_next_wave -= frames
+
+        ice = scene.ice_path
+        for row in range(scene.rows):
+            if ice.countdown[row] > 0:
+                ice.countdown[row] -= frames
+
+        if spawn.countdown_pool > 0:
+            spawn.countdown_pool = max(spawn.countdown_pool - frames, 0)
+
+    # --- 植物 (与 PlantSystem.update 的逐帧流程一一对应) ---
+
+    @staticmethod
+    def _is_active(p: Plant) -> bool:
+        # PlantSystem._update_countdown_and_status 中 launch / status 倒计时是否递减
+        return not (p.is_sleeping or p.is_smashed or p.edible != PlantEdibleStatus.VISIBLE_AND_EDIBLE)
+
+    def _plant_horizon(self, p: Plant) -> int:
+        if p.type not in _IDLE_PLANT_TYPES or p.status == PlantStatus.WORK or p.is_smashed or p.hp < 0:
+            return 1
+
+        c = p.countdown
+        horizon = NO_EVENT
+        if c.awake > 0:
+            horizon = c.awake
+
+        active = self._is_active(p)
+        if active and c.launch != 0:
+            return 1
+
+        if p.type == PlantType.POTATO_MINE and p.status in _POTATO_TIMED_STATUS:
+            if c.status == 0:
+                return 1
+            if active:
+                horizon = min(horizon, c.status)
+
+        if (p.can_attack or p.type in _SUN_PLANT_TYPES) and not p.is_sleeping:
+            horizon = min(horizon, max(c.generate, 1))
+
+        if c.effect > 0:
+            horizon = min(horizon, c.effect)
+        return horizon
+
+    def _advance_plant(self, p: Plant, frames: int) -> None:
+        c = p.countdown
+        if c.awake > 0:
+            c.awake -= frames
+
+        if self._is_active(p) and c.status > 0:
+            c.status = max(c.status - frames, 0)
+
+        if (p.can_attack or p.type in _SUN_PLANT_TYPES) and not p.is_sleeping and c.generate > 0:
+            c.generate -= frames
+
+        if c.effect > 0:
+            c.effect -= frames
+
+        if c.eaten > 0:
+            c.eaten = max(c.eaten - frames, 0)
+
+        reanim.advance_progress(p.reanimate, frames)
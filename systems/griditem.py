@@ -9,14 +9,16 @@ class GridItemSystem:
         self.griditem_factory = griditem_factory
 
     def update(self) -> None:
-        for item in self.scene.grid_items:
-            if item.type == GridItemType.GRAVE:
-                # 墓碑的倒计时增加（用于冒出动画等逻辑）
-                if item.countdown < 100:
-                    item.countdown += 1
-            elif item.type == GridItemType.CRATER:
-                # 弹坑的倒计时衰减，归零时恢复成正常土地
-                if item.countdown > 0:
-                    item.countdown -= 1
-                    if item.countdown == 0:
-                        self.griditem_factory.destroy(item)
+        # 弹坑消失时会从 grid_items 移除，用 scan() 遍历
+        with self.scene.grid_items.scan() as grid_items:
+            for item in grid_items:
+                if item.type == GridItemType.GRAVE:
+                    # 墓碑的倒计时增加（用于冒出动画等逻辑）
+                    if item.countdown < 100:
+                        item.countdown += 1
+                elif item.type == GridItemType.CRATER:
+                    # 弹坑的倒计时衰减，归零时恢复成正常土地
+                    if item.countdown > 0:
+                        item.countdown -= 1
+                        if item.countdown == 0:
+                            self.griditem_factory.destroy(item)
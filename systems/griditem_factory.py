@@ -18,8 +18,8 @@ class GridItemFactory:
             # 墓碑会销毁该位置的植物
             plant_factory = PlantFactory(self.scene)
             # Safe iteration because destroy removes from list
-            for p in list(self.scene.plants):
-                if p.row == item.row and p.col == item.col:
+            for p in list(self.scene.plants_in_row(item.row)):
+                if p.col == item.col:
                     plant_factory.destroy(p)
 
             item.countdown = -self.rng.randint(50)
@@ -31,8 +31,10 @@ class GridItemFactory:
             item.countdown = 0
 
         self.scene.grid_items.add(item)
+        self.scene.index_grid_item(item)
         return item
 
     def destroy(self, item: GridItem) -> None:
         item.is_disappeared = True
         self.scene.grid_items.remove_obj(item)
+        self.scene.unindex_grid_item(item)
@@ -31,15 +31,14 @@ class PlantFactory:
         has_grave = False
         has_crater = False
 
-        for item in self.scene.grid_items:
-            if item.col == col and item.row == row:
-                if item.type == GridItemType.GRAVE:
-                    has_grave = True
-                elif item.type == GridItemType.CRATER:
-                    has_crater = True
+        for item in self.scene.grid_items_at(row, col):
+            if item.type == GridItemType.GRAVE:
+                has_grave = True
+            elif item.type == GridItemType.CRATER:
+                has_crater = True
 
-                if has_grave and has_crater:
-                    return True, True
+            if has_grave and has_crater:
+                return True, True
 
         return has_grave, has_crater
 
@@ -68,7 +67,7 @@ class PlantFactory:
 
         base_cost = COST_TABLE[type]
         if type >= PlantType.GATLING_PEA:
-            n = sum(1 for p in self.scene.plants if p.type == type)
+            n = sum(len(self.scene.plants_of_type(row, type)) for row in range(6))
             return base_cost + 50 * n
         return base_cost
 
@@ -333,6 +332,7 @@ class PlantFactory:
             plant.countdown.status = 30  # Approx delay before transforming
 
         self.scene.plants.add(plant)
+        self.scene.index_plant(plant)
 
         # Update Grid Map
         if 0 <= row < len(self.scene.plant_map) and 0 <= col < 9:
@@ -356,17 +356,20 @@ class PlantFactory:
     def destroy(self, plant: Plant) -> None:
         plant.is_dead = True
         self.scene.plants.remove_obj(plant)
+        self.scene.unindex_plant(plant)
+        if 0 <= plant.row < len(self.scene.zombies_by_row):
+            self.scene.zombies_by_row[plant.row].unwatch(plant)
 
         # Handle Tangle Kelp target logic (Simplified, assumes we can't easily access zombie from here without more info)
         # In C++: if (p.type == plant_type::tangle_kelp && p.target != -1) ...
 
         if plant.type != PlantType.COFFEE_BEAN:
             # Destroy ladders at this position
-            for item in self.scene.grid_items:
-                if item.row == plant.row and item.col == plant.col and item.type == GridItemType.LADDER:
+            for item in self.scene.grid_items_at(plant.row, plant.col):
+                if item.type == GridItemType.LADDER:
                     # Circular import avoidance: We don't import GridItemFactory here. 
-                    # Just mark item as disappeared or use a callback if possible.
-                    item.is_disappeared = True
+                    # Just mark item as disappeared and let World remove it at the end of the frame.
+                    self.scene.kill(item)
 
         if 0 <= plant.row < len(self.scene.plant_map) and 0 <= plant.col < 9:
             status = self.scene.plant_map[plant.row][plant.col]
@@ -0,0 +1,90 @@
+"""
+植物分派表：PlantSystem 在构造时为每个 PlantType 预先生成一条 PlantRecord，
+按 int(PlantType) 下标存放，update / 攻击 / 发射时各做一次下标查找。
+
+第三方可以不修改 plant_system.py 而注册新的植物子系统：
+
+    class MySubsystem(PlantSubsystem):
+        def update(self, plant): ...
+
+    register_plant_subsystem((PlantType.MARIGOLD,), MySubsystem)
+
+之后创建的 PlantSystem (World) 会以 factory(scene, damage_system, rng) 实例化子系统，
+并调用 subsystem.configure(record) 填写对应类型的记录 (默认只接管 update)。
+注册项按注册顺序应用在内置子系统之后，可覆盖内置行为。
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+from pvzemu2.enums import PlantType, PlantStatus, ProjectileType, ProjectileMotionType
+
+if TYPE_CHECKING:
+    from pvzemu2.objects.plant import Plant
+    from pvzemu2.objects.projectile import Projectile
+    from pvzemu2.objects.zombie import Zombie
+    from pvzemu2.scene import Scene
+    from pvzemu2.systems.damage import DamageSystem
+    from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
+    from pvzemu2.systems.rng import RNG
+
+PlantHandler = Callable[['Plant'], None]
+# aim(plant, projectile, target, row, x, y)：子弹创建后设置运动参数
+AimHandler = Callable[['Plant', 'Projectile', Optional['Zombie'], int, int, int], None]
+SubsystemFactory = Callable[['Scene', 'DamageSystem', 'RNG'], 'PlantSubsystem']
+
+# 下标范围：覆盖全部植物类型 (PlantType.NONE = -1 落在最后一格的默认记录上)
+RECORD_COUNT = max(PlantType) + 1
+
+
+@dataclass(slots=True)
+class LaunchSpec:
+    """一次发射的子弹类型与出生点偏移 (相对植物 x, y)。"""
+    projectile: ProjectileType
+    dx: int
+    dy: int
+    # 豌豆类按动画帧插值的额外偏移表 (plant_reanim_data.PEA_OFFSETS_*)
+    pea_offsets: Optional[list[tuple[int, int]]] = None
+    # 无 aim 时直接写入子弹的运动类型，None 表示保留工厂默认值
+    motion: Optional[ProjectileMotionType] = None
+    aim: Optional[AimHandler] = None
+
+
+@dataclass(slots=True)
+class PlantRecord:
+    """单个植物类型的预计算分派记录，未设置的项即该类型没有对应行为。"""
+    # 每帧状态机 (子系统 update)
+    update: Optional[PlantHandler] = None
+    # generate 倒计时归零时产出阳光 (向日葵 / 阳光菇)，设置后即使 can_attack 为 False 也会进入攻击逻辑
+    produce: Optional[PlantHandler] = None
+    # 攻击前是否需要 find_target 找到目标 (杨桃由子系统自行判定)
+    needs_target: bool = True
+    # 找到目标后设置 launch 倒计时，None 时使用固定的 launch_countdown
+    set_launch_countdown: Optional[PlantHandler] = None
+    launch_countdown: int = 29
+    # launch 倒计时减到这些值时开火
+    fire_frames: frozenset[int] = frozenset((1,))
+    # 开火时替代默认的 find_target + launch (三线射手、裂荚射手)
+    fire: Optional[PlantHandler] = None
+    # 替代发射子弹的攻击 (大喷菇、杨桃)
+    on_launch: Optional[PlantHandler] = None
+    launch: Optional[LaunchSpec] = None
+    alt_launch: Optional[LaunchSpec] = None
+    # 按植物状态覆盖 launch (高仙人掌)
+    status_launch: dict[PlantStatus, LaunchSpec] = field(default_factory=dict)
+
+
+_subsystem_factories: list[tuple[tuple[PlantType, ...], SubsystemFactory]] = []
+
+
+def register_plant_subsystem(types: Iterable[PlantType], factory: SubsystemFactory) -> None:
+    """为 types 注册植物子系统，对之后创建的 PlantSystem 生效。"""
+    _subsystem_factories.append((tuple(types), factory))
+
+
+def unregister_plant_subsystem(factory: SubsystemFactory) -> None:
+    """移除 factory 的全部注册项。"""
+    _subsystem_factories[:] = [entry for entry in _subsystem_factories if entry[1] is not factory]
+
+
+def registered_subsystems() -> list[tuple[tuple[PlantType, ...], SubsystemFactory]]:
+    return list(_subsystem_factories)
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from pvzemu2.objects.plant import Plant
     from pvzemu2.objects.zombie import Zombie
     from pvzemu2.systems.damage import DamageSystem
+    from pvzemu2.systems.plant_registry import PlantRecord
     from pvzemu2.systems.rng import RNG
 
 
@@ -22,6 +23,24 @@ class PlantSubsystem:
         """Called every frame for the plant. Override for specific state machine logic."""
         pass
 
+    def configure(self, record: 'PlantRecord') -> None:
+        """Fill the dispatch record of a plant type this subsystem is registered for."""
+        record.update = self.update
+
+    def is_dormant(self, plant: 'Plant') -> bool:
+        """plant 已登记触发区间 (watch_range) 且尚无僵尸可能进入，本帧的 find_target 必然落空。"""
+        rows = self.scene.zombies_by_row
+        return 0 <= plant.row < len(rows) and rows[plant.row].is_dormant(plant)
+
+    def watch_range(self, plant: 'Plant', x0: float, x1: float) -> None:
+        """
+        find_target 落空后登记触发区间 [x0, x1] (僵尸判定框的横向范围需与之相交才可能成为目标)，
+        之后由行索引在僵尸进入时唤醒，休眠期间不必逐帧索敌。
+        """
+        rows = self.scene.zombies_by_row
+        if 0 <= plant.row < len(rows):
+            rows[plant.row].watch(plant, x0, x1)
+
     def set_launch_countdown(self, plant: 'Plant', is_alt_attack: bool = False) -> None:
         """
         Determines if the plant should attack and sets the launch countdown.
@@ -124,10 +143,8 @@ class PlantSubsystem:
             if not (0 <= r < self.scene.rows):
                 continue
 
-            for z_id in self.scene.zombies_by_row[r]:
-                z = self.scene.zombies.get(z_id)
-                if z is None: continue
-
+            # 只查看判定框可能与攻击框相交的僵尸 (行内按 x 升序)
+            for z in self.scene.zombies_by_row[r].overlapping(pr_abs.x, pr_abs.x + pr_abs.width):
                 # Basic exclusions
                 if not z.is_not_dying: continue
 
@@ -175,4 +192,8 @@ class PlantSubsystem:
                         best_weight = weight
                         best_target = z
 
+                    # 权重为 -z.x 时，该行第一个合法目标即最优
+                    if plant.type != PlantType.CATTAIL:
+                        break
+
         return best_target
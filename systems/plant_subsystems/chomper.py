@@ -13,11 +13,17 @@ from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
 class ChomperSubsystem(PlantSubsystem):
     def update(self, plant: 'Plant') -> None:
         if plant.status == PlantStatus.WAIT:
+            if self.is_dormant(plant):
+                return
             target = self.find_target(plant, plant.row)
             if target:
                 plant.set_reanim(PlantReanimName.anim_bite, ReanimateType.ONCE, 24.0)
                 plant.status = PlantStatus.CHOMPER_BITE_BEGIN
                 plant.countdown.status = 70
+            else:
+                # 啃食中的僵尸额外放宽 60
+                pr = plant.get_attack_box()
+                self.watch_range(plant, pr.x - 60, pr.x + pr.width + 60)
 
         elif plant.status == PlantStatus.CHOMPER_BITE_BEGIN:
             if plant.countdown.status == 0:
@@ -81,9 +87,8 @@ class ChomperSubsystem(PlantSubsystem):
         if 0 <= row < len(self.scene.zombies_by_row):
             candidates = list(self.scene.zombies_by_row[row])
 
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None or z.is_dead:
+        for z in candidates:
+            if z.is_dead:
                 continue
 
             if not self.damage_system.can_be_attacked(z, AttackFlags.GROUND):
@@ -107,8 +112,8 @@ class ChomperSubsystem(PlantSubsystem):
             overlap = temp_attack_rect.get_overlap_len(zr)
 
             if overlap >= -current_extra_range:
-                # 寻找最靠前（最左边，x最小）的僵尸
-                if z.int_x < min_x:
+                # 寻找最靠前（最左边，x最小）的僵尸；x 相同时取 id 最小者 (C++ 数组顺序)
+                if z.int_x < min_x or z.int_x == min_x and best_target is not None and z.id < best_target.id:
                     min_x = z.int_x
                     best_target = z
 
@@ -10,4 +10,4 @@ class CoffeeBeanSubsystem(PlantSubsystem):
             if plant.countdown.effect > 0:
                 plant.countdown.effect -= 1
             else:
-                plant.is_dead = True
+                self.scene.kill(plant)
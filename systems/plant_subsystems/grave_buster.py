@@ -19,8 +19,8 @@ class GraveBusterSubsystem(PlantSubsystem):
                 griditem_factory = GridItemFactory(self.scene)
                 plant_factory = PlantFactory(self.scene)
 
-                for item in self.scene.grid_items:
-                    if item.col == plant.col and item.row == plant.row and item.type == GridItemType.GRAVE:
+                for item in self.scene.grid_items_at(plant.row, plant.col):
+                    if item.type == GridItemType.GRAVE:
                         griditem_factory.destroy(item)
                         break
 
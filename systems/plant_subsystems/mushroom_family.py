@@ -199,6 +199,7 @@ class MushroomFamilySubsystem(PlantSubsystem):
             # Assuming scene.grid_items is the list
             if target_item in self.scene.grid_items:
                 self.scene.grid_items.remove(target_item.id)
+                self.scene.unindex_grid_item(target_item)
 
     def _update_scaredyshroom(self, p: Plant) -> None:
         if p.countdown.launch > 0:
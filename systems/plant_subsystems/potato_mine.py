@@ -4,6 +4,7 @@ from pvzemu2.enums import PlantStatus, ZombieStatus, ZombieType, AttackFlags
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
+from pvzemu2.zombie_index import by_id
 
 
 class PotatoMineSubsystem(PlantSubsystem):
@@ -19,8 +20,12 @@ class PotatoMineSubsystem(PlantSubsystem):
                 plant.status = PlantStatus.POTATO_ARMED
 
         elif plant.status == PlantStatus.POTATO_ARMED:
+            if self.is_dormant(plant):
+                return
             if self.find_target(plant, plant.row):
                 self.damage_system.activate_plant(plant)
+            else:
+                self.watch_range(plant, plant.x + 40, plant.x + 80)
 
     def find_target(self, plant: Plant, row: int) -> Optional[Zombie]:
         # Potato mine trigger range
@@ -32,15 +37,12 @@ class PotatoMineSubsystem(PlantSubsystem):
 
         trigger_x = plant.x + 40
 
-        # Spatial optimization: only iterate zombies in the same row
+        # Spatial optimization: 同行中判定框可能与触发区 [trigger_x, plant.x + 80] 相交的僵尸
         candidates = []
         if 0 <= row < len(self.scene.zombies_by_row):
-            candidates = list(self.scene.zombies_by_row[row])
-
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
+            candidates = by_id(self.scene.zombies_by_row[row].overlapping(trigger_x, plant.x + 80))
 
+        for z in candidates:
             if z.is_dead: continue
             # Row check implicit
 
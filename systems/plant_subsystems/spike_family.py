@@ -28,6 +28,9 @@ class SpikeFamilySubsystem(PlantSubsystem):
 
             return
 
+        elif self.is_dormant(plant):
+            return
+
         elif self.find_target(plant, plant.row):
             plant.set_reanim_frame(PlantReanimName.anim_attack)
             plant.reanimate.type = ReanimateType.ONCE
@@ -37,6 +40,10 @@ class SpikeFamilySubsystem(PlantSubsystem):
             plant.status = PlantStatus.SPIKE_ATTACK
             plant.countdown.status = 100
 
+        else:
+            pr = plant.get_attack_box()
+            self.watch_range(plant, pr.x, pr.x + pr.width)
+
     def attack(self, plant: Plant) -> None:
         self.damage_system.range_attack(plant, DamageFlags.SPIKE | DamageFlags.BYPASSES_SHIELD)
 
@@ -46,15 +53,12 @@ class SpikeFamilySubsystem(PlantSubsystem):
         pr = plant.attack_box
         pr_abs = plant.get_attack_box()
 
-        # Spatial optimization: only iterate zombies in the same row
+        # Spatial optimization: 同行中判定框可能与攻击框相交的僵尸
         candidates = []
         if 0 <= row < len(self.scene.zombies_by_row):
-            candidates = list(self.scene.zombies_by_row[row])
-
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
+            candidates = self.scene.zombies_by_row[row].overlapping(pr_abs.x, pr_abs.x + pr_abs.width)
 
+        for z in candidates:
             # Row check implicit
 
             if not self.damage_system.can_be_attacked(z, flags):
@@ -4,13 +4,20 @@ from pvzemu2.enums import PlantStatus, ZombieStatus, AttackFlags, DamageFlags, Z
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
+from pvzemu2.zombie_index import by_id
 
 
 class SquashSubsystem(PlantSubsystem):
     def update(self, plant: Plant) -> None:
         # Initial check for idle state to find target
         if plant.status == PlantStatus.IDLE:
+            if self.is_dormant(plant):
+                return
             target = self.find_target(plant, plant.row)
+            if not target:
+                # 左右各 70，啃食中的僵尸 110
+                pr = plant.get_attack_box()
+                self.watch_range(plant, pr.x - 110, pr.x + pr.width + 110)
             if target:
                 # plant.target = target.id # TODO: Need to store target ref/id? C++ stores index
 
@@ -142,13 +149,10 @@ class SquashSubsystem(PlantSubsystem):
         # Spatial optimization: only iterate zombies in the same row
         candidates = []
         if 0 <= plant.row < len(self.scene.zombies_by_row):
-            candidates = list(self.scene.zombies_by_row[plant.row])
+            candidates = by_id(self.scene.zombies_by_row[plant.row])
 
         # Check overlap with zombies
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
-
+        for z in candidates:
             if z.is_dead: continue
             # Row check implicit
 
@@ -179,10 +183,7 @@ class SquashSubsystem(PlantSubsystem):
         if 0 <= row < len(self.scene.zombies_by_row):
             candidates = list(self.scene.zombies_by_row[row])
 
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
-
+        for z in candidates:
             if z.is_dead: continue
 
             if z.status in (
@@ -193,7 +194,8 @@ class SquashSubsystem(PlantSubsystem):
             dist = -abs_attack_rect.get_overlap_len(zr)
 
             if dist <= (110 if z.is_eating else 70):
-                if dist < min_dist:
+                # 距离相同时取 id 最小者 (C++ 数组顺序)
+                if dist < min_dist or dist == min_dist and best_target is not None and z.id < best_target.id:
                     min_dist = dist
                     best_target = z
 
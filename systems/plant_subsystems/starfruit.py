@@ -105,12 +105,13 @@ class StarfruitSubsystem(PlantSubsystem):
                     return True
                 continue
 
-            # Adjust hit box for Digger Zombie
+            # Adjust hit box for Digger Zombie (判定框是缓存的 FrozenRect，只在局部加宽)
+            width = zr.width
             if z.type == ZombieType.DIGGER:
-                zr.width += DIGGER_OFFSET_WIDTH
+                width += DIGGER_OFFSET_WIDTH
 
             # 获取僵尸当前中心点
-            hzw = zr.width / 2 + zr.x
+            hzw = width / 2 + zr.x
             hzh = zr.height / 2 + zr.y
 
             # 计算植物中心到僵尸中心的位移向量 (dx, dy)
@@ -127,7 +128,7 @@ class StarfruitSubsystem(PlantSubsystem):
             # 杨桃上下方垂直方向的子弹可以击中该僵尸 (对应朝上和朝下的两枚子弹)
             # Check for vertical hits (Up/Down stars)
             # C++: if (px < predict + zr.width / 2 && predict - zr.width / 2 < px)
-            z_half_w = zr.width / 2
+            z_half_w = width / 2
             if (predict - z_half_w) < px < (predict + z_half_w):
                 return True
 
@@ -4,6 +4,7 @@ from pvzemu2.enums import PlantStatus, ZombieAction, AttackFlags, DamageFlags
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
+from pvzemu2.zombie_index import by_id
 
 
 class TangleKelpSubsystem(PlantSubsystem):
@@ -11,8 +12,8 @@ class TangleKelpSubsystem(PlantSubsystem):
         if plant.status == PlantStatus.TANGLE_KELP_GRAB:
             target = None
             if plant.target_id != -1:
-                # Find zombie by ID using O(1) lookup
-                target = self.scene.zombies.get(plant.target_id)
+                # target_id 是句柄：目标死亡后 id 被复用时解析为 None，不会抓住新来的僵尸
+                target = self.scene.zombies.resolve(plant.target_id)
 
             if plant.countdown.status == 50 and target:
                 target.action = ZombieAction.CAUGHT_BY_KELP
@@ -24,12 +25,15 @@ class TangleKelpSubsystem(PlantSubsystem):
                     self.damage_system.take(target, target.max_hp + 1000,
                                             DamageFlags.DAMAGE_HITS_SHIELD_AND_BODY)  # Destroy zombie
 
-        else:
+        elif not self.is_dormant(plant):
             target = self.find_target(plant, plant.row)
             if target:
                 plant.status = PlantStatus.TANGLE_KELP_GRAB
                 plant.countdown.status = 100
-                plant.target_id = target.id
+                plant.target_id = self.scene.zombies.handle(target.id)
+            else:
+                pr = plant.get_hit_box()
+                self.watch_range(plant, pr.x, pr.x + pr.width)
 
     def find_target(self, plant: Plant, row: int) -> Optional[Zombie]:
         # Tangle kelp targets zombies in water
@@ -38,12 +42,9 @@ class TangleKelpSubsystem(PlantSubsystem):
         # Spatial optimization: only iterate zombies in the same row
         candidates = []
         if 0 <= row < len(self.scene.zombies_by_row):
-            candidates = list(self.scene.zombies_by_row[row])
-
-        for z_id in candidates:
-            z = self.scene.zombies.get(z_id)
-            if z is None: continue
+            candidates = by_id(self.scene.zombies_by_row[row])
 
+        for z in candidates:
             if z.is_dead: continue
             # Row check implicit
 
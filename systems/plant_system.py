@@ -8,11 +8,14 @@ from pvzemu2.objects.plant_reanim_data import (
     PEA_OFFSETS_PEA_SHOOTER, PEA_OFFSETS_SNOW_PEA,
     PEA_OFFSETS_REPEATER, PEA_OFFSETS_SPLIT_PEA, PEA_OFFSETS_GATLING_PEA
 )
+from pvzemu2.objects.projectile import Projectile
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.scene import Scene
 from pvzemu2.systems import reanim
 from pvzemu2.systems.damage import DamageSystem
 from pvzemu2.systems.plant_factory import PlantFactory
+from pvzemu2.systems.plant_registry import LaunchSpec, PlantRecord, RECORD_COUNT, registered_subsystems
+from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
 from pvzemu2.systems.plant_subsystems.blover import BloverSubsystem
 from pvzemu2.systems.plant_subsystems.cactus import CactusSubsystem
 from pvzemu2.systems.plant_subsystems.chomper import ChomperSubsystem
@@ -86,70 +89,141 @@ class PlantSystem:
         self.fume_shroom_subsystem = FumeShroomSubsystem(scene, damage_system, self.rng)
         # self.HypnoShroomSubsystem = HypnoShroomSubsystem(scene,damage_system, self.rng)
 
+        # 第三方通过 plant_registry.register_plant_subsystem 注册的子系统实例
+        self.custom_subsystems: list[PlantSubsystem] = []
+        # 按 int(PlantType) 下标的分派表
+        self.records: list[PlantRecord] = self._build_records()
+
+    def _build_records(self) -> list[PlantRecord]:
+        """为每个植物类型预先生成分派记录，随后应用第三方注册的子系统。"""
+        records = [PlantRecord() for _ in range(RECORD_COUNT)]
+
+        # 每帧状态机。咖啡豆与豌豆类没有额外的状态机
+        # TODO: coffee bean 唤醒蘑菇的逻辑 - Refer to C++ coffee_bean.cpp
+        for types, subsystem in (
+                ((PlantType.COB_CANNON,), self.cob_cannon_subsystem),
+                ((PlantType.BLOVER,), self.blover_subsystem),
+                ((PlantType.GRAVE_BUSTER,), self.grave_buster_subsystem),
+                ((PlantType.SPIKEWEED, PlantType.SPIKEROCK), self.spike_family_subsystem),
+                ((PlantType.SQUASH,), self.squash_subsystem),
+                ((PlantType.CHOMPER,), self.chomper_subsystem),
+                ((PlantType.POTATO_MINE,), self.potato_mine_subsystem),
+                ((PlantType.TANGLE_KELP,), self.tangle_kelp_subsystem),
+                ((PlantType.DOOMSHROOM, PlantType.SUNSHROOM, PlantType.ICESHROOM, PlantType.MAGNETSHROOM,
+                  PlantType.SCAREDYSHROOM), self.mushroom_family_subsystem),
+                ((PlantType.WALLNUT, PlantType.TALLNUT, PlantType.PUMPKIN, PlantType.GARLIC),
+                 self.shield_plants_subsystem),
+                ((PlantType.STARFRUIT,), self.starfruit_subsystem),
+                ((PlantType.TORCHWOOD,), self.torchwood_subsystem),
+                ((PlantType.UMBRELLA_LEAF,), self.umbrella_leaf_subsystem),
+                ((PlantType.CACTUS,), self.cactus_subsystem),
+                ((PlantType.IMITATER,), self.imitater_subsystem),
+                ((PlantType.FUMESHROOM,), self.fume_shroom_subsystem),
+        ):
+            for t in types:
+                records[t].update = subsystem.update
+
+        # 产出阳光
+        records[PlantType.SUNFLOWER].produce = self.sun_plants_subsystem.update
+        records[PlantType.TWIN_SUNFLOWER].produce = self.sun_plants_subsystem.update
+        records[PlantType.SUNSHROOM].produce = self.mushroom_family_subsystem.handle_sunshroom_production
+
+        # 找到目标后的 launch 倒计时 (C++ plant_base::set_launch_countdown)，未列出的类型为 29
+        for t in (PlantType.PEA_SHOOTER, PlantType.SNOW_PEA, PlantType.REPEATER, PlantType.GATLING_PEA,
+                  PlantType.THREEPEATER):
+            records[t].set_launch_countdown = self.pea_family_subsystem.set_launch_countdown
+        records[PlantType.SPLIT_PEA].set_launch_countdown = self._set_split_pea_launch_countdown
+        records[PlantType.CACTUS].set_launch_countdown = self.cactus_subsystem.set_launch_countdown
+        records[PlantType.KERNELPULT].set_launch_countdown = self._set_kernelpult_launch_countdown
+        # 固定倒计时取自 LAUNCH_COOLDOWN_TABLE，只在没有 set_launch_countdown 回调时生效
+        for t, countdown in LAUNCH_COOLDOWN_TABLE.items():
+            records[t].launch_countdown = countdown
+
+        starfruit = records[PlantType.STARFRUIT]
+        starfruit.needs_target = False
+        starfruit.set_launch_countdown = self.starfruit_subsystem.set_launch_countdown
+        starfruit.on_launch = self.starfruit_subsystem.attack
+        # damage.range_attack(p, 0x0 | zombie_damage_flags::not_reduce)；忧郁菇没有发射记录
+        records[PlantType.FUMESHROOM].on_launch = self.fume_shroom_subsystem.attack
+
+        # 开火时机
+        records[PlantType.REPEATER].fire_frames = frozenset((25, 1))
+        # Fire 4 times: approx 75, 50, 25, 1 if start is 100
+        records[PlantType.GATLING_PEA].fire_frames = frozenset((75, 50, 25, 1))
+        records[PlantType.THREEPEATER].fire = self._fire_threepeater
+        records[PlantType.SPLIT_PEA].fire = self._fire_split_pea
+
+        # 子弹类型与出生点 (C++ plant_system::launch)
+        records[PlantType.PEA_SHOOTER].launch = LaunchSpec(ProjectileType.PEA, 24, -33, PEA_OFFSETS_PEA_SHOOTER)
+        records[PlantType.SNOW_PEA].launch = LaunchSpec(ProjectileType.SNOW_PEA, 24, -33, PEA_OFFSETS_SNOW_PEA)
+        records[PlantType.REPEATER].launch = LaunchSpec(ProjectileType.PEA, 24, -33, PEA_OFFSETS_REPEATER)
+        records[PlantType.GATLING_PEA].launch = LaunchSpec(ProjectileType.PEA, 34, -33, PEA_OFFSETS_GATLING_PEA)
+        records[PlantType.SPLIT_PEA].launch = LaunchSpec(ProjectileType.PEA, 24, -33, PEA_OFFSETS_SPLIT_PEA)
+        records[PlantType.SPLIT_PEA].alt_launch = LaunchSpec(ProjectileType.PEA, -64, -33, PEA_OFFSETS_SPLIT_PEA,
+                                                             motion=ProjectileMotionType.LEFT_STRAIGHT)
+        records[PlantType.THREEPEATER].launch = LaunchSpec(ProjectileType.PEA, 45, 10, aim=self._aim_switch_way)
+        records[PlantType.CABBAGEPULT].launch = LaunchSpec(ProjectileType.CABBAGE, 5, -12, aim=self._aim_lob)
+        records[PlantType.KERNELPULT].launch = LaunchSpec(ProjectileType.KERNEL, 19, -37, aim=self._aim_lob)
+        records[PlantType.KERNELPULT].alt_launch = LaunchSpec(ProjectileType.BUTTER, 12, -56, aim=self._aim_lob)
+        records[PlantType.MELONPULT].launch = LaunchSpec(ProjectileType.MELON, 25, -46, aim=self._aim_lob)
+        records[PlantType.WINTER_MELON].launch = LaunchSpec(ProjectileType.WINTERMELON, 25, -46, aim=self._aim_lob)
+        records[PlantType.PUFFSHROOM].launch = LaunchSpec(ProjectileType.PUFF, 40, 40,
+                                                          motion=ProjectileMotionType.PUFF)
+        records[PlantType.SEASHROOM].launch = LaunchSpec(ProjectileType.PUFF, 45, 63,
+                                                         motion=ProjectileMotionType.PUFF)
+        records[PlantType.SCAREDYSHROOM].launch = LaunchSpec(ProjectileType.PUFF, 29, 21)
+        records[PlantType.CACTUS].launch = LaunchSpec(ProjectileType.CACTUS, 70, 23)
+        records[PlantType.CACTUS].status_launch[PlantStatus.CACTUS_TALL_IDLE] = LaunchSpec(ProjectileType.CACTUS,
+                                                                                           93, -50)
+        records[PlantType.CATTAIL].launch = LaunchSpec(ProjectileType.CACTUS, 20, -3, aim=self._aim_cattail)
+        records[PlantType.COB_CANNON].launch = LaunchSpec(ProjectileType.COB_CANNON, -44, -184,
+                                                          aim=self._aim_cob_cannon)
+
+        for types, factory in registered_subsystems():
+            subsystem = factory(self.scene, self.damage_system, self.rng)
+            self.custom_subsystems.append(subsystem)
+            for t in types:
+                subsystem.configure(records[t])
+
+        return records
+
     def update(self) -> None:
         """对应 C++ plant_system::update"""
-        # Iterate over a copy to allow safe removal during iteration
-        for p in list(self.scene.plants):
-            if p.is_dead: continue
-
-            self._update_countdown_and_status(p)
-
-            if p.type == PlantType.COB_CANNON:
-                self.cob_cannon_subsystem.update(p)
-            elif p.type == PlantType.BLOVER:
-                self.blover_subsystem.update(p)
-            elif p.type == PlantType.GRAVE_BUSTER:
-                self.grave_buster_subsystem.update(p)
-            elif p.type in (PlantType.SPIKEWEED, PlantType.SPIKEROCK):
-                self.spike_family_subsystem.update(p)
-            elif p.type == PlantType.SQUASH:
-                self.squash_subsystem.update(p)
-            elif p.type == PlantType.CHOMPER:
-                self.chomper_subsystem.update(p)
-            elif p.type == PlantType.POTATO_MINE:
-                self.potato_mine_subsystem.update(p)
-            elif p.type == PlantType.TANGLE_KELP:
-                self.tangle_kelp_subsystem.update(p)
-            elif p.type in (PlantType.DOOMSHROOM, PlantType.SUNSHROOM, PlantType.ICESHROOM, PlantType.MAGNETSHROOM,
-                            PlantType.SCAREDYSHROOM):
-                self.mushroom_family_subsystem.update(p)
-            elif p.type in (PlantType.WALLNUT, PlantType.TALLNUT, PlantType.PUMPKIN, PlantType.GARLIC):
-                self.shield_plants_subsystem.update(p)
-            elif p.type == PlantType.STARFRUIT:
-                self.starfruit_subsystem.update(p)
-            elif p.type == PlantType.TORCHWOOD:
-                self.torchwood_subsystem.update(p)
-            elif p.type == PlantType.UMBRELLA_LEAF:
-                self.umbrella_leaf_subsystem.update(p)
-            elif p.type == PlantType.CACTUS:
-                self.cactus_subsystem.update(p)
-            elif p.type == PlantType.IMITATER:
-                self.imitater_subsystem.update(p)
-            elif p.type == PlantType.FUMESHROOM:
-                self.fume_shroom_subsystem.update(p)
-            elif p.type == PlantType.COFFEE_BEAN:
-                # TODO: Implement coffee bean logic (waking up sleeping mushrooms) - Refer to C++ coffee_bean.cpp
-                pass
-            elif p.type in (PlantType.PEA_SHOOTER, PlantType.REPEATER, PlantType.THREEPEATER, PlantType.SPLIT_PEA,
-                            PlantType.GATLING_PEA, PlantType.SNOW_PEA):
-                # TODO: Pea family general updates if any (mostly handled in base or specific logic)
-                pass
-
-            if p.can_attack or p.type in (PlantType.SUNFLOWER, PlantType.TWIN_SUNFLOWER, PlantType.SUNSHROOM):
-                self._update_attack(p)
-
-            if p.countdown.effect > 0:
-                p.countdown.effect -= 1
-                if p.countdown.effect == 0:
-                    self.damage_system.activate_plant(p)
-
-            if p.countdown.eaten > 0:
-                p.countdown.eaten -= 1
-
-            if p.hp < 0:
-                self.plant_factory.destroy(p)
+        # 本阶段僵尸不移动，同步一次行索引后各植物的索敌均为区间查询
+        self.scene.sync_zombie_index()
+        # 计时统计 (profiling.FrameProfiler) 会以实例属性替换 _update_plant
+        update_plant = self._update_plant
+
+        # scan() 容许循环中增删植物：新种下的植物本帧不更新，已移除的被跳过
+        with self.scene.plants.scan() as plants:
+            for p in plants:
+                if not p.is_dead:
+                    update_plant(p)
+
+    def _update_plant(self, p: Plant) -> None:
+        records = self.records
+        self._update_countdown_and_status(p)
+
+        handler = records[p.type].update
+        if handler is not None:
+            handler(p)
+
+        # 模仿者会在 update 中变身，之后的判定按新类型查表
+        if p.can_attack or records[p.type].produce is not None:
+            self._update_attack(p)
+
+        if p.countdown.effect > 0:
+            p.countdown.effect -= 1
+            if p.countdown.effect == 0:
+                self.damage_system.activate_plant(p)
 
-            reanim.update_progress(p.reanimate)
+        if p.countdown.eaten > 0:
+            p.countdown.eaten -= 1
+
+        if p.hp < 0:
+            self.plant_factory.destroy(p)
+
+        reanim.update_progress(p.reanimate)
 
     def _update_countdown_and_status(self, p: Plant) -> None:
         """对应 C++ plant_system::update_countdown_and_status"""
@@ -178,40 +252,30 @@ class PlantSystem:
 
         p.countdown.launch -= 1
 
-        if p.type == PlantType.THREEPEATER:
-            if p.countdown.launch == 1:
-                self.launch(p, None, p.row)
-                if p.row > 0:
-                    self.launch(p, None, p.row - 1)
-                if p.row < self.scene.rows - 1:
-                    self.launch(p, None, p.row + 1)
-
-        elif p.type == PlantType.SPLIT_PEA:
-            if p.countdown.launch == 1:
-                if p.split_pea_attack_flags['front']:
-                    self.launch(p, None, p.row)
-                    p.split_pea_attack_flags['front'] = False
-                if p.split_pea_attack_flags['back']:
-                    self.launch(p, None, p.row, is_alt_attack=True)
-                    p.split_pea_attack_flags['back'] = False
-
-        elif p.type == PlantType.REPEATER:
-            if p.countdown.launch == 25 or p.countdown.launch == 1:
-                target = self.find_target(p, p.row)
-                self.launch(p, target, p.row)
-
-        elif p.type == PlantType.GATLING_PEA:
-            # Fire 4 times: approx 75, 50, 25, 1 if start is 100
-            if p.countdown.launch in (75, 50, 25, 1):
-                target = self.find_target(p, p.row)
-                self.launch(p, target, p.row)
-
-        else:
-            if p.countdown.launch == 1:
+        record = self.records[p.type]
+        if p.countdown.launch in record.fire_frames:
+            if record.fire is not None:
+                record.fire(p)
+            else:
                 # Find target before launching
                 target = self.find_target(p, p.row)
                 self.launch(p, target, p.row)
 
+    def _fire_threepeater(self, p: Plant) -> None:
+        self.launch(p, None, p.row)
+        if p.row > 0:
+            self.launch(p, None, p.row - 1)
+        if p.row < self.scene.rows - 1:
+            self.launch(p, None, p.row + 1)
+
+    def _fire_split_pea(self, p: Plant) -> None:
+        if p.split_pea_attack_flags['front']:
+            self.launch(p, None, p.row)
+            p.split_pea_attack_flags['front'] = False
+        if p.split_pea_attack_flags['back']:
+            self.launch(p, None, p.row, is_alt_attack=True)
+            p.split_pea_attack_flags['back'] = False
+
     def _update_attack(self, p: Plant) -> None:
         """对应 C++ plant_system::update_attack"""
         if p.is_sleeping:
@@ -221,12 +285,9 @@ class PlantSystem:
             p.countdown.generate -= 1
 
         if p.countdown.generate <= 0:
-            if p.type in (PlantType.SUNFLOWER, PlantType.TWIN_SUNFLOWER):
-                self.sun_plants_subsystem.update(p)
-                return
-
-            elif p.type == PlantType.SUNSHROOM:
-                self.mushroom_family_subsystem.handle_sunshroom_production(p)
+            record = self.records[p.type]
+            if record.produce is not None:
+                record.produce(p)
                 return
 
             # Reset countdown
@@ -236,61 +297,32 @@ class PlantSystem:
             # We need to determine if we can attack (find target)
             # If so, set countdown.launch based on plant type/animation
 
-            if p.type == PlantType.STARFRUIT:
-                self.starfruit_subsystem.set_launch_countdown(p)
+            if not record.needs_target:
+                record.set_launch_countdown(p)
                 return
 
             target = self.find_target(p, p.row)
 
             if target is None:
-                # Some plants might attack without target (e.g. Cherry Bomb immediately?)
-                # But mostly shooters need target.
                 # If no target, we don't set launch countdown, so we don't shoot.
                 return
 
-            # If target found, set launch countdown
-            # Delays based on C++ plant_base::set_launch_countdown
-
-            if p.type in (PlantType.PEA_SHOOTER, PlantType.SNOW_PEA, PlantType.REPEATER,
-                          PlantType.GATLING_PEA, PlantType.SPLIT_PEA, PlantType.THREEPEATER):
-                self.pea_family_subsystem.set_launch_countdown(p, is_alt_attack=False)
-                if p.type == PlantType.SPLIT_PEA:
-                    self.pea_family_subsystem.set_launch_countdown(p, is_alt_attack=True)
-
-            elif p.type == PlantType.CACTUS:
-                self.cactus_subsystem.set_launch_countdown(p)
-
-            elif p.type == PlantType.GLOOMSHROOM:
-                p.countdown.launch = 200
-
-            elif p.type == PlantType.CATTAIL:
-                p.countdown.launch = 50
-
-            elif p.type == PlantType.FUMESHROOM:
-                p.countdown.launch = 50
-
-            elif p.type == PlantType.PUFFSHROOM:
-                p.countdown.launch = 29
-
-            elif p.type == PlantType.SCAREDYSHROOM:
-                p.countdown.launch = 25
-
-            elif p.type == PlantType.CABBAGEPULT:
-                p.countdown.launch = 32
-
-            elif p.type in (PlantType.MELONPULT, PlantType.WINTER_MELON):
-                p.countdown.launch = 36
+            if record.set_launch_countdown is not None:
+                record.set_launch_countdown(p)
+            else:
+                p.countdown.launch = record.launch_countdown
 
-            elif p.type == PlantType.KERNELPULT:
-                # Random butter logic
-                if self.rng.randint(4) == 0:
-                    p.status = PlantStatus.KERNELPULT_LAUNCH_BUTTER
-                else:
-                    p.status = PlantStatus.IDLE  # Reset status if needed
-                p.countdown.launch = 30
+    def _set_split_pea_launch_countdown(self, p: Plant) -> None:
+        self.pea_family_subsystem.set_launch_countdown(p, is_alt_attack=False)
+        self.pea_family_subsystem.set_launch_countdown(p, is_alt_attack=True)
 
-            else:
-                p.countdown.launch = 29  # Default
+    def _set_kernelpult_launch_countdown(self, p: Plant) -> None:
+        # Random butter logic
+        if self.rng.randint(4) == 0:
+            p.status = PlantStatus.KERNELPULT_LAUNCH_BUTTER
+        else:
+            p.status = PlantStatus.IDLE  # Reset status if needed
+        p.countdown.launch = 30
 
     def find_target(self, p: Plant, row: int) -> Optional[Zombie]:
         """对应 C++ plant_base::find_target"""
@@ -324,10 +356,16 @@ class PlantSystem:
             if not (0 <= r < self.scene.rows):
                 continue
 
-            # Iterate only zombies in this row
-            for z_id in self.scene.zombies_by_row[r]:
-                z = self.scene.zombies.get(z_id)
-                if z is None or z.is_dead:
+            # 行内按 x 升序：除香蒲外只需查看射程 [pr_x, pr_x + pr_w] 内的僵尸，
+            # 且第一个合法目标即该行 x 最小 (权重最大) 者
+            zombie_row = self.scene.zombies_by_row[r]
+            if p.type == PlantType.CATTAIL:
+                candidates = zombie_row.zombies
+            else:
+                candidates = zombie_row.between(pr_x, pr_x + pr_w)
+
+            for z in candidates:
+                if z.is_dead:
                     continue
 
                 if not self.damage_system.can_be_attacked(z, flags):
@@ -361,24 +399,20 @@ class PlantSystem:
                     best_weight = weight
                     best_target = z
 
+                if p.type != PlantType.CATTAIL:
+                    break
+
         return best_target
 
     def get_pea_offset(self, p: Plant) -> tuple[int, int]:
-        rfs = p.reanimate.get_frame_status()
-
-        # 根据植物类型获取对应的偏移数组
-        if p.type == PlantType.PEA_SHOOTER:
-            offsets = PEA_OFFSETS_PEA_SHOOTER
-        elif p.type == PlantType.SNOW_PEA:
-            offsets = PEA_OFFSETS_SNOW_PEA
-        elif p.type == PlantType.REPEATER:
-            offsets = PEA_OFFSETS_REPEATER
-        elif p.type == PlantType.SPLIT_PEA:
-            offsets = PEA_OFFSETS_SPLIT_PEA
-        elif p.type == PlantType.GATLING_PEA:
-            offsets = PEA_OFFSETS_GATLING_PEA
-        else:
+        spec = self.records[p.type].launch
+        if spec is None or spec.pea_offsets is None:
             return 0, 0
+        return self._interpolate_pea_offset(p, spec.pea_offsets)
+
+    @staticmethod
+    def _interpolate_pea_offset(p: Plant, offsets: list[tuple[int, int]]) -> tuple[int, int]:
+        rfs = p.reanimate.get_frame_status()
 
         # 防越界保护
         if rfs.frame >= len(offsets) or rfs.next_frame >= len(offsets):
@@ -395,99 +429,25 @@ class PlantSystem:
 
     def launch(self, p: Plant, target: Optional[Zombie], row: int, is_alt_attack: bool = False) -> None:
         """对应 C++ plant_system::launch"""
-        proj_type = ProjectileType.NONE
-
-        if p.type == PlantType.FUMESHROOM:
-            # damage.range_attack(p, 0x0 | zombie_damage_flags::not_reduce)
-            self.fume_shroom_subsystem.attack(p)
+        record = self.records[p.type]
+        if record.on_launch is not None:
+            record.on_launch(p)
             return
-        elif p.type == PlantType.GLOOMSHROOM:
-            # damage.range_attack(p, 0x0 | zombie_damage_flags::not_reduce)
-            return
-        elif p.type == PlantType.STARFRUIT:
-            self.starfruit_subsystem.attack(p)
-            return
-        elif p.type in (
-        PlantType.PEA_SHOOTER, PlantType.REPEATER, PlantType.THREEPEATER, PlantType.SPLIT_PEA, PlantType.GATLING_PEA):
-            proj_type = ProjectileType.PEA
-        elif p.type == PlantType.SNOW_PEA:
-            proj_type = ProjectileType.SNOW_PEA
-        elif p.type == PlantType.CABBAGEPULT:
-            proj_type = ProjectileType.CABBAGE
-        elif p.type == PlantType.KERNELPULT:
-            proj_type = ProjectileType.BUTTER if is_alt_attack else ProjectileType.KERNEL
-        elif p.type == PlantType.MELONPULT:
-            proj_type = ProjectileType.MELON
-        elif p.type == PlantType.WINTER_MELON:
-            proj_type = ProjectileType.WINTERMELON
-        elif p.type in (PlantType.PUFFSHROOM, PlantType.SCAREDYSHROOM, PlantType.SEASHROOM):
-            proj_type = ProjectileType.PUFF
-        elif p.type in (PlantType.CACTUS, PlantType.CATTAIL):
-            proj_type = ProjectileType.CACTUS
-        elif p.type == PlantType.COB_CANNON:
-            proj_type = ProjectileType.COB_CANNON
-
-        if proj_type == ProjectileType.NONE:
+
+        if is_alt_attack and record.alt_launch is not None:
+            spec = record.alt_launch
+        else:
+            spec = record.status_launch.get(p.status, record.launch)
+        if spec is None:
             return
 
         # Calculate spawn position
-        x, y = 0, 0
-        if p.type == PlantType.PUFFSHROOM:
-            x = p.x + 40
-            y = p.y + 40
-        elif p.type == PlantType.SEASHROOM:
-            x = p.x + 45
-            y = p.y + 63
-        elif p.type == PlantType.CABBAGEPULT:
-            x = p.x + 5
-            y = p.y - 12
-        elif p.type in (PlantType.MELONPULT, PlantType.WINTER_MELON):
-            x = p.x + 25
-            y = p.y - 46
-        elif p.type == PlantType.CATTAIL:
-            x = p.x + 20
-            y = p.y - 3
-        elif p.type == PlantType.KERNELPULT:
-            if is_alt_attack:
-                x = p.x + 12
-                y = p.y - 56
-            else:
-                x = p.x + 19
-                y = p.y - 37
-        elif p.type in (PlantType.PEA_SHOOTER, PlantType.SNOW_PEA, PlantType.REPEATER):
-            ox, oy = self.get_pea_offset(p)
-            x = p.x + 24 + ox
-            y = p.y - 33 + oy
-        elif p.type == PlantType.GATLING_PEA:
-            ox, oy = self.get_pea_offset(p)
-            x = p.x + 34 + ox
-            y = p.y - 33 + oy
-        elif p.type == PlantType.SPLIT_PEA:
-            ox, oy = self.get_pea_offset(p)
-            if is_alt_attack:
-                x = p.x - 64 + ox
-            else:
-                x = p.x + 24 + ox
-            y = p.y - 33 + oy
-        elif p.type == PlantType.THREEPEATER:
-            x = p.x + 45
-            y = p.y + 10
-        elif p.type == PlantType.SCAREDYSHROOM:
-            x = p.x + 29
-            y = p.y + 21
-        elif p.type == PlantType.CACTUS:
-            if p.status == PlantStatus.CACTUS_TALL_IDLE:
-                x = p.x + 93
-                y = p.y - 50
-            else:
-                x = p.x + 70
-                y = p.y + 23
-        elif p.type == PlantType.COB_CANNON:
-            x = p.x - 44
-            y = p.y - 184
-        else:
-            x = p.x + 10
-            y = p.y + 5
+        x = p.x + spec.dx
+        y = p.y + spec.dy
+        if spec.pea_offsets is not None:
+            ox, oy = self._interpolate_pea_offset(p, spec.pea_offsets)
+            x += ox
+            y += oy
 
         # Adjust for flower pot (Optimized using plant_map)
         if 0 <= p.row < len(self.scene.plant_map) and 0 <= p.col < 9:
@@ -496,70 +456,68 @@ class PlantSystem:
                 if not pot.is_smashed and pot.edible != PlantEdibleStatus.INVISIBLE_AND_NOT_EDIBLE and not pot.is_dead:
                     y -= 5
 
-        proj = self.projectile_factory.create(proj_type, row, x, y)
+        proj = self.projectile_factory.create(spec.projectile, row, x, y)
 
-        # Set attack flags (simplified, C++ uses p.get_attack_flags)
-        # Assuming projectile_factory already sets default flags, we might need to override based on plant
+        if spec.aim is not None:
+            spec.aim(p, proj, target, row, x, y)
+        elif spec.motion is not None:
+            proj.motion_type = spec.motion
 
+    def _aim_lob(self, p: Plant, proj: Projectile, target: Optional[Zombie], row: int, x: int, y: int) -> None:
+        """投手类的抛物线，按目标 50 帧后的位置预判"""
         dist_x: float = 0.0
         dist_y: float = 0.0
 
-        if p.type in (PlantType.CABBAGEPULT, PlantType.KERNELPULT, PlantType.MELONPULT, PlantType.WINTER_MELON):
-            if target is None:
-                dist_x = 700.0 - x
-                dist_y = 0.0
-            else:
-                zr = target.get_hit_box_rect()
-
-                # Simple prediction: target current x + speed * 50
-                # C++: zombie_base(scene).predict_after(*target, 50)
-                predicted_x = target.x + target.dx * 50.0  # dx is typically negative for zombies moving left
-                dist_x = predicted_x - x - 30.0
-                dist_y = float(zr.y) - y
-
-                if target.status == ZombieStatus.DOLPHIN_RIDE:
-                    dist_x -= 60.0
-                elif target.type == ZombieType.POGO and target.has_item_or_walk_left:
-                    dist_x -= 60.0
-                elif target.status == ZombieStatus.SNORKEL_SWIM:
-                    dist_x -= 40.0
-
-            proj.motion_type = ProjectileMotionType.PARABOLA
-            proj.dx = float(max(40.0, dist_x) / 120.0)
-            proj.dy2 = 0.0
-            proj.ddy = float(dist_y / 120.0 - 7.0)
-            proj.dddy = 0.115
-
-        elif p.type == PlantType.THREEPEATER:
-            if row > p.row:
-                proj.motion_type = ProjectileMotionType.SWITCH_WAY
-                proj.dy2 = 3.0
-                proj.shadow_y -= 80.0
-            elif row < p.row:
-                proj.motion_type = ProjectileMotionType.SWITCH_WAY
-                proj.dy2 = -3.0
-                proj.shadow_y += 80.0
-
-        elif p.type in (PlantType.PUFFSHROOM, PlantType.SEASHROOM):
-            proj.motion_type = ProjectileMotionType.PUFF
-
-        elif p.type == PlantType.CATTAIL:
-            proj.dx = 2.0
-            proj.motion_type = ProjectileMotionType.CATTAIL
-            # Store target ID or reference. C++ stores index.
-            if target:
-                proj.target_id = id(target)  # Or handle this in projectile update
-
-        elif p.type == PlantType.COB_CANNON:
-            proj.flags = p.get_attack_flags(False)
-            proj.dx = 0.001
-            proj.motion_type = ProjectileMotionType.PARABOLA
-            proj.dy2 = 0.0
-            proj.ddy = -8.0
-            proj.dddy = 0.0
-            proj.cannon_x = float(p.cannon_x)
-            proj.cannon_row = get_row_by_x_and_y(self.scene.type, p.cannon_x, p.cannon_y)
-
-        elif p.type == PlantType.SPLIT_PEA:
-            if is_alt_attack:
-                proj.motion_type = ProjectileMotionType.LEFT_STRAIGHT
+        if target is None:
+            dist_x = 700.0 - x
+            dist_y = 0.0
+        else:
+            zr = target.get_hit_box_rect()
+
+            # Simple prediction: target current x + speed * 50
+            # C++: zombie_base(scene).predict_after(*target, 50)
+            predicted_x = target.x + target.dx * 50.0  # dx is typically negative for zombies moving left
+            dist_x = predicted_x - x - 30.0
+            dist_y = float(zr.y) - y
+
+            if target.status == ZombieStatus.DOLPHIN_RIDE:
+                dist_x -= 60.0
+            elif target.type == ZombieType.POGO and target.has_item_or_walk_left:
+                dist_x -= 60.0
+            elif target.status == ZombieStatus.SNORKEL_SWIM:
+                dist_x -= 40.0
+
+        proj.motion_type = ProjectileMotionType.PARABOLA
+        proj.dx = float(max(40.0, dist_x) / 120.0)
+        proj.dy2 = 0.0
+        proj.ddy = float(dist_y / 120.0 - 7.0)
+        proj.dddy = 0.115
+
+    def _aim_switch_way(self, p: Plant, proj: Projectile, target: Optional[Zombie], row: int, x: int,
+                        y: int) -> None:
+        if row > p.row:
+            proj.motion_type = ProjectileMotionType.SWITCH_WAY
+            proj.dy2 = 3.0
+            proj.shadow_y -= 80.0
+        elif row < p.row:
+            proj.motion_type = ProjectileMotionType.SWITCH_WAY
+            proj.dy2 = -3.0
+            proj.shadow_y += 80.0
+
+    def _aim_cattail(self, p: Plant, proj: Projectile, target: Optional[Zombie], row: int, x: int, y: int) -> None:
+        proj.dx = 2.0
+        proj.motion_type = ProjectileMotionType.CATTAIL
+        # Store target ID or reference. C++ stores index.
+        if target:
+            proj.target_id = id(target)  # Or handle this in projectile update
+
+    def _aim_cob_cannon(self, p: Plant, proj: Projectile, target: Optional[Zombie], row: int, x: int,
+                        y: int) -> None:
+        proj.flags = p.get_attack_flags(False)
+        proj.dx = 0.001
+        proj.motion_type = ProjectileMotionType.PARABOLA
+        proj.dy2 = 0.0
+        proj.ddy = -8.0
+        proj.dddy = 0.0
+        proj.cannon_x = float(p.cannon_x)
+        proj.cannon_row = get_row_by_x_and_y(self.scene.type, p.cannon_x, p.cannon_y)
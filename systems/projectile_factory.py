@@ -11,12 +11,16 @@ class ProjectileFactory:
 
     def create(self, projectile_type: ProjectileType, row: int, x: float, y: float) -> Projectile:
         """对应 C++ projectile_factory::create"""
-        proj = Projectile(
-            type=projectile_type,
-            row=row,
-            x=x,
-            y=y
-        )
+        pool = self.scene.projectile_pool
+        if pool is not None:
+            proj = pool.acquire(projectile_type, row, x, y)
+        else:
+            proj = Projectile(
+                type=projectile_type,
+                row=row,
+                x=x,
+                y=y
+            )
 
         # 赋予子弹一个初始高度，防止被 _roof_set_disappear 误判为撞地
         # 67.0 是一个经验值（参考了 CobCannon 的重置逻辑）
@@ -48,3 +52,5 @@ class ProjectileFactory:
     def destroy(self, proj: Projectile) -> None:
         proj.is_disappeared = True
         self.scene.projectiles.remove_obj(proj)
+        if self.scene.projectile_pool is not None:
+            self.scene.projectile_pool.release(proj)
@@ -5,6 +5,7 @@ from pvzemu2.enums import (
     ProjectileMotionType, ProjectileType, ZombieType, ZombieAccessoriesType2, ZombieStatus,
     PlantType, PlantStatus, SceneType, PlantEdibleStatus
 )
+from pvzemu2.geometry import overlap_len
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.projectile import Projectile
 from pvzemu2.objects.zombie import Zombie
@@ -15,6 +16,7 @@ from pvzemu2.systems.util import (
     get_y_by_row_and_col, get_col_by_x, get_row_by_x_and_y,
     get_y_by_row_and_x
 )
+from pvzemu2.zombie_index import by_id
 
 
 class ProjectileSystem:
@@ -37,10 +39,8 @@ class ProjectileSystem:
 
         proj_rect = proj.get_attack_box()
 
-        for p in self.scene.plants:
-            if (p.row == proj.row and
-                    p.type == PlantType.TORCHWOOD and
-                    not p.is_smashed and
+        for p in self.scene.plants_of_type(proj.row, PlantType.TORCHWOOD):
+            if (not p.is_smashed and
                     not p.is_dead and
                     proj.last_torchwood_col != p.col):
 
@@ -57,18 +57,19 @@ class ProjectileSystem:
             return None
 
         proj_rect = proj.get_attack_box()
+        px = proj_rect.x
+        pw = proj_rect.width
         min_x = 9999
         target: Optional[Zombie] = None
 
-        # Optimization: Only iterate zombies in the same row
+        # Optimization: 同行中判定框可能与子弹相交的僵尸 (按 x 升序)
         if 0 <= proj.row < self.scene.rows:
-            candidate_ids = self.scene.zombies_by_row[proj.row]
+            candidates = self.scene.zombies_by_row[proj.row].overlapping(px, px + pw)
         else:
-            candidate_ids = []
+            candidates = []
 
-        for z_id in candidate_ids:
-            z = self.scene.zombies.get(z_id)
-            if z is None or z.is_dead:
+        for z in candidates:
+            if z.is_dead:
                 continue
 
             if (z.row == proj.row and
@@ -81,8 +82,9 @@ class ProjectileSystem:
 
                 zr = z.get_hit_box_rect()
 
-                if (proj_rect.get_overlap_len(zr) >= 0 and
-                        (target is None or z.int_x < min_x)):
+                # int_x 相同时取 id 较小者 (原版按数组下标扫描)
+                if (overlap_len(px, pw, zr.x, zr.width) >= 0 and
+                        (target is None or z.int_x < min_x or z.int_x == min_x and z.id < target.id)):
                     target = z
                     min_x = z.int_x
 
@@ -92,11 +94,10 @@ class ProjectileSystem:
         proj_rect = proj.get_attack_box()
         target: Optional[Plant] = None
 
-        for p in self.scene.plants:
-            if (p.row == proj.row and
-                    p.type not in (PlantType.PUFFSHROOM, PlantType.SUNSHROOM,
-                                   PlantType.POTATO_MINE, PlantType.SPIKEWEED,
-                                   PlantType.LILY_PAD)):
+        for p in self.scene.plants_in_row(proj.row):
+            if p.type not in (PlantType.PUFFSHROOM, PlantType.SUNSHROOM,
+                              PlantType.POTATO_MINE, PlantType.SPIKEWEED,
+                              PlantType.LILY_PAD):
 
                 pr = p.get_hit_box()
                 if proj_rect.get_overlap_len(pr) > 8:
@@ -126,20 +127,20 @@ class ProjectileSystem:
                 not self.damage_system.can_be_attacked(z, proj.flags)):
             return False
 
-        return zr.get_overlap_len(proj_rect) >= 0
+        return overlap_len(zr.x, zr.width, proj_rect.x, proj_rect.width) >= 0
 
     def _suppter_attack(self, proj: Projectile, main_target: Optional[Zombie]) -> None:
         n = 0
         targets: List[Zombie] = []
+        proj_rect = proj.get_attack_box()
 
         # Optimization: Only check adjacent rows
         rows_to_check = [proj.row - 1, proj.row, proj.row + 1]
 
         for r in rows_to_check:
             if 0 <= r < self.scene.rows:
-                for z_id in self.scene.zombies_by_row[r]:
-                    z = self.scene.zombies.get(z_id)
-                    if z and not z.is_dead and self._is_covered_by_suppter(proj, z):
+                for z in by_id(self.scene.zombies_by_row[r].overlapping(proj_rect.x, proj_rect.x + proj_rect.width)):
+                    if not z.is_dead and self._is_covered_by_suppter(proj, z):
                         targets.append(z)
                         if z is not main_target:
                             n += 1
@@ -262,13 +263,11 @@ class ProjectileSystem:
             self._parabola_do_attack(proj, zombie_target)
         elif plant_target:
             # Plant target found (Basketball)
-            for p in self.scene.plants:
-                if (p.type == PlantType.UMBRELLA_LEAF and
-                        not p.is_smashed and
+            for p in self._umbrella_leaves_near(plant_target.row):
+                if (not p.is_smashed and
                         p.edible != PlantEdibleStatus.INVISIBLE_AND_NOT_EDIBLE and
                         not p.is_dead and
-                        abs(int(p.col) - int(plant_target.col)) <= 1 and
-                        abs(int(p.row) - int(plant_target.row)) <= 1):
+                        abs(int(p.col) - int(plant_target.col)) <= 1):
 
                     if p.status == PlantStatus.UMBRELLA_LEAF_SHRINK:
                         self.factory.destroy(proj)
@@ -278,7 +277,7 @@ class ProjectileSystem:
 
             plant_target.hp -= Projectile.DAMAGE[int(proj.type)]
             if plant_target.hp <= 0:
-                plant_target.is_dead = True
+                self.scene.kill(plant_target)
 
             self.factory.destroy(proj)
         else:
@@ -287,6 +286,14 @@ class ProjectileSystem:
             if proj.dy1 > threshold:
                 self._parabola_do_attack(proj, None)
 
+    def _umbrella_leaves_near(self, row: int) -> list[Plant]:
+        # 相邻三行的叶子保护伞，按加入 plants 的先后排列
+        leaves = [p for r in (row - 1, row, row + 1) for p in self.scene.plants_of_type(r, PlantType.UMBRELLA_LEAF)]
+        if len(leaves) > 1:
+            order = {id(p): i for i, p in enumerate(self.scene.plants)}
+            leaves.sort(key=lambda p: order[id(p)])
+        return leaves
+
     def _others_do_attack(self, proj: Projectile) -> None:
         if (proj.motion_type == ProjectileMotionType.PUFF and
                 proj.time_since_created >= 75 or
@@ -359,30 +366,38 @@ class ProjectileSystem:
 
     def update(self) -> None:
         """对应 C++ projectile_system::update"""
-        # Iterate copy for safe removal
-        for proj in list(self.scene.projectiles):
-            if proj.is_disappeared:
-                continue
+        # 僵尸阶段结束后同步行索引，本阶段只有子弹移动
+        self.scene.sync_zombie_index()
+
+        # scan() 容许循环中增删子弹：新发射的子弹本帧不更新，已移除的被跳过
+        update_projectile = self._update_projectile
+        with self.scene.projectiles.scan() as projectiles:
+            for proj in projectiles:
+                update_projectile(proj)
 
-            proj.time_since_created += 1
-            if proj.countdown > 0:
-                proj.countdown -= 1
+    def _update_projectile(self, proj: Projectile) -> None:
+        if proj.is_disappeared:
+            return
 
-            row = proj.row
-            y_before = get_y_by_row_and_x(self.scene.type, proj.row, proj.x)
+        proj.time_since_created += 1
+        if proj.countdown > 0:
+            proj.countdown -= 1
 
-            if proj.motion_type == ProjectileMotionType.PARABOLA:
-                self._do_parabola_motion(proj)
-            else:
-                self._do_other_motion(proj)
+        row = proj.row
+        y_before = get_y_by_row_and_x(self.scene.type, proj.row, proj.x)
+
+        if proj.motion_type == ProjectileMotionType.PARABOLA:
+            self._do_parabola_motion(proj)
+        else:
+            self._do_other_motion(proj)
 
-            y_after = get_y_by_row_and_x(self.scene.type, row, proj.x)
-            diff = y_after - y_before
+        y_after = get_y_by_row_and_x(self.scene.type, row, proj.x)
+        diff = y_after - y_before
 
-            if proj.motion_type == ProjectileMotionType.PARABOLA:
-                proj.y += diff
-                proj.dy1 = proj.dy1 - diff
+        if proj.motion_type == ProjectileMotionType.PARABOLA:
+            proj.y += diff
+            proj.dy1 = proj.dy1 - diff
 
-            proj.shadow_y += diff
-            proj.int_x = int(proj.x)
-            proj.int_y = int(proj.dy1 + proj.y)
+        proj.shadow_y += diff
+        proj.int_x = int(proj.x)
+        proj.int_y = int(proj.dy1 + proj.y)
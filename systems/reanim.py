@@ -33,6 +33,45 @@ def update_progress(r: Reanimate) -> None:
             r.progress += 1.0
 
 
+def advance_progress(r: Reanimate, frames: int) -> None:
+    """
+    连续调用 frames 次 update_progress 的等价实现 (用于快进)。
+    每帧仍逐次累加步长，保证浮点结果与逐帧推进逐位相同。
+    """
+    if r.n_frames == 0 or frames <= 0:
+        return
+
+    step = (r.fps * 0.01) / r.n_frames
+    progress = r.progress
+    prev_progress = progress
+    n_repeated = r.n_repeated
+
+    if r.type == ReanimateType.ONCE:
+        for _ in range(frames):
+            prev_progress = progress
+            progress += step
+            if progress >= 1.0:
+                n_repeated = 1
+                progress = 1.0
+            elif progress < 0:
+                n_repeated = 1
+                progress = 0.0
+    else:
+        for _ in range(frames):
+            prev_progress = progress
+            progress += step
+            while progress >= 1.0:
+                n_repeated += 1
+                progress -= 1.0
+            while progress < 0:
+                n_repeated += 1
+                progress += 1.0
+
+    r.prev_progress = prev_progress
+    r.progress = progress
+    r.n_repeated = n_repeated
+
+
 def is_just_finished(r: Reanimate) -> bool:
     """动画是否在当前帧刚刚完成一次循环/播放"""
     return r.n_repeated > 0
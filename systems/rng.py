@@ -1,9 +1,164 @@
+import hashlib
+import os
+import struct
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from random import Random
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from pvzemu2.scene import Scene
 
+_BLOCK = 64
+_BLOCK_WORDS = struct.Struct(f'<{_BLOCK}Q')
+_U64 = struct.Struct('<Q')
+_TO_FLOAT = 2.0 ** -53
+
+
+def _derive_key(*parts: bytes) -> int:
+    return int.from_bytes(hashlib.shake_128(b'|'.join(parts)).digest(8), 'little')
+
+
+def _int_bytes(n: int) -> bytes:
+    return n.to_bytes(n.bit_length() // 8 + 1, 'little', signed=True)
+
+
+class CounterRNG(Random):
+    """
+    计数器式随机数流，可替换 Scene.rng。
+
+    第 i 个 64 位输出只取决于 (key, i)：输出按 64 个一块，第 b 块为 SHAKE-128(key | b) 的 512 字节，因此
+    - skip(n) 跳过 n 个输出是 O(1) 的
+    - spawn(i) / split(n) 由 key 派生互相独立的子流，每个 worker / 每局各取一条即可复现，不必协调全局种子
+    - 整块在一次 C 调用中生成，random() / getrandbits() 只从缓冲区取值；randoms(n) 一次批量生成
+
+    继承 random.Random，randint / uniform / choices 等照常可用。
+    状态为 (key, counter)，getstate() 返回 (STATE_TAG, key, counter, gauss_next)。
+    """
+    STATE_TAG = 'shake128-ctr'
+
+    _key: int
+    _key_bytes: bytes
+    _counter: int
+    _block: list[int]
+    _block_start: int
+
+    def __init__(self, seed: Any = None, *, key: Optional[int] = None) -> None:
+        """
+        :param seed: 种子 (整数、字符串等，None 取系统随机)。
+        :param key: 直接指定 64 位 key (派生子流时使用)，优先于 seed。
+        """
+        super().__init__(seed if key is None else 0)
+        if key is not None:
+            self._set_position(key, 0)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        if a is None:
+            data = os.urandom(16)
+        elif isinstance(a, int):
+            data = _int_bytes(a)
+        else:
+            data = str(a).encode()
+        self._set_position(_derive_key(b'seed', data), 0)
+        self.gauss_next = None
+
+    def _set_position(self, key: int, counter: int) -> None:
+        self._key = key
+        self._key_bytes = _U64.pack(key)
+        self._counter = counter
+        self._block = []
+        self._block_start = counter
+
+    @property
+    def key(self) -> int:
+        return self._key
+
+    @property
+    def counter(self) -> int:
+        """已消耗的 64 位输出个数"""
+        return self._counter
+
+    # ---- 分流与跳跃 ----
+
+    def spawn(self, index: int) -> 'CounterRNG':
+        """第 index 条子流。相同 (key, index) 总是得到相同的子流，与父流当前位置无关。"""
+        return CounterRNG(key=_derive_key(b'spawn', self._key_bytes, _int_bytes(index)))
+
+    def split(self, n: int) -> list['CounterRNG']:
+        """子流 0..n-1"""
+        return [self.spawn(i) for i in range(n)]
+
+    def skip(self, n: int) -> None:
+        """跳过 n 个 64 位输出"""
+        if n < 0:
+            raise ValueError("cannot skip backwards")
+        self._counter += n
+
+    # ---- 生成 ----
+
+    def _words(self, block: int) -> tuple[int, ...]:
+        digest = hashlib.shake_128(self._key_bytes + _U64.pack(block)).digest(_BLOCK_WORDS.size)
+        return _BLOCK_WORDS.unpack(digest)
+
+    def _next64(self) -> int:
+        c = self._counter
+        i = c - self._block_start
+        if i < 0 or i >= len(self._block):
+            i = c % _BLOCK
+            self._block_start = c - i
+            self._block = self._words(c // _BLOCK)
+        self._counter = c + 1
+        return self._block[i]
+
+    def random(self) -> float:
+        c = self._counter
+        i = c - self._block_start
+        if 0 <= i < len(self._block):
+            self._counter = c + 1
+            return (self._block[i] >> 11) * _TO_FLOAT
+        return (self._next64() >> 11) * _TO_FLOAT
+
+    def _randbelow(self, n: int) -> int:
+        # randint / randrange / choice 的入口，直接从缓冲区取高位做拒绝采样
+        shift = 64 - n.bit_length()
+        r = self._next64() >> shift
+        while r >= n:
+            r = self._next64() >> shift
+        return r
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        words = (k + 63) // 64
+        x = 0
+        for i in range(words):
+            x |= self._next64() << (64 * i)
+        return x >> (words * 64 - k)
+
+    def randoms(self, n: int) -> list[float]:
+        """接下来的 n 个 [0, 1) 浮点数，等价于调用 n 次 random()"""
+        c = self._counter
+        first, last = c // _BLOCK, (c + n - 1) // _BLOCK
+        words: list[int] = []
+        for b in range(first, last + 1):
+            words.extend(self._words(b))
+        offset = c - first * _BLOCK
+        self._counter = c + n
+        return [(z >> 11) * _TO_FLOAT for z in words[offset:offset + n]]
+
+    # ---- 状态 ----
+
+    def getstate(self) -> tuple[str, int, int, Optional[float]]:
+        return self.STATE_TAG, self._key, self._counter, self.gauss_next
+
+    def setstate(self, state: tuple) -> None:
+        tag, key, counter, gauss_next = state
+        if tag != self.STATE_TAG:
+            raise ValueError(f"not a {self.STATE_TAG} state: {tag!r}")
+        self._set_position(key, counter)
+        self.gauss_next = gauss_next
+
 
 @dataclass(slots=True)
 class RNG:
@@ -2,6 +2,9 @@ from typing import TYPE_CHECKING, Optional
 
 from pvzemu2.enums import SceneType, ZombieType, ZombieStatus, ZombieAction, PlantType
 from pvzemu2.objects.zombie import Zombie
+from pvzemu2.status_flags import (
+    ZOMBIE_STATUS_FLAGS, ZOMBIE_ACTION_FLAGS, ZOMBIE_TYPE_FLAGS, ZS_DYING, ZS_IMMOBILE, ZA_IMMOBILE, ZT_IMMOBILE
+)
 
 if TYPE_CHECKING:
     from pvzemu2.scene import Scene
@@ -76,34 +79,14 @@ def zombie_init_y(scene_type: SceneType, z: Zombie, row: int) -> float:
 
 
 def is_not_movable(scene: 'Scene', z: Zombie) -> bool:
+    # 原地动作的状态 / FALL_FROM_SKY / 蹦极僵尸见 status_flags 中的 ZS_IMMOBILE 等位
+    # C++ 还检查 static_cast<int>(z.action) == 8，但 8 不在枚举中
     if (z.is_eating or
             z.countdown.freeze > 0 or
             z.countdown.butter > 0 or
-            z.status == ZombieStatus.JACKBOX_POP or
-            z.status == ZombieStatus.NEWSPAPER_DESTROYED or
-            z.status == ZombieStatus.GARGANTUAR_THROW or
-            z.status == ZombieStatus.GARGANTUAR_SMASH or
-            z.status == ZombieStatus.CATAPULT_SHOOT or
-            z.status == ZombieStatus.CATAPULT_IDLE or
-            z.status == ZombieStatus.DIGGER_DRILL or
-            z.status == ZombieStatus.DIGGER_LOST_DIG or
-            z.status == ZombieStatus.DIGGER_LANDING or
-            z.status == ZombieStatus.DIGGER_DIZZY or
-            z.status == ZombieStatus.DANCING_POINT or
-            z.status == ZombieStatus.DANCING_WAIT_SUMMONING or
-            z.status == ZombieStatus.DANCING_SUMMONING or
-            z.status == ZombieStatus.DANCING_DANCER_SPAWNING or
-            z.status == ZombieStatus.IMP_FLYING or
-            z.status == ZombieStatus.IMP_LANDING or
-            z.status == ZombieStatus.LADDER_PLACING or
-            z.action == ZombieAction.FALL_FROM_SKY or
-            z.status == ZombieStatus.DANCING_ARMRISE1 or
-            z.status == ZombieStatus.DANCING_ARMRISE2 or
-            z.status == ZombieStatus.DANCING_ARMRISE3 or
-            z.status == ZombieStatus.DANCING_ARMRISE4 or
-            z.status == ZombieStatus.DANCING_ARMRISE5 or
-            # z.action.value == 8 or # C++ checks static_cast<int>(z.action) == 8, but 8 is not in enum
-            z.type == ZombieType.BUNGEE):
+            ZOMBIE_STATUS_FLAGS[z.status] & ZS_IMMOBILE or
+            ZOMBIE_ACTION_FLAGS[z.action] & ZA_IMMOBILE or
+            ZOMBIE_TYPE_FLAGS[z.type] & ZT_IMMOBILE):
         return True
 
     p: Optional[Zombie] = None
@@ -131,11 +114,7 @@ def is_not_movable(scene: 'Scene', z: Zombie) -> bool:
 
 
 def has_death_status(z: Zombie) -> bool:
-    return z.status in (
-        ZombieStatus.DYING,
-        ZombieStatus.DYING_FROM_INSTANT_KILL,
-        ZombieStatus.DYING_FROM_LAWNMOWER
-    )
+    return ZOMBIE_STATUS_FLAGS[z.status] & ZS_DYING != 0
 
 
 def is_walk_right(z: Zombie) -> bool:
@@ -195,10 +174,11 @@ def is_target_of_kelp(scene: 'Scene', z: Zombie) -> bool:
     if z.action == ZombieAction.CAUGHT_BY_KELP:
         return True
 
-    # 扫描该行所有植物，看是否有水草的 target_id 指向了该僵尸
+    # 扫描该行所有植物，看是否有水草的目标句柄指向了该僵尸
     for col in range(9):
         plant = scene.plant_map[z.row][col]['content']
-        if plant and plant.type == PlantType.TANGLE_KELP and plant.target_id == z.id:
+        if (plant and plant.type == PlantType.TANGLE_KELP and plant.target_id != -1
+                and scene.zombies.resolve(plant.target_id) is z):
             return True
 
     return False
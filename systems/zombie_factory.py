@@ -114,7 +114,7 @@ class ZombieFactory:
 
         self.scene.zombies.add(zombie)
         if 0 <= row < len(self.scene.zombies_by_row):
-            self.scene.zombies_by_row[row].add(zombie.id)
+            self.scene.zombies_by_row[row].add(zombie)
 
         return zombie
 
@@ -162,7 +162,7 @@ class ZombieFactory:
         z.is_dead = True
         self.scene.zombies.remove_obj(z)
         if 0 <= z.row < len(self.scene.zombies_by_row):
-            self.scene.zombies_by_row[z.row].discard(z.id)
+            self.scene.zombies_by_row[z.row].discard(z)
 
         # TODO: Handle Bungee logic
 
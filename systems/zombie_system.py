@@ -4,10 +4,14 @@ from pvzemu2.enums import (
     ZombieStatus, ZombieType, ZombieAction,
     DamageFlags, PlantType, PlantStatus, SceneType, GridItemType, ZombieReanimName,
 )
-from pvzemu2.geometry import Rect
+from pvzemu2.geometry import overlap_len
 from pvzemu2.objects.plant import Plant
 from pvzemu2.objects.zombie import Zombie
 from pvzemu2.scene import Scene
+from pvzemu2.status_flags import (
+    ZOMBIE_STATUS_FLAGS, ZOMBIE_ACTION_FLAGS, ZOMBIE_TYPE_FLAGS, PLANT_STATUS_FLAGS,
+    ZS_NO_EAT, ZS_BALLOON_AIR, ZA_NO_EAT, ZA_POOL_TRANSITION, ZT_NO_EAT, ZT_WADES, PS_NOT_EDIBLE
+)
 from pvzemu2.systems import reanim
 from pvzemu2.systems.damage import DamageSystem
 from pvzemu2.systems.griditem_factory import GridItemFactory
@@ -15,6 +19,7 @@ from pvzemu2.systems.plant_factory import PlantFactory
 from pvzemu2.systems.rng import RNG
 from pvzemu2.systems.util import get_col_by_x, zombie_init_y, is_slowed, is_not_movable
 from pvzemu2.systems.zombie_factory import ZombieFactory
+from pvzemu2.zombie_index import by_id
 
 
 class ZombieSystem:
@@ -28,105 +33,113 @@ class ZombieSystem:
 
     def update(self) -> bool:
         """对应 C++ zombie_system::update"""
-        # 使用 list(self.scene.zombies) 创建副本，确保在遍历过程中删除对象是安全的
-        for z in list(self.scene.zombies):
-            z.time_since_spawn += 1
-
-            if z.status == ZombieStatus.DYING_FROM_INSTANT_KILL:
-                z.countdown.action -= 1
-                if z.countdown.action == 1:
-                    self.zombie_factory.destroy(z)
-                continue
+        # scan() 容许循环中增删僵尸：本帧新生成的僵尸不更新，循环到达前已移除的被跳过
+        update_zombie = self._update_zombie
+        with self.scene.zombies.scan() as zombies:
+            for z in zombies:
+                if update_zombie(z):
+                    return True
 
-            elif z.status == ZombieStatus.DYING_FROM_LAWNMOWER:
-                z.countdown.butter = 0
-                z.is_not_dying = False
+        return False
 
-                if z.type == ZombieType.FLAG:
-                    z.has_item_or_walk_left = False
+    def _update_zombie(self, z: Zombie) -> bool:
+        """单只僵尸的一帧更新，返回 True 表示僵尸进家"""
+        z.time_since_spawn += 1
 
+        if z.status == ZombieStatus.DYING_FROM_INSTANT_KILL:
+            z.countdown.action -= 1
+            if z.countdown.action == 1:
                 self.zombie_factory.destroy(z)
-                continue
+            return False
 
-            elif z.status == ZombieStatus.DYING:
-                self._update_dead_from_plant(z)
-                self._update_x(z)
+        elif z.status == ZombieStatus.DYING_FROM_LAWNMOWER:
+            z.countdown.butter = 0
+            z.is_not_dying = False
 
-            # Normal update flow
-            if z.countdown.action > 0 and z.countdown.freeze == 0 and z.countdown.butter == 0:
-                z.countdown.action -= 1
+            if z.type == ZombieType.FLAG:
+                z.has_item_or_walk_left = False
 
-            # 核心更新：当倒计时归零时，调用全局 reanim 模块重新计算并恢复真实的 FPS
-            if z.countdown.freeze > 0:
-                z.countdown.freeze -= 1
-                if z.countdown.freeze == 0:
-                    reanim.update_fps(z, self.scene)
+            self.zombie_factory.destroy(z)
+            return False
 
-            if z.countdown.slow > 0:
-                z.countdown.slow -= 1
-                if z.countdown.slow == 0:
-                    reanim.update_fps(z, self.scene)
+        elif z.status == ZombieStatus.DYING:
+            self._update_dead_from_plant(z)
+            self._update_x(z)
 
-            if z.countdown.butter > 0:
-                z.countdown.butter -= 1
-                if z.countdown.butter == 0:
-                    reanim.update_fps(z, self.scene)
+        # Normal update flow
+        if z.countdown.action > 0 and z.countdown.freeze == 0 and z.countdown.butter == 0:
+            z.countdown.action -= 1
 
-            if z.status == ZombieStatus.RISING_FROM_GROUND:
-                self._update_lurking_dy(z)
-                continue
+        # 核心更新：当倒计时归零时，调用全局 reanim 模块重新计算并恢复真实的 FPS
+        if z.countdown.freeze > 0:
+            z.countdown.freeze -= 1
+            if z.countdown.freeze == 0:
+                reanim.update_fps(z, self.scene)
 
-            # Normal update flow
-            if z.countdown.action > 0 and z.countdown.freeze == 0 and z.countdown.butter == 0:
-                z.countdown.action -= 1
+        if z.countdown.slow > 0:
+            z.countdown.slow -= 1
+            if z.countdown.slow == 0:
+                reanim.update_fps(z, self.scene)
 
-            if z.countdown.freeze > 0:
-                z.countdown.freeze -= 1
-                if z.countdown.freeze == 0:
-                    self.damage_system.debuff.update_fps(z)
+        if z.countdown.butter > 0:
+            z.countdown.butter -= 1
+            if z.countdown.butter == 0:
+                reanim.update_fps(z, self.scene)
 
-            if z.countdown.slow > 0:
-                z.countdown.slow -= 1
-                if z.countdown.slow == 0:
-                    self.damage_system.debuff.update_fps(z)
+        if z.status == ZombieStatus.RISING_FROM_GROUND:
+            self._update_lurking_dy(z)
+            return False
 
-            if z.countdown.butter > 0:
-                z.countdown.butter -= 1
-                if z.countdown.butter == 0:
-                    self.damage_system.debuff.update_fps(z)
+        # Normal update flow
+        if z.countdown.action > 0 and z.countdown.freeze == 0 and z.countdown.butter == 0:
+            z.countdown.action -= 1
 
-            if z.status == ZombieStatus.RISING_FROM_GROUND:
-                self._update_lurking_dy(z)
-                continue
+        if z.countdown.freeze > 0:
+            z.countdown.freeze -= 1
+            if z.countdown.freeze == 0:
+                self.damage_system.debuff.update_fps(z)
+
+        if z.countdown.slow > 0:
+            z.countdown.slow -= 1
+            if z.countdown.slow == 0:
+                self.damage_system.debuff.update_fps(z)
 
-            if z.countdown.freeze <= 0 and z.countdown.butter <= 0:
-                self._update_status(z)
-                self._update_pos(z)
-                self._update_eating(z)
-                self._update_water_status(z)
+        if z.countdown.butter > 0:
+            z.countdown.butter -= 1
+            if z.countdown.butter == 0:
+                self.damage_system.debuff.update_fps(z)
+
+        if z.status == ZombieStatus.RISING_FROM_GROUND:
+            self._update_lurking_dy(z)
+            return False
 
-                if self._update_entering_home(z):
-                    return True  # Game Over
+        if z.countdown.freeze <= 0 and z.countdown.butter <= 0:
+            self._update_status(z)
+            self._update_pos(z)
+            self._update_eating(z)
+            self._update_water_status(z)
 
-            self._update_near_death(z)
+            if self._update_entering_home(z):
+                return True  # Game Over
 
-            # Subsystems update (simplified placeholders)
-            # TODO: Implement specific zombie subsystems (Bungee, Ladder, etc.)
-            # if z.type == ZombieType.BUNGEE: subsystems.bungee.update(z)
+        self._update_near_death(z)
 
-            self._update_garlic_and_hypno_effect(z)
+        # Subsystems update (simplified placeholders)
+        # TODO: Implement specific zombie subsystems (Bungee, Ladder, etc.)
+        # if z.type == ZombieType.BUNGEE: subsystems.bungee.update(z)
 
-            if z.countdown.dead > 0:
-                z.countdown.dead -= 1
-                if z.countdown.dead == 0:
-                    self.zombie_factory.destroy(z)
+        self._update_garlic_and_hypno_effect(z)
 
-            # Update integer coordinates
-            z.int_x = int(z.x)
-            z.int_y = int(z.y)
+        if z.countdown.dead > 0:
+            z.countdown.dead -= 1
+            if z.countdown.dead == 0:
+                self.zombie_factory.destroy(z)
 
-            reanim.update_progress(z.reanimate)
+        # Update integer coordinates
+        z.int_x = int(z.x)
+        z.int_y = int(z.y)
 
+        reanim.update_progress(z.reanimate)
         return False
 
     def _update_dead_from_plant(self, z: Zombie) -> None:
@@ -236,11 +249,9 @@ class ZombieSystem:
 
     def _update_eating(self, z: Zombie) -> None:
         # Simplified exclusions check
-        if z.type in (ZombieType.BUNGEE, ZombieType.GARGANTUAR, ZombieType.GIGA_GARGANTUAR,
-                      ZombieType.ZOMBONI, ZombieType.CATAPULT) or \
-                z.status in (ZombieStatus.POLE_VALUTING_JUMPING, ZombieStatus.BALLOON_FLYING) or \
-                z.action in (ZombieAction.FALL_FROM_SKY, ZombieAction.CLIMBING_LADDER,
-                             ZombieAction.ENTERING_POOL, ZombieAction.LEAVING_POOL, ZombieAction.FALLING) or \
+        if ZOMBIE_TYPE_FLAGS[z.type] & ZT_NO_EAT or \
+                ZOMBIE_STATUS_FLAGS[z.status] & ZS_NO_EAT or \
+                ZOMBIE_ACTION_FLAGS[z.action] & ZA_NO_EAT or \
                 not z.is_not_dying:
             return
 
@@ -271,10 +282,8 @@ class ZombieSystem:
         zr = z.get_attack_box_rect()  # 攻击方用攻击框
 
         if 0 <= z.row < len(self.scene.zombies_by_row):
-            for enemy_id in list(self.scene.zombies_by_row[z.row]):
-                enemy = self.scene.zombies.get(enemy_id)
-
-                if enemy is None or enemy is z:
+            for enemy in by_id(self.scene.zombies_by_row[z.row]):
+                if enemy is z:
                     continue
 
                 # 必须是一个魅惑，一个非魅惑
@@ -289,7 +298,7 @@ class ZombieSystem:
 
                 # 被打方用受击框
                 er = enemy.get_hit_box_rect()
-                d = zr.get_overlap_len(er)
+                d = overlap_len(zr.x, zr.width, er.x, er.width)
 
                 # 判定重叠，放宽到 10 像素以增加稳定性，或者只要有重叠且对方正在吃
                 if d >= 10 or (d >= 0 and enemy.is_eating):
@@ -298,16 +307,12 @@ class ZombieSystem:
         return None
 
     def _find_target(self, z: Zombie) -> Optional[Plant]:
-        # Simple find target plant
-        z_attack_box = Rect(
-            z.int_x + z.attack_box_x,
-            z.int_y + z.attack_box_y,
-            z.attack_box_width,
-            z.attack_box_height
-        )
-
-        for p in self.scene.plants:
-            if p.row != z.row or p.is_dead:
+        # Simple find target plant (攻击框只需横向范围)
+        ax = z.int_x + z.attack_box_x
+        aw = z.attack_box_width
+
+        for p in self.scene.plants_in_row(z.row):
+            if p.is_dead:
                 continue
 
             # Check edible status
@@ -316,7 +321,7 @@ class ZombieSystem:
 
             p_rect = p.get_hit_box()
             # 必须达到至少 20 像素的重叠才算咬到
-            if z_attack_box.get_overlap_len(p_rect) >= 20:
+            if overlap_len(ax, aw, p_rect.x, p_rect.width) >= 20:
                 # 地刺系列不作为啃食目标
                 if p.type in (PlantType.SPIKEWEED, PlantType.SPIKEROCK):
                     continue
@@ -333,8 +338,8 @@ class ZombieSystem:
 
         # 梯子逻辑：遇到梯子时停止啃食并开始攀爬
         if z.type != ZombieType.DIGGER:
-            for item in self.scene.grid_items:
-                if item.row == p.row and item.col == p.col and item.type == GridItemType.LADDER:
+            for item in self.scene.grid_items_at(p.row, p.col):
+                if item.type == GridItemType.LADDER:
                     z.is_eating = False
                     if z.action == ZombieAction.NONE and z.ladder_col != p.col:
                         z.action = ZombieAction.CLIMBING_LADDER
@@ -395,9 +400,7 @@ class ZombieSystem:
         # =========================================================
 
         # 倭瓜跳起攻击时无敌
-        if p.status in (PlantStatus.SQUASH_JUMP_UP, PlantStatus.SQUASH_STOP_IN_THE_AIR,
-                        PlantStatus.SQUASH_JUMP_DOWN, PlantStatus.SQUASH_CRUSHED,
-                        PlantStatus.FLOWER_POT_PLACED, PlantStatus.LILY_PAD_PLACED):
+        if PLANT_STATUS_FLAGS[p.status] & PS_NOT_EDIBLE:
             return
 
         # 土豆雷只有在未出土(IDLE)状态下才会被吃
@@ -424,11 +427,9 @@ class ZombieSystem:
             self.plant_factory.destroy(p)
 
     def _update_water_status(self, z: Zombie) -> None:
-        if z.type not in (ZombieType.ZOMBIE, ZombieType.CONE_HEAD, ZombieType.BUCKET_HEAD,
-                          ZombieType.FLAG, ZombieType.BALLOON) or \
-                z.status in (ZombieStatus.BALLOON_FLYING, ZombieStatus.BALLOON_FALLING) or \
-                z.type in (ZombieType.DOLPHIN_RIDER, ZombieType.SNORKEL) or \
-                z.action in (ZombieAction.ENTERING_POOL, ZombieAction.LEAVING_POOL):
+        if not ZOMBIE_TYPE_FLAGS[z.type] & ZT_WADES or \
+                ZOMBIE_STATUS_FLAGS[z.status] & ZS_BALLOON_AIR or \
+                ZOMBIE_ACTION_FLAGS[z.action] & ZA_POOL_TRANSITION:
             return
 
         current_in_water = False
@@ -487,8 +488,8 @@ class ZombieSystem:
     def _update_climb_ladder(self, z: Zombie) -> None:
         col = max(0, get_col_by_x(int(z.dy * 0.5 + z.int_x + 5)))  # 错误：类 'Zombie' 的未解析的特性引用 'int_x'
         found_ladder = False
-        for item in self.scene.grid_items:
-            if item.col == col and item.row == z.row and item.type == GridItemType.LADDER:
+        for item in self.scene.grid_items_at(z.row, col):
+            if item.type == GridItemType.LADDER:
                 found_ladder = True
                 break
 
@@ -530,12 +531,9 @@ class ZombieSystem:
     def _crush_plant(self, z: Zombie) -> None:
         zr = z.get_hit_box_rect()  # TODO: Should be attack box? C++ uses attack box
 
-        for p in list(self.scene.plants):
-            if p.row != z.row:
-                continue
-
+        for p in list(self.scene.plants_in_row(z.row)):
             pr = p.get_hit_box()
-            if zr.get_overlap_len(pr) >= 20 and \
+            if overlap_len(zr.x, zr.width, pr.x, pr.width) >= 20 and \
                     p.type not in (PlantType.SPIKEWEED, PlantType.SPIKEROCK):
                 # simplified: assume can crush
                 # p.is_smashed = True # Should use damage system
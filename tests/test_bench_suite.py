@@ -0,0 +1,76 @@
+import unittest
+from typing import Any
+
+from pvzemu2.bench.suite import compare, _fps_skip_reason
+
+
+def _results(calibration: float = 1000.0, **scenarios: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'python': '3.11.7',
+        'implementation': 'CPython',
+        'machine': 'x86_64',
+        'calibration': calibration,
+        'scenarios': scenarios,
+    }
+
+
+def _scenario(fps: float, frames: int = 100, peak_kib: float = 100.0) -> dict[str, Any]:
+    return {'frames': frames, 'fps': fps, 'peak_kib': peak_kib}
+
+
+class TestRegressionGate(unittest.TestCase):
+    def test_within_tolerance(self) -> None:
+        baseline = _results(lane=_scenario(1000.0))
+        self.assertEqual(compare(_results(lane=_scenario(900.0)), baseline, 0.15, 0.25), ([], []))
+
+    def test_fps_regression(self) -> None:
+        baseline = _results(lane=_scenario(1000.0))
+        regressions, skipped = compare(_results(lane=_scenario(800.0)), baseline, 0.15, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('lane: fps 800'))
+        self.assertEqual(skipped, [])
+
+    def test_fps_scaled_by_calibration(self) -> None:
+        """基线 fps 按标定值之比换算到本机：慢一半的机器上 fps 减半不算退化"""
+        baseline = _results(2000.0, lane=_scenario(1000.0))
+        self.assertEqual(compare(_results(1000.0, lane=_scenario(500.0)), baseline, 0.15, 0.25), ([], []))
+        # 同样的 fps 在快一倍的机器上则是退化
+        regressions, _ = compare(_results(4000.0, lane=_scenario(1000.0)), baseline, 0.15, 0.25)
+        self.assertEqual(len(regressions), 1)
+
+    def test_memory_regression(self) -> None:
+        baseline = _results(lane=_scenario(1000.0, peak_kib=100.0))
+        regressions, _ = compare(_results(lane=_scenario(1000.0, peak_kib=130.0)), baseline, 0.15, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('peak 130KiB', regressions[0])
+
+    def test_frame_mismatch_and_unknown_scenario_skipped(self) -> None:
+        baseline = _results(lane=_scenario(1000.0))
+        results = _results(lane=_scenario(10.0, frames=50), extra=_scenario(1.0))
+        regressions, skipped = compare(results, baseline, 0.15, 0.25)
+        self.assertEqual(regressions, [])
+        self.assertEqual(skipped, ['lane: 50 frames != baseline 100'])
+
+    def test_fps_skipped_but_memory_checked(self) -> None:
+        """不能比较 fps 时仍比较峰值内存"""
+        baseline = _results(lane=_scenario(1000.0, peak_kib=100.0))
+        results = _results(lane=_scenario(1.0, peak_kib=200.0))
+        results['implementation'] = 'PyPy'
+        regressions, skipped = compare(results, baseline, 0.15, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn('peak', regressions[0])
+        self.assertEqual(skipped, ['fps not compared: implementation PyPy != baseline CPython'])
+
+    def test_fps_skip_reason(self) -> None:
+        baseline = _results()
+        self.assertIsNone(_fps_skip_reason(_results(), baseline))
+        self.assertIsNone(_fps_skip_reason(dict(_results(), python='3.11.9'), baseline))
+        self.assertIn('python', _fps_skip_reason(dict(_results(), python='3.12.1'), baseline) or '')
+        self.assertIn('machine', _fps_skip_reason(dict(_results(), machine='arm64'), baseline) or '')
+        self.assertIn('calibration', _fps_skip_reason(_results(), dict(baseline, calibration=None)) or '')
+        self.assertIn('calibration', _fps_skip_reason({k: v for k, v in _results().items() if k != 'calibration'},
+                                                      baseline) or '')
+
+
+if __name__ == '__main__':
+    unittest.main()
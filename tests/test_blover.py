@@ -22,9 +22,9 @@ class TestBlover(unittest.TestCase):
     def _move_zombie_to_row(self, zombie, row):
         """Helper to properly move a zombie to a row and update spatial cache"""
         if 0 <= zombie.row < len(self.scene.zombies_by_row):
-            self.scene.zombies_by_row[zombie.row].discard(zombie.id)
+            self.scene.zombies_by_row[zombie.row].discard(zombie)
         zombie.row = row
-        self.scene.zombies_by_row[row].add(zombie.id)
+        self.scene.zombies_by_row[row].add(zombie)
 
     def test_blover_initial_state(self):
         """测试三叶草创建后的初始状态"""
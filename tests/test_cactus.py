@@ -22,9 +22,9 @@ class TestCactus(unittest.TestCase):
     def _move_zombie_to_row(self, zombie, row):
         """Helper to properly move a zombie to a row and update spatial cache"""
         if 0 <= zombie.row < len(self.scene.zombies_by_row):
-            self.scene.zombies_by_row[zombie.row].discard(zombie.id)
+            self.scene.zombies_by_row[zombie.row].discard(zombie)
         zombie.row = row
-        self.scene.zombies_by_row[row].add(zombie.id)
+        self.scene.zombies_by_row[row].add(zombie)
 
     def test_cactus_initial_state(self):
         cactus = self.plant_factory.create(PlantType.CACTUS, 2, 2)
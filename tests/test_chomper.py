@@ -22,13 +22,13 @@ class TestChomper(unittest.TestCase):
     def _move_zombie_to_row(self, zombie, row):
         """Helper to properly move a zombie to a row and update spatial cache"""
         if 0 <= zombie.row < len(self.scene.zombies_by_row):
-            self.scene.zombies_by_row[zombie.row].discard(zombie.id)
+            self.scene.zombies_by_row[zombie.row].discard(zombie)
         zombie.row = row
         zombie.y = zombie_init_y(self.scene.type, zombie, row)
         zombie.int_y = int(zombie.y)
 
-        self.scene.zombies_by_row[row].add(zombie.id)
-        self.scene.zombies_by_row[row].add(zombie.id)
+        self.scene.zombies_by_row[row].add(zombie)
+        self.scene.zombies_by_row[row].add(zombie)
 
     def test_chomper_initial_state(self):
         """测试大嘴花创建后的初始状态"""
@@ -0,0 +1,81 @@
+import copy
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.world import World
+
+
+def _make_world() -> World:
+    world = World(SceneType.DAY)
+    world.seed(7)
+    world.plant(PlantType.PEA_SHOOTER, 1, 0)
+    world.plant(PlantType.SNOW_PEA, 2, 0)
+    world.plant(PlantType.WALLNUT, 2, 4)
+    world.plant(PlantType.SUNFLOWER, 0, 0)
+    world.spawn(ZombieType.ZOMBIE, 1, x=700.0)
+    world.spawn(ZombieType.BUCKET_HEAD, 2, x=650.0)
+    world.step(300)
+    return world
+
+
+class TestClone(unittest.TestCase):
+    def test_clone_matches_original(self) -> None:
+        """克隆与原世界继续推进，结果逐帧一致 (含随机数状态)"""
+        world = _make_world()
+        clone = world.clone()
+        self.assertEqual(world.get_state(), clone.get_state())
+        world.step(1500)
+        clone.step(1500)
+        self.assertEqual(world.get_state(), clone.get_state())
+        self.assertEqual(world.scene.rng.random(), clone.scene.rng.random())
+
+    def test_matches_deepcopy(self) -> None:
+        """与 copy.deepcopy 的结果一致"""
+        world = _make_world()
+        deep = copy.deepcopy(world)
+        clone = world.clone()
+        deep.step(800)
+        clone.step(800)
+        self.assertEqual(deep.get_state(), clone.get_state())
+
+    def test_clone_is_independent(self) -> None:
+        """克隆的子系统绑定到新场景，修改互不影响"""
+        world = _make_world()
+        before = world.get_state()
+        clone = world.clone()
+
+        for system in (clone.plant_system, clone.zombie_system, clone.damage_system,
+                       clone.plant_factory, clone.zombie_factory, clone.sun_system, clone.spawn_system):
+            self.assertIs(system.scene, clone.scene)
+        self.assertIs(clone.sun_system.data, clone.scene.sun)
+        self.assertIs(clone.spawn_system.data, clone.scene.spawn)
+
+        clone.plant(PlantType.REPEATER, 3, 0)
+        clone.remove_plant(2, 4)
+        clone.step(200)
+        self.assertEqual(world.get_state(), before)
+        self.assertIsNotNone(world.scene.plant_map[2][4]['content'])
+
+        # plant_map 指向克隆场景中的同一植物对象
+        p = clone.scene.plant_map[1][0]['content']
+        self.assertIs(p, clone.scene.plants.get(p.id))
+
+    def test_snapshot_restore(self) -> None:
+        """同一快照可多次恢复，且恢复后的推进结果相同"""
+        world = _make_world()
+        snap = world.snapshot()
+        world.step(600)
+        first = world.get_state()
+
+        world.restore(snap)
+        world.step(600)
+        self.assertEqual(world.get_state(), first)
+
+        world.restore(snap)
+        world.plant(PlantType.REPEATER, 3, 0)
+        world.restore(snap)
+        self.assertIsNone(world.scene.plant_map[3][0]['content'])
+
+
+if __name__ == '__main__':
+    unittest.main()
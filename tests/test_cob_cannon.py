@@ -27,7 +27,7 @@ class TestCobCannon(unittest.TestCase):
 
         # 1. 彻底清除旧行索引
         for r_list in self.scene.zombies_by_row:
-            r_list.discard(z.id)
+            r_list.discard(z)
 
         # 2. 设置逻辑属性
         z.row = row
@@ -40,7 +40,7 @@ class TestCobCannon(unittest.TestCase):
         z.int_y = int(z.y)
 
         # 4. 重新加入目标行索引
-        self.scene.zombies_by_row[row].add(z.id)
+        self.scene.zombies_by_row[row].add(z)
         return z
 
     def test_cob_cannon_initial_state(self):
@@ -10,9 +10,9 @@ class TestCombatSystem(unittest.TestCase):
 
     def _move_zombie_to_row(self, zombie, row):
         if 0 <= zombie.row < len(self.world.scene.zombies_by_row):
-            self.world.scene.zombies_by_row[zombie.row].discard(zombie.id)
+            self.world.scene.zombies_by_row[zombie.row].discard(zombie)
         zombie.row = row
-        self.world.scene.zombies_by_row[row].add(zombie.id)
+        self.world.scene.zombies_by_row[row].add(zombie)
 
     def test_plant_shoots_zombie(self) -> None:
         """测试：豌豆射手应该攻击同一行的僵尸"""
@@ -0,0 +1,97 @@
+import unittest
+from unittest import mock
+
+from pvzemu2.enums import SceneType, PlantType, GridItemType
+from pvzemu2.obj_list import ObjList
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+
+class TestDeadQueues(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.seed(3)
+        self.world.scene.stop_spawn = True
+
+    def test_kill_removes_at_frame_end(self) -> None:
+        scene = self.world.scene
+        nut = self.world.plant(PlantType.WALLNUT, 1, 4)
+        ladder = self.world.griditem_factory.create(GridItemType.LADDER, 2, 5)
+        scene.kill(nut)
+        scene.kill(ladder)
+        self.assertIs(scene.plants.get(nut.id), nut)
+        self.world.update()
+        self.assertIsNone(scene.plants.get(nut.id))
+        self.assertNotIn(nut, scene.plants_in_row(1))
+        self.assertEqual(scene.grid_items_at(2, 5), [])
+        self.assertEqual(len(scene.grid_items), 0)
+        self.assertEqual(scene.dead_plants, [])
+        self.assertEqual(scene.dead_grid_items, [])
+
+    def test_ladder_removed_with_plant(self) -> None:
+        scene = self.world.scene
+        nut = self.world.plant(PlantType.WALLNUT, 0, 3)
+        self.world.griditem_factory.create(GridItemType.LADDER, 0, 3)
+        self.world.plant_factory.destroy(nut)
+        self.world.update()
+        self.assertEqual(len(scene.grid_items), 0)
+        self.assertEqual(scene.grid_items_at(0, 3), [])
+
+    def test_id_recycle_order_follows_list_order(self) -> None:
+        """同一帧多个对象被清理时按 plants 的顺序回收 id，与逐个扫描时相同"""
+        scene = self.world.scene
+        plants = [self.world.plant(PlantType.WALLNUT, row, 2) for row in range(4)]
+        for p in (plants[3], plants[0], plants[2]):
+            scene.kill(p)
+        self.world.update()
+        self.assertEqual(list(scene.plants._free_ids), [plants[0].id, plants[2].id, plants[3].id])
+
+    def test_cleanup_does_not_walk_pools(self) -> None:
+        """多个对象同时清理时按槽位排序，不遍历整个对象池；重复 kill 只移除一次"""
+        scene = self.world.scene
+        plants = [self.world.plant(PlantType.WALLNUT, row, 2) for row in range(4)]
+        # 回收 id 后迭代顺序与 id 顺序不同
+        self.world.plant_factory.destroy(plants[0])
+        plants[0] = self.world.plant(PlantType.WALLNUT, 0, 2)
+        order = [p.id for p in scene.plants]
+        for p in (plants[0], plants[3], plants[1], plants[0]):
+            scene.kill(p)
+        with mock.patch('pvzemu2.world._CHECK_DEAD_FLAGS', False), \
+                mock.patch.object(ObjList, '__iter__', side_effect=AssertionError("pool iterated")):
+            self.world._clean_dead_objects()
+        self.assertEqual(list(scene.plants._free_ids), [i for i in order if i != plants[2].id])
+
+    def test_dev_mode_reports_unqueued_flags(self) -> None:
+        """-X dev 下直接设置 is_dead 而未排队的对象在帧末触发断言"""
+        nut = self.world.plant(PlantType.WALLNUT, 2, 2)
+        with mock.patch('pvzemu2.world._CHECK_DEAD_FLAGS', True):
+            self.world.scene.kill(self.world.plant(PlantType.WALLNUT, 3, 2))
+            self.world.update()
+            nut.is_dead = True
+            with self.assertRaisesRegex(AssertionError, f'Plant#{nut.id}'):
+                self.world.update()
+
+    def test_destroyed_before_cleanup(self) -> None:
+        """排队后又被 destroy、id 被新植物复用时，新植物不受影响"""
+        scene = self.world.scene
+        nut = self.world.plant(PlantType.WALLNUT, 1, 1)
+        scene.kill(nut)
+        self.world.plant_factory.destroy(nut)
+        fresh = self.world.plant(PlantType.SUNFLOWER, 1, 1)
+        self.assertEqual(fresh.id, nut.id)
+        self.world.update()
+        self.assertIs(scene.plants.get(fresh.id), fresh)
+
+    def test_queue_survives_clone_and_codec(self) -> None:
+        scene = self.world.scene
+        nut = self.world.plant(PlantType.WALLNUT, 3, 3)
+        scene.kill(nut)
+        for copy in (self.world.clone(), World.from_scene(Scene.from_bytes(scene.to_bytes()))):
+            self.assertEqual([p.id for p in copy.scene.dead_plants], [nut.id])
+            self.assertIsNot(copy.scene.dead_plants[0], nut)
+            copy.update()
+            self.assertIsNone(copy.scene.plants.get(nut.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
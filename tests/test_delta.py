@@ -0,0 +1,74 @@
+import unittest
+
+from pvzemu2.delta import apply_delta, ENTITY_KINDS
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.world import World
+
+
+def _make_world() -> World:
+    world = World(SceneType.DAY)
+    world.seed(3)
+    for row in range(5):
+        world.plant(PlantType.REPEATER, row, 0)
+        world.plant(PlantType.SUNFLOWER, row, 1)
+    world.spawn(ZombieType.ZOMBIE, 2, x=500.0)
+    return world
+
+
+class TestDelta(unittest.TestCase):
+    def test_tracking_is_lazy(self) -> None:
+        """未调用 get_delta 时不创建任何跟踪状态"""
+        world = _make_world()
+        world.step(10)
+        self.assertIsNone(world._delta_tracker)
+        self.assertIsNone(world.clone()._delta_tracker)
+
+    def test_applied_deltas_match_full_state(self) -> None:
+        """逐帧合并增量后与全量结果一致 (包括 id 被回收复用的情况)"""
+        world = _make_world()
+        delta = world.get_delta()
+        self.assertTrue(delta['full'])
+        state = apply_delta(None, delta)
+
+        saw_removed = False
+        for frame in range(1500):
+            if frame % 300 == 0:
+                world.spawn(ZombieType.CONE_HEAD, frame // 300, x=450.0)
+            world.update()
+            delta = world.get_delta(delta['token'])
+            self.assertFalse(delta['full'])
+            saw_removed = saw_removed or any(delta[k]['removed'] for k in ENTITY_KINDS)
+            state = apply_delta(state, delta)
+
+        self.assertTrue(saw_removed)
+        full = apply_delta(None, world.get_delta())
+        for key in ('scene',) + ENTITY_KINDS:
+            self.assertEqual(state[key], full[key])
+
+    def test_only_changed_fields(self) -> None:
+        world = _make_world()
+        token = world.get_delta()['token']
+        world.scene.sun.sun = 1234
+        delta = world.get_delta(token)
+        self.assertEqual(delta['scene'], {'sun.sun': 1234})
+        for kind in ENTITY_KINDS:
+            self.assertEqual(delta[kind], {'created': {}, 'removed': [], 'modified': {}})
+
+    def test_unknown_token_returns_full(self) -> None:
+        world = _make_world()
+        first = world.get_delta()
+        for _ in range(20):
+            world.get_delta()
+        delta = world.get_delta(first['token'])
+        self.assertTrue(delta['full'])
+        self.assertEqual(len(delta['plants']['created']), len(world.scene.plants))
+
+        # 跳过一个增量后合并会被拒绝
+        state = apply_delta(None, delta)
+        skipped = world.get_delta(delta['token'])
+        with self.assertRaises(ValueError):
+            apply_delta(state, world.get_delta(skipped['token']))
+
+
+if __name__ == '__main__':
+    unittest.main()
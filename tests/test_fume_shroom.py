@@ -28,7 +28,7 @@ class TestFumeShroom(unittest.TestCase):
 
         # 移除原有的(可能越界或错误行的)索引
         for r_set in self.scene.zombies_by_row:
-            r_set.discard(z.id)
+            r_set.discard(z)
 
         z.x = float(x)
         z.int_x = int(x)  # 核心修复：更新整数坐标供判定框使用
@@ -36,7 +36,7 @@ class TestFumeShroom(unittest.TestCase):
         z.y = zombie_init_y(self.scene.type, z, row)
         z.int_y = int(z.y)  # 核心修复：同步 Y 轴整数坐标
 
-        self.scene.zombies_by_row[row].add(z.id)
+        self.scene.zombies_by_row[row].add(z)
         return z
 
     def test_basic_damage_and_kill_conehead(self):
@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from pvzemu2.geometry import Rect, RectArray, overlap_len, circle_overlaps
+
+
+def _ref_overlap_len(a: Rect, r: Rect) -> int:
+    # 原 Rect.get_overlap_len 的逐行实现
+    if a.x < r.x:
+        xmin, xmax = a.x, a.x + a.width
+        rmin, rmax = r.x, r.x + r.width
+    else:
+        xmin, xmax = r.x, r.x + r.width
+        rmin, rmax = a.x, a.x + a.width
+    if xmax <= rmin:
+        return xmax - rmin
+    if rmax <= xmax:
+        return rmax - rmin
+    return xmax - rmin
+
+
+def _ref_circle(a: Rect, x: int, y: int, r: int) -> bool:
+    # 原 Rect.is_overlap_with_circle 的逐行实现
+    inside_x = inside_y = False
+    dx = dy = 0
+    if x < a.x:
+        dx = a.x - x
+    elif x >= a.x + a.width:
+        dx = x - a.x - a.width
+    else:
+        inside_x = True
+    if y < a.y:
+        dy = a.y - y
+    elif y >= a.y + a.height:
+        dy = y - a.y - a.height
+    else:
+        inside_y = True
+    if inside_x and inside_y:
+        return True
+    if inside_x:
+        return dy <= r
+    if inside_y:
+        return dx <= r
+    return dx * dx + dy * dy <= r * r
+
+
+def _random_rect(rng: random.Random) -> Rect:
+    # 含零宽与负宽 (如火焰豌豆的攻击框) 的情况
+    return Rect(rng.randint(-50, 50), rng.randint(-50, 50), rng.randint(-10, 40), rng.randint(-10, 40))
+
+
+class TestGeometryParity(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rng = random.Random(0)
+
+    def test_overlap_len(self) -> None:
+        for _ in range(20000):
+            a, b = _random_rect(self.rng), _random_rect(self.rng)
+            expected = _ref_overlap_len(a, b)
+            self.assertEqual(a.get_overlap_len(b), expected)
+            self.assertEqual(overlap_len(a.x, a.width, b.x, b.width), expected)
+
+    def test_circle(self) -> None:
+        for _ in range(20000):
+            a = _random_rect(self.rng)
+            x, y, r = self.rng.randint(-80, 80), self.rng.randint(-80, 80), self.rng.randint(0, 60)
+            expected = _ref_circle(a, x, y, r)
+            self.assertEqual(a.is_overlap_with_circle(x, y, r), expected)
+            self.assertEqual(circle_overlaps(a.x, a.y, a.width, a.height, x, y, r), expected)
+
+    def test_rect_array(self) -> None:
+        rects = [_random_rect(self.rng) for _ in range(300)]
+        batch = RectArray(rects)
+        self.assertEqual(len(batch), 300)
+        self.assertEqual(batch[7], rects[7])
+        for _ in range(200):
+            q = _random_rect(self.rng)
+            lens = [_ref_overlap_len(q, r) for r in rects]
+            self.assertEqual(batch.overlap_lens(q.x, q.width), lens)
+            self.assertEqual(batch.overlapping(q.x, q.width, 5), [i for i, d in enumerate(lens) if d >= 5])
+
+            x, y, r = self.rng.randint(-80, 80), self.rng.randint(-80, 80), self.rng.randint(0, 60)
+            self.assertEqual(batch.circle_hits(x, y, r), [i for i, a in enumerate(rects) if _ref_circle(a, x, y, r)])
+
+        batch.clear()
+        self.assertEqual(batch.overlap_lens(0, 10), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, GridItemType
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+
+def _map_matches(scene: Scene) -> bool:
+    expected = [[[] for _ in range(9)] for _ in range(6)]
+    for item in scene.grid_items:
+        expected[item.row][item.col].append(item)
+    return all(len(a) == len(b) and all(x is y for x, y in zip(a, b))
+               for row_a, row_b in zip(expected, scene.grid_item_map) for a, b in zip(row_a, row_b))
+
+
+class TestGridItemMap(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.NIGHT)
+        self.world.scene.stop_spawn = True
+        self.factory = self.world.griditem_factory
+
+    def test_create_and_destroy(self) -> None:
+        """GridItemFactory 创建与销毁时同步格子索引"""
+        grave = self.factory.create(GridItemType.GRAVE, 1, 6)
+        crater = self.factory.create(GridItemType.CRATER, 1, 6)
+        self.assertEqual(self.world.scene.grid_items_at(1, 6), [grave, crater])
+        self.assertEqual(self.world.plant_factory.is_covered_by_griditem(1, 6), (True, True))
+        self.assertEqual(self.world.scene.grid_items_at(-1, 3), [])
+
+        self.factory.destroy(grave)
+        self.assertEqual(self.world.scene.grid_items_at(1, 6), [crater])
+        self.assertEqual(self.world.plant_factory.is_covered_by_griditem(1, 6), (False, True))
+        self.assertTrue(_map_matches(self.world.scene))
+
+    def test_clean_dead_objects(self) -> None:
+        """植物被移除时标记的梯子在帧末清理时离开索引"""
+        self.world.plant(PlantType.WALLNUT, 2, 4)
+        ladder = self.factory.create(GridItemType.LADDER, 2, 4)
+        self.world.remove_plant(2, 4)
+        self.assertTrue(ladder.is_disappeared)
+        self.world.update()
+        self.assertEqual(self.world.scene.grid_items_at(2, 4), [])
+        self.assertTrue(_map_matches(self.world.scene))
+
+    def test_clone_and_codec(self) -> None:
+        """clone 与 to_bytes/from_bytes 后索引指向新场景中的对象"""
+        for row, col in ((0, 5), (3, 7), (3, 7)):
+            self.factory.create(GridItemType.GRAVE, row, col)
+        self.factory.create(GridItemType.LADDER, 4, 2)
+
+        for scene in (self.world.clone().scene, Scene.from_bytes(self.world.scene.to_bytes())):
+            self.assertTrue(_map_matches(scene))
+            self.assertEqual([i.id for i in scene.grid_items_at(3, 7)],
+                             [i.id for i in self.world.scene.grid_items_at(3, 7)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from dataclasses import dataclass
+
+from pvzemu2.enums import SceneType, PlantType, PlantStatus, ZombieType, ZombieAction
+from pvzemu2.obj_list import ObjList, handle_id
+from pvzemu2.world import World
+
+
+@dataclass(slots=True, eq=False)
+class _Obj:
+    name: str
+    id: int = -1
+
+
+class TestObjListScan(unittest.TestCase):
+    def setUp(self) -> None:
+        self.objs: ObjList[_Obj] = ObjList(use_recycle=True)
+        self.items = [_Obj(c) for c in 'abcde']
+        for o in self.items:
+            self.objs.add(o)
+
+    def test_scan_rules(self) -> None:
+        """循环中移除尚未访问的对象会跳过，新加入的对象本轮不访问、之后按插入顺序出现"""
+        a, b, c, d, e = self.items
+        visited = []
+        with self.objs.scan() as it:
+            for o in it:
+                visited.append(o.name)
+                if o is b:
+                    self.objs.remove(d.id)
+                    self.objs.remove(a.id)
+                    f = _Obj('f')
+                    self.objs.add(f)
+                    self.assertIs(self.objs.get(f.id), f)
+                    self.objs.add(_Obj('g'))
+                    self.objs.remove(f.id)
+        self.assertEqual(visited, ['a', 'b', 'c', 'e'])
+        self.assertEqual([o.name for o in self.objs], ['b', 'c', 'e', 'g'])
+        with self.objs.scan() as it:
+            self.assertEqual([o.name for o in it], ['b', 'c', 'e', 'g'])
+
+    def test_order_matches_plain_iteration_after_churn(self) -> None:
+        for i in range(200):
+            victim = next(iter(self.objs)) if i % 3 else list(self.objs)[-1]
+            self.objs.remove(victim.id)
+            self.objs.add(_Obj(str(i)))
+            self.objs.add(_Obj(f'x{i}'))
+            with self.objs.scan() as it:
+                self.assertEqual(list(it), list(self.objs))
+        self.assertEqual(list(self.objs.clone(lambda o: o)), list(self.objs))
+
+    def test_nested_and_early_exit(self) -> None:
+        with self.objs.scan() as outer:
+            for o in outer:
+                with self.objs.scan() as inner:
+                    for _ in inner:
+                        self.objs.add(_Obj('n'))
+                        break
+                break
+        self.assertEqual(len(list(self.objs)), 6)
+        with self.objs.scan() as it:
+            self.assertEqual(len(list(it)), 6)
+
+
+class TestObjListHandles(unittest.TestCase):
+    def test_stale_handle_after_recycle(self) -> None:
+        """移除后 id 被复用，旧句柄解析为 None，新句柄指向新对象"""
+        objs: ObjList[_Obj] = ObjList(use_recycle=True)
+        a = _Obj('a')
+        objs.add(a)
+        h = objs.handle(a.id)
+        self.assertIs(objs.resolve(h), a)
+        self.assertEqual(handle_id(h), a.id)
+
+        objs.remove(a.id)
+        b = _Obj('b')
+        objs.add(b)
+        self.assertEqual(b.id, a.id)
+        self.assertIsNone(objs.resolve(h))
+        self.assertIs(objs.resolve(objs.handle(b.id)), b)
+        self.assertIs(objs.clone(lambda o: o).resolve(objs.handle(b.id)), b)
+        with self.assertRaises(KeyError):
+            objs.handle(b.id + 1)
+
+        h = objs.handle(b.id)
+        objs.clear()
+        objs.add(_Obj('c'))
+        self.assertIsNone(objs.resolve(h))
+
+    def test_kelp_ignores_recycled_id(self) -> None:
+        """水草的目标在抓取期间死亡，id 被新僵尸复用后水草不会抓走新僵尸"""
+        world = World(SceneType.POOL)
+        world.scene.stop_spawn = True
+        kelp = world.plant(PlantType.TANGLE_KELP, 2, 3)
+        target = world.spawn(ZombieType.ZOMBIE, 2, x=kelp.x + 10)
+        target.is_in_water = True
+        for _ in range(10):
+            world.update()
+            if kelp.status == PlantStatus.TANGLE_KELP_GRAB:
+                break
+        self.assertEqual(kelp.status, PlantStatus.TANGLE_KELP_GRAB)
+
+        world.scene.kill(target)
+        world.update()
+        newcomer = world.spawn(ZombieType.ZOMBIE, 2, x=700.0)
+        self.assertEqual(newcomer.id, target.id)
+        for _ in range(120):
+            world.update()
+        self.assertNotEqual(newcomer.action, ZombieAction.CAUGHT_BY_KELP)
+        self.assertFalse(newcomer.is_dead)
+        self.assertIs(world.scene.zombies.get(newcomer.id), newcomer)
+
+
+if __name__ == '__main__':
+    unittest.main()
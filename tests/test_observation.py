@@ -0,0 +1,86 @@
+import tracemalloc
+import unittest
+from array import array
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.observation import ObservationEncoder, PLANE_NAMES, ZOMBIE_FEATURES, CELLS, COLS
+from pvzemu2.world import World
+
+
+def _plane(enc: ObservationEncoder, buf: array, name: str) -> list[float]:
+    start = enc.plane_offset + PLANE_NAMES.index(name) * CELLS
+    return list(buf[start:start + CELLS])
+
+
+class TestObservation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.seed(5)
+        self.world.scene.stop_spawn = True
+        self.world.plant(PlantType.PEA_SHOOTER, 1, 0)
+        self.world.plant(PlantType.WALLNUT, 2, 3)
+        self.world.plant(PlantType.PUMPKIN, 2, 3)
+        self.z1 = self.world.spawn(ZombieType.CONE_HEAD, 1, x=500.0)
+        self.z2 = self.world.spawn(ZombieType.ZOMBIE, 1, x=505.0)
+        self.enc = ObservationEncoder(max_zombies=4)
+        self.buf = array('d', bytes(8 * self.enc.size))
+        self.enc.bind(self.buf)
+
+    def test_planes(self) -> None:
+        self.enc.encode(self.world.scene)
+        content = _plane(self.enc, self.buf, 'content_type')
+        self.assertEqual(content[1 * COLS + 0], PlantType.PEA_SHOOTER + 1)
+        self.assertEqual(content[2 * COLS + 3], PlantType.WALLNUT + 1)
+        self.assertEqual(_plane(self.enc, self.buf, 'pumpkin_hp')[2 * COLS + 3],
+                         self.world.scene.plant_map[2][3]['pumpkin'].hp)
+        self.assertEqual(sum(content), PlantType.PEA_SHOOTER + PlantType.WALLNUT + 2)
+
+        counts = _plane(self.enc, self.buf, 'zombie_count')
+        self.assertEqual(counts[1 * COLS + 5], 2)
+        self.assertEqual(sum(counts), 2)
+        self.assertEqual(_plane(self.enc, self.buf, 'zombie_hp')[1 * COLS + 5],
+                         self.z1.hp + self.z1.accessory_1_hp + self.z2.hp)
+
+    def test_zombie_table_and_mask(self) -> None:
+        self.enc.encode(self.world.scene)
+        n = len(ZOMBIE_FEATURES)
+        table = self.buf[self.enc.zombie_offset:self.enc.mask_offset]
+        mask = list(self.buf[self.enc.mask_offset:])
+        self.assertEqual(mask, [1, 1, 0, 0])
+        self.assertEqual(table[0], ZombieType.CONE_HEAD)
+        self.assertEqual(table[ZOMBIE_FEATURES.index('x')], 500.0)
+        self.assertEqual(table[n + ZOMBIE_FEATURES.index('x')], 505.0)
+        self.assertEqual(list(table[2 * n:]), [0.0] * (2 * n))
+
+        # 僵尸被移除后旧数据被清零
+        self.world.zombie_factory.destroy(self.z1)
+        self.world.update()
+        self.enc.encode(self.world.scene)
+        self.assertEqual(list(self.buf[self.enc.mask_offset:]), [1, 0, 0, 0])
+        self.assertEqual(sum(_plane(self.enc, self.buf, 'zombie_count')), 1)
+
+    def test_bind_checks_size(self) -> None:
+        with self.assertRaises(ValueError):
+            self.enc.bind(array('d', bytes(8 * (self.enc.size + 1))))
+        # 字节缓冲区按 float64 解释
+        raw = bytearray(8 * self.enc.size)
+        self.enc.bind(raw)
+        self.enc.encode(self.world.scene)
+        self.assertEqual(memoryview(raw).cast('d')[0], self.world.scene.sun.sun)
+
+    def test_steady_state_does_not_allocate(self) -> None:
+        """稳态编码不产生随场上对象数量增长的中间对象"""
+        scene = self.world.scene
+        self.enc.encode(scene)
+        tracemalloc.start()
+        try:
+            for _ in range(50):
+                self.enc.encode(scene)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import signal
+import unittest
+from array import array
+from multiprocessing import shared_memory
+
+from pvzemu2.enums import SceneType, PlantType
+from pvzemu2.parallel import SubprocWorldPool, encode_summary, SUMMARY_SIZE
+from pvzemu2.systems.rng import CounterRNG
+from pvzemu2.world import World
+
+
+def _local_obs(seed: int, actions: list, frames: int) -> list[float]:
+    world = World(SceneType.DAY)
+    world.seed(seed)
+    for action in actions:
+        if action is not None:
+            world.plant(*action)
+        world.step(frames)
+    buf = array('d', bytes(8 * SUMMARY_SIZE))
+    encode_summary(world, memoryview(buf))
+    return list(buf)
+
+
+class TestSubprocWorldPool(unittest.TestCase):
+    def test_step_matches_local_world(self) -> None:
+        """共享内存中的观测与本地 World 的编码一致"""
+        with SubprocWorldPool(2, 2, SceneType.DAY, seed=10, frames_per_step=5) as pool:
+            actions = [(PlantType.PEA_SHOOTER, 1, 0), None, (PlantType.SUNFLOWER, 0, 0), None]
+            obs, dones = pool.step(actions)
+            obs, dones = pool.step()
+
+            self.assertEqual(dones, [False] * 4)
+            for i, action in enumerate(actions):
+                self.assertEqual(list(obs[i]), _local_obs(10 + i, [action, None], 5))
+
+    def test_worker_crash_recovery(self) -> None:
+        """worker 崩溃后自动重启，其环境报告 done 并以新一局继续"""
+        with SubprocWorldPool(2, 1, SceneType.DAY, seed=0) as pool:
+            pool._procs[1].kill()
+            pool._procs[1].join()
+
+            obs, dones = pool.step()
+            self.assertEqual(dones, [False, True])
+            self.assertEqual(pool.restarts, [0, 1])
+
+            # 重启后的环境使用第 1 局的种子 (seed + 1 + 1 * n_envs)
+            self.assertEqual(list(obs[1]), _local_obs(3, [], 0))
+
+            obs, dones = pool.step()
+            self.assertEqual(dones, [False, False])
+
+    @unittest.skipUnless(hasattr(signal, 'SIGSTOP'), "needs SIGSTOP")
+    def test_hung_worker_times_out(self) -> None:
+        """worker 挂起时 step 在 timeout 后返回，挂起的 worker 被重启"""
+        with SubprocWorldPool(2, 1, SceneType.DAY, seed=0, timeout=1.0) as pool:
+            os.kill(pool._procs[1].pid, signal.SIGSTOP)
+            obs, dones = pool.step()
+            self.assertEqual(dones, [False, True])
+            self.assertEqual(pool.restarts, [0, 1])
+            self.assertIn('did not respond', pool.worker_errors[1])
+
+    def test_close_unlinks_with_exported_view(self) -> None:
+        """调用方仍持有派生视图时 close() 报错，但共享内存段已被删除；释放视图后可再次关闭"""
+        pool = SubprocWorldPool(1, 1, SceneType.DAY, seed=0)
+        name = pool._shm.name
+        view = memoryview(pool.observations[0])[0:8]
+        with self.assertRaises(BufferError):
+            pool.close()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        self.assertFalse(pool._closed)
+
+        view.release()
+        pool.close()
+        self.assertTrue(pool._closed)
+        pool.close()
+
+    def test_reset_with_seed(self) -> None:
+        """reset(seed) 后各环境按新种子重新开局"""
+        with SubprocWorldPool(1, 2, SceneType.DAY, seed=1) as pool:
+            pool.step()
+            obs = pool.reset(seed=42)
+            self.assertEqual(list(obs[0]), _local_obs(42, [], 0))
+            self.assertEqual(list(obs[1]), _local_obs(43, [], 0))
+
+    def test_rng_streams(self) -> None:
+        """rng_streams 时第 i 号环境第 e 局使用 CounterRNG(seed).spawn(i).spawn(e)"""
+        with SubprocWorldPool(2, 1, SceneType.DAY, seed=5, frames_per_step=300, rng_streams=True) as pool:
+            obs, _ = pool.step()
+            for i in range(2):
+                world = World(SceneType.DAY, rng=CounterRNG(5).spawn(i).spawn(0))
+                world.step(300)
+                buf = array('d', bytes(8 * SUMMARY_SIZE))
+                encode_summary(world, memoryview(buf))
+                self.assertEqual(list(obs[i]), list(buf))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ProjectileType, ZombieType
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+
+def _index_matches(scene: Scene) -> bool:
+    by_row = [[p for p in scene.plants if p.row == row] for row in range(6)]
+    if any(len(a) != len(b) or any(x is not y for x, y in zip(a, b)) for a, b in zip(by_row, scene.plants_by_row)):
+        return False
+    for (row, type), plants in scene.plants_by_row_type.items():
+        expected = [p for p in by_row[row] if p.type == type]
+        if len(expected) != len(plants) or any(x is not y for x, y in zip(expected, plants)):
+            return False
+    return True
+
+
+class TestPlantIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.POOL)
+        self.world.scene.stop_spawn = True
+
+    def test_create_destroy(self) -> None:
+        """PlantFactory 创建与销毁时同步行索引与 (行, 类型) 索引"""
+        scene = self.world.scene
+        a = self.world.plant(PlantType.TORCHWOOD, 1, 4)
+        b = self.world.plant(PlantType.PEA_SHOOTER, 1, 2)
+        self.world.plant(PlantType.TORCHWOOD, 0, 4)
+        self.assertEqual(scene.plants_in_row(1), [a, b])
+        self.assertEqual(scene.plants_of_type(1, PlantType.TORCHWOOD), [a])
+        self.assertEqual(scene.plants_in_row(9), [])
+
+        self.world.remove_plant(1, 4)
+        self.assertEqual(scene.plants_in_row(1), [b])
+        self.assertEqual(scene.plants_of_type(1, PlantType.TORCHWOOD), [])
+        self.assertTrue(_index_matches(scene))
+
+    def test_gatling_cost_counts_all_rows(self) -> None:
+        factory = self.world.plant_factory
+        base = factory.get_cost(PlantType.GATLING_PEA)
+        for row in (0, 4):
+            self.world.plant(PlantType.REPEATER, row, 1)
+            factory.create(PlantType.GATLING_PEA, row, 1)
+        self.assertEqual(factory.get_cost(PlantType.GATLING_PEA), base + 100)
+
+    def test_torchwood_ignites_pea(self) -> None:
+        """子弹只检查本行的火炬树桩"""
+        self.world.plant(PlantType.TORCHWOOD, 0, 5)
+        self.world.plant(PlantType.PEA_SHOOTER, 1, 0)
+        self.world.plant(PlantType.TORCHWOOD, 1, 5)
+        self.world.spawn(ZombieType.ZOMBIE, 1, x=760.0)
+        peas = []
+        for _ in range(600):
+            self.world.update()
+            peas.extend(p for p in self.world.scene.projectiles if p.type == ProjectileType.FIRE_PEA)
+            if peas:
+                break
+        self.assertTrue(peas)
+        self.assertTrue(all(p.row == 1 for p in peas))
+
+    def test_clone_codec_and_cleanup(self) -> None:
+        for row in range(6):
+            self.world.plant(PlantType.LILY_PAD if row in (2, 3) else PlantType.SUNFLOWER, row, row)
+        dead = self.world.plant(PlantType.WALLNUT, 1, 7)
+        self.world.scene.kill(dead)
+        self.world.update()
+        self.assertFalse(any(p is dead for p in self.world.scene.plants_in_row(1)))
+        self.assertTrue(_index_matches(self.world.scene))
+
+        for scene in (self.world.clone().scene, Scene.from_bytes(self.world.scene.to_bytes())):
+            self.assertTrue(_index_matches(scene))
+
+
+if __name__ == '__main__':
+    unittest.main()
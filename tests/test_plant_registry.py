@@ -0,0 +1,101 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, PlantStatus, ProjectileType, ProjectileMotionType
+from pvzemu2.objects.plant import Plant
+from pvzemu2.systems.plant_registry import (
+    LaunchSpec, PlantRecord, RECORD_COUNT, register_plant_subsystem, unregister_plant_subsystem
+)
+from pvzemu2.systems.plant_subsystems.base import PlantSubsystem
+from pvzemu2.systems.plant_system import LAUNCH_COOLDOWN_TABLE
+from pvzemu2.world import World
+
+
+def _last_projectile(world: World):
+    return list(world.scene.projectiles)[-1]
+
+
+class MarigoldSubsystem(PlantSubsystem):
+    def __init__(self, scene, damage_system, rng) -> None:
+        super().__init__(scene, damage_system, rng)
+        self.updated: list[Plant] = []
+
+    def update(self, plant: Plant) -> None:
+        self.updated.append(plant)
+
+    def configure(self, record: PlantRecord) -> None:
+        super().configure(record)
+        record.launch = LaunchSpec(ProjectileType.PEA, 24, -33, motion=ProjectileMotionType.LEFT_STRAIGHT)
+
+
+class TestPlantRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.scene.stop_spawn = True
+        self.ps = self.world.plant_system
+
+    def test_every_type_has_record(self) -> None:
+        self.assertEqual(len(self.ps.records), RECORD_COUNT)
+        self.assertIsNone(self.ps.records[PlantType.PEA_SHOOTER].update)
+        self.assertEqual(self.ps.records[PlantType.WALLNUT].update, self.ps.shield_plants_subsystem.update)
+        self.assertIsNotNone(self.ps.records[PlantType.SUNSHROOM].produce)
+        self.assertEqual(self.ps.records[PlantType.GATLING_PEA].fire_frames, {75, 50, 25, 1})
+        for t, countdown in LAUNCH_COOLDOWN_TABLE.items():
+            self.assertEqual(self.ps.records[t].launch_countdown, countdown)
+
+    def test_launch_specs(self) -> None:
+        """子弹类型与出生点由表决定"""
+        cases = (
+            (PlantType.CABBAGEPULT, 1, ProjectileType.CABBAGE, 5, -12),
+            (PlantType.THREEPEATER, 2, ProjectileType.PEA, 45, 10),
+            (PlantType.CACTUS, 3, ProjectileType.CACTUS, 70, 23),
+        )
+        for plant_type, row, proj_type, dx, dy in cases:
+            p = self.world.plant(plant_type, row, 2)
+            self.ps.launch(p, None, row)
+            proj = _last_projectile(self.world)
+            self.assertEqual((proj.type, proj.x, proj.y), (proj_type, p.x + dx, p.y + dy))
+
+        cactus = self.world.scene.plant_map[3][2]['content']
+        cactus.status = PlantStatus.CACTUS_TALL_IDLE
+        self.ps.launch(cactus, None, 3)
+        proj = _last_projectile(self.world)
+        self.assertEqual((proj.x, proj.y), (cactus.x + 93, cactus.y - 50))
+
+    def test_split_pea_alt_launch(self) -> None:
+        p = self.world.plant(PlantType.SPLIT_PEA, 1, 4)
+        self.ps.launch(p, None, 1, is_alt_attack=True)
+        proj = _last_projectile(self.world)
+        self.assertEqual(proj.motion_type, ProjectileMotionType.LEFT_STRAIGHT)
+        self.assertLess(proj.x, p.x)
+
+
+class TestRegisterSubsystem(unittest.TestCase):
+    def setUp(self) -> None:
+        register_plant_subsystem((PlantType.MARIGOLD,), MarigoldSubsystem)
+        self.addCleanup(unregister_plant_subsystem, MarigoldSubsystem)
+        self.world = World(SceneType.DAY)
+        self.world.scene.stop_spawn = True
+
+    def test_update_and_launch(self) -> None:
+        """注册的子系统接管对应类型的 update 与发射记录"""
+        subsystem = self.world.plant_system.custom_subsystems[0]
+        marigold = self.world.plant(PlantType.MARIGOLD, 2, 3)
+        self.world.plant(PlantType.SUNFLOWER, 1, 3)
+        self.world.step(3)
+        self.assertEqual(subsystem.updated, [marigold] * 3)
+
+        self.world.plant_system.launch(marigold, None, 2)
+        proj = _last_projectile(self.world)
+        self.assertEqual(proj.motion_type, ProjectileMotionType.LEFT_STRAIGHT)
+
+    def test_clone_and_unregister(self) -> None:
+        clone = self.world.clone()
+        self.assertIsInstance(clone.plant_system.custom_subsystems[0], MarigoldSubsystem)
+        self.assertIs(clone.plant_system.custom_subsystems[0].scene, clone.scene)
+
+        unregister_plant_subsystem(MarigoldSubsystem)
+        self.assertIsNone(World(SceneType.DAY).plant_system.records[PlantType.MARIGOLD].update)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.profiling import STAGES
+from pvzemu2.world import World
+
+
+def _make_world() -> World:
+    world = World(SceneType.DAY)
+    world.seed(5)
+    for row in range(5):
+        world.plant(PlantType.PEA_SHOOTER, row, 0)
+    world.plant(PlantType.SUNFLOWER, 0, 1)
+    world.spawn(ZombieType.ZOMBIE, 2, x=700.0)
+    return world
+
+
+class TestProfiling(unittest.TestCase):
+    def test_counts_and_parity(self) -> None:
+        """计时不改变模拟结果，各阶段与各植物类型的调用次数正确"""
+        plain, profiled = _make_world(), _make_world()
+        prof = profiled.enable_profiling()
+        self.assertIs(profiled.enable_profiling(), prof)
+        plain.step(600)
+        profiled.step(600)
+        self.assertEqual(plain.get_state(), profiled.get_state())
+
+        d = prof.to_dict()
+        self.assertEqual(d['frames'], 600)
+        self.assertEqual(list(d['stages']), list(STAGES))
+        for name, stage in d['stages'].items():
+            self.assertEqual(stage['calls'], 600, name)
+            self.assertGreaterEqual(stage['time'], 0.0)
+        self.assertEqual(d['plants']['PEA_SHOOTER']['calls'], 5 * 600)
+        self.assertEqual(d['plants']['SUNFLOWER']['calls'], 600)
+        self.assertIn('zombie_system', prof.report())
+        self.assertIn('PEA_SHOOTER', str(prof))
+
+    def test_disable_and_rebind(self) -> None:
+        world = _make_world()
+        prof = world.enable_profiling()
+        snap = world.snapshot()
+        world.restore(snap)
+        world.reset()
+        world.plant(PlantType.PEA_SHOOTER, 0, 0)
+        world.step(10)
+        self.assertIs(world.profiler, prof)
+        self.assertEqual(prof.plant_calls[PlantType.PEA_SHOOTER], 10)
+
+        self.assertIs(world.disable_profiling(), prof)
+        self.assertIs(type(world), World)
+        self.assertNotIn('_update_plant', vars(world.plant_system))
+        self.assertIsNone(world.profiler)
+        world.step(10)
+        self.assertEqual(prof.frames, 10)
+        prof.reset()
+        self.assertEqual(prof.to_dict()['plants'], {})
+
+    def test_subclass_kept(self) -> None:
+        """启用计时不替换实例的类，子类覆盖的阶段照常执行并被计时"""
+        class CountingWorld(World):
+            __slots__ = ('card_updates',)
+
+            def _update_cards(self) -> None:
+                self.card_updates += 1
+                super()._update_cards()
+
+        world = CountingWorld(SceneType.DAY)
+        world.card_updates = 0
+        prof = world.enable_profiling()
+        self.assertIs(type(world), CountingWorld)
+        world.step(5)
+        world.disable_profiling()
+        world.step(5)
+        self.assertEqual(world.card_updates, 10)
+        self.assertEqual(prof.to_dict()['stages']['_update_cards']['calls'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType, ProjectileType
+from pvzemu2.objects.projectile import Projectile
+from pvzemu2.objects.projectile_pool import ProjectilePool, ProjectileRef, StaleProjectileError
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+
+def _build(pooled: bool) -> World:
+    world = World(SceneType.DAY, pooled_projectiles=pooled)
+    world.seed(5)
+    world.scene.stop_spawn = True
+    for row in range(5):
+        world.plant(PlantType.REPEATER, row, 0)
+        world.plant(PlantType.SNOW_PEA, row, 1)
+        world.plant(PlantType.CABBAGEPULT, row, 2)
+    world.plant(PlantType.STARFRUIT, 2, 4)
+    return world
+
+
+def _drive(world: World, frames: int) -> list[dict]:
+    states = []
+    for f in range(frames):
+        if f % 40 == 0:
+            world.spawn(ZombieType.CONE_HEAD, f // 40 % 5, x=650.0)
+        world.update()
+        if f % 50 == 0:
+            states.append(world.get_state())
+    return states
+
+
+class TestProjectilePool(unittest.TestCase):
+    def test_pooled_matches_default(self) -> None:
+        """启用对象池后模拟结果逐帧相同，且确实发生了复用"""
+        plain, pooled = _build(False), _build(True)
+        self.assertEqual(_drive(plain, 1500), _drive(pooled, 1500))
+        pool = pooled.scene.projectile_pool
+        self.assertGreater(pool.reused, pool.allocated)
+
+    def test_reinit_matches_constructor(self) -> None:
+        pool = ProjectilePool()
+        proj = pool.acquire(ProjectileType.PEA, 1, 100.5, 200.0)
+        proj.dx, proj.countdown, proj.is_visible, proj.last_torchwood_col = 9.0, 3, False, 4
+        pool.release(proj)
+        pool.recycle()
+        again = pool.acquire(ProjectileType.MELON, 3, 10.0, 20.7)
+        self.assertIs(again, proj)
+        fresh = Projectile(type=ProjectileType.MELON, row=3, x=10.0, y=20.7)
+        for name in Projectile.__slots__:
+            if name not in ('id', 'generation'):
+                self.assertEqual(getattr(again, name), getattr(fresh, name), name)
+
+    def test_stale_reference_guard(self) -> None:
+        pool = ProjectilePool()
+        proj = pool.acquire(ProjectileType.PEA, 0, 0.0, 0.0)
+        ref = ProjectileRef(proj)
+        self.assertIs(ref.get(), proj)
+        pool.release(proj)
+        self.assertFalse(ref.alive)
+        self.assertIsNone(ref.get_or_none())
+        with self.assertRaises(StaleProjectileError):
+            ref.get()
+        with self.assertRaises(ValueError):
+            pool.release(proj)
+        # 归还后在 recycle 之前不会被复用
+        self.assertIsNot(pool.acquire(ProjectileType.PEA, 0, 0.0, 0.0), proj)
+
+    def test_clone_and_snapshot_keep_mode(self) -> None:
+        world = _build(True)
+        _drive(world, 300)
+        for scene in (world.clone().scene, Scene.from_bytes(world.scene.to_bytes())):
+            self.assertIsNotNone(scene.projectile_pool)
+            self.assertIsNot(scene.projectile_pool, world.scene.projectile_pool)
+        self.assertIsNone(Scene.from_bytes(_build(False).scene.to_bytes()).projectile_pool)
+        world.reset()
+        self.assertIsNotNone(world.scene.projectile_pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.systems.plant_subsystems.spike_family import SpikeFamilySubsystem
+from pvzemu2.world import World
+from pvzemu2.zombie_index import ZombieRow
+
+
+def _build(seed: int) -> World:
+    world = World(SceneType.POOL)
+    world.seed(seed)
+    world.scene.stop_spawn = True
+    layout = {0: (PlantType.SQUASH, PlantType.SPIKEWEED), 1: (PlantType.POTATO_MINE, PlantType.SPIKEWEED),
+              4: (PlantType.SPIKEWEED, PlantType.CHOMPER), 5: (PlantType.CHOMPER, PlantType.SPIKEWEED)}
+    for row, (front, back) in layout.items():
+        world.plant(front, row, 5)
+        world.plant(back, row, 3)
+    for row in (2, 3):
+        world.plant(PlantType.TANGLE_KELP, row, 3)
+    return world
+
+
+def _run(world: World, frames: int) -> None:
+    # 只在陆地行出怪；水路的睡莲 / 缠绕水草保持休眠
+    waves = {50: (0, 1), 300: (4, 5), 700: (0, 4)}
+    for frame in range(frames):
+        for row in waves.get(frame, ()):
+            world.spawn(ZombieType.POLE_VAULTING if row == 4 else ZombieType.ZOMBIE, row, x=490.0 + 5 * row + frame // 20)
+        world.update()
+
+
+class TestRangeWakeup(unittest.TestCase):
+    def test_matches_polling(self) -> None:
+        """休眠 / 唤醒与逐帧 find_target 的结果逐帧一致"""
+        woken = _build(5)
+        polling = _build(5)
+        with mock.patch.object(ZombieRow, 'is_dormant', return_value=False):
+            _run(polling, 1600)
+        _run(woken, 1600)
+        self.assertEqual(woken.get_state(), polling.get_state())
+
+    def test_empty_lane_stops_polling(self) -> None:
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        spikes = [world.plant(PlantType.SPIKEWEED, row, col) for row in range(5) for col in (3, 5)]
+        with mock.patch.object(SpikeFamilySubsystem, 'find_target', autospec=True,
+                               side_effect=SpikeFamilySubsystem.find_target) as find_target:
+            for _ in range(20):
+                world.update()
+            self.assertEqual(find_target.call_count, len(spikes))
+
+            # 远处的僵尸不会唤醒；进入触发区间后恢复索敌并攻击
+            zombie = world.spawn(ZombieType.ZOMBIE, 2, x=700.0)
+            world.update()
+            self.assertEqual(find_target.call_count, len(spikes))
+            zombie.x = zombie.int_x = spikes[4].x + 20
+            world.update()
+            self.assertGreater(find_target.call_count, len(spikes))
+        self.assertNotEqual(spikes[4].status, spikes[0].status)
+
+    def test_destroyed_plant_unwatched(self) -> None:
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        spike = world.plant(PlantType.SPIKEWEED, 1, 4)
+        world.update()
+        row = world.scene.zombies_by_row[1]
+        self.assertTrue(row.is_dormant(spike))
+        world.plant_factory.destroy(spike)
+        self.assertFalse(row.is_dormant(spike))
+        self.assertEqual(row._watchers, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from pvzemu2.enums import ZombieType, ZombieReanimName, PlantType, PlantReanimName
+from pvzemu2.objects import plant_reanim_data, zombie_reanim_data
+
+
+class TestReanimTables(unittest.TestCase):
+    def test_zombie_tables_match_source(self) -> None:
+        """编译后的表与 if 链逐项一致"""
+        m = zombie_reanim_data
+        for t in ZombieType:
+            self.assertEqual(m.get_zombie_reanim_data(t), m._reanim_data_source(t))
+            for name in ZombieReanimName:
+                self.assertEqual(m.get_reanim_frame_data(t, name), m._frame_data_source(t, name), (t, name))
+                self.assertIs(m.has_reanim(t, name), bool(m._has_reanim_source(t, name)), (t, name))
+
+    def test_plant_tables_match_source(self) -> None:
+        m = plant_reanim_data
+        for t in PlantType:
+            self.assertEqual(m.get_plant_reanim_data(t), m._reanim_data_source(t))
+            for name in PlantReanimName:
+                self.assertEqual(m.get_reanim_frame_data(t, name), m._frame_data_source(t, name), (t, name))
+                self.assertIs(m.has_reanim(t, name), bool(m._has_reanim_source(t, name)), (t, name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import pickle
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.replay import Recorder, Replay
+from pvzemu2.world import World
+
+FRAMES = 2400
+
+
+def _record(interval: int = 300) -> tuple[Recorder, dict[int, dict]]:
+    """录一局，同时记下若干帧的真实状态"""
+    rec = Recorder(World(SceneType.DAY), checkpoint_interval=interval, seed=21)
+    states = {0: rec.world.get_state()}
+    rec.plant(PlantType.SUNFLOWER, 0, 0)
+    while rec.frame < FRAMES:
+        f = rec.frame
+        if f % 200 == 0:
+            rec.plant(PlantType.PEA_SHOOTER, f // 200 % 5, 1)
+            rec.spawn(ZombieType.CONE_HEAD, f // 200 % 5, x=700.0)
+        if f == 450:
+            rec.set_field(rec.world.scene, 'sun.sun', 5000)
+            z = rec.spawn(ZombieType.BUCKET_HEAD, 3, x=600.0)
+            rec.set_field(z, 'countdown.freeze', 120)
+        if f == 999:
+            rec.remove_plant(0, 0)
+        if f == 1500:
+            rec.step_until(('plant', 'zombie'), 700)
+        else:
+            rec.step(1 if f % 7 else 13)
+        if rec.frame % 97 == 0 or rec.frame in (299, 300, 301, 999, 1000):
+            states[rec.frame] = rec.world.get_state()
+    return rec, states
+
+
+class TestReplay(unittest.TestCase):
+    def test_seek_matches_recording(self) -> None:
+        """任意顺序跳转得到与录制时相同的状态"""
+        rec, states = _record()
+        log = rec.log
+        self.assertEqual(log.checkpoint_frames, list(range(0, rec.frame + 1, 300))[:len(log.checkpoint_frames)])
+        self.assertGreaterEqual(len(log.checkpoint_frames), FRAMES // 300)
+
+        replay = Replay(log)
+        frames = sorted(states)
+        for f in frames + frames[::-1] + frames[::3]:
+            self.assertEqual(replay.seek(f).get_state(), states[f], f)
+        self.assertEqual(replay.seek(rec.frame).get_state(), rec.world.get_state())
+
+    def test_log_is_picklable(self) -> None:
+        rec, states = _record(interval=1000)
+        log = pickle.loads(pickle.dumps(rec.log))
+        f = max(states)
+        self.assertEqual(Replay(log).seek(f).get_state(), states[f])
+
+    def test_set_dead_kills(self) -> None:
+        """set_field 写入 is_dead 经 Scene.kill，对象在帧末被移除，回放一致"""
+        rec = Recorder(World(SceneType.DAY), checkpoint_interval=10, seed=3)
+        z = rec.spawn(ZombieType.ZOMBIE, 1, x=700.0)
+        rec.step(3)
+        rec.set_field(z, 'is_dead', True)
+        self.assertIn(z, rec.world.scene.dead_zombies)
+        rec.step(1)
+        self.assertIsNone(rec.world.scene.zombies.get(z.id))
+        self.assertNotIn(z, rec.world.scene.zombies_by_row[1])
+        rec.step(20)
+        self.assertEqual(Replay(rec.log).seek(4).get_state()['zombies'], [])
+
+    def test_errors(self) -> None:
+        rec = Recorder(World(SceneType.DAY), checkpoint_interval=10)
+        rec.step(5)
+        with self.assertRaises(ValueError):
+            Replay(rec.log).seek(6)
+        with self.assertRaises(TypeError):
+            rec.set_field(rec.world.scene.sun, 'sun', 1)
+        with self.assertRaises(ValueError):
+            Recorder(World(SceneType.DAY), checkpoint_interval=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
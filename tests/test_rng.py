@@ -0,0 +1,118 @@
+import copy
+import pickle
+import unittest
+from random import Random
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.scene import Scene
+from pvzemu2.systems.rng import CounterRNG
+from pvzemu2.world import World
+
+
+def _run(world: World, frames: int = 1500) -> World:
+    for row in range(5):
+        world.plant(PlantType.SUNFLOWER, row, 0)
+        world.plant(PlantType.PEA_SHOOTER, row, 1)
+    world.spawn(ZombieType.CONE_HEAD, 2, x=700.0)
+    world.step(frames)
+    return world
+
+
+class TestCounterRNG(unittest.TestCase):
+    def test_seeded_and_skip(self) -> None:
+        """同种子同序列；skip(n) 与逐个取 n 次等价；randoms 与逐个调用 random 一致"""
+        seq = CounterRNG(7).randoms(300)
+        r = CounterRNG(7)
+        self.assertEqual([r.random() for _ in range(300)], seq)
+        self.assertNotEqual(CounterRNG(8).randoms(300), seq)
+
+        for n in (0, 1, 63, 64, 65, 200):
+            r = CounterRNG(7)
+            r.skip(n)
+            self.assertEqual(r.counter, n)
+            self.assertEqual(r.random(), seq[n])
+
+        r = CounterRNG(7)
+        r.random()
+        self.assertEqual(r.randoms(100), seq[1:101])
+        self.assertEqual(r.random(), seq[101])
+        with self.assertRaises(ValueError):
+            r.skip(-1)
+
+    def test_integers(self) -> None:
+        r = CounterRNG('abc')
+        values = [r.randint(0, 9) for _ in range(2000)]
+        self.assertEqual(set(values), set(range(10)))
+        self.assertEqual(r.getrandbits(0), 0)
+        self.assertLess(r.getrandbits(130), 1 << 130)
+        self.assertEqual(r.choices(range(3), weights=[0, 1, 0], k=1), [1])
+
+    def test_spawn(self) -> None:
+        """子流由 (key, index) 决定，与父流位置无关，且互不相同"""
+        parent = CounterRNG(1)
+        first = parent.spawn(3).randoms(50)
+        parent.randoms(1000)
+        self.assertEqual(parent.spawn(3).randoms(50), first)
+        streams = [s.randoms(50) for s in parent.split(8)]
+        self.assertEqual(streams[3], first)
+        self.assertEqual(len({tuple(s) for s in streams}), 8)
+        self.assertNotEqual(parent.spawn(0).spawn(1).key, parent.spawn(1).spawn(0).key)
+
+    def test_state(self) -> None:
+        r = CounterRNG(5)
+        r.randoms(10)
+        r.gauss(0, 1)
+        for other in (pickle.loads(pickle.dumps(r)), copy.copy(r)):
+            self.assertEqual(other.getstate(), r.getstate())
+            self.assertEqual(other.gauss(0, 1), copy.copy(r).gauss(0, 1))
+        state = r.getstate()
+        expected = r.randoms(5)
+        r.setstate(state)
+        self.assertEqual(r.randoms(5), expected)
+        with self.assertRaises(ValueError):
+            r.setstate(Random(0).getstate())
+
+
+class TestWorldRng(unittest.TestCase):
+    def test_world_reproducible(self) -> None:
+        """同一子流构造的场景逐帧一致，clone 与编码保留 CounterRNG"""
+        a = _run(World(SceneType.DAY, rng=CounterRNG(3).spawn(0)))
+        b = _run(World(SceneType.DAY, rng=CounterRNG(3).spawn(0)))
+        self.assertEqual(a.get_state(), b.get_state())
+
+        clone = a.clone()
+        self.assertIsInstance(clone.scene.rng, CounterRNG)
+        self.assertEqual(clone.scene.rng.random(), a.scene.rng.random())
+
+        scene = Scene.from_bytes(a.scene.to_bytes())
+        self.assertIsInstance(scene.rng, CounterRNG)
+        self.assertEqual(scene.rng.getstate(), a.scene.rng.getstate())
+
+    def test_reset_spawns_next_stream(self) -> None:
+        """第 k 次 reset() 使用第 0 局流的子流 spawn(k)，开局与用该子流新建的世界一致"""
+        world = _run(World(SceneType.DAY, rng=CounterRNG(5)), 300)
+        for k in (1, 2):
+            world.reset()
+            fresh = World(SceneType.DAY, rng=CounterRNG(5).spawn(k))
+            self.assertIsInstance(world.scene.rng, CounterRNG)
+            self.assertEqual(world.scene.rng.getstate(), fresh.scene.rng.getstate())
+            self.assertEqual(world.get_state(), fresh.get_state())
+            _run(world, 100)
+
+    def test_reset_replay(self) -> None:
+        """replay=True 回到当前这一局流的开头"""
+        world = World(SceneType.DAY, rng=CounterRNG(5))
+        world.reset()
+        start = World(SceneType.DAY, rng=CounterRNG(5).spawn(1)).get_state()
+        _run(world, 300)
+        world.reset(replay=True)
+        self.assertEqual(world.get_state(), start)
+        world.reset()
+        fresh = World(SceneType.DAY, rng=CounterRNG(5).spawn(2))
+        self.assertEqual(world.scene.rng.getstate(), fresh.scene.rng.getstate())
+        with self.assertRaises(ValueError):
+            World(SceneType.DAY).reset(replay=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
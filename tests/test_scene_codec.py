@@ -0,0 +1,95 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.scene import Scene
+from pvzemu2.scene_codec import MAGIC
+from pvzemu2.world import World
+
+
+def _make_world() -> World:
+    world = World(SceneType.POOL)
+    world.seed(11)
+    for row in range(6):
+        world.plant(PlantType.SUNFLOWER, row, 0)
+        world.plant(PlantType.SPLIT_PEA, row, 1)
+        world.plant(PlantType.SNOW_PEA, row, 2)
+    world.plant(PlantType.PUMPKIN, 0, 2)
+    world.spawn(ZombieType.BUCKET_HEAD, 1, x=700.0)
+    world.spawn(ZombieType.POLE_VAULTING, 4, x=750.0)
+    world.step(2000)
+    return world
+
+
+class TestSceneCodec(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """编码后解码得到相同的场景，且继续模拟的结果一致"""
+        world = _make_world()
+        scene = Scene.from_bytes(world.scene.to_bytes())
+        self.assertEqual(scene.to_dict(), world.scene.to_dict())
+
+        restored = World(SceneType.POOL)
+        restored.restore(scene)
+        world.step(1500)
+        restored.step(1500)
+        self.assertEqual(world.get_state(), restored.get_state())
+        self.assertEqual(world.scene.rng.random(), restored.scene.rng.random())
+
+    def test_round_trip_keeps_value_types(self) -> None:
+        """float 字段中的 int 值 (子弹的 y 等) 解码后仍为 int，恢复的场景与原场景序列化结果相同"""
+        world = _make_world()
+        self.assertTrue(any(type(p.y) is int for p in world.scene.projectiles))
+        restored = World(SceneType.POOL)
+        restored.restore(Scene.from_bytes(world.scene.to_bytes()))
+        self.assertEqual(restored.to_json(), world.to_json())
+        for p, q in zip(world.scene.projectiles, restored.scene.projectiles):
+            self.assertIs(type(q.y), type(p.y))
+            self.assertIs(type(q.x), type(p.x))
+
+    def test_references_rebuilt(self) -> None:
+        """plant_map 与 zombies_by_row 指向解码后的对象"""
+        world = _make_world()
+        scene = Scene.from_bytes(world.scene.to_bytes())
+        cell = scene.plant_map[0][2]
+        self.assertIs(cell['content'], scene.plants.get(cell['content'].id))
+        self.assertIs(cell['pumpkin'], scene.plants.get(cell['pumpkin'].id))
+        self.assertEqual([[z.id for z in r] for r in scene.zombies_by_row],
+                         [[z.id for z in r] for r in world.scene.zombies_by_row])
+        for r in scene.zombies_by_row:
+            for z in r:
+                self.assertIs(z, scene.zombies.get(z.id))
+
+    def test_handles_survive(self) -> None:
+        """对象池的句柄代数随快照保存，旧句柄在解码后仍然失效"""
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        zombies = world.scene.zombies
+        z = world.spawn(ZombieType.ZOMBIE, 1, x=700.0)
+        stale = zombies.handle(z.id)
+        world.zombie_factory.destroy(z)
+        world.update()
+        newcomer = world.spawn(ZombieType.ZOMBIE, 2, x=700.0)
+        self.assertEqual(newcomer.id, z.id)
+        scene = Scene.from_bytes(world.scene.to_bytes())
+        self.assertIsNone(scene.zombies.resolve(stale))
+        self.assertEqual(scene.zombies.handle(newcomer.id), zombies.handle(newcomer.id))
+
+    def test_smaller_than_json(self) -> None:
+        world = _make_world()
+        self.assertLess(len(world.scene.to_bytes()), len(world.to_json()))
+
+    def test_rejects_bad_data(self) -> None:
+        """格式不符或截断的数据抛出 ValueError"""
+        data = World().scene.to_bytes()
+        with self.assertRaises(ValueError):
+            Scene.from_bytes(b'JSON' + data[4:])
+        with self.assertRaises(ValueError):
+            Scene.from_bytes(MAGIC + b'\xff\xff' + data[6:])
+        with self.assertRaises(ValueError):
+            Scene.from_bytes(data[:len(data) // 2])
+        # 未知的标志位
+        with self.assertRaises(ValueError):
+            Scene.from_bytes(data[:10] + bytes([data[10] | 0x80]) + data[11:])
+
+
+if __name__ == '__main__':
+    unittest.main()
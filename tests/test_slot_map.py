@@ -0,0 +1,88 @@
+import unittest
+from dataclasses import dataclass
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.obj_list import ObjList
+from pvzemu2.slot_map import SlotMap
+from pvzemu2.world import World
+
+
+@dataclass(slots=True, eq=False)
+class _Obj:
+    name: str
+    id: int = -1
+
+
+class TestSlotMap(unittest.TestCase):
+    def test_ids_match_obj_list(self) -> None:
+        """slot 复用规则与 ObjList(use_recycle=True) 相同，得到相同的 id 序列"""
+        a, b = ObjList(use_recycle=True), SlotMap()
+        live: list[int] = []
+        for i in range(300):
+            if i % 3 == 2:
+                victim = live.pop((i * 7) % len(live))
+                a.remove(victim)
+                b.remove(victim)
+            ids = a.add(_Obj(str(i))), b.add(_Obj(str(i)))
+            self.assertEqual(ids[0], ids[1])
+            live.append(ids[0])
+        self.assertEqual(len(a), len(b))
+        self.assertEqual(sorted(o.name for o in a), sorted(o.name for o in b))
+        self.assertEqual([o.id for o in b], sorted(o.id for o in b))
+
+    def test_stale_handle(self) -> None:
+        objs: SlotMap[_Obj] = SlotMap()
+        kelp_target = objs.add(_Obj('zombie'))
+        handle = objs.handle(kelp_target)
+        self.assertEqual(objs.resolve(handle).name, 'zombie')
+        objs.remove(kelp_target)
+        recycled = objs.add(_Obj('newcomer'))
+        self.assertEqual(recycled, kelp_target)
+        self.assertIsNone(objs.resolve(handle))
+        self.assertEqual(objs.resolve(objs.handle(recycled)).name, 'newcomer')
+        objs.clear()
+        self.assertEqual(objs.add(_Obj('after clear')), 0)
+        self.assertIsNone(objs.resolve(handle))
+        with self.assertRaises(KeyError):
+            objs.handle(5)
+
+    def test_scan_is_array_scan(self) -> None:
+        objs: SlotMap[_Obj] = SlotMap()
+        items = [objs.add(_Obj(c)) for c in 'abcd']
+        objs.remove(items[0])
+        seen = []
+        with objs.scan() as it:
+            for o in it:
+                seen.append(o.name)
+                if o.name == 'b':
+                    objs.remove(items[2])
+                    objs.add(_Obj('x'))  # 复用 slot 0，位于游标之前
+                    objs.add(_Obj('y'))  # 复用 slot 2，位于游标之后
+                    objs.add(_Obj('z'))  # 新 slot 4
+        self.assertEqual(seen, ['b', 'y', 'd', 'z'])
+        self.assertEqual([o.name for o in objs], ['x', 'b', 'y', 'd', 'z'])
+
+    def test_world_runs_on_slot_maps(self) -> None:
+        """作为 Scene 的对象池替换 ObjList 后世界可以正常推进与复制"""
+        world = World(SceneType.DAY)
+        world.seed(9)
+        scene = world.scene
+        scene.stop_spawn = True
+        scene.zombies, scene.plants, scene.projectiles, scene.grid_items = \
+            SlotMap(), SlotMap(), SlotMap(), SlotMap()
+        for row in range(5):
+            world.plant(PlantType.REPEATER, row, 0)
+            world.spawn(ZombieType.CONE_HEAD, row, x=500.0)
+        for _ in range(200):
+            world.update()
+        clone = world.clone()
+        self.assertIsInstance(clone.scene.zombies, SlotMap)
+        for _ in range(200):
+            world.update()
+            clone.update()
+        self.assertEqual(world.get_state(), clone.get_state())
+        self.assertGreater(len(scene.projectiles), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import unittest
+
+from pvzemu2 import status_flags as sf
+from pvzemu2.enums import SceneType, PlantType, PlantStatus, ZombieType, ZombieStatus as S, ZombieAction as A
+from pvzemu2.systems.util import is_not_movable, has_death_status
+from pvzemu2.world import World
+
+STATUSES = range(max(S) + 1)
+ACTIONS = range(max(A) + 1)
+TYPES = range(-1, max(ZombieType) + 1)
+
+_DYING = (S.DYING, S.DYING_FROM_INSTANT_KILL, S.DYING_FROM_LAWNMOWER)
+
+
+# ---- 改写前的逐项实现 ----
+
+def _ref_is_not_movable_self(z) -> bool:
+    return (z.is_eating or z.countdown.freeze > 0 or z.countdown.butter > 0 or
+            z.status in (S.JACKBOX_POP, S.NEWSPAPER_DESTROYED, S.GARGANTUAR_THROW, S.GARGANTUAR_SMASH,
+                         S.CATAPULT_SHOOT, S.CATAPULT_IDLE, S.DIGGER_DRILL, S.DIGGER_LOST_DIG,
+                         S.DIGGER_LANDING, S.DIGGER_DIZZY, S.DANCING_POINT, S.DANCING_WAIT_SUMMONING,
+                         S.DANCING_SUMMONING, S.DANCING_DANCER_SPAWNING, S.IMP_FLYING, S.IMP_LANDING,
+                         S.LADDER_PLACING, S.DANCING_ARMRISE1, S.DANCING_ARMRISE2, S.DANCING_ARMRISE3,
+                         S.DANCING_ARMRISE4, S.DANCING_ARMRISE5) or
+            z.action == A.FALL_FROM_SKY or z.type == ZombieType.BUNGEE)
+
+
+def _ref_can_be_slowed(z) -> bool:
+    if z.type == ZombieType.ZOMBONI or z.is_dead:
+        return False
+    return (z.status not in _DYING and
+            z.status not in (S.DIGGER_DIG, S.DIGGER_DRILL, S.DIGGER_LOST_DIG, S.DIGGER_LANDING,
+                             S.RISING_FROM_GROUND, S.DANCING_DANCER_SPAWNING) and
+            not z.is_hypno)
+
+
+def _ref_can_be_freezed(z) -> bool:
+    if not _ref_can_be_slowed(z):
+        return False
+    return (z.status not in (S.POLE_VALUTING_JUMPING, S.DOLPHIN_JUMP_IN_POOL, S.DOLPHIN_IN_JUMP,
+                             S.SNORKEL_JUMP_IN_THE_POOL, S.IMP_FLYING, S.IMP_LANDING) and
+            z.status not in (S.BALLOON_FLYING, S.BALLOON_FALLING) and
+            int(z.status) != 19 and
+            not (S.POGO_WITH_STICK <= z.status <= S.POGO_JUMP_ACROSS) and
+            (z.type != ZombieType.BUNGEE or z.status == S.BUNGEE_IDLE_AFTER_DROP))
+
+
+def _ref_damage_can_be_freezed(z) -> bool:
+    flying = z.type == ZombieType.BALLOON and z.status in (S.BALLOON_FLYING, S.BALLOON_FALLING)
+    return not (z.type in (ZombieType.ZOMBONI, ZombieType.CATAPULT, ZombieType.BUNGEE) or flying or
+                z.status in (S.POLE_VALUTING_JUMPING, S.DOLPHIN_JUMP_IN_POOL, S.DOLPHIN_IN_JUMP,
+                             S.DOLPHIN_RIDE, S.SNORKEL_JUMP_IN_THE_POOL))
+
+
+def _ref_skips_eating(t: int, s: int, a: int) -> bool:
+    return (t in (ZombieType.BUNGEE, ZombieType.GARGANTUAR, ZombieType.GIGA_GARGANTUAR,
+                  ZombieType.ZOMBONI, ZombieType.CATAPULT) or
+            s in (S.POLE_VALUTING_JUMPING, S.BALLOON_FLYING) or
+            a in (A.FALL_FROM_SKY, A.CLIMBING_LADDER, A.ENTERING_POOL, A.LEAVING_POOL, A.FALLING))
+
+
+def _ref_skips_water(t: int, s: int, a: int) -> bool:
+    return (t not in (ZombieType.ZOMBIE, ZombieType.CONE_HEAD, ZombieType.BUCKET_HEAD,
+                      ZombieType.FLAG, ZombieType.BALLOON) or
+            s in (S.BALLOON_FLYING, S.BALLOON_FALLING) or
+            t in (ZombieType.DOLPHIN_RIDER, ZombieType.SNORKEL) or
+            a in (A.ENTERING_POOL, A.LEAVING_POOL))
+
+
+class TestStatusFlags(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.scene.stop_spawn = True
+        self.z = self.world.spawn(ZombieType.ZOMBIE, 2, x=600.0)
+
+    def test_zombie_predicates(self) -> None:
+        """遍历 状态 x 类型 x (is_dead, is_hypno)，与改写前的实现逐项一致"""
+        z, damage = self.z, self.world.damage_system
+        for s in STATUSES:
+            z.status = s
+            death = s in _DYING
+            self.assertIs(z.has_death_status(), death, s)
+            self.assertIs(has_death_status(z), death, s)
+            self.assertIs(damage._has_death_status(z), death, s)
+            self.assertIs(z.is_flying_or_falling(), s in (S.BALLOON_FLYING, S.BALLOON_FALLING), s)
+            self.assertIs(z.has_pogo_status(), S.POGO_WITH_STICK <= s <= 28, s)
+            self.assertEqual(sf.ZOMBIE_STATUS_FLAGS[s] & sf.ZS_ANIMATING != 0, s in (
+                S.POLE_VALUTING_JUMPING, S.IMP_FLYING, S.DIGGER_DRILL, S.DIGGER_LOST_DIG, S.DIGGER_LANDING,
+                S.DOLPHIN_JUMP_IN_POOL, S.DOLPHIN_IN_JUMP, S.SNORKEL_JUMP_IN_THE_POOL, S.BALLOON_FALLING,
+                S.RISING_FROM_GROUND, S.DANCING_DANCER_SPAWNING), s)
+            for t in TYPES:
+                z.type = t
+                self.assertIs(damage._can_be_freezed(z), _ref_damage_can_be_freezed(z), (s, t))
+                for dead in (False, True):
+                    z.is_dead = dead
+                    for hypno in (False, True):
+                        z.is_hypno = hypno
+                        key = (s, t, dead, hypno)
+                        self.assertIs(z.can_be_slowed(), _ref_can_be_slowed(z), key)
+                        self.assertIs(z.can_be_freezed(), _ref_can_be_freezed(z), key)
+
+    def test_is_not_movable(self) -> None:
+        """单个僵尸 (无舞伴) 时 is_not_movable 只取决于自身字段"""
+        z, scene = self.z, self.world.scene
+        for s in STATUSES:
+            z.status = s
+            for a in ACTIONS:
+                z.action = a
+                for t in TYPES:
+                    z.type = t
+                    self.assertEqual(bool(is_not_movable(scene, z)), _ref_is_not_movable_self(z), (s, a, t))
+        z.status, z.action, z.type = S.WALKING, A.NONE, ZombieType.ZOMBIE
+        for attr in ('freeze', 'butter'):
+            setattr(z.countdown, attr, 5)
+            self.assertTrue(is_not_movable(scene, z))
+            setattr(z.countdown, attr, 0)
+        z.is_eating = True
+        self.assertTrue(is_not_movable(scene, z))
+
+    def test_system_exclusions(self) -> None:
+        """ZombieSystem 啃食 / 入水的排除条件"""
+        st, at, tt = sf.ZOMBIE_STATUS_FLAGS, sf.ZOMBIE_ACTION_FLAGS, sf.ZOMBIE_TYPE_FLAGS
+        for s in STATUSES:
+            for a in ACTIONS:
+                for t in TYPES:
+                    eat = bool(tt[t] & sf.ZT_NO_EAT or st[s] & sf.ZS_NO_EAT or at[a] & sf.ZA_NO_EAT)
+                    self.assertEqual(eat, _ref_skips_eating(t, s, a), (s, a, t))
+                    water = bool(not tt[t] & sf.ZT_WADES or st[s] & sf.ZS_BALLOON_AIR or
+                                 at[a] & sf.ZA_POOL_TRANSITION)
+                    self.assertEqual(water, _ref_skips_water(t, s, a), (s, a, t))
+
+    def test_plant_status(self) -> None:
+        p = self.world.plant(PlantType.SQUASH, 1, 1)
+        for s in range(max(PlantStatus) + 1):
+            p.status = s
+            for t in (PlantType.SQUASH, PlantType.PEA_SHOOTER):
+                p.type = t
+                self.assertIs(p.is_squash_attacking(), t == PlantType.SQUASH and s in (
+                    PlantStatus.SQUASH_STOP_IN_THE_AIR, PlantStatus.SQUASH_JUMP_DOWN, PlantStatus.SQUASH_CRUSHED))
+            self.assertEqual(sf.PLANT_STATUS_FLAGS[s] & sf.PS_NOT_EDIBLE != 0, s in (
+                PlantStatus.SQUASH_JUMP_UP, PlantStatus.SQUASH_STOP_IN_THE_AIR, PlantStatus.SQUASH_JUMP_DOWN,
+                PlantStatus.SQUASH_CRUSHED, PlantStatus.FLOWER_POT_PLACED, PlantStatus.LILY_PAD_PLACED), s)
+
+    def test_type_none_slot(self) -> None:
+        """ZombieType.NONE (-1) 落在表尾的空槽位"""
+        self.assertEqual(len(sf.ZOMBIE_TYPE_FLAGS), max(ZombieType) + 2)
+        self.assertEqual(sf.ZOMBIE_TYPE_FLAGS[ZombieType.NONE], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import random
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType
+from pvzemu2.world import World
+
+_PLANTS = (
+    PlantType.SUNFLOWER, PlantType.PEA_SHOOTER, PlantType.WALLNUT, PlantType.POTATO_MINE,
+    PlantType.TWIN_SUNFLOWER, PlantType.PUFFSHROOM, PlantType.KERNELPULT, PlantType.REPEATER,
+)
+
+
+def _make_world(seed: int, scene_type: SceneType = SceneType.DAY) -> World:
+    world = World(scene_type)
+    world.seed(seed)
+    layout = random.Random(seed)
+    for row in range(5):
+        for col in range(4):
+            if layout.random() < 0.6:
+                world.plant(layout.choice(_PLANTS), row, col)
+    return world
+
+
+class CountingWorld(World):
+    def __init__(self) -> None:
+        super().__init__(SceneType.DAY)
+        self.n_updates = 0
+
+    def update(self) -> bool:
+        self.n_updates += 1
+        return super().update()
+
+
+class TestStepUntil(unittest.TestCase):
+    def test_matches_frame_by_frame(self) -> None:
+        """快进结果与逐帧推进逐位相同 (含出怪、战斗与随机数状态)"""
+        for seed, scene_type in ((0, SceneType.DAY), (1, SceneType.NIGHT), (2, SceneType.POOL)):
+            with self.subTest(seed=seed, scene_type=scene_type):
+                a = _make_world(seed, scene_type)
+                b = _make_world(seed, scene_type)
+                a.step(3000)
+                self.assertEqual(b.step_until(max_frames=3000), 3000)
+                self.assertEqual(a.get_state(), b.get_state())
+                self.assertEqual(a.scene.rng.getstate(), b.scene.rng.getstate())
+
+    def test_skips_idle_frames(self) -> None:
+        """空场地上只在事件帧执行 update"""
+        world = CountingWorld()
+        world.scene.stop_spawn = True
+        reference = World(SceneType.DAY)
+        reference.scene.rng.setstate(world.scene.rng.getstate())
+        reference.scene.sun.natural_sun_countdown = world.scene.sun.natural_sun_countdown
+        reference.scene.zombie_dancing_clock = world.scene.zombie_dancing_clock
+        reference.scene.stop_spawn = True
+
+        world.step_until(max_frames=20000)
+        reference.step(20000)
+        self.assertLess(world.n_updates, 200)
+        self.assertEqual(world.get_state(), reference.get_state())
+
+    def test_event_kinds(self) -> None:
+        world = _make_world(3)
+        frames = world.step_until({'wave'})
+        self.assertEqual(frames, 600)
+        self.assertEqual(world.scene.spawn.wave, 1)
+
+        world = _make_world(3)
+        world.scene.stop_spawn = True
+        sun = world.scene.sun.sun = 0
+        world.step_until({'sun'})
+        self.assertGreater(world.scene.sun.sun, sun)
+
+        with self.assertRaises(ValueError):
+            world.step_until({'lunch'})
+
+    def test_predicate_and_limit(self) -> None:
+        world = _make_world(4)
+        world.step_until(lambda w: len(w.scene.zombies) > 0)
+        self.assertGreater(len(world.scene.zombies), 0)
+
+        world = _make_world(4)
+        self.assertEqual(world.step_until(lambda w: False, max_frames=123), 123)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from array import array
+from unittest import mock
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType
+from pvzemu2.parallel import SUMMARY_SIZE, encode_summary
+from pvzemu2.systems.fast_forward import FastForwardSystem
+from pvzemu2.vector_world import VectorWorld
+from pvzemu2.world import World
+
+
+def _setup(world: World, i: int) -> None:
+    world.plant(PlantType.PEA_SHOOTER, 1, 0)
+    world.plant(PlantType.REPEATER, 2, 0)
+    world.plant(PlantType.WALLNUT, 2, 3 + i % 3)
+    world.spawn(ZombieType.CONE_HEAD, 1, x=650.0 + 10 * i)
+    world.spawn(ZombieType.FOOTBALL, 2, x=700.0)
+    world.spawn(ZombieType.NEWSPAPER, 3, x=600.0)
+
+
+def _scalar(seed: int) -> World:
+    world = World(SceneType.DAY)
+    world.seed(seed)
+    return world
+
+
+class TestVectorWorld(unittest.TestCase):
+    def test_lockstep_matches_scalar_worlds(self) -> None:
+        """按阶段批量推进的结果与逐个 World.update 完全一致"""
+        n = 3
+        vw = VectorWorld(n, SceneType.DAY, seed=7)
+        scalar = [_scalar(7 + i) for i in range(n)]
+        for i in range(n):
+            _setup(scalar[i], i)
+            _setup(vw[i], i)
+
+        for _ in range(1500):
+            vw.update()
+        for w in scalar:
+            w.step(1500)
+        for i in range(n):
+            self.assertEqual(vw[i].get_state(), scalar[i].get_state())
+
+    def test_step_skips_idle_frames(self) -> None:
+        """多帧 step 中空闲场景解析地跳帧，动作、观测与逐帧推进一致"""
+        n = 2
+        vw = VectorWorld(n, SceneType.DAY, seed=2, frames_per_step=50)
+        scalar = [_scalar(2 + i) for i in range(n)]
+        vw[1].spawn(ZombieType.ZOMBIE, 4, x=700.0)
+        scalar[1].spawn(ZombieType.ZOMBIE, 4, x=700.0)
+
+        out = array('d', bytes(8 * SUMMARY_SIZE))
+        with mock.patch.object(FastForwardSystem, 'advance', autospec=True,
+                               side_effect=FastForwardSystem.advance) as advance:
+            for step in range(30):
+                actions = [(PlantType.SUNFLOWER, step % 5, step // 5) if step < 10 else None] * n
+                rows, dones = vw.step(actions)
+                for i, w in enumerate(scalar):
+                    if actions[i] is not None:
+                        w.plant(*actions[i])
+                    w.step(50)
+                    encode_summary(w, memoryview(out))
+                    self.assertEqual(rows[i].tolist(), out.tolist())
+            self.assertGreater(advance.call_count, 0)
+        for i in range(n):
+            self.assertEqual(vw[i].get_state(), scalar[i].get_state())
+        self.assertEqual(len(vw.shared_buffer), n * SUMMARY_SIZE)
+
+    def test_game_over_and_auto_reset(self) -> None:
+        """结束的场景不再推进；auto_reset 时以下一局的种子重新开始"""
+        vw = VectorWorld(2, SceneType.DAY, seed=1, auto_reset=False)
+        vw[0].spawn(ZombieType.ZOMBIE, 0, x=-200.0)
+        for _ in range(5):
+            dones = vw.update()
+        self.assertEqual(dones, [True, False])
+        clock = vw[0].scene.zombie_dancing_clock
+        vw.update()
+        self.assertEqual(vw[0].scene.zombie_dancing_clock, clock)
+
+        vw = VectorWorld(2, SceneType.DAY, seed=1)
+        vw[0].spawn(ZombieType.ZOMBIE, 0, x=-200.0)
+        for _ in range(5):
+            _, dones = vw.step()
+            if dones[0]:
+                break
+        self.assertEqual(dones, [True, False])
+        self.assertEqual(len(vw[0].scene.zombies), 0)
+        self.assertEqual(vw[0].get_state(), _scalar(1 + 0 + 1 * 2).get_state())
+        with self.assertRaises(ValueError):
+            vw.step([None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType, ZombieStatus
+from pvzemu2.scene import Scene
+from pvzemu2.world import World
+
+
+class TestZombieBoxCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.scene.stop_spawn = True
+
+    def test_reuse_until_inputs_change(self) -> None:
+        """依赖字段不变时返回同一个 Rect，任一字段变化后重新计算"""
+        z = self.world.spawn(ZombieType.ZOMBIE, 2, x=500.0)
+        r = z.get_hit_box_rect()
+        self.assertIs(z.get_hit_box_rect(), r)
+        self.assertIs(z.get_attack_box_rect(), z.get_attack_box_rect())
+
+        for change in (lambda: setattr(z, 'int_x', z.int_x - 3),
+                       lambda: setattr(z, 'dy', 12.0),
+                       lambda: setattr(z, 'is_hypno', True),
+                       lambda: setattr(z, 'is_in_water', True),
+                       lambda: setattr(z, 'status', ZombieStatus.RISING_FROM_GROUND),
+                       lambda: setattr(z.countdown, 'action', 25),
+                       lambda: setattr(z, 'hit_box_width', 40)):
+            change()
+            self.assertEqual(z.get_hit_box_rect(), z._compute_hit_box_rect())
+            self.assertEqual(z.get_attack_box_rect(), z._compute_attack_box_rect())
+
+    def test_matches_uncached_while_running(self) -> None:
+        for row in range(5):
+            self.world.plant(PlantType.REPEATER, row, 1)
+            self.world.plant(PlantType.WALLNUT, row, 5)
+        spawn = (ZombieType.ZOMBIE, ZombieType.POLE_VAULTING, ZombieType.FOOTBALL, ZombieType.DANCING)
+        for frame in range(400):
+            if frame % 40 == 0:
+                self.world.spawn(spawn[frame // 40 % len(spawn)], frame // 40 % 5)
+            self.world.update()
+            for z in self.world.scene.zombies:
+                self.assertEqual(z.get_hit_box_rect(), z._compute_hit_box_rect())
+                self.assertEqual(z.get_attack_box_rect(), z._compute_attack_box_rect())
+
+    def test_starfruit_leaves_digger_box(self) -> None:
+        """杨桃对异行矿工的判定只在局部加宽，缓存的判定框不被修改"""
+        starfruits = [self.world.plant(PlantType.STARFRUIT, row, 2) for row in (1, 3)]
+        digger = self.world.spawn(ZombieType.DIGGER, 2, x=600.0)
+        width = digger.get_hit_box_rect().width
+        subsystem = self.world.plant_system.starfruit_subsystem
+        for _ in range(3):
+            for p in starfruits:
+                subsystem.has_target(p)
+        self.assertEqual(digger.get_hit_box_rect().width, width)
+        self.assertEqual(digger.get_hit_box_rect(), digger._compute_hit_box_rect())
+        with self.assertRaises(AttributeError):
+            digger.get_hit_box_rect().width += 1
+
+    def test_codec(self) -> None:
+        """解码得到的僵尸没有缓存"""
+        z = self.world.spawn(ZombieType.CONE_HEAD, 1, x=600.0)
+        z.get_hit_box_rect()
+        decoded = Scene.from_bytes(self.world.scene.to_bytes()).zombies.get(z.id)
+        self.assertIsNone(decoded._hit_box_cache)
+        self.assertEqual(decoded.get_hit_box_rect(), z.get_hit_box_rect())
+
+
+if __name__ == '__main__':
+    unittest.main()
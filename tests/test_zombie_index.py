@@ -0,0 +1,174 @@
+import random
+import unittest
+
+from unittest import mock
+
+from pvzemu2.enums import SceneType, PlantType, ZombieType, AttackFlags
+from pvzemu2.geometry import Rect
+from pvzemu2.systems.damage import DamageSystem
+from pvzemu2.world import World
+from pvzemu2.zombie_index import ZombieRow
+
+
+def _spawn_row(world: World, row: int, xs: list[float]) -> list:
+    return [world.spawn(ZombieType.ZOMBIE, row, x=x) for x in xs]
+
+
+class TestZombieRow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.world = World(SceneType.DAY)
+        self.world.scene.stop_spawn = True
+
+    def test_sorted_by_x_then_id(self) -> None:
+        """行内按 (x, id) 升序，移动后 sync 恢复有序"""
+        zs = _spawn_row(self.world, 1, [700.0, 500.0, 600.0, 500.0])
+        row = self.world.scene.zombies_by_row[1]
+        row.sync()
+        self.assertEqual([z.x for z in row], [500.0, 500.0, 600.0, 700.0])
+        self.assertLess(list(row)[0].id, list(row)[1].id)
+
+        zs[0].x = 100.0
+        row.sync()
+        self.assertIs(list(row)[0], zs[0])
+        self.assertEqual(row.keys, sorted(row.keys))
+
+    def test_range_queries(self) -> None:
+        zs = _spawn_row(self.world, 2, [300.0, 450.0, 600.0, 750.0])
+        row = self.world.scene.zombies_by_row[2]
+        row.sync()
+        self.assertEqual(row.between(400, 600), zs[1:3])
+        self.assertEqual(row.between(800, 900), [])
+
+        # overlapping 返回的候选必须包含所有判定框与区间相交的僵尸
+        for x0 in range(250, 850, 10):
+            expected = [z for z in zs if z.get_hit_box_rect().get_overlap_len(Rect(x0, 0, 15, 1000)) >= 0]
+            got = row.overlapping(x0, x0 + 15)
+            for z in expected:
+                self.assertIn(z, got)
+
+    def test_add_discard(self) -> None:
+        row = ZombieRow()
+        zs = _spawn_row(self.world, 0, [400.0, 200.0])
+        for z in zs:
+            row.add(z)
+            row.add(z)
+        self.assertEqual(len(row), 2)
+        zs[1].x = 999.0  # 未同步的坐标不影响按身份删除
+        row.discard(zs[1])
+        self.assertEqual(list(row), [zs[0]])
+        self.assertNotIn(zs[1], row)
+
+    def test_destroy_and_clone(self) -> None:
+        zs = _spawn_row(self.world, 3, [400.0, 500.0])
+        self.world.zombie_factory.destroy(zs[0])
+        self.assertEqual(list(self.world.scene.zombies_by_row[3]), [zs[1]])
+
+        clone = self.world.clone()
+        cloned = list(clone.scene.zombies_by_row[3])
+        self.assertEqual([z.id for z in cloned], [zs[1].id])
+        self.assertIs(cloned[0], clone.scene.zombies.get(zs[1].id))
+
+
+class TestTargetParity(unittest.TestCase):
+    def test_find_target_matches_full_scan(self) -> None:
+        """区间查询得到的目标与逐个扫描全部僵尸的结果一致"""
+        layout = random.Random(3)
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        plants = []
+        for row in range(5):
+            for col in range(0, 9, 2):
+                p = world.plant(layout.choice((PlantType.PEA_SHOOTER, PlantType.PUFFSHROOM,
+                                               PlantType.FUMESHROOM, PlantType.THREEPEATER)), row, col)
+                if p is not None:
+                    plants.append(p)
+            for _ in range(12):
+                world.spawn(layout.choice((ZombieType.ZOMBIE, ZombieType.FOOTBALL)), row,
+                            x=float(layout.randrange(0, 800)))
+
+        scene = world.scene
+        ps = world.plant_system
+        for _ in range(3):
+            scene.sync_zombie_index()
+            for p in plants:
+                self.assertIs(ps.find_target(p, p.row), _scan_find_target(world, p))
+            for z in scene.zombies:
+                z.x += layout.uniform(-30, 30)
+                z.int_x = int(z.x)
+
+    def test_multi_kill_frees_ids_in_id_order(self) -> None:
+        """同一帧被压死的两只僵尸按 id 顺序归还 id (与 x 顺序相反时也一样)"""
+        world = World(SceneType.DAY)
+        world.seed(0)
+        world.scene.stop_spawn = True
+        front, back = _spawn_row(world, 2, [330.0, 320.0])
+        world.plant(PlantType.SQUASH, 2, 3)
+        for _ in range(300):
+            world.update()
+            if world.scene.zombies._free_ids:
+                break
+        self.assertEqual(list(world.scene.zombies._free_ids), [front.id, back.id])
+        self.assertEqual(world.spawn(ZombieType.ZOMBIE, 0).id, front.id)
+
+    def test_range_attack_in_id_order(self) -> None:
+        """范围攻击按 id 顺序结算，而不是行内的 x 顺序"""
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        spike = world.plant(PlantType.SPIKEWEED, 1, 4)
+        zs = _spawn_row(world, 1, [spike.x + 30.0, spike.x + 20.0, spike.x + 10.0])
+        world.scene.sync_zombie_index()
+        with mock.patch.object(DamageSystem, 'take', autospec=True) as take:
+            world.damage_system.range_attack(spike, AttackFlags.GROUND)
+        self.assertEqual([c.args[1] for c in take.call_args_list], zs)
+
+    def test_ties_go_to_lowest_id(self) -> None:
+        """窝瓜、大嘴花在判定值相同时选 id 最小的僵尸，而不是浮点 x 最小的"""
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        squash = world.plant(PlantType.SQUASH, 2, 3)
+        chomper = world.plant(PlantType.CHOMPER, 1, 3)
+        ps = world.plant_system
+        for row, plant, subsystem in ((2, squash, ps.squash_subsystem), (1, chomper, ps.chomper_subsystem)):
+            first, second = _spawn_row(world, row, [plant.x + 40.9, plant.x + 40.1])
+            self.assertEqual(first.int_x, second.int_x)
+            world.scene.sync_zombie_index()
+            self.assertIs(list(world.scene.zombies_by_row[row])[0], second)
+            self.assertIs(subsystem.find_target(plant, row), first)
+
+    def test_splash_in_id_order(self) -> None:
+        """西瓜溅射按 id 顺序结算"""
+        world = World(SceneType.DAY)
+        world.scene.stop_spawn = True
+        world.plant(PlantType.MELONPULT, 1, 0)
+        zs = _spawn_row(world, 1, [502.0, 501.0, 500.0])
+        with mock.patch.object(DamageSystem, 'take', autospec=True) as take:
+            for _ in range(600):
+                world.update()
+                if take.call_count:
+                    break
+        self.assertEqual([c.args[1] for c in take.call_args_list], zs)
+
+
+def _scan_find_target(world: World, p):
+    # PlantSystem.find_target 的逐个扫描版本 (不含香蒲)
+    pr_x, pr_w = p.x, 900
+    if p.type == PlantType.GLOOMSHROOM:
+        pr_x, pr_w = p.x - 80, 240
+    elif p.type == PlantType.FUMESHROOM:
+        pr_w = 320
+    elif p.type == PlantType.PUFFSHROOM:
+        pr_w = 240
+    rows = [p.row - 1, p.row, p.row + 1] if p.type == PlantType.THREEPEATER else [p.row]
+    best = None
+    for z in sorted(world.scene.zombies, key=lambda z: z.id):
+        if z.row not in rows or z.is_dead or not world.damage_system.can_be_attacked(z, AttackFlags.GROUND):
+            continue
+        if not pr_x <= z.x <= pr_x + pr_w:
+            continue
+        if best is None or z.x < best.x or z.x == best.x and rows.index(z.row) < rows.index(best.row):
+            best = z
+    return best
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+VectorWorld：在同一进程内以锁步方式推进 N 个相互独立的 World。
+
+- 每帧按流水线阶段批量调度：先推进全部场景的第一个阶段，再推进全部场景的下一个阶段……
+  各场景已绑定的阶段方法 (World._pipeline) 按阶段转置成调度表，只在参与的场景或其流水线变化
+  (结束、重置、enable_profiling) 时重建，一帧只有一层 (阶段, 场景) 循环，不再逐场景调用 World.update。
+- 一次 step 推进多帧时，没有僵尸与子弹的场景按 FastForwardSystem 解析地跳过空闲帧，只有仍需
+  逐帧模拟的场景进入调度表。
+- 场景之间互不影响，结果与逐个调用 World.step 逐位相同。
+
+接口与 SubprocWorldPool 一致 (step(actions) / reset() / observations / shared_buffer)，
+观测写入同一块连续的 array('d')，不经过进程间通信。
+"""
+from array import array
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+from pvzemu2.enums import SceneType
+from pvzemu2.parallel import Action, Encoder, SUMMARY_SIZE, encode_summary, _make_world
+from pvzemu2.world import World
+
+
+class VectorWorld:
+    """
+    N 个同类型场景的批量模拟器，主要用于强化学习的批量环境。
+    单个场景仍可通过 vw[i] 取得对应的 World 进行种植、生成等操作。
+    """
+    __slots__ = ('n_envs', 'scene_type', 'seed', 'rng_streams', 'frames_per_step', 'auto_reset', 'encode',
+                 'obs_size', 'worlds', '_episodes', '_obs', '_buf', '_rows', '_schedule')
+
+    def __init__(self, n: int, scene_type: SceneType = SceneType.DAY, seed: Optional[int] = None,
+                 frames_per_step: int = 1, auto_reset: bool = True, encode: Encoder = encode_summary,
+                 obs_size: int = SUMMARY_SIZE, rng_streams: bool = False) -> None:
+        """
+        :param seed: 给定时第 i 号环境第 e 局使用种子 seed + i + e * n，
+                     rng_streams=True 时改用 CounterRNG(seed).spawn(i).spawn(e)，与 SubprocWorldPool 相同。
+        """
+        self.n_envs = n
+        self.scene_type = scene_type
+        self.seed = seed
+        self.rng_streams = rng_streams
+        self.frames_per_step = frames_per_step
+        self.auto_reset = auto_reset
+        self.encode = encode
+        self.obs_size = obs_size
+
+        self._episodes = [0] * n
+        self._obs = array('d', bytes(8 * n * obs_size))
+        self._buf = memoryview(self._obs)
+        self._rows = [self._buf[i * obs_size:(i + 1) * obs_size] for i in range(n)]
+        # (参与的场景下标, 各自的流水线, 调度表)
+        self._schedule: Optional[tuple[tuple[int, ...], list[Any], list[Any]]] = None
+        self.worlds = [self._new_world(i) for i in range(n)]
+        for i in range(n):
+            encode(self.worlds[i], self._rows[i])
+
+    def __len__(self) -> int:
+        return self.n_envs
+
+    def __getitem__(self, index: int) -> World:
+        return self.worlds[index]
+
+    def __iter__(self) -> Iterator[World]:
+        return iter(self.worlds)
+
+    # --- 公共接口 ---
+
+    @property
+    def observations(self) -> list[memoryview]:
+        """每个环境的观测行视图 (长度 obs_size)。"""
+        return self._rows
+
+    @property
+    def shared_buffer(self) -> memoryview:
+        """全部观测的扁平视图，形状为 n_envs * obs_size，可直接交给 NumPy (np.frombuffer)。"""
+        return self._buf
+
+    @property
+    def dones(self) -> list[bool]:
+        """每个场景是否已结束。"""
+        return [w.scene.is_game_over for w in self.worlds]
+
+    def update(self) -> list[bool]:
+        """
+        所有未结束的场景各推进一帧 (不跳过空闲帧，不自动重置)。
+        :return: 每个场景是否已结束。
+        """
+        self._update_frame(None)
+        return self.dones
+
+    def step(self, actions: Optional[Sequence[Action]] = None) -> tuple[list[memoryview], list[bool]]:
+        """
+        每个环境执行一个动作并推进 frames_per_step 帧。
+        :param actions: 长度为 n_envs 的动作序列，None 表示全部不操作。
+        :return: (观测行视图, done 标志)
+        """
+        worlds = self.worlds
+        if actions is not None:
+            if len(actions) != self.n_envs:
+                raise ValueError(f"expected {self.n_envs} actions, got {len(actions)}")
+            for world, action in zip(worlds, actions):
+                if action is not None and not world.scene.is_game_over:
+                    world.plant(*action)
+
+        remaining = [0 if w.scene.is_game_over else self.frames_per_step for w in worlds]
+        while True:
+            for i, world in enumerate(worlds):
+                left = remaining[i]
+                if left > 1:
+                    # 最后一帧总是实际模拟，保证 step 返回时场景状态与逐帧推进一致
+                    skip = world.fast_forward_system.idle_frames(left - 1)
+                    if skip:
+                        world.fast_forward_system.advance(skip)
+                        remaining[i] = left - skip
+            active = [left > 0 for left in remaining]
+            if not any(active):
+                break
+            self._update_frame(active)
+            for i, world in enumerate(worlds):
+                if active[i]:
+                    remaining[i] = 0 if world.scene.is_game_over else remaining[i] - 1
+
+        dones = self.dones
+        for i, done in enumerate(dones):
+            if done and self.auto_reset:
+                self._episodes[i] += 1
+                worlds[i] = self._new_world(i)
+            self.encode(worlds[i], self._rows[i])
+        return self._rows, dones
+
+    def reset(self, seed: Optional[int] = None) -> list[memoryview]:
+        """重置全部环境。给定 seed 时替换基准种子并重新计数局数。"""
+        if seed is not None:
+            self.seed = seed
+            self._episodes = [0] * self.n_envs
+        else:
+            self._episodes = [e + 1 for e in self._episodes]
+        self.worlds = [self._new_world(i) for i in range(self.n_envs)]
+        for i in range(self.n_envs):
+            self.encode(self.worlds[i], self._rows[i])
+        return self._rows
+
+    # --- 内部辅助逻辑 ---
+
+    def _new_world(self, index: int) -> World:
+        return _make_world(self.scene_type, self.seed, index, self._episodes[index], self.n_envs, self.rng_streams)
+
+    def _build_schedule(self, live: tuple[int, ...], pipelines: list[tuple[Callable[[], Optional[bool]], ...]]
+                        ) -> list[tuple[tuple[int, ...], tuple[Callable[[], Optional[bool]], ...]]]:
+        """按阶段转置：第 k 项为 (场景下标, 各场景的第 k 个阶段方法)。"""
+        if len({len(p) for p in pipelines}) > 1:
+            # 流水线长度不同 (子类增加了阶段)：每个场景单独成组，保持各自的阶段顺序
+            return [((i,), (stage,)) for i, p in zip(live, pipelines) for stage in p]
+        return [(live, column) for column in zip(*pipelines)]
+
+    def _update_frame(self, active: Optional[list[bool]]) -> None:
+        worlds = self.worlds
+        live = tuple(i for i, w in enumerate(worlds)
+                     if not w.scene.is_game_over and (active is None or active[i]))
+        if not live:
+            return
+        # 调度表随参与的场景及其流水线对象 (重置、enable_profiling 后会更换) 失效
+        pipelines = [worlds[i]._pipeline for i in live]
+        cached = self._schedule
+        if cached is None or cached[0] != live or any(a is not b for a, b in zip(cached[1], pipelines)):
+            cached = self._schedule = (live, pipelines, self._build_schedule(live, pipelines))
+
+        for i in live:
+            worlds[i].scene.zombie_dancing_clock += 1
+        ended: set[int] = set()
+        for group, stages in cached[2]:
+            for i, stage in zip(group, stages):
+                if ended and i in ended:
+                    continue
+                # 只有僵尸阶段有返回值 (进家判定)，返回 True 表示 Game Over
+                if stage():
+                    worlds[i].scene.is_game_over = True
+                    ended.add(i)
@@ -1,12 +1,19 @@
-from typing import Optional, Dict, Any, TYPE_CHECKING
+import sys
+from random import Random
+from typing import Optional, Dict, Any, Callable, Iterable, Union, TYPE_CHECKING
 
 from pvzemu2.enums import SceneType, PlantType, ZombieType
 if TYPE_CHECKING:
     from pvzemu2.objects.plant import Plant
     from pvzemu2.objects.zombie import Zombie
 
+from pvzemu2.delta import DeltaTracker
+from pvzemu2.obj_list import ObjList
+from pvzemu2 import profiling
+from pvzemu2.objects.projectile_pool import ProjectilePool
 from pvzemu2.scene import Scene
 from pvzemu2.systems.damage import DamageSystem
+from pvzemu2.systems.fast_forward import FastForwardSystem
 from pvzemu2.systems.griditem import GridItemSystem
 from pvzemu2.systems.griditem_factory import GridItemFactory
 from pvzemu2.systems.ice_path import IcePathSystem
@@ -14,12 +21,34 @@ from pvzemu2.systems.plant_factory import PlantFactory
 from pvzemu2.systems.plant_system import PlantSystem
 from pvzemu2.systems.projectile_factory import ProjectileFactory
 from pvzemu2.systems.projectile_system import ProjectileSystem
+from pvzemu2.systems.rng import CounterRNG
 from pvzemu2.systems.spawn import SpawnSystem
 from pvzemu2.systems.sun import SunSystem
 from pvzemu2.systems.util import get_y_by_row_and_col
 from pvzemu2.systems.zombie_factory import ZombieFactory
 from pvzemu2.systems.zombie_system import ZombieSystem
 
+# step_until 可等待的事件：阳光数变化、波数变化、僵尸数量变化、植物数量变化、游戏结束
+EVENT_KINDS = ('sun', 'wave', 'zombie', 'plant', 'game_over')
+
+# python -X dev 下帧末检查被直接置为 is_dead / is_disappeared、却没有经 Scene.kill 排队的对象
+_CHECK_DEAD_FLAGS = sys.flags.dev_mode
+
+
+def _take_dead(objs: ObjList[Any], queue: list[Any]) -> list[Any]:
+    """
+    取出并清空待清理队列，只保留仍在 objs 中的对象 (已被 destroy 移除、id 可能已被复用的跳过)。
+    多于一个时按 objs 的迭代顺序排列 (按槽位下标排序，代价只与死亡对象数有关)，
+    与逐个扫描时的移除顺序相同，ID 回收顺序因而不变。
+    """
+    get = objs.get
+    dead = [o for o in queue if get(o.id) is o]
+    queue.clear()
+    if len(dead) > 1:
+        # 同一对象可能被 kill 多次，先去重
+        dead = objs.in_iteration_order(list({id(o): o for o in dead}.values()))
+    return dead
+
 
 class World:
     """
@@ -30,13 +59,30 @@ class World:
         'scene', 'plant_factory', 'zombie_factory', 'damage_system',
         'projectile_factory', 'plant_system', 'projectile_system',
         'griditem_factory', 'zombie_system', 'sun_system',
-        'griditem_system', 'ice_path_system', 'spawn_system'
+        'griditem_system', 'ice_path_system', 'spawn_system', 'fast_forward_system', '_delta_tracker',
+        '_profiler', '_pipeline', '_rng_root', '_resets'
     )
 
-    def __init__(self, scene_type: SceneType = SceneType.DAY) -> None:
+    def __init__(self, scene_type: SceneType = SceneType.DAY,
+                 rng: Optional[Random] = None, pooled_projectiles: bool = False) -> None:
+        """
+        :param pooled_projectiles: 启用子弹对象池 (见 objects/projectile_pool.py)，默认关闭。
+        :param rng: 场景使用的随机数源，默认为未设种子的 random.Random。
+                    传入 CounterRNG (或其 spawn 出的子流) 时，开局状态完全由该流决定。
+        """
         # 1. 核心状态存储
-        self.scene = Scene(type=scene_type)
-
+        self.scene = Scene(type=scene_type, rng=Random() if rng is None else rng,
+                           projectile_pool=ProjectilePool() if pooled_projectiles else None)
+        self._profiler: Optional[profiling.FrameProfiler] = None
+        self._init_systems()
+        # 首次调用 get_delta 时才创建
+        self._delta_tracker: Optional[DeltaTracker] = None
+        # reset() 派生每局随机数子流用：第 0 局流的 key 与已重置的次数
+        self._rng_root: Optional[int] = None
+        self._resets = 0
+
+    def _init_systems(self) -> None:
+        """基于 self.scene 构造全部工厂与系统。"""
         # 2. 基础工厂初始化
         self.plant_factory = PlantFactory(self.scene)
         self.zombie_factory = ZombieFactory(self.scene)
@@ -54,6 +100,12 @@ class World:
         self.griditem_system = GridItemSystem(self.scene, self.griditem_factory)
         self.ice_path_system = IcePathSystem(self.scene)
         self.spawn_system = SpawnSystem(self.scene, self.zombie_factory)
+        self.fast_forward_system = FastForwardSystem(self.scene)
+
+        # 系统重建后重新取得各阶段的绑定方法；启用计时时同样换上新系统的计时包装
+        self._pipeline = self._stages()
+        if self._profiler is not None:
+            self._instrument(self._profiler)
 
     # --- 核心控制接口 ---
 
@@ -62,35 +114,16 @@ class World:
         执行单帧物理步进。
         :return: bool, 如果游戏结束返回 True。
         """
-        if self.scene.is_game_over:
+        scene = self.scene
+        if scene.is_game_over:
             return True
 
-        self.scene.zombie_dancing_clock += 1
-
-        # 逻辑流水线
-        self.griditem_system.update()
-        self.plant_system.update()
-
-        # 僵尸更新包含进家判定，返回 True 表示 Game Over
-        if self.zombie_system.update():
-            self.scene.is_game_over = True
-            return True
-
-        self.projectile_system.update()
-
-        # 辅助系统更新
-        self._update_cards()
-        self.sun_system.update()
-        if not self.scene.stop_spawn:
-            self.spawn_system.update()
-
-        self.ice_path_system.update()
-        if self.scene.spawn.countdown_pool > 0:
-            self.scene.spawn.countdown_pool -= 1
-
-        # 清理垃圾对象
-        self._clean_dead_objects()
-
+        scene.zombie_dancing_clock += 1
+        # 只有僵尸阶段有返回值 (进家判定)，返回 True 表示 Game Over
+        for stage in self._pipeline:
+            if stage():
+                scene.is_game_over = True
+                return True
         return False
 
     def step(self, frames: int = 1) -> bool:
@@ -102,6 +135,116 @@ class World:
                 return True
         return False
 
+    def step_until(self, until: Union[Callable[['World'], bool], Iterable[str], None] = None,
+                   max_frames: int = 100000) -> int:
+        """
+        推进直到 until 成立、游戏结束或达到 max_frames 帧。空闲帧 (只有倒计时递减的帧) 被解析地跳过，
+        结果与逐帧调用 update() 逐位相同。
+        :param until: 判定函数 until(world) -> bool，或 EVENT_KINDS 中事件名的集合。
+                      只在实际执行的帧之后判定；被跳过的帧中除倒计时外没有任何可观察的变化。
+        :return: 实际推进的帧数。
+        """
+        check = self._event_check(until)
+        frames = 0
+        while frames < max_frames and not self.scene.is_game_over:
+            skip = self.fast_forward_system.idle_frames(max_frames - frames)
+            if skip:
+                self.fast_forward_system.advance(skip)
+                frames += skip
+                continue
+
+            self.update()
+            frames += 1
+            if check is not None and check(self):
+                break
+        return frames
+
+    def seed(self, seed: int) -> None:
+        """
+        设定随机种子，并重新生成构造时已消耗随机数的初始状态
+        (舞王时钟、首个自然阳光倒计时)。应在开局前调用。
+        """
+        self.scene.rng.seed(seed)
+        self.scene.zombie_dancing_clock = self.scene.rng.randint(0, 9999)
+        self.scene.sun.natural_sun_countdown = self.sun_system._gen_nature_sun_countdown()
+
+    def clone(self) -> 'World':
+        """复制整个世界 (场景与全部系统)，两者此后互不影响。"""
+        return World.from_scene(self.scene.clone())
+
+    @classmethod
+    def from_scene(cls, scene: Scene) -> 'World':
+        """以 scene (不复制) 构造 World，场景状态与随机数状态保持不变。"""
+        world = cls.__new__(cls)
+        world._profiler = None
+        world._bind(scene)
+        world._delta_tracker = None
+        return world
+
+    def snapshot(self) -> Scene:
+        """保存当前场景的快照，可多次传给 restore()。"""
+        return self.scene.clone()
+
+    def restore(self, snapshot: Scene) -> None:
+        """恢复到 snapshot() 保存的状态，快照本身不被修改。"""
+        self._bind(snapshot.clone())
+
+    # --- 计时统计 ---
+
+    @property
+    def profiler(self) -> Optional[profiling.FrameProfiler]:
+        """enable_profiling() 返回的统计对象，未启用时为 None。"""
+        return self._profiler
+
+    def enable_profiling(self, profiler: Optional[profiling.FrameProfiler] = None) -> profiling.FrameProfiler:
+        """
+        开始累计各流水线阶段与各植物类型的耗时，见 profiling.py。
+        实现为把阶段表中的绑定方法换成计时包装，而不是在每帧判断开关；已启用时返回现有的统计对象。
+        :param profiler: 继续累计到已有的统计对象，默认新建。
+        """
+        if self._profiler is None:
+            self._profiler = profiler if profiler is not None else profiling.FrameProfiler()
+            self._instrument(self._profiler)
+        return self._profiler
+
+    def disable_profiling(self) -> Optional[profiling.FrameProfiler]:
+        """停止计时并恢复原方法，返回最后的统计对象。"""
+        prof = self._profiler
+        if prof is not None:
+            profiling.FrameProfiler.uninstrument_plant_system(self.plant_system)
+            self._pipeline = self._stages()
+            self._profiler = None
+        return prof
+
+    def _instrument(self, profiler: profiling.FrameProfiler) -> None:
+        self._pipeline = profiler.instrument_stages(self._stages())
+        profiler.instrument_plant_system(self.plant_system)
+
+    # --- 帧流水线 ---
+
+    def _stages(self) -> tuple[Callable[[], Optional[bool]], ...]:
+        """帧流水线的阶段表 (绑定方法)，顺序与 profiling.STAGES 一致。"""
+        return (
+            self.griditem_system.update,
+            self.plant_system.update,
+            self.zombie_system.update,
+            self.projectile_system.update,
+            self._update_cards,
+            self.sun_system.update,
+            self._update_spawn,
+            self._update_ice_path,
+            self._clean_dead_objects,
+        )
+
+    def _update_spawn(self) -> None:
+        if not self.scene.stop_spawn:
+            self.spawn_system.update()
+
+    def _update_ice_path(self) -> None:
+        self.ice_path_system.update()
+        if self.scene.spawn.countdown_pool > 0:
+            self.scene.spawn.countdown_pool -= 1
+
     # --- 交互操作接口 (Actions) ---
 
     def plant(self, plant_type: PlantType, row: int, col: int) -> Optional['Plant']:
@@ -121,9 +264,9 @@ class World:
 
         # 修正行索引同步逻辑
         if z.row != row:
-            self.scene.zombies_by_row[z.row].discard(z.id)
+            self.scene.zombies_by_row[z.row].discard(z)
             z.row = row
-            self.scene.zombies_by_row[row].add(z.id)
+            self.scene.zombies_by_row[row].add(z)
 
         z.x = x
         z.int_x = int(x)
@@ -151,6 +294,16 @@ class World:
         """导出当前状态为 JSON 字符串。"""
         return self.scene.to_json()
 
+    def get_delta(self, since_token: Optional[int] = None) -> Dict[str, Any]:
+        """
+        获取自 since_token 对应的调用以来新增、移除、变化的实体 (只含变化字段)。
+        返回值中的 token 用于下一次调用；since_token 为 None 或已失效时返回全量。
+        格式与消费端的 apply_delta 见 delta.py。
+        """
+        if self._delta_tracker is None:
+            self._delta_tracker = DeltaTracker()
+        return self._delta_tracker.get_delta(self.scene, since_token)
+
     # --- 内部辅助逻辑 ---
 
     def _update_cards(self) -> None:
@@ -159,31 +312,123 @@ class World:
             if card.cold_down > 0:
                 card.cold_down -= 1
 
+    def _event_check(self, until: Union[Callable[['World'], bool], Iterable[str], None]
+                     ) -> Optional[Callable[['World'], bool]]:
+        """把 step_until 的 until 参数转为判定函数；事件名集合转为“与上次判定相比是否变化”。"""
+        if until is None or callable(until):
+            return until
+
+        kinds = frozenset(until)
+        unknown = kinds - frozenset(EVENT_KINDS)
+        if unknown:
+            raise ValueError(f"unknown event kinds: {sorted(unknown)}")
+
+        def signature(world: 'World') -> tuple[Any, ...]:
+            scene = world.scene
+            return (
+                scene.sun.sun if 'sun' in kinds else None,
+                scene.spawn.wave if 'wave' in kinds else None,
+                len(scene.zombies) if 'zombie' in kinds else None,
+                len(scene.plants) if 'plant' in kinds else None,
+                scene.is_game_over if 'game_over' in kinds else None,
+            )
+
+        last = [signature(self)]
+
+        def check(world: 'World') -> bool:
+            sig = signature(world)
+            changed = sig != last[0]
+            last[0] = sig
+            return changed
+
+        return check
+
+    def _bind(self, scene: Scene) -> None:
+        """换用给定场景并重建系统。SunSystem 构造时会消耗随机数，这里保持场景状态不变。"""
+        rng_state = scene.rng.getstate()
+        natural_sun_countdown = scene.sun.natural_sun_countdown
+        self.scene = scene
+        self._init_systems()
+        scene.rng.setstate(rng_state)
+        scene.sun.natural_sun_countdown = natural_sun_countdown
+
     def _clean_dead_objects(self) -> None:
         """
-        清理所有系统中标记为已销毁的对象，释放内存。
-        此步骤确保 ObjList 中的 ID 被回收且空间缓存不包含死对象。
+        清理本帧经 Scene.kill 标记、尚未移除的对象。
+        factory.destroy 已即时移除对象并维护索引，这里只处理待清理队列，代价与死亡对象数成正比。
         """
+        scene = self.scene
+
         # 1. 清理僵尸 (必须同时从 zombies 和 zombies_by_row 移除)
-        for zid in [z.id for z in self.scene.zombies if z.is_dead]:
-            z = self.scene.zombies.get(zid)
-            if z and 0 <= z.row < len(self.scene.zombies_by_row):
-                self.scene.zombies_by_row[z.row].discard(zid)
-            self.scene.zombies.remove(zid)
+        if scene.dead_zombies:
+            for z in _take_dead(scene.zombies, scene.dead_zombies):
+                if 0 <= z.row < len(scene.zombies_by_row):
+                    scene.zombies_by_row[z.row].discard(z)
+                scene.zombies.remove(z.id)
 
         # 2. 清理植物、子弹、地形物品 (ObjList 已实现 ID 复用)
-        for pid in [p.id for p in self.scene.plants if p.is_dead]:
-            self.scene.plants.remove(pid)
-
-        for pid in [p.id for p in self.scene.projectiles if p.is_disappeared]:
-            self.scene.projectiles.remove(pid)
-
-        for iid in [i.id for i in self.scene.grid_items if i.is_disappeared]:
-            self.scene.grid_items.remove(iid)
-
-    def reset(self, scene_type: Optional[SceneType] = None) -> None:
-        """重置世界状态。"""
+        if scene.dead_plants:
+            for p in _take_dead(scene.plants, scene.dead_plants):
+                scene.unindex_plant(p)
+                scene.plants.remove(p.id)
+
+        pool = scene.projectile_pool
+        if scene.dead_projectiles:
+            for p in _take_dead(scene.projectiles, scene.dead_projectiles):
+                scene.projectiles.remove(p.id)
+                if pool is not None:
+                    pool.release(p)
+        if pool is not None:
+            pool.recycle()
+
+        if scene.dead_grid_items:
+            for item in _take_dead(scene.grid_items, scene.dead_grid_items):
+                scene.unindex_grid_item(item)
+                scene.grid_items.remove(item.id)
+
+        if _CHECK_DEAD_FLAGS:
+            self._check_dead_flags()
+
+    def _check_dead_flags(self) -> None:
+        """
+        兼容性检查 (-X dev)：对象只经待清理队列移除，直接改写标志的旧代码会让对象留在场景中，
+        这里以断言报告，代价与对象总数成正比。
+        """
+        scene = self.scene
+        stale = [o for objs in (scene.zombies, scene.plants) for o in objs if o.is_dead]
+        stale += [o for objs in (scene.projectiles, scene.grid_items) for o in objs if o.is_disappeared]
+        assert not stale, (
+            f"{', '.join(f'{type(o).__name__}#{o.id}' for o in stale)} flagged is_dead / is_disappeared "
+            f"without Scene.kill or factory destroy; setting the flag no longer removes the object")
+
+    def reset(self, scene_type: Optional[SceneType] = None, replay: bool = False) -> None:
+        """
+        重置世界状态，随机数源保持类型。
+        - CounterRNG：第 k 次重置改用第 0 局流的子流 spawn(k)，每局互不相同且可复现；
+          replay=True 时回到当前这一局流的开头，重放同一局。
+        - 其他随机数源：新建同类的未设种子实例 (不支持 replay)。
+        """
         st = scene_type or self.scene.type
+        pooled_projectiles = self.scene.projectile_pool is not None
+        rng = self.scene.rng
+        root, resets = self._rng_root, self._resets
+        if isinstance(rng, CounterRNG):
+            if root is None:
+                root = rng.key
+            if replay:
+                rng = CounterRNG(key=rng.key)
+            else:
+                resets += 1
+                rng = CounterRNG(key=root).spawn(resets)
+        elif replay:
+            raise ValueError("reset(replay=True) needs a CounterRNG world")
+        else:
+            rng = type(rng)()
+        profiler = self.disable_profiling()
         self.scene = Scene(type=st)
         # 重新绑定所有系统的 scene 引用
-        self.__init__(st)
+        self.__init__(st, rng=rng, pooled_projectiles=pooled_projectiles)
+        self._rng_root, self._resets = root, resets
+        if profiler is not None:
+            self.enable_profiling(profiler)
+
@@ -0,0 +1,232 @@
+"""
+按行的僵尸空间索引：每行一个 ZombieRow，行内僵尸按 (x, id) 升序排列。
+x 相同时按 id 排序，与原版按数组下标顺序扫描时的先后一致。
+
+- add / discard 由 ZombieFactory 等在僵尸进出某行时调用，插入时按当前 x 二分定位。
+- 僵尸移动后需调用 sync() 重新读取坐标并恢复有序：移动是局部的，序列几乎有序，
+  Timsort 只需线性时间。
+  PlantSystem / ProjectileSystem 在每帧开始查询前同步一次 (Scene.sync_zombie_index)，
+  这两个阶段内僵尸不会移动，查询结果与逐个扫描一致。
+- between / overlapping 为二分区间查询，返回候选僵尸的列表副本 (按 x 升序)，
+  调用方仍需对候选做精确判定。
+- 同时伤害多只僵尸的循环须先用 by_id() 把候选恢复为 id 顺序再结算：原版按数组下标顺序处理，
+  同一帧死亡的僵尸按该顺序归还 id，决定后续出怪复用哪个 id。
+- watch / is_dormant 为触发区间登记：索敌落空的植物登记自己的触发区间后进入休眠，
+  直到某只僵尸的判定框可能进入该区间 (sync 时重新判定、add 时即时唤醒) 才恢复 find_target。
+  判定使用僵尸判定框在朝左 / 朝右两种朝向下的最大范围 (框参数只在创建时设置)，
+  只会多唤醒不会漏唤醒，唤醒后的精确判定仍由 find_target 完成。
+"""
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
+
+from pvzemu2.objects.zombie import Zombie
+
+if TYPE_CHECKING:
+    from pvzemu2.objects.plant import Plant
+
+_sort_key = attrgetter('x', 'id')
+_id_key = attrgetter('id')
+
+# 判定框以 int_x 为基准，与 x 相差不到 1
+_INT_PAD = 1
+
+
+def by_id(zombies: Iterable[Zombie]) -> list[Zombie]:
+    """按 id 升序的列表副本 (多目标伤害的结算顺序)。"""
+    return sorted(zombies, key=_id_key)
+
+
+class ZombieRow:
+    """单行僵尸，zombies 与 keys (同步时的 x) 平行且按 x 升序。"""
+    __slots__ = ('zombies', 'keys', '_reach_lo', '_reach_hi', '_watchers', '_awake')
+
+    def __init__(self) -> None:
+        self.zombies: list[Zombie] = []
+        self.keys: list[float] = []
+        # 判定框左右边界相对 x 的最小 / 最大偏移，None 表示需在下次 overlapping 时重新计算
+        self._reach_lo: Optional[float] = None
+        self._reach_hi: Optional[float] = None
+        # 植物 id -> (植物, 触发区间左端, 右端)；_awake 为可能有僵尸进入区间的植物 id
+        self._watchers: dict[int, tuple['Plant', float, float]] = {}
+        self._awake: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self.zombies)
+
+    def __iter__(self) -> Iterator[Zombie]:
+        return iter(self.zombies)
+
+    def __contains__(self, z: Zombie) -> bool:
+        return self._position(z) >= 0
+
+    def add(self, z: Zombie) -> None:
+        if self._position(z) >= 0:
+            return
+        keys = self.keys
+        zombies = self.zombies
+        i = bisect_right(keys, z.x)
+        while i > 0 and keys[i - 1] == z.x and zombies[i - 1].id > z.id:
+            i -= 1
+        keys.insert(i, z.x)
+        self.zombies.insert(i, z)
+        if self._reach_lo is not None:
+            self._extend_reach(z)
+        if self._watchers:
+            lo, hi = _static_reach(z)
+            x0, x1 = z.x + lo - _INT_PAD, z.x + hi + _INT_PAD
+            for plant_id, (_, w0, w1) in self._watchers.items():
+                if x0 <= w1 and w0 <= x1:
+                    self._awake.add(plant_id)
+
+    def discard(self, z: Zombie) -> None:
+        i = self._position(z)
+        if i >= 0:
+            del self.zombies[i]
+            del self.keys[i]
+
+    def clear(self) -> None:
+        self.zombies.clear()
+        self.keys.clear()
+        self._reach_lo = self._reach_hi = None
+        self._watchers.clear()
+        self._awake.clear()
+
+    def sync(self) -> None:
+        """重新读取 x 并恢复 (x, id) 有序。"""
+        zombies = self.zombies
+        keys = [z.x for z in zombies]
+        if any(a >= b for a, b in zip(keys, keys[1:])):
+            zombies.sort(key=_sort_key)
+            keys = [z.x for z in zombies]
+        self.keys = keys
+        self._reach_lo = self._reach_hi = None
+        if self._watchers:
+            self._wake()
+
+    def between(self, x0: float, x1: float) -> list[Zombie]:
+        """x 落在 [x0, x1] 内的僵尸。"""
+        keys = self.keys
+        return self.zombies[bisect_left(keys, x0):bisect_right(keys, x1)]
+
+    def overlapping(self, x0: float, x1: float) -> list[Zombie]:
+        """判定框 (get_hit_box_rect) 的横向范围可能与 [x0, x1] 相交 (含相接) 的僵尸。"""
+        if self._reach_lo is None:
+            self._compute_reach()
+        if self._reach_lo is None:
+            return []
+        return self.between(x0 - self._reach_hi, x1 - self._reach_lo)
+
+    # --- 触发区间 ---
+
+    def watch(self, plant: 'Plant', x0: float, x1: float) -> None:
+        """登记 plant 的触发区间 [x0, x1]：判定框横向范围与之相交 (含相接) 的僵尸会唤醒它。"""
+        self._watchers[plant.id] = (plant, x0, x1)
+        if self._any_within(x0, x1):
+            self._awake.add(plant.id)
+        else:
+            self._awake.discard(plant.id)
+
+    def unwatch(self, plant: 'Plant') -> None:
+        entry = self._watchers.get(plant.id)
+        if entry is not None and entry[0] is plant:
+            del self._watchers[plant.id]
+            self._awake.discard(plant.id)
+
+    def is_dormant(self, plant: 'Plant') -> bool:
+        """plant 已登记触发区间且没有僵尸可能进入时为 True；未登记时为 False (需正常索敌)。"""
+        entry = self._watchers.get(plant.id)
+        return entry is not None and entry[0] is plant and plant.id not in self._awake
+
+    def clone(self, memo: dict[int, Zombie]) -> 'ZombieRow':
+        """
+        按 memo (id(旧僵尸) -> 新僵尸) 复制，已不在 memo 中的僵尸被丢弃。
+        触发区间不复制：副本中的植物下一次索敌落空时重新登记。
+        """
+        new = ZombieRow()
+        for z, key in zip(self.zombies, self.keys):
+            q = memo.get(id(z))
+            if q is not None:
+                new.zombies.append(q)
+                new.keys.append(key)
+        return new
+
+    def rebuild(self, zombies: list[Zombie]) -> None:
+        """用给定顺序的僵尸重建该行，随后同步坐标。"""
+        self.zombies = list(zombies)
+        self.sync()
+
+    # --- 内部辅助逻辑 ---
+
+    def _position(self, z: Zombie) -> int:
+        # 先在当前 x 附近按身份查找，坐标已变化 (尚未同步) 时退化为线性查找
+        zombies = self.zombies
+        keys = self.keys
+        i = bisect_left(keys, z.x)
+        while i < len(keys) and keys[i] == z.x:
+            if zombies[i] is z:
+                return i
+            i += 1
+        for i, other in enumerate(zombies):
+            if other is z:
+                return i
+        return -1
+
+    def _wake(self) -> None:
+        awake = self._awake
+        if not self.zombies:
+            awake.clear()
+            return
+        keys = self.keys
+        lo, hi = self._static_bounds()
+        awake.clear()
+        for plant_id, (_, x0, x1) in self._watchers.items():
+            i = bisect_left(keys, x0 - hi)
+            if i < len(keys) and keys[i] <= x1 - lo:
+                awake.add(plant_id)
+
+    def _any_within(self, x0: float, x1: float) -> bool:
+        if not self.zombies:
+            return False
+        keys = self.keys
+        lo, hi = self._static_bounds()
+        i = bisect_left(keys, x0 - hi)
+        return i < len(keys) and keys[i] <= x1 - lo
+
+    def _static_bounds(self) -> tuple[float, float]:
+        # 行内僵尸判定框相对 x 的最大范围 (含两种朝向与取整误差)
+        lo = hi = None
+        for z in self.zombies:
+            a, b = _static_reach(z)
+            if lo is None:
+                lo, hi = a, b
+            else:
+                if a < lo:
+                    lo = a
+                if b > hi:
+                    hi = b
+        return lo - _INT_PAD, hi + _INT_PAD
+
+    def _compute_reach(self) -> None:
+        self._reach_lo = self._reach_hi = None
+        for z in self.zombies:
+            self._extend_reach(z)
+
+    def _extend_reach(self, z: Zombie) -> None:
+        r = z.get_hit_box_rect()
+        lo = r.x - z.x
+        hi = r.x + r.width - z.x
+        if self._reach_lo is None:
+            self._reach_lo, self._reach_hi = lo, hi
+        else:
+            self._reach_lo = min(self._reach_lo, lo)
+            self._reach_hi = max(self._reach_hi, hi)
+
+
+
+def _static_reach(z: Zombie) -> tuple[int, int]:
+    """判定框左右边界相对 int_x 的范围，覆盖朝左与朝右 (is_walk_right) 两种情况。"""
+    hx = z.hit_box_x
+    w = z.hit_box_width
+    mirrored = z.hit_box_offset_x - w - hx
+    return min(hx, mirrored), max(hx + w, mirrored + w)